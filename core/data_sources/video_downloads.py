@@ -0,0 +1,471 @@
+"""
+Video Download Manager
+Concurrent yt-dlp downloads backed by a persistent SQLite job queue
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlparse
+
+try:
+    import yt_dlp
+except ImportError as exc:  # pragma: no cover - optional dependency
+    yt_dlp = None
+    _YT_DLP_IMPORT_ERROR = exc
+else:
+    _YT_DLP_IMPORT_ERROR = None
+
+DEFAULT_DOMAIN_LIMITS = {
+    'youtube.com': 4,
+    'youtu.be': 4,
+    'tiktok.com': 3,
+    'instagram.com': 2,
+}
+INFO_TTL_SECONDS = 3600  # stream URLs in extracted info expire after a few hours
+RETRY_BACKOFF_SECONDS = 30.0  # first retry delay; doubles with each attempt
+_HASH_CHUNK = 1024 * 1024
+
+
+def url_domain(url: str) -> str:
+    """Host used for per-domain concurrency caps (``www.``/``m.`` stripped)"""
+    host = (urlparse(url).hostname or '').lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class DownloadJob:
+    """One video to fetch: ``job_id`` is stable across runs (usually the video id)"""
+    job_id: str
+    url: str
+    output_path: Path
+    domain: str = ''
+
+    def __post_init__(self):
+        self.output_path = Path(self.output_path)
+        if not self.domain:
+            self.domain = url_domain(self.url)
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a job: status is downloaded, skipped or failed"""
+    job: DownloadJob
+    status: str
+    reason: str = ''
+    size_bytes: int = 0
+    sha256: Optional[str] = None
+    info: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ('downloaded', 'skipped')
+
+
+class DownloadQueue:
+    """
+    SQLite-backed job table
+
+    A job row survives across runs with its last status, attempt count,
+    error, extracted info and the checksum of the finished file. Rows left
+    ``running`` by a crashed run are put back to ``pending`` on open. A
+    pending row with ``not_before`` set (a retry backing off) is not claimed
+    until that time.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    seq INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    info_json TEXT,
+                    info_at REAL,
+                    sha256 TEXT,
+                    size_bytes INTEGER,
+                    updated_at REAL,
+                    not_before REAL
+                )
+                """
+            )
+            columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(jobs)')}
+            if 'not_before' not in columns:
+                self._conn.execute('ALTER TABLE jobs ADD COLUMN not_before REAL')
+            self._conn.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+
+    def enqueue(self, jobs: Iterable[DownloadJob]) -> None:
+        """Add jobs (or re-arm existing ones) as pending, keeping checksums and info"""
+        now = time.time()
+        with self._lock, self._conn:
+            seq = self._conn.execute('SELECT COALESCE(MAX(seq), 0) FROM jobs').fetchone()[0]
+            for job in jobs:
+                seq += 1
+                self._conn.execute(
+                    """
+                    INSERT INTO jobs (job_id, url, output_path, domain, seq, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_id) DO UPDATE SET
+                        url = excluded.url, output_path = excluded.output_path,
+                        domain = excluded.domain, seq = excluded.seq,
+                        status = 'pending', attempts = 0, error = NULL, not_before = NULL,
+                        updated_at = excluded.updated_at
+                    """,
+                    (job.job_id, job.url, str(job.output_path), job.domain, seq, now),
+                )
+
+    def claim(self, job_ids: Optional[Sequence[str]] = None, exclude_domains: Sequence[str] = ()) -> Optional[DownloadJob]:
+        """Mark the oldest pending job that is not backing off as running and return it"""
+        query = "SELECT * FROM jobs WHERE status = 'pending' AND (not_before IS NULL OR not_before <= ?)"
+        params: List[Any] = [time.time()]
+        if job_ids is not None:
+            query += f" AND job_id IN ({','.join('?' * len(job_ids))})"
+            params.extend(job_ids)
+        if exclude_domains:
+            query += f" AND domain NOT IN ({','.join('?' * len(exclude_domains))})"
+            params.extend(exclude_domains)
+        query += ' ORDER BY seq LIMIT 1'
+        with self._lock, self._conn:
+            row = self._conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE job_id = ?",
+                (time.time(), row['job_id']),
+            )
+        return DownloadJob(row['job_id'], row['url'], Path(row['output_path']), row['domain'])
+
+    def pending_count(self, job_ids: Optional[Sequence[str]] = None) -> int:
+        query = "SELECT COUNT(*) FROM jobs WHERE status = 'pending'"
+        params: List[Any] = []
+        if job_ids is not None:
+            query += f" AND job_id IN ({','.join('?' * len(job_ids))})"
+            params.extend(job_ids)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def get(self, job_id: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+
+    def pending_jobs(self) -> List[DownloadJob]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs WHERE status = 'pending' ORDER BY seq").fetchall()
+        return [DownloadJob(row['job_id'], row['url'], Path(row['output_path']), row['domain']) for row in rows]
+
+    def save_info(self, job_id: str, info: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE jobs SET info_json = ?, info_at = ? WHERE job_id = ?',
+                (json.dumps(info), time.time(), job_id),
+            )
+
+    def load_info(self, job_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        row = self.get(job_id)
+        if row is None or not row['info_json']:
+            return None
+        if max_age is not None and time.time() - (row['info_at'] or 0) > max_age:
+            return None
+        return json.loads(row['info_json'])
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None,
+               sha256: Optional[str] = None, size_bytes: Optional[int] = None,
+               not_before: Optional[float] = None) -> None:
+        """Record a job's outcome; ``not_before`` delays claiming a re-queued job"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?, sha256 = COALESCE(?, sha256),
+                    size_bytes = COALESCE(?, size_bytes), not_before = ?, updated_at = ?
+                WHERE job_id = ?
+                """,
+                (status, error, sha256, size_bytes, not_before, time.time(), job_id),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'DownloadQueue':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class VideoDownloadManager:
+    """
+    Download many videos with yt-dlp in-process, several at a time
+
+    Jobs are persisted in a :class:`DownloadQueue`, claimed by ``max_workers``
+    threads and capped per domain (``domain_limits``, falling back to
+    ``default_domain_limit``) so one site is never hammered while another
+    sits idle. Interrupted downloads resume from yt-dlp's ``.part`` files;
+    finished files are checksummed, and a later run skips any file whose
+    size and SHA-256 still match the recorded values.
+
+    A failed download is retried up to ``max_attempts`` times, waiting
+    ``retry_backoff`` seconds before the first retry and doubling after
+    each, so retries do not hit a rate-limited site back to back.
+
+    ``ydl_factory`` builds a YoutubeDL-compatible object from an options
+    dict (defaults to ``yt_dlp.YoutubeDL``). Use it as a context manager (or
+    call ``close``) to release the queue's SQLite connection.
+    """
+
+    def __init__(
+        self,
+        queue_path: Path,
+        max_workers: int = 8,
+        domain_limits: Optional[Dict[str, int]] = None,
+        default_domain_limit: int = 2,
+        format: str = 'best',
+        merge_output_format: Optional[str] = None,
+        max_attempts: int = 3,
+        retry_backoff: float = RETRY_BACKOFF_SECONDS,
+        socket_timeout: int = 30,
+        ydl_opts: Optional[Dict[str, Any]] = None,
+        ydl_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        if ydl_factory is None:
+            if yt_dlp is None:
+                raise RuntimeError('yt-dlp is required for video downloads (pip install yt-dlp)') from _YT_DLP_IMPORT_ERROR
+            ydl_factory = yt_dlp.YoutubeDL
+
+        self.queue = DownloadQueue(queue_path)
+        self.max_workers = max(1, max_workers)
+        self.domain_limits = dict(DEFAULT_DOMAIN_LIMITS if domain_limits is None else domain_limits)
+        self.default_domain_limit = max(1, default_domain_limit)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = max(0.0, retry_backoff)
+        self._ydl_factory = ydl_factory
+        self._base_opts = {
+            'format': format,
+            'quiet': True,
+            'no_warnings': True,
+            'noplaylist': True,
+            'noprogress': True,
+            'continuedl': True,
+            'nopart': False,
+            'socket_timeout': socket_timeout,
+            **(ydl_opts or {}),
+        }
+        if merge_output_format:
+            self._base_opts['merge_output_format'] = merge_output_format
+
+        self._cond = threading.Condition()
+        self._active: Dict[str, int] = {}
+        self._domain_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._local = threading.local()
+
+    def domain_limit(self, domain: str) -> int:
+        for suffix, limit in self.domain_limits.items():
+            if domain == suffix or domain.endswith('.' + suffix):
+                return max(1, limit)
+        return self.default_domain_limit
+
+    # -- info extraction -------------------------------------------------
+
+    def _probe_ydl(self):
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = self._local.ydl = self._ydl_factory(dict(self._base_opts, skip_download=True))
+        return ydl
+
+    def _domain_semaphore(self, domain: str) -> threading.BoundedSemaphore:
+        with self._cond:
+            if domain not in self._domain_semaphores:
+                self._domain_semaphores[domain] = threading.BoundedSemaphore(self.domain_limit(domain))
+            return self._domain_semaphores[domain]
+
+    def _extract(self, job: DownloadJob) -> Dict[str, Any]:
+        with self._domain_semaphore(job.domain):
+            ydl = self._probe_ydl()
+            info = ydl.sanitize_info(ydl.extract_info(job.url, download=False))
+        self.queue.save_info(job.job_id, info)
+        return info
+
+    def extract_info(self, jobs: Sequence[DownloadJob], max_age: Optional[float] = INFO_TTL_SECONDS) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch metadata for many jobs concurrently without downloading
+
+        Info younger than ``max_age`` seconds is served from the queue.
+        Returns job_id -> info dict, or None where extraction failed.
+        """
+        self.queue.enqueue(job for job in jobs if self.queue.get(job.job_id) is None)
+
+        def probe(job: DownloadJob) -> Optional[Dict[str, Any]]:
+            cached = self.queue.load_info(job.job_id, max_age)
+            if cached is not None:
+                return cached
+            try:
+                return self._extract(job)
+            except Exception as e:  # yt-dlp raises DownloadError and friends
+                self.queue.finish(job.job_id, 'failed', error=f'info: {str(e)[:200]}')
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            infos = list(pool.map(probe, jobs))
+        return {job.job_id: info for job, info in zip(jobs, infos)}
+
+    # -- downloads -------------------------------------------------------
+
+    def _already_present(self, job: DownloadJob) -> Optional[DownloadResult]:
+        path = job.output_path
+        if not path.exists():
+            return None
+        row = self.queue.get(job.job_id)
+        size = path.stat().st_size
+        if row is not None and row['sha256'] and row['size_bytes'] == size:
+            if file_sha256(path) == row['sha256']:
+                return DownloadResult(job, 'skipped', 'Already downloaded (checksum match)', size, row['sha256'])
+            return None
+        if row is not None and row['sha256']:
+            return None  # size changed since it was recorded: fetch again
+        # Downloaded before it was tracked: adopt it
+        return DownloadResult(job, 'skipped', 'Already downloaded', size, file_sha256(path))
+
+    def _download(self, job: DownloadJob) -> DownloadResult:
+        present = self._already_present(job)
+        if present is not None:
+            return present
+        if job.output_path.exists():
+            job.output_path.unlink()  # checksum mismatch
+
+        job.output_path.parent.mkdir(parents=True, exist_ok=True)
+        info = self.queue.load_info(job.job_id, INFO_TTL_SECONDS)
+        ydl = self._ydl_factory(dict(self._base_opts, outtmpl=str(job.output_path)))
+        if info is not None:
+            ydl.process_ie_result(info, download=True)
+        else:
+            info = ydl.sanitize_info(ydl.extract_info(job.url, download=True))
+            self.queue.save_info(job.job_id, info)
+
+        if not job.output_path.exists():
+            return DownloadResult(job, 'failed', 'Video file not created', info=info)
+        size = job.output_path.stat().st_size
+        return DownloadResult(job, 'downloaded', 'OK', size, file_sha256(job.output_path), info)
+
+    def _claim(self, job_ids: Sequence[str]) -> Optional[DownloadJob]:
+        with self._cond:
+            while True:
+                busy = [domain for domain, active in self._active.items() if active >= self.domain_limit(domain)]
+                job = self.queue.claim(job_ids, busy)
+                if job is not None:
+                    self._active[job.domain] = self._active.get(job.domain, 0) + 1
+                    return job
+                # Nothing claimable: wait for a domain slot or a retry's backoff
+                if not self.queue.pending_count(job_ids):
+                    return None
+                self._cond.wait(timeout=1.0)
+
+    def _release(self, job: DownloadJob) -> None:
+        with self._cond:
+            self._active[job.domain] -= 1
+            self._cond.notify_all()
+
+    def run(
+        self,
+        jobs: Optional[Sequence[DownloadJob]] = None,
+        on_complete: Optional[Callable[[DownloadResult], None]] = None,
+    ) -> List[DownloadResult]:
+        """
+        Download ``jobs`` (or every pending job left in the queue)
+
+        ``on_complete`` is called from the worker thread right after each
+        successful download. Results come back in job order.
+        """
+        if jobs is None:
+            jobs = self.queue.pending_jobs()
+        else:
+            self.queue.enqueue(jobs)
+        job_ids = [job.job_id for job in jobs]
+        by_id = {job.job_id: job for job in jobs}
+        results: Dict[str, DownloadResult] = {}
+        results_lock = threading.Lock()
+
+        def worker() -> None:
+            while True:
+                job = self._claim(job_ids)
+                if job is None:
+                    return
+                job = by_id.get(job.job_id, job)
+                try:
+                    result = self._download(job)
+                except Exception as e:  # yt-dlp raises DownloadError and friends
+                    result = DownloadResult(job, 'failed', str(e)[:200])
+
+                try:
+                    if result.status == 'failed':
+                        row = self.queue.get(job.job_id)
+                        retry = row is not None and row['attempts'] < self.max_attempts
+                        not_before = None
+                        if retry:
+                            not_before = time.time() + self.retry_backoff * 2 ** (row['attempts'] - 1)
+                        self.queue.finish(job.job_id, 'pending' if retry else 'failed',
+                                          error=result.reason, not_before=not_before)
+                        if retry:
+                            continue
+                    else:
+                        self.queue.finish(job.job_id, 'done', sha256=result.sha256, size_bytes=result.size_bytes)
+                        if result.status == 'downloaded' and on_complete is not None:
+                            on_complete(result)
+                    with results_lock:
+                        results[job.job_id] = result
+                finally:
+                    self._release(job)
+
+        workers = min(self.max_workers, len(job_ids)) or 1
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return [
+            results.get(job_id) or DownloadResult(by_id[job_id], 'failed', 'Not processed')
+            for job_id in job_ids
+        ]
+
+    def close(self) -> None:
+        self.queue.close()
+
+    def __enter__(self) -> 'VideoDownloadManager':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,4 +1,26 @@
-"""Core models module"""
-from .model_registry import ModelRegistry, OllamaClient
+"""Core models module
 
-__all__ = ['ModelRegistry', 'OllamaClient']
+Exports resolve on first attribute access, so ``import core.models`` does
+not pull in submodules (or their provider SDKs) that a caller never uses.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    'BatchRequest': '.batch',
+    'BatchRunner': '.batch',
+    'ModelRegistry': '.model_registry',
+    'OllamaClient': '.model_registry',
+    'get_registry': '.model_registry',
+    'ModelRouter': '.router',
+    'TierManager': '.tier_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
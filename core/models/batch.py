@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Batch API - Offline submission through provider batch endpoints
+Serializes chat requests to the OpenAI Batch (JSONL file) and Anthropic
+Message Batches formats, tracks jobs in a local SQLite table, polls until
+they finish and maps results back to request ids
+
+Batch endpoints are billed at roughly half the synchronous price and have
+separate, much higher rate limits, at the cost of up to 24h turnaround.
+"""
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import requests
+
+ANTHROPIC_VERSION = '2023-06-01'
+FINAL_STATES = ('completed', 'failed', 'expired', 'cancelled', 'ended')
+
+
+@dataclass
+class BatchRequest:
+    """One chat request; custom_id must be unique within a batch"""
+    custom_id: str
+    messages: List[Dict[str, str]]
+    max_tokens: int = 4000
+    temperature: Optional[float] = None
+    json_mode: bool = False
+
+
+@dataclass
+class BatchStatus:
+    batch_id: str
+    status: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    results_ref: Optional[str] = None
+    errors_ref: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINAL_STATES
+
+
+def _response(content: str, usage: Dict[str, int]) -> Dict[str, Any]:
+    """Ollama-compatible response dict, as returned by the sync clients"""
+    return {
+        'message': {'role': 'assistant', 'content': content},
+        'done': True,
+        'usage': usage,
+    }
+
+
+class OpenAIBatchBackend:
+    """OpenAI Batch API (also works with OpenAI-compatible servers)"""
+
+    provider = 'openai'
+
+    def __init__(self, api_key: str, base_url: str = 'https://api.openai.com/v1',
+                 session: Optional[requests.Session] = None):
+        self.base_url = base_url.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {api_key}'
+
+    @staticmethod
+    def serialize(request: BatchRequest, model: str) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            'model': model,
+            'messages': request.messages,
+            'max_tokens': request.max_tokens,
+        }
+        if request.temperature is not None:
+            body['temperature'] = request.temperature
+        if request.json_mode:
+            body['response_format'] = {'type': 'json_object'}
+        return {
+            'custom_id': request.custom_id,
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': body,
+        }
+
+    def submit(self, requests_: Sequence[BatchRequest], model: str) -> str:
+        jsonl = '\n'.join(json.dumps(self.serialize(r, model)) for r in requests_) + '\n'
+        upload = self.session.post(
+            f'{self.base_url}/files',
+            data={'purpose': 'batch'},
+            files={'file': ('batch.jsonl', jsonl.encode('utf-8'), 'application/jsonl')},
+            timeout=120,
+        )
+        upload.raise_for_status()
+        batch = self.session.post(
+            f'{self.base_url}/batches',
+            json={
+                'input_file_id': upload.json()['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': '24h',
+            },
+            timeout=60,
+        )
+        batch.raise_for_status()
+        return batch.json()['id']
+
+    def status(self, batch_id: str) -> BatchStatus:
+        response = self.session.get(f'{self.base_url}/batches/{batch_id}', timeout=60)
+        response.raise_for_status()
+        data = response.json()
+        errors = (data.get('errors') or {}).get('data') or []
+        return BatchStatus(
+            batch_id=batch_id,
+            status=data['status'],
+            counts=data.get('request_counts') or {},
+            results_ref=data.get('output_file_id'),
+            errors_ref=data.get('error_file_id'),
+            error=errors[0].get('message') if errors else None,
+        )
+
+    def _file_lines(self, file_id: Optional[str]) -> List[str]:
+        if not file_id:
+            return []
+        response = self.session.get(f'{self.base_url}/files/{file_id}/content', timeout=300)
+        response.raise_for_status()
+        return response.text.splitlines()
+
+    def results(self, status: BatchStatus) -> Dict[str, Dict[str, Any]]:
+        """
+        custom_id -> {'response': dict} or {'error': str}
+
+        Successful requests are in the output file; failed ones are in a
+        separate error file (``error_file_id``).
+        """
+        results = {}
+        for line in self._file_lines(status.results_ref) + self._file_lines(status.errors_ref):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            reply = item.get('response') or {}
+            if item.get('error') or reply.get('status_code', 200) >= 400:
+                results[item['custom_id']] = {'error': json.dumps(item.get('error') or reply.get('body'))[:500]}
+                continue
+            body = reply['body']
+            usage = body.get('usage') or {}
+            results[item['custom_id']] = {'response': _response(
+                body['choices'][0]['message']['content'],
+                {
+                    'prompt_tokens': usage.get('prompt_tokens', 0),
+                    'completion_tokens': usage.get('completion_tokens', 0),
+                    'total_tokens': usage.get('total_tokens', 0),
+                },
+            )}
+        return results
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API"""
+
+    provider = 'anthropic'
+
+    def __init__(self, api_key: str, base_url: str = 'https://api.anthropic.com/v1',
+                 session: Optional[requests.Session] = None):
+        self.base_url = base_url.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers.update({'x-api-key': api_key, 'anthropic-version': ANTHROPIC_VERSION})
+
+    @staticmethod
+    def serialize(request: BatchRequest, model: str) -> Dict[str, Any]:
+        system = [m['content'] for m in request.messages if m['role'] == 'system']
+        params: Dict[str, Any] = {
+            'model': model,
+            'max_tokens': request.max_tokens,
+            'messages': [m for m in request.messages if m['role'] != 'system'],
+        }
+        if system:
+            params['system'] = '\n\n'.join(system)
+        if request.temperature is not None:
+            params['temperature'] = request.temperature
+        return {'custom_id': request.custom_id, 'params': params}
+
+    def submit(self, requests_: Sequence[BatchRequest], model: str) -> str:
+        response = self.session.post(
+            f'{self.base_url}/messages/batches',
+            json={'requests': [self.serialize(r, model) for r in requests_]},
+            timeout=120,
+        )
+        response.raise_for_status()
+        return response.json()['id']
+
+    def status(self, batch_id: str) -> BatchStatus:
+        response = self.session.get(f'{self.base_url}/messages/batches/{batch_id}', timeout=60)
+        response.raise_for_status()
+        data = response.json()
+        return BatchStatus(
+            batch_id=batch_id,
+            status=data['processing_status'],
+            counts=data.get('request_counts') or {},
+            results_ref=data.get('results_url'),
+        )
+
+    def results(self, status: BatchStatus) -> Dict[str, Dict[str, Any]]:
+        if not status.results_ref:
+            return {}
+        response = self.session.get(status.results_ref, timeout=300)
+        response.raise_for_status()
+        results = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            result = item['result']
+            if result['type'] != 'succeeded':
+                results[item['custom_id']] = {'error': json.dumps(result.get('error') or result['type'])[:500]}
+                continue
+            message = result['message']
+            usage = message.get('usage') or {}
+            input_tokens = usage.get('input_tokens', 0)
+            output_tokens = usage.get('output_tokens', 0)
+            text = ''.join(block.get('text', '') for block in message['content'] if block.get('type') == 'text')
+            results[item['custom_id']] = {'response': _response(text, {
+                'prompt_tokens': input_tokens,
+                'completion_tokens': output_tokens,
+                'total_tokens': input_tokens + output_tokens,
+            })}
+        return results
+
+
+class BatchJobStore:
+    """SQLite record of submitted batches and per-request results"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS batches (
+                    batch_id TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    request_count INTEGER NOT NULL,
+                    error TEXT,
+                    submitted_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS batch_requests (
+                    batch_id TEXT NOT NULL,
+                    custom_id TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    response_json TEXT,
+                    error TEXT,
+                    PRIMARY KEY (batch_id, custom_id)
+                );
+                """
+            )
+
+    def add_batch(self, batch_id: str, provider: str, model: str, custom_ids: Sequence[str]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO batches VALUES (?, ?, ?, ?, ?, NULL, ?, ?)',
+                (batch_id, provider, model, 'submitted', len(custom_ids), now, now),
+            )
+            self._conn.executemany(
+                'INSERT INTO batch_requests (batch_id, custom_id) VALUES (?, ?)',
+                [(batch_id, custom_id) for custom_id in custom_ids],
+            )
+
+    def update_status(self, status: BatchStatus) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE batches SET status = ?, error = ?, updated_at = ? WHERE batch_id = ?',
+                (status.status, status.error, time.time(), status.batch_id),
+            )
+
+    def save_results(self, batch_id: str, results: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            for custom_id, result in results.items():
+                self._conn.execute(
+                    """
+                    UPDATE batch_requests SET status = ?, response_json = ?, error = ?
+                    WHERE batch_id = ? AND custom_id = ?
+                    """,
+                    (
+                        'succeeded' if 'response' in result else 'errored',
+                        json.dumps(result['response']) if 'response' in result else None,
+                        result.get('error'),
+                        batch_id,
+                        custom_id,
+                    ),
+                )
+            # Requests the provider never reported back on
+            self._conn.execute(
+                "UPDATE batch_requests SET status = 'missing' WHERE batch_id = ? AND status = 'pending'",
+                (batch_id,),
+            )
+
+    def batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute('SELECT * FROM batches WHERE batch_id = ?', (batch_id,))
+            row = cursor.fetchone()
+            return dict(zip([c[0] for c in cursor.description], row)) if row else None
+
+    def open_batches(self, provider: Optional[str] = None) -> List[str]:
+        """Batches submitted but not yet collected (to resume after a restart)"""
+        query = 'SELECT batch_id FROM batches WHERE status NOT IN ({})'.format(','.join('?' * len(FINAL_STATES)))
+        params: List[Any] = list(FINAL_STATES)
+        if provider:
+            query += ' AND provider = ?'
+            params.append(provider)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query + ' ORDER BY submitted_at', params)]
+
+    def results(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT custom_id, status, response_json, error FROM batch_requests WHERE batch_id = ?',
+                (batch_id,),
+            ).fetchall()
+        return {
+            custom_id: {
+                'status': status,
+                'response': json.loads(response_json) if response_json else None,
+                'error': error,
+            }
+            for custom_id, status, response_json, error in rows
+        }
+
+
+class BatchRunner:
+    """
+    Submit, track and collect batches for one provider/model
+
+    Example:
+        runner = client.batch('data/batches.sqlite')
+        batch_id = runner.submit([BatchRequest('p1', messages)])
+        results = runner.wait(batch_id)   # custom_id -> {status, response, error}
+    """
+
+    def __init__(self, backend, model: str, store: BatchJobStore, poll_interval: float = 60.0):
+        self.backend = backend
+        self.model = model
+        self.store = store
+        self.poll_interval = poll_interval
+
+    def submit(self, requests_: Sequence[BatchRequest]) -> str:
+        ids = [r.custom_id for r in requests_]
+        if len(set(ids)) != len(ids):
+            raise ValueError('custom_id values must be unique within a batch')
+        batch_id = self.backend.submit(requests_, self.model)
+        self.store.add_batch(batch_id, self.backend.provider, self.model, ids)
+        return batch_id
+
+    def poll(self, batch_id: str) -> BatchStatus:
+        """Refresh status; on completion, download and store results"""
+        status = self.backend.status(batch_id)
+        if status.finished:
+            self.store.save_results(batch_id, self.backend.results(status))
+        self.store.update_status(status)
+        return status
+
+    def wait(self, batch_id: str, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Poll until the batch finishes
+
+        Raises:
+            TimeoutError: If timeout (seconds) passes first; the batch stays
+                recorded and can be collected later with wait()/resume()
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.poll(batch_id).finished:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f'Batch {batch_id} still running after {timeout}s')
+            time.sleep(self.poll_interval)
+        return self.store.results(batch_id)
+
+    def resume(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Wait for every open batch of this provider; batch_id -> results"""
+        return {
+            batch_id: self.wait(batch_id, timeout)
+            for batch_id in self.store.open_batches(self.backend.provider)
+        }
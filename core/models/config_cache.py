@@ -0,0 +1,41 @@
+"""
+Config Cache
+Parsed YAML config shared across callers, re-read only when the file changes
+"""
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import yaml
+
+_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+_lock = threading.Lock()
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file, memoized on (mtime, size)
+
+    The same parsed object is returned to every caller until the file
+    changes on disk, so treat it as read-only.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    with open(path) as f:
+        data = yaml.safe_load(f)
+
+    with _lock:
+        _cache[path] = (key, data)
+    return data
+
+
+def clear_config_cache() -> None:
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Fake Batch Server - Local stand-in for the provider batch endpoints
+Implements the subset of the OpenAI Batch and Anthropic Message Batches APIs
+used by core/models/batch.py, so batch jobs can be exercised end to end
+without API keys or cost
+
+Example:
+    with FakeBatchServer(responder=lambda req: '{"ok": true}') as server:
+        runner = BatchRunner(OpenAIBatchBackend('test', server.openai_url), 'gpt-4o-mini',
+                             BatchJobStore(tmp / 'batches.sqlite'), poll_interval=0)
+"""
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+
+def _echo(request: Dict[str, Any]) -> str:
+    """Default responder: reply with the last user message"""
+    messages = request.get('messages') or []
+    return json.dumps({'echo': messages[-1]['content'] if messages else ''})
+
+
+def _jsonl(lines) -> str:
+    return ''.join(json.dumps(line) + '\n' for line in lines)
+
+
+class FakeBatchServer:
+    """
+    Threaded HTTP server; batches finish after ``polls_to_complete`` status calls
+
+    ``responder`` receives the request body (OpenAI) or params (Anthropic)
+    and returns the reply text; raising marks that request as errored.
+    """
+
+    def __init__(self, responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 polls_to_complete: int = 1, host: str = '127.0.0.1', port: int = 0):
+        self.responder = responder or _echo
+        self.polls_to_complete = polls_to_complete
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def openai_url(self) -> str:
+        return f'{self.url}/openai/v1'
+
+    @property
+    def anthropic_url(self) -> str:
+        return f'{self.url}/anthropic/v1'
+
+    def start(self) -> 'FakeBatchServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeBatchServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # -- batch processing ------------------------------------------------
+
+    def _run(self, body: Dict[str, Any]):
+        """(reply text, None) or (None, error message)"""
+        try:
+            return self.responder(body), None
+        except Exception as e:
+            return None, str(e)
+
+    def _openai_output(self, input_file_id: str):
+        """(output JSONL, error JSONL); like OpenAI, failed requests go to the error file"""
+        lines = []
+        errors = []
+        for raw in self.files[input_file_id].decode('utf-8').splitlines():
+            if not raw.strip():
+                continue
+            item = json.loads(raw)
+            text, error = self._run(item['body'])
+            if error is not None:
+                errors.append({'custom_id': item['custom_id'], 'response': None,
+                               'error': {'code': 'responder_error', 'message': error}})
+                continue
+            prompt_tokens = sum(len(m['content'].split()) for m in item['body']['messages'])
+            completion_tokens = len(text.split())
+            lines.append({'custom_id': item['custom_id'], 'error': None, 'response': {
+                'status_code': 200,
+                'body': {
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}}],
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens,
+                    },
+                },
+            }})
+        return _jsonl(lines), _jsonl(errors)
+
+    def _anthropic_output(self, requests_) -> str:
+        lines = []
+        for item in requests_:
+            text, error = self._run(item['params'])
+            if error is not None:
+                result = {'type': 'errored', 'error': {'type': 'api_error', 'message': error}}
+            else:
+                input_tokens = sum(len(m['content'].split()) for m in item['params']['messages'])
+                result = {'type': 'succeeded', 'message': {
+                    'role': 'assistant',
+                    'content': [{'type': 'text', 'text': text}],
+                    'usage': {'input_tokens': input_tokens, 'output_tokens': len(text.split())},
+                }}
+            lines.append({'custom_id': item['custom_id'], 'result': result})
+        return _jsonl(lines)
+
+    def _poll(self, batch: Dict[str, Any]) -> None:
+        batch['polls'] += 1
+        if batch['polls'] < self.polls_to_complete or batch['done']:
+            return
+        batch['done'] = True
+        if batch['provider'] == 'openai':
+            output, errors = self._openai_output(batch['input_file_id'])
+            batch['output_file_id'] = self._add_file(output)
+            batch['error_file_id'] = self._add_file(errors)
+        else:
+            batch['output_file_id'] = self._add_file(self._anthropic_output(batch['requests']))
+
+    def _add_file(self, content: str) -> Optional[str]:
+        """Store a results file; None when it is empty, as OpenAI reports it"""
+        if not content:
+            return None
+        file_id = f'file-{uuid.uuid4().hex[:12]}'
+        self.files[file_id] = content.encode('utf-8')
+        return file_id
+
+    def _openai_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        return {
+            'id': batch_id,
+            'object': 'batch',
+            'status': 'completed' if batch['done'] else 'in_progress',
+            'output_file_id': batch.get('output_file_id'),
+            'error_file_id': batch.get('error_file_id'),
+            'request_counts': {'total': batch['total']},
+        }
+
+    def _anthropic_batch(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.batches[batch_id]
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if batch['done'] else 'in_progress',
+            'results_url': f"{self.anthropic_url}/messages/batches/{batch_id}/results" if batch['done'] else None,
+            'request_counts': {'processing': 0 if batch['done'] else batch['total']},
+        }
+
+    # -- HTTP --------------------------------------------------------------
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, payload: Any, content_type: str = 'application/json'):
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+            def do_POST(self):
+                with server._lock:
+                    if self.path == '/openai/v1/files':
+                        content = self._multipart_file(self._body())
+                        file_id = f'file-{uuid.uuid4().hex[:12]}'
+                        server.files[file_id] = content
+                        return self._send(200, {'id': file_id, 'object': 'file', 'purpose': 'batch'})
+                    if self.path == '/openai/v1/batches':
+                        data = json.loads(self._body())
+                        if data.get('input_file_id') not in server.files:
+                            return self._send(404, {'error': {'message': 'input file not found'}})
+                        total = sum(1 for line in server.files[data['input_file_id']].splitlines() if line.strip())
+                        batch_id = f'batch_{uuid.uuid4().hex[:12]}'
+                        server.batches[batch_id] = {'provider': 'openai', 'polls': 0, 'done': False,
+                                                    'input_file_id': data['input_file_id'], 'total': total}
+                        return self._send(200, server._openai_batch(batch_id))
+                    if self.path == '/anthropic/v1/messages/batches':
+                        if not self.headers.get('x-api-key'):
+                            return self._send(401, {'error': {'message': 'missing x-api-key'}})
+                        data = json.loads(self._body())
+                        batch_id = f'msgbatch_{uuid.uuid4().hex[:12]}'
+                        server.batches[batch_id] = {'provider': 'anthropic', 'polls': 0, 'done': False,
+                                                    'requests': data['requests'], 'total': len(data['requests'])}
+                        return self._send(200, server._anthropic_batch(batch_id))
+                self._send(404, {'error': {'message': f'no route for POST {self.path}'}})
+
+            def do_GET(self):
+                parts = self.path.strip('/').split('/')
+                with server._lock:
+                    if parts[:3] == ['openai', 'v1', 'batches'] and len(parts) == 4 and parts[3] in server.batches:
+                        server._poll(server.batches[parts[3]])
+                        return self._send(200, server._openai_batch(parts[3]))
+                    if parts[:3] == ['openai', 'v1', 'files'] and len(parts) == 5 and parts[4] == 'content':
+                        if parts[3] in server.files:
+                            return self._send(200, server.files[parts[3]], 'application/jsonl')
+                    if parts[:4] == ['anthropic', 'v1', 'messages', 'batches'] and len(parts) >= 5:
+                        batch = server.batches.get(parts[4])
+                        if batch is not None and len(parts) == 5:
+                            server._poll(batch)
+                            return self._send(200, server._anthropic_batch(parts[4]))
+                        if batch is not None and parts[5:] == ['results'] and batch['done']:
+                            return self._send(200, server.files[batch['output_file_id']], 'application/jsonl')
+                self._send(404, {'error': {'message': f'no route for GET {self.path}'}})
+
+            def _multipart_file(self, body: bytes) -> bytes:
+                """Content of the single file part in a multipart/form-data body"""
+                boundary = self.headers['Content-Type'].split('boundary=', 1)[1].encode('utf-8')
+                for part in body.split(b'--' + boundary):
+                    head, _, content = part.partition(b'\r\n\r\n')
+                    if b'filename=' in head:
+                        return content.rsplit(b'\r\n', 1)[0]
+                return b''
+
+        return Handler
@@ -2,16 +2,53 @@
 """
 Model Registry - Centralized Model Management
 Provides unified interface to all ML models used in the pipeline
+
+Provider SDKs (ollama, google.generativeai, openai, anthropic) are imported
+only when a client for that provider is built, so importing this module
+costs little more than PyYAML.
 """
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
-import ollama
-from dotenv import load_dotenv
-
-# Load environment variables from .env
-load_dotenv()
+from typing import Dict, Any, Iterator, Optional
+
+from .config_cache import load_yaml_cached
+from .prompt_cache import (
+    GeminiContextCache,
+    PromptCacheStats,
+    anthropic_system_blocks,
+    anthropic_usage,
+    gemini_usage,
+    openai_usage,
+)
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / 'config' / 'model_paths.yaml'
+
+_env_loaded = False
+_registries: Dict[Path, 'ModelRegistry'] = {}
+_registry_lock = threading.Lock()
+
+
+def _load_env():
+    """Load .env once per process (python-dotenv is optional)"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
+def get_registry(config_path: Optional[Path] = None) -> 'ModelRegistry':
+    """Shared ModelRegistry per config file, built on first use"""
+    path = Path(config_path or DEFAULT_CONFIG_PATH).resolve()
+    with _registry_lock:
+        if path not in _registries:
+            _registries[path] = ModelRegistry(path)
+        return _registries[path]
 
 
 class ModelRegistry:
@@ -21,29 +58,40 @@ class ModelRegistry:
         """
         Initialize model registry
 
+        Prefer get_registry(), which reuses one instance per config file.
+
         Args:
             config_path: Path to models.yaml config file
         """
-        if config_path is None:
-            project_root = Path(__file__).parent.parent.parent
-            config_path = project_root / 'config' / 'model_paths.yaml'
-
-        with open(config_path) as f:
-            self.config = yaml.safe_load(f)
+        _load_env()
+        self.config_path = Path(config_path or DEFAULT_CONFIG_PATH)
+        self._applied_config = None
 
         # Set environment variables for model paths
-        self._configure_environment()
+        self._refresh_config()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Parsed model_paths.yaml, reloaded when the file changes"""
+        return self._refresh_config()
 
-    def _configure_environment(self):
+    def _refresh_config(self) -> Dict[str, Any]:
+        config = load_yaml_cached(self.config_path)
+        if config is not self._applied_config:
+            self._configure_environment(config)
+            self._applied_config = config
+        return config
+
+    def _configure_environment(self, config: Dict[str, Any]):
         """Set up environment variables for models"""
-        if 'ollama' in self.config['models']:
-            os.environ['OLLAMA_MODELS'] = self.config['models']['ollama']['base_path']
+        if 'ollama' in config['models']:
+            os.environ['OLLAMA_MODELS'] = config['models']['ollama']['base_path']
 
-        if 'whisper' in self.config['models']:
-            os.environ['XDG_CACHE_HOME'] = self.config['models']['whisper']['cache_dir']
+        if 'whisper' in config['models']:
+            os.environ['XDG_CACHE_HOME'] = config['models']['whisper']['cache_dir']
 
-        if 'hubert' in self.config['models']:
-            os.environ['HF_HOME'] = self.config['models']['hubert']['cache_dir']
+        if 'hubert' in config['models']:
+            os.environ['HF_HOME'] = config['models']['hubert']['cache_dir']
 
     def get_whisper_config(self) -> Dict[str, Any]:
         """Get Whisper model configuration"""
@@ -164,11 +212,107 @@ class ModelRegistry:
             'max_tokens': 4000
         }
 
+    def create_client(self, model_type: str, temperature: float = 0.3):
+        """
+        Build a chat client for a model name from model_tiers.yaml
+
+        Args:
+            model_type: Model to use:
+                - Local: 'llama', 'deepseek-local'
+                - API Normal: 'deepseek-api', 'glm4', 'togetherai'
+                - API Premium: 'gemini', 'openai', 'anthropic'
+            temperature: Sampling temperature
+
+        Returns:
+            Client exposing chat(messages, temperature=None, max_tokens=None)
+        """
+        # Premium API Models
+        if model_type == 'gemini':
+            config = self.get_gemini_config()
+            return GeminiClient(
+                api_key=config['api_key'],
+                model=config['model'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        elif model_type == 'openai':
+            config = self.get_openai_config()
+            return OpenAIClient(
+                api_key=config['api_key'],
+                model=config['model'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        elif model_type == 'anthropic':
+            config = self.get_anthropic_config()
+            return AnthropicClient(
+                api_key=config['api_key'],
+                model=config['model'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        # Normal API Models
+        elif model_type == 'deepseek-api':
+            config = self.get_deepseek_api_config()
+            return DeepSeekAPIClient(
+                api_key=config['api_key'],
+                model=config['model'],
+                base_url=config['base_url'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        elif model_type == 'glm4':
+            config = self.get_glm4_config()
+            return GLM4Client(
+                api_key=config['api_key'],
+                model=config['model'],
+                base_url=config['base_url'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        elif model_type == 'togetherai':
+            config = self.get_togetherai_config()
+            return TogetherAIClient(
+                api_key=config['api_key'],
+                model=config['model'],
+                base_url=config['base_url'],
+                temperature=temperature,
+                max_tokens=config.get('max_tokens', 4000)
+            )
+        # Local Models
+        elif model_type == 'deepseek-local':
+            config = self.get_deepseek_local_config()
+            return OllamaClient(
+                model=config['model'],
+                temperature=temperature,
+                format='json'
+            )
+        else:  # llama (default)
+            config = self.get_llama_config()
+            return OllamaClient(
+                model=config['model'],
+                temperature=temperature,
+                format='json'
+            )
+
+
+def _stream_openai_compatible(client, **kwargs) -> Iterator[str]:
+    """Yield content deltas from an OpenAI-SDK chat completion stream"""
+    stream = client.chat.completions.create(stream=True, **kwargs)
+    try:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        # Closing early (e.g. on off-schema output) cancels the request
+        stream.close()
+
 
 class OllamaClient:
     """Wrapper for Ollama API calls"""
 
-    def __init__(self, model: str, temperature: float = 0.7, format: Optional[str] = None):
+    def __init__(self, model: str, temperature: float = 0.7, format: Optional[str] = None,
+                 keep_alive: Optional[str] = '30m'):
         """
         Initialize Ollama client
 
@@ -176,10 +320,17 @@ class OllamaClient:
             model: Model name (e.g., 'llava:latest', 'llama3.1:8b')
             temperature: Sampling temperature
             format: Output format ('json' for structured output)
+            keep_alive: How long the server keeps the model (and the KV cache
+                of the last prompt, reused when the next one shares its
+                prefix) loaded between calls; None uses the server default
         """
         self.model = model
         self.temperature = temperature
         self.format = format
+        self.keep_alive = keep_alive
+        self.cache_stats = PromptCacheStats()
+        # Context of the last generate() per prompt prefix
+        self._contexts: Dict[str, list] = {}
 
     def chat(
         self,
@@ -200,6 +351,40 @@ class OllamaClient:
         Returns:
             Response dict from Ollama
         """
+        import ollama
+
+        response = ollama.chat(**self._chat_kwargs(messages, temperature, format, max_tokens))
+        self.cache_stats.record(self._usage(response))
+        return response
+
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        format: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from Ollama as it is generated"""
+        import ollama
+
+        stream = ollama.chat(stream=True, **self._chat_kwargs(messages, temperature, format, max_tokens))
+        try:
+            for chunk in stream:
+                content = chunk['message']['content']
+                if content:
+                    yield content
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+
+    def _chat_kwargs(
+        self,
+        messages: list,
+        temperature: Optional[float],
+        format: Optional[str],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
         options = {
             'temperature': temperature if temperature is not None else self.temperature
         }
@@ -215,14 +400,32 @@ class OllamaClient:
 
         if format or self.format:
             kwargs['format'] = format or self.format
+        if self.keep_alive is not None:
+            kwargs['keep_alive'] = self.keep_alive
+
+        return kwargs
 
-        return ollama.chat(**kwargs)
+    @staticmethod
+    def _usage(response) -> Dict[str, int]:
+        """
+        Token counts from an Ollama response; prompt_eval_count covers only
+        tokens evaluated this call, so a prefix the server reused from its
+        KV cache is not counted
+        """
+        prompt_tokens = response.get('prompt_eval_count') or 0
+        completion_tokens = response.get('eval_count') or 0
+        return {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        }
 
     def generate(
         self,
         prompt: str,
         temperature: Optional[float] = None,
-        format: Optional[str] = None
+        format: Optional[str] = None,
+        system: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate text from prompt
@@ -231,6 +434,8 @@ class OllamaClient:
             prompt: Input prompt
             temperature: Override default temperature
             format: Override default format
+            system: Stable instructions; evaluated once, after which each
+                call resumes from the saved context instead of re-reading them
 
         Returns:
             Response dict from Ollama
@@ -247,15 +452,45 @@ class OllamaClient:
 
         if format or self.format:
             kwargs['format'] = format or self.format
+        if self.keep_alive is not None:
+            kwargs['keep_alive'] = self.keep_alive
+
+        import ollama
+
+        if not system:
+            response = ollama.generate(**kwargs)
+            self.cache_stats.record(self._usage(response))
+            return response
+
+        context = self._contexts.get(system)
+        if context is None:
+            # Evaluate the prefix alone (no output) and keep its context
+            primed = ollama.generate(
+                model=self.model,
+                prompt=system,
+                options={'num_predict': 0},
+                keep_alive=self.keep_alive
+            )
+            context = self._contexts[system] = primed.get('context') or []
+            self.cache_stats.record({
+                'prompt_tokens': primed.get('prompt_eval_count') or 0,
+                'cache_write_tokens': primed.get('prompt_eval_count') or 0,
+            })
 
-        return ollama.generate(**kwargs)
+        response = ollama.generate(context=context, **kwargs)
+        usage = self._usage(response)
+        usage['cached_tokens'] = len(context)
+        usage['prompt_tokens'] += len(context)
+        self.cache_stats.record(usage)
+        return response
 
 
 class GeminiClient:
     """Wrapper for Google Gemini API calls"""
 
     def __init__(self, api_key: str, model: str = 'gemini-2.0-flash-exp',
-                 temperature: float = 0.3, max_tokens: int = 4000):
+                 temperature: float = 0.3, max_tokens: int = 4000,
+                 cache_prompts: bool = True, cache_ttl_seconds: int = 3600):
         """
         Initialize Gemini client
 
@@ -264,6 +499,9 @@ class GeminiClient:
             model: Model name (default: gemini-2.0-flash-exp)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_prompts: Serve the system prompt from an explicit cached
+                content (falls back to inlining it when the API won't cache)
+            cache_ttl_seconds: Lifetime of each cached content
         """
         import google.generativeai as genai
 
@@ -280,6 +518,10 @@ class GeminiClient:
             model_name=model,
             generation_config=self.generation_config
         )
+        self.context_cache = (
+            GeminiContextCache(model, self.generation_config, cache_ttl_seconds) if cache_prompts else None
+        )
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -298,6 +540,41 @@ class GeminiClient:
         Returns:
             Response dict compatible with Ollama format
         """
+        response = self._send(messages, temperature, max_tokens)
+        usage = gemini_usage(getattr(response, 'usage_metadata', None))
+        self.cache_stats.record(usage)
+
+        # Return in Ollama-compatible format
+        return {
+            'message': {
+                'role': 'assistant',
+                'content': response.text
+            },
+            'done': True,
+            'usage': usage
+        }
+
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from Gemini as it is generated"""
+        usage_metadata = None
+        for chunk in self._send(messages, temperature, max_tokens, stream=True):
+            usage_metadata = getattr(chunk, 'usage_metadata', None) or usage_metadata
+            if chunk.text:
+                yield chunk.text
+        self.cache_stats.record(gemini_usage(usage_metadata))
+
+    def _send(
+        self,
+        messages: list,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        stream: bool = False
+    ):
         # Convert OpenAI-style messages to Gemini format
         # Gemini uses: [{'role': 'user', 'parts': ['text']}]
         gemini_messages = []
@@ -321,6 +598,19 @@ class GeminiClient:
         if max_tokens is not None:
             config['max_output_tokens'] = max_tokens
 
+        history = gemini_messages[:-1] if len(gemini_messages) > 1 else []
+
+        # Stable system prompt served from cache; only the suffix is sent
+        cached_model = self.context_cache.model_for(system_instruction) if (
+            system_instruction and self.context_cache
+        ) else None
+        if cached_model is not None:
+            return cached_model.start_chat(history=history).send_message(
+                gemini_messages[-1]['parts'][0],
+                generation_config=config,
+                stream=stream
+            )
+
         # Create chat session
         if system_instruction:
             chat = self.model.start_chat(
@@ -328,28 +618,21 @@ class GeminiClient:
             )
             # Prepend system instruction to first message
             user_message = gemini_messages[-1]['parts'][0]
-            response = chat.send_message(
+            return chat.send_message(
                 f"{system_instruction}\n\n{user_message}",
-                generation_config=config
+                generation_config=config,
+                stream=stream
             )
         else:
             chat = self.model.start_chat(
                 history=gemini_messages[:-1] if len(gemini_messages) > 1 else []
             )
-            response = chat.send_message(
+            return chat.send_message(
                 gemini_messages[-1]['parts'][0],
-                generation_config=config
+                generation_config=config,
+                stream=stream
             )
 
-        # Return in Ollama-compatible format
-        return {
-            'message': {
-                'role': 'assistant',
-                'content': response.text
-            },
-            'done': True
-        }
-
     def generate(
         self,
         prompt: str,
@@ -394,9 +677,11 @@ class OpenAIClient:
         from openai import OpenAI
 
         self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -413,32 +698,69 @@ class OpenAIClient:
             response_format={"type": "json_object"}
         )
 
+        usage = openai_usage(response.usage)
+        self.cache_stats.record(usage)
+
         return {
             'message': {
                 'role': 'assistant',
                 'content': response.choices[0].message.content
             },
             'done': True,
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+            'usage': usage
         }
 
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from OpenAI as it is generated"""
+        return _stream_openai_compatible(
+            self.client,
+            model=self.model,
+            messages=messages,
+            temperature=temperature if temperature is not None else self.temperature,
+            max_tokens=max_tokens if max_tokens is not None else self.max_tokens,
+            response_format={"type": "json_object"}
+        )
+
+    def batch(self, db_path: Path, base_url: Optional[str] = None, poll_interval: float = 60.0):
+        """
+        Runner for the OpenAI Batch API (about half price, up to 24h turnaround)
+
+        Args:
+            db_path: SQLite file tracking submitted batches
+            base_url: API root override (e.g. a local fake server)
+        """
+        from .batch import BatchJobStore, BatchRunner, OpenAIBatchBackend
+
+        backend = OpenAIBatchBackend(self.api_key, base_url or 'https://api.openai.com/v1')
+        return BatchRunner(backend, self.model, BatchJobStore(db_path), poll_interval)
+
 
 class AnthropicClient:
     """Wrapper for Anthropic Claude API calls"""
 
     def __init__(self, api_key: str, model: str = 'claude-3-5-sonnet-20241022',
-                 temperature: float = 0.3, max_tokens: int = 4000):
-        """Initialize Anthropic client"""
+                 temperature: float = 0.3, max_tokens: int = 4000, cache_prompts: bool = True):
+        """
+        Initialize Anthropic client
+
+        Args:
+            cache_prompts: Mark the system prompt with a cache breakpoint so
+                repeated calls read it from the prompt cache
+        """
         from anthropic import Anthropic
 
         self.client = Anthropic(api_key=api_key)
+        self.api_key = api_key
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_prompts = cache_prompts
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -447,6 +769,37 @@ class AnthropicClient:
         max_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
         """Send chat request to Claude"""
+        response = self.client.messages.create(**self._message_kwargs(messages, temperature, max_tokens))
+        usage = anthropic_usage(response.usage)
+        self.cache_stats.record(usage)
+
+        return {
+            'message': {
+                'role': 'assistant',
+                'content': response.content[0].text
+            },
+            'done': True,
+            'usage': usage
+        }
+
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from Claude as it is generated"""
+        with self.client.messages.stream(**self._message_kwargs(messages, temperature, max_tokens)) as stream:
+            for text in stream.text_stream:
+                yield text
+            self.cache_stats.record(anthropic_usage(stream.get_final_message().usage))
+
+    def _message_kwargs(
+        self,
+        messages: list,
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Dict[str, Any]:
         # Extract system message if present
         system_msg = None
         api_messages = []
@@ -465,22 +818,22 @@ class AnthropicClient:
         }
 
         if system_msg:
-            kwargs['system'] = system_msg
+            kwargs['system'] = anthropic_system_blocks(system_msg) if self.cache_prompts else system_msg
 
-        response = self.client.messages.create(**kwargs)
+        return kwargs
 
-        return {
-            'message': {
-                'role': 'assistant',
-                'content': response.content[0].text
-            },
-            'done': True,
-            'usage': {
-                'prompt_tokens': response.usage.input_tokens,
-                'completion_tokens': response.usage.output_tokens,
-                'total_tokens': response.usage.input_tokens + response.usage.output_tokens
-            }
-        }
+    def batch(self, db_path: Path, base_url: Optional[str] = None, poll_interval: float = 60.0):
+        """
+        Runner for Anthropic Message Batches (about half price, up to 24h turnaround)
+
+        Args:
+            db_path: SQLite file tracking submitted batches
+            base_url: API root override (e.g. a local fake server)
+        """
+        from .batch import AnthropicBatchBackend, BatchJobStore, BatchRunner
+
+        backend = AnthropicBatchBackend(self.api_key, base_url or 'https://api.anthropic.com/v1')
+        return BatchRunner(backend, self.model, BatchJobStore(db_path), poll_interval)
 
 
 class DeepSeekAPIClient:
@@ -496,6 +849,7 @@ class DeepSeekAPIClient:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -512,19 +866,34 @@ class DeepSeekAPIClient:
             response_format={"type": "json_object"}
         )
 
+        usage = openai_usage(response.usage)
+        self.cache_stats.record(usage)
+
         return {
             'message': {
                 'role': 'assistant',
                 'content': response.choices[0].message.content
             },
             'done': True,
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+            'usage': usage
         }
 
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from DeepSeek API as it is generated"""
+        return _stream_openai_compatible(
+            self.client,
+            model=self.model,
+            messages=messages,
+            temperature=temperature if temperature is not None else self.temperature,
+            max_tokens=max_tokens if max_tokens is not None else self.max_tokens,
+            response_format={"type": "json_object"}
+        )
+
 
 class GLM4Client:
     """Wrapper for GLM-4 API calls (OpenAI-compatible)"""
@@ -539,6 +908,7 @@ class GLM4Client:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -554,19 +924,33 @@ class GLM4Client:
             max_tokens=max_tokens if max_tokens is not None else self.max_tokens
         )
 
+        usage = openai_usage(response.usage)
+        self.cache_stats.record(usage)
+
         return {
             'message': {
                 'role': 'assistant',
                 'content': response.choices[0].message.content
             },
             'done': True,
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+            'usage': usage
         }
 
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from GLM-4 API as it is generated"""
+        return _stream_openai_compatible(
+            self.client,
+            model=self.model,
+            messages=messages,
+            temperature=temperature if temperature is not None else self.temperature,
+            max_tokens=max_tokens if max_tokens is not None else self.max_tokens
+        )
+
 
 class TogetherAIClient:
     """Wrapper for Together AI API calls (OpenAI-compatible)"""
@@ -581,6 +965,7 @@ class TogetherAIClient:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache_stats = PromptCacheStats()
 
     def chat(
         self,
@@ -597,15 +982,30 @@ class TogetherAIClient:
             response_format={"type": "json_object"}
         )
 
+        usage = openai_usage(response.usage)
+        self.cache_stats.record(usage)
+
         return {
             'message': {
                 'role': 'assistant',
                 'content': response.choices[0].message.content
             },
             'done': True,
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens,
-                'completion_tokens': response.usage.completion_tokens,
-                'total_tokens': response.usage.total_tokens
-            }
+            'usage': usage
         }
+
+    def stream_chat(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Stream response text from Together AI API as it is generated"""
+        return _stream_openai_compatible(
+            self.client,
+            model=self.model,
+            messages=messages,
+            temperature=temperature if temperature is not None else self.temperature,
+            max_tokens=max_tokens if max_tokens is not None else self.max_tokens,
+            response_format={"type": "json_object"}
+        )
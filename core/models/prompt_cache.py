@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Prompt Cache - Reuse of stable prompt prefixes across calls
+Callers put the fixed instructions in the system message (stable prefix) and
+per-item data in the user message (variable suffix); the clients then mark
+the prefix for provider-side caching and record cache hits per client
+
+Providers only cache prefixes above a minimum size (Anthropic: 1024 tokens
+for Sonnet/Opus, 2048 for Haiku; OpenAI: 1024, automatic; Gemini explicit
+caches: 4096+). Shorter prefixes are sent normally and simply show no hits.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Anthropic bills cache writes at 1.25x and reads at 0.1x the input price
+ANTHROPIC_CACHE_WRITE_MULTIPLIER = 1.25
+ANTHROPIC_CACHE_READ_MULTIPLIER = 0.1
+
+
+def split_messages(prefix: str, suffix: str) -> List[Dict[str, str]]:
+    """Chat messages with the cacheable prefix as the system prompt"""
+    return [
+        {'role': 'system', 'content': prefix},
+        {'role': 'user', 'content': suffix},
+    ]
+
+
+def anthropic_system_blocks(system: str) -> List[Dict[str, Any]]:
+    """System prompt as a content block with an ephemeral cache breakpoint"""
+    return [{'type': 'text', 'text': system, 'cache_control': {'type': 'ephemeral'}}]
+
+
+def anthropic_usage(usage) -> Dict[str, int]:
+    """
+    Normalize Anthropic usage; ``input_tokens`` there excludes cached tokens,
+    so prompt_tokens here is uncached + cache reads + cache writes
+    """
+    cached = getattr(usage, 'cache_read_input_tokens', None) or 0
+    written = getattr(usage, 'cache_creation_input_tokens', None) or 0
+    prompt_tokens = usage.input_tokens + cached + written
+    return {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': usage.output_tokens,
+        'total_tokens': prompt_tokens + usage.output_tokens,
+        'cached_tokens': cached,
+        'cache_write_tokens': written,
+    }
+
+
+def openai_usage(usage) -> Dict[str, int]:
+    """Normalize OpenAI-compatible usage (prefix caching is automatic there)"""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return {
+        'prompt_tokens': usage.prompt_tokens,
+        'completion_tokens': usage.completion_tokens,
+        'total_tokens': usage.total_tokens,
+        'cached_tokens': (getattr(details, 'cached_tokens', None) or 0) if details else 0,
+    }
+
+
+def gemini_usage(usage_metadata) -> Dict[str, int]:
+    """Normalize Gemini usage_metadata (None-safe: streams may omit it)"""
+    if usage_metadata is None:
+        return {}
+    return {
+        'prompt_tokens': getattr(usage_metadata, 'prompt_token_count', 0) or 0,
+        'completion_tokens': getattr(usage_metadata, 'candidates_token_count', 0) or 0,
+        'total_tokens': getattr(usage_metadata, 'total_token_count', 0) or 0,
+        'cached_tokens': getattr(usage_metadata, 'cached_content_token_count', 0) or 0,
+    }
+
+
+class PromptCacheStats:
+    """Running cache-hit totals for one client (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.cache_hits = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.cache_write_tokens = 0
+
+    def record(self, usage: Optional[Dict[str, int]]) -> None:
+        if not usage:
+            return
+        cached = usage.get('cached_tokens', 0)
+        with self._lock:
+            self.calls += 1
+            self.cache_hits += 1 if cached else 0
+            self.prompt_tokens += usage.get('prompt_tokens', 0)
+            self.cached_tokens += cached
+            self.cache_write_tokens += usage.get('cache_write_tokens', 0)
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of prompt tokens served from cache"""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'cache_hits': self.cache_hits,
+                'prompt_tokens': self.prompt_tokens,
+                'cached_tokens': self.cached_tokens,
+                'cache_write_tokens': self.cache_write_tokens,
+                'hit_rate': round(self.hit_rate, 4),
+            }
+
+
+class GeminiContextCache:
+    """
+    Explicit Gemini cached contents, one per (model, system prompt)
+
+    A prefix the API refuses to cache (too short, unsupported model) is
+    remembered so later calls skip straight to the uncached path.
+    """
+
+    def __init__(self, model_name: str, generation_config: Dict[str, Any], ttl_seconds: int = 3600):
+        self.model_name = model_name
+        self.generation_config = generation_config
+        self.ttl_seconds = ttl_seconds
+        # key -> (model or None, expires_at)
+        self._models: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def model_for(self, system_instruction: str):
+        """GenerativeModel bound to the cached prefix, or None if uncacheable"""
+        key = hashlib.sha256(system_instruction.encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None and (entry[0] is None or time.monotonic() < entry[1]):
+                return entry[0]
+            import google.generativeai as genai
+
+            try:
+                cached = genai.caching.CachedContent.create(
+                    model=self.model_name,
+                    display_name=f'prefix-{key[:12]}',
+                    system_instruction=system_instruction,
+                    ttl=f'{self.ttl_seconds}s'
+                )
+                model = genai.GenerativeModel.from_cached_content(
+                    cached_content=cached,
+                    generation_config=self.generation_config
+                )
+            except Exception:
+                model = None
+            # Recreate a little before the server-side TTL runs out
+            self._models[key] = (model, time.monotonic() + self.ttl_seconds * 0.9)
+            return model
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Model Router - Cost and Latency Aware Model Selection
+Routes chat calls to the cheapest model in a tier that meets the request
+class SLO, using latency/failure/cost observed on real calls, and fails
+over to the next-ranked model when a call errors
+"""
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .tier_manager import TierManager
+
+# Used when a model has no observed usage yet
+# (matches the cost_estimates assumption in model_tiers.yaml)
+DEFAULT_EXPECTED_TOKENS = {'input': 10_000, 'output': 4_000}
+
+
+@dataclass
+class RequestClassSLO:
+    """Latency/quality targets for one kind of request"""
+    max_p95_seconds: Optional[float] = None
+    max_failure_rate: float = 0.25
+    min_quality: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, raw: Dict[str, Any]) -> 'RequestClassSLO':
+        return cls(
+            max_p95_seconds=raw.get('max_p95_seconds'),
+            max_failure_rate=raw.get('max_failure_rate', 0.25),
+            min_quality=raw.get('min_quality'),
+        )
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class ModelStats:
+    """Rolling window of observed calls for one model"""
+
+    def __init__(self, window: int = 50):
+        self._calls: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.last_failure_at = 0.0
+
+    def record(self, latency: float, ok: bool, cost: Optional[float] = None,
+               tokens: Optional[Dict[str, int]] = None) -> None:
+        with self._lock:
+            self._calls.append((latency, ok, cost, tokens))
+            if ok:
+                self.consecutive_failures = 0
+            else:
+                self.consecutive_failures += 1
+                self.last_failure_at = time.monotonic()
+
+    def calls(self) -> List[tuple]:
+        with self._lock:
+            return list(self._calls)
+
+    @property
+    def samples(self) -> int:
+        return len(self._calls)
+
+    def latency_percentile(self, q: float) -> Optional[float]:
+        return _percentile([latency for latency, ok, _, _ in self.calls() if ok], q)
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.latency_percentile(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.latency_percentile(0.95)
+
+    @property
+    def failure_rate(self) -> float:
+        calls = self.calls()
+        if not calls:
+            return 0.0
+        return sum(1 for _, ok, _, _ in calls if not ok) / len(calls)
+
+    @property
+    def avg_cost(self) -> Optional[float]:
+        costs = [cost for _, ok, cost, _ in self.calls() if ok and cost is not None]
+        return sum(costs) / len(costs) if costs else None
+
+    def avg_tokens(self) -> Optional[Dict[str, float]]:
+        tokens = [t for _, ok, _, t in self.calls() if ok and t]
+        if not tokens:
+            return None
+        return {
+            'input': sum(t['input'] for t in tokens) / len(tokens),
+            'output': sum(t['output'] for t in tokens) / len(tokens),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'samples': self.samples,
+            'p50_seconds': self.p50,
+            'p95_seconds': self.p95,
+            'failure_rate': round(self.failure_rate, 3),
+            'avg_cost_usd': self.avg_cost,
+            'consecutive_failures': self.consecutive_failures,
+        }
+
+
+def usage_tokens(response: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """Input/output token counts from an OpenAI-style or Ollama response"""
+    usage = response.get('usage')
+    if usage:
+        return {'input': usage.get('prompt_tokens', 0), 'output': usage.get('completion_tokens', 0)}
+    if 'prompt_eval_count' in response or 'eval_count' in response:
+        return {'input': response.get('prompt_eval_count', 0), 'output': response.get('eval_count', 0)}
+    return None
+
+
+class ModelRouter:
+    """
+    Chooses and calls models for a subscription tier
+
+    Candidates are the tier's active models. Those whose observed p95
+    latency, failure rate and configured quality_score meet the request
+    class SLO are ranked by expected cost per call (observed average, else
+    tier pricing x expected tokens), ties broken by priority; models
+    missing the SLO follow in priority order as failover targets. Models
+    with too few samples are assumed to meet the latency and failure
+    targets so they get measured. A model that failed ``trip_after`` times
+    in a row sits out ``cooldown_seconds`` unless nothing else is left.
+
+    Routing settings come from the optional ``routing`` section of
+    model_tiers.yaml.
+    """
+
+    def __init__(
+        self,
+        tier_manager: Optional[TierManager] = None,
+        client_factory: Optional[Callable[[str], Any]] = None,
+        window: Optional[int] = None,
+    ):
+        """
+        Args:
+            tier_manager: Tier configuration (default: config/model_tiers.yaml)
+            client_factory: model name -> client with chat(messages, ...)
+                (default: ModelRegistry().create_client)
+            window: Calls kept per model for rolling stats
+        """
+        self.tier_manager = tier_manager or TierManager()
+        routing = self.tier_manager.get_routing_config()
+        self.window = window or routing.get('window', 50)
+        self.min_samples = routing.get('min_samples', 5)
+        self.trip_after = routing.get('trip_after', 3)
+        self.cooldown_seconds = routing.get('cooldown_seconds', 60)
+        self.expected_tokens = {**DEFAULT_EXPECTED_TOKENS, **routing.get('expected_tokens', {})}
+        self.request_classes = {
+            name: RequestClassSLO.from_config(raw or {})
+            for name, raw in routing.get('request_classes', {}).items()
+        }
+        self._client_factory = client_factory
+        self._clients: Dict[str, Any] = {}
+        self._stats: Dict[str, ModelStats] = {}
+        self._lock = threading.Lock()
+
+    def _factory(self) -> Callable[[str], Any]:
+        if self._client_factory is None:
+            from .model_registry import ModelRegistry
+            self._client_factory = ModelRegistry().create_client
+        return self._client_factory
+
+    def client(self, model_name: str) -> Any:
+        with self._lock:
+            if model_name not in self._clients:
+                self._clients[model_name] = self._factory()(model_name)
+            return self._clients[model_name]
+
+    def stats(self, model_name: str) -> ModelStats:
+        with self._lock:
+            if model_name not in self._stats:
+                self._stats[model_name] = ModelStats(self.window)
+            return self._stats[model_name]
+
+    def slo(self, request_class: str) -> RequestClassSLO:
+        return self.request_classes.get(request_class) or self.request_classes.get('default') or RequestClassSLO()
+
+    def expected_cost(self, model: Dict[str, Any]) -> float:
+        stats = self.stats(model['name'])
+        if stats.avg_cost is not None:
+            return stats.avg_cost
+        tokens = stats.avg_tokens() or self.expected_tokens
+        return self.cost_of(model, tokens)
+
+    @staticmethod
+    def cost_of(model: Dict[str, Any], tokens: Dict[str, float]) -> float:
+        pricing = model.get('pricing') or {}
+        return (
+            tokens['input'] * pricing.get('input_per_1m', 0.0)
+            + tokens['output'] * pricing.get('output_per_1m', 0.0)
+        ) / 1_000_000
+
+    def meets_slo(self, model: Dict[str, Any], slo: RequestClassSLO) -> bool:
+        if slo.min_quality is not None and (model.get('quality_score') or 0) < slo.min_quality:
+            return False  # unscored models do not meet a quality bar
+        stats = self.stats(model['name'])
+        if stats.samples < self.min_samples:
+            return True
+        if stats.failure_rate > slo.max_failure_rate:
+            return False
+        if slo.max_p95_seconds is not None and stats.p95 is not None and stats.p95 > slo.max_p95_seconds:
+            return False
+        return True
+
+    def _cooling_down(self, model_name: str) -> bool:
+        stats = self.stats(model_name)
+        return (
+            stats.consecutive_failures >= self.trip_after
+            and time.monotonic() - stats.last_failure_at < self.cooldown_seconds
+        )
+
+    def rank_models(
+        self,
+        subscription_tier: str,
+        request_class: str = 'default',
+        preferred_model: Optional[str] = None
+    ) -> List[str]:
+        """
+        Model names in the order they should be tried
+
+        Raises:
+            PermissionError: If the tier has no model access
+        """
+        available = self.tier_manager.get_available_models(subscription_tier)
+        if not available:
+            # Same error select_model raises for tiers without access
+            self.tier_manager.select_model(subscription_tier)
+
+        slo = self.slo(request_class)
+        meeting = [m for m in available if self.meets_slo(m, slo)]
+        missing = [m for m in available if m not in meeting]
+        meeting.sort(key=lambda m: (self.expected_cost(m), m.get('priority', 999)))
+        ranked = [m['name'] for m in meeting + missing]
+
+        if preferred_model:
+            self.tier_manager.select_model(subscription_tier, preferred_model)
+            ranked.remove(preferred_model)
+            ranked.insert(0, preferred_model)
+
+        healthy = [name for name in ranked if not self._cooling_down(name)]
+        return healthy + [name for name in ranked if name not in healthy]
+
+    def select_model(self, subscription_tier: str, request_class: str = 'default',
+                     preferred_model: Optional[str] = None) -> str:
+        """Best model for the next request of this class"""
+        return self.rank_models(subscription_tier, request_class, preferred_model)[0]
+
+    def chat(
+        self,
+        subscription_tier: str,
+        messages: list,
+        request_class: str = 'default',
+        preferred_model: Optional[str] = None,
+        validate: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a chat request, failing over down the ranked model list
+
+        Args:
+            subscription_tier: User's subscription tier
+            messages: Chat messages
+            request_class: Key into routing.request_classes
+            preferred_model: Try this model first
+            validate: Optional check on the response; raising counts as a
+                failed call (e.g. json.loads on malformed output)
+            **kwargs: Passed to the client's chat()
+
+        Returns:
+            Client response with 'model' (name used) and 'latency_seconds' added
+
+        Raises:
+            The last error if every model fails
+        """
+        models = {m['name']: m for m in self.tier_manager.get_available_models(subscription_tier)}
+        last_error: Optional[Exception] = None
+
+        for model_name in self.rank_models(subscription_tier, request_class, preferred_model):
+            stats = self.stats(model_name)
+            start = time.monotonic()
+            try:
+                response = self.client(model_name).chat(messages=messages, **kwargs)
+                if validate is not None:
+                    validate(response)
+            except Exception as e:
+                stats.record(time.monotonic() - start, ok=False)
+                last_error = e
+                continue
+
+            latency = time.monotonic() - start
+            tokens = usage_tokens(response)
+            cost = self.cost_of(models[model_name], tokens) if tokens and model_name in models else None
+            stats.record(latency, ok=True, cost=cost, tokens=tokens)
+            return {**response, 'model': model_name, 'latency_seconds': latency}
+
+        raise last_error or RuntimeError(f"No models available for {subscription_tier} tier")
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling stats per model"""
+        with self._lock:
+            stats = dict(self._stats)
+        return {name: model_stats.snapshot() for name, model_stats in stats.items()}
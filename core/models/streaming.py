@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON - Early validation of streamed model output
+Feeds streamed tokens through an incremental JSON checker so malformed or
+off-schema output is abandoned at the first bad character instead of after
+the whole completion has been paid for
+"""
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_NUMBER = re.compile(r'-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?$')
+_NUMBER_PREFIX = re.compile(r'-?(\d+(\.\d*)?([eE][+-]?\d*)?)?$')
+_LITERALS = ('true', 'false', 'null')
+_SCALAR_CHARS = set('0123456789+-.eEtrufalsn')
+
+# First character a value of each type can start with
+_TYPE_STARTS = {
+    dict: '{',
+    list: '[',
+    str: '"',
+    bool: 'tf',
+    int: '-0123456789',
+    float: '-0123456789',
+}
+
+
+class OffSchemaError(ValueError):
+    """Streamed output is not valid JSON or does not fit the expected shape"""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} (at char {position})")
+        self.position = position
+        self.metrics: Optional['StreamMetrics'] = None
+
+
+def _starts(expected) -> str:
+    if isinstance(expected, list):
+        return '['
+    if isinstance(expected, tuple):
+        return ''.join(_starts(t) for t in expected)
+    return _TYPE_STARTS.get(expected, '')
+
+
+class IncrementalJSONValidator:
+    """
+    Character-level JSON checker
+
+    Tracks container nesting, string/escape state and what token may come
+    next, raising OffSchemaError as soon as the text can no longer be valid.
+    With ``schema`` (top-level key -> type, e.g. ``{'pain_points': [dict]}``
+    for a list of objects), a known key whose value starts with the wrong
+    type is rejected when its first character arrives; with
+    ``allow_extra_keys=False`` so is any unknown top-level key. ``finish``
+    does the authoritative ``json.loads``.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, Any]] = None, allow_extra_keys: bool = True):
+        self.schema = schema or {}
+        self.allow_extra_keys = allow_extra_keys
+        self._parts: List[str] = []
+        self._pos = 0
+        # Each frame: [container, expecting, current key, element type]
+        self._stack: List[list] = []
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._key_chars: List[str] = []
+        self._scalar: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._parts)
+
+    def _fail(self, message: str):
+        raise OffSchemaError(message, self._pos)
+
+    def feed(self, chunk: str) -> None:
+        self._parts.append(chunk)
+        for char in chunk:
+            self._char(char)
+            self._pos += 1
+
+    def _expected_type(self):
+        """Schema type for the value about to start, if any"""
+        if len(self._stack) == 1 and self._stack[0][0] == 'object':
+            return self.schema.get(self._stack[0][2])
+        if len(self._stack) == 2 and self._stack[1][0] == 'array':
+            return self._stack[1][3]
+        return None
+
+    def _begin_value(self, char: str) -> None:
+        if not self._stack:
+            if self._done:
+                self._fail('Text after the JSON value')
+            if char != '{':
+                self._fail('Expected a JSON object')
+        else:
+            expected = self._expected_type()
+            if expected is not None and char not in _starts(expected):
+                self._fail(f"Wrong type for {self._stack[0][2] or 'item'!r}")
+            self._stack[-1][1] = 'comma_or_end'
+
+        if char == '{':
+            self._stack.append(['object', 'key_or_end', None, None])
+        elif char == '[':
+            element = None
+            expected = self._expected_type() if self._stack else None
+            if isinstance(expected, list) and expected:
+                element = expected[0]
+            self._stack.append(['array', 'value_or_end', None, element])
+        elif char == '"':
+            self._in_string = True
+            self._string_is_key = False
+        elif char in _SCALAR_CHARS:
+            self._scalar = [char]
+        else:
+            self._fail(f'Unexpected {char!r}')
+
+    def _end_scalar(self) -> None:
+        token = ''.join(self._scalar)
+        self._scalar = []
+        if token not in _LITERALS and not _NUMBER.match(token):
+            self._fail(f'Invalid literal {token!r}')
+
+    def _close(self, char: str) -> None:
+        container, expecting = self._stack[-1][0], self._stack[-1][1]
+        if (char == '}') != (container == 'object'):
+            self._fail(f'Mismatched {char!r}')
+        if expecting not in ('key_or_end', 'value_or_end', 'comma_or_end'):
+            self._fail(f'Unexpected {char!r}')
+        self._stack.pop()
+        if not self._stack:
+            self._done = True
+
+    def _char(self, char: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == '\\':
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._string_is_key:
+                    self._end_key()
+            elif self._string_is_key:
+                self._key_chars.append(char)
+            return
+
+        if self._scalar:
+            if char in _SCALAR_CHARS:
+                self._scalar.append(char)
+                token = ''.join(self._scalar)
+                if not (_NUMBER_PREFIX.match(token) or any(lit.startswith(token) for lit in _LITERALS)):
+                    self._fail(f'Invalid literal {token!r}')
+                return
+            self._end_scalar()
+
+        if char in ' \t\r\n':
+            return
+        if not self._stack:
+            self._begin_value(char)
+            return
+
+        frame = self._stack[-1]
+        expecting = frame[1]
+        if char in '}]':
+            self._close(char)
+        elif expecting in ('key', 'key_or_end'):
+            if char != '"':
+                self._fail('Expected an object key')
+            self._in_string = True
+            self._string_is_key = True
+            self._key_chars = []
+        elif expecting == 'colon':
+            if char != ':':
+                self._fail("Expected ':'")
+            frame[1] = 'value'
+        elif expecting == 'comma_or_end':
+            if char != ',':
+                self._fail("Expected ',' or end of container")
+            frame[1] = 'key' if frame[0] == 'object' else 'value'
+        else:  # value / value_or_end
+            self._begin_value(char)
+
+    def _end_key(self) -> None:
+        key = ''.join(self._key_chars)
+        frame = self._stack[-1]
+        frame[2] = key
+        frame[1] = 'colon'
+        if len(self._stack) == 1 and not self.allow_extra_keys and key not in self.schema:
+            self._fail(f'Unexpected key {key!r}')
+
+    def finish(self) -> Any:
+        """Parse the complete text; raises OffSchemaError if it is not valid"""
+        try:
+            data = json.loads(self.text)
+        except json.JSONDecodeError as e:
+            raise OffSchemaError(f'Incomplete or invalid JSON: {e.msg}', e.pos) from e
+        return data
+
+
+@dataclass
+class StreamMetrics:
+    """Timing for one streamed completion"""
+    started_at: float = field(default_factory=time.monotonic)
+    first_token_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    chunks: int = 0
+    chars: int = 0
+    aborted: bool = False
+    abort_reason: Optional[str] = None
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def total_seconds(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'time_to_first_token': self.time_to_first_token,
+            'total_seconds': self.total_seconds,
+            'chunks': self.chunks,
+            'chars': self.chars,
+            'aborted': self.aborted,
+            'abort_reason': self.abort_reason,
+        }
+
+
+def collect_json_stream(
+    tokens: Iterable[str],
+    schema: Optional[Dict[str, Any]] = None,
+    allow_extra_keys: bool = True,
+) -> Tuple[Any, StreamMetrics]:
+    """
+    Consume a token stream, validating as it arrives
+
+    On the first off-schema character the stream is closed (which cancels
+    the provider request) and OffSchemaError is raised with ``metrics``
+    attached.
+
+    Returns:
+        (parsed JSON, StreamMetrics)
+    """
+    validator = IncrementalJSONValidator(schema, allow_extra_keys)
+    metrics = StreamMetrics()
+    iterator: Iterator[str] = iter(tokens)
+    try:
+        for token in iterator:
+            if not token:
+                continue
+            if metrics.first_token_at is None:
+                metrics.first_token_at = time.monotonic()
+            metrics.chunks += 1
+            metrics.chars += len(token)
+            validator.feed(token)
+        data = validator.finish()
+    except OffSchemaError as e:
+        metrics.aborted = True
+        metrics.abort_reason = str(e)
+        e.metrics = metrics
+        raise
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+        metrics.finished_at = time.monotonic()
+    return data, metrics
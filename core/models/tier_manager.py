@@ -173,12 +173,17 @@ class TierManager:
             )
 
         # Default for tier
+        # (core.models.router.ModelRouter ranks by observed cost/latency instead)
         return self.get_default_model(subscription_tier)
 
     def get_tier_pricing(self, subscription_tier: str) -> Dict[str, str]:
         """Get cost estimates for a tier"""
         return self.config.get('cost_estimates', {}).get(subscription_tier, {})
 
+    def get_routing_config(self) -> Dict:
+        """Get router settings (request class SLOs, stats window)"""
+        return self.config.get('routing') or {}
+
     def get_tier_description(self, tier_name: str) -> str:
         """Get description of a tier"""
         tier = self.config['tiers'].get(tier_name)
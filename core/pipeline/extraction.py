@@ -6,12 +6,22 @@ Extracts Jobs-to-be-Done insights from combined transcript + visual analysis
 import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-import yaml
 
-from core.models.model_registry import (
-    ModelRegistry, OllamaClient, GeminiClient, OpenAIClient,
-    AnthropicClient, DeepSeekAPIClient, GLM4Client, TogetherAIClient
-)
+from core.models.config_cache import load_yaml_cached
+from core.models.model_registry import get_registry
+from core.models.router import ModelRouter
+from core.models.streaming import OffSchemaError, collect_json_stream
+
+# Expected shape of one chunk's insights; streamed output is abandoned as
+# soon as a known key starts with the wrong type
+INSIGHTS_SCHEMA = {
+    'pain_points': [dict],
+    'solutions': [dict],
+    'verbatims': [dict],
+    'golden_moments': [dict],
+    'product_adjacencies': [dict],
+    'metadata': dict,
+}
 
 
 class LLMExtractor:
@@ -21,7 +31,10 @@ class LLMExtractor:
         self,
         client_name: str,
         client_config_path: Optional[Path] = None,
-        model_type: str = 'gemini'
+        model_type: str = 'gemini',
+        router: Optional[ModelRouter] = None,
+        subscription_tier: str = 'pro',
+        stream: Optional[bool] = None
     ):
         """
         Initialize extractor with client configuration
@@ -33,9 +46,18 @@ class LLMExtractor:
                 - Local: 'llama', 'deepseek-local'
                 - API Normal: 'deepseek-api', 'glm4'
                 - API Premium: 'gemini', 'openai', 'anthropic'
+            router: Optional ModelRouter; when given, model_type is ignored
+                and each chunk goes to the cheapest model in subscription_tier
+                meeting the 'extraction' SLO, with automatic failover
+            subscription_tier: Tier the router picks models from
+            stream: Stream tokens and validate JSON as it arrives, retrying
+                as soon as output goes off-schema (default: prompts.yaml
+                'stream' setting, else False). Not used with a router.
         """
         self.client_name = client_name
         self.model_type = model_type
+        self.router = router
+        self.subscription_tier = subscription_tier
 
         # Load client configuration
         if client_config_path is None:
@@ -45,95 +67,27 @@ class LLMExtractor:
         self.config_path = client_config_path
         self.config = self._load_config()
         self.prompts = self._load_prompts()
+        self.stream = self.prompts.get('stream', False) if stream is None else stream
+        self.stream_metrics: List[Dict[str, Any]] = []
 
         # Initialize model based on type
-        self.registry = ModelRegistry()
-        self.llm = self._initialize_model()
+        self.registry = get_registry()
+        self.llm = None if router else self._initialize_model()
 
     def _initialize_model(self):
         """Initialize the appropriate model client"""
-        temp = self.prompts.get('temperature', 0.3)
-
-        # Premium API Models
-        if self.model_type == 'gemini':
-            config = self.registry.get_gemini_config()
-            return GeminiClient(
-                api_key=config['api_key'],
-                model=config['model'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        elif self.model_type == 'openai':
-            config = self.registry.get_openai_config()
-            return OpenAIClient(
-                api_key=config['api_key'],
-                model=config['model'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        elif self.model_type == 'anthropic':
-            config = self.registry.get_anthropic_config()
-            return AnthropicClient(
-                api_key=config['api_key'],
-                model=config['model'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        # Normal API Models
-        elif self.model_type == 'deepseek-api':
-            config = self.registry.get_deepseek_api_config()
-            return DeepSeekAPIClient(
-                api_key=config['api_key'],
-                model=config['model'],
-                base_url=config['base_url'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        elif self.model_type == 'glm4':
-            config = self.registry.get_glm4_config()
-            return GLM4Client(
-                api_key=config['api_key'],
-                model=config['model'],
-                base_url=config['base_url'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        elif self.model_type == 'togetherai':
-            config = self.registry.get_togetherai_config()
-            return TogetherAIClient(
-                api_key=config['api_key'],
-                model=config['model'],
-                base_url=config['base_url'],
-                temperature=temp,
-                max_tokens=config.get('max_tokens', 4000)
-            )
-        # Local Models
-        elif self.model_type == 'deepseek-local':
-            config = self.registry.get_deepseek_local_config()
-            return OllamaClient(
-                model=config['model'],
-                temperature=temp,
-                format='json'
-            )
-        else:  # llama (default)
-            config = self.registry.get_llama_config()
-            return OllamaClient(
-                model=config['model'],
-                temperature=temp,
-                format='json'
-            )
+        return self.registry.create_client(
+            self.model_type,
+            temperature=self.prompts.get('temperature', 0.3)
+        )
 
     def _load_config(self) -> Dict[str, Any]:
         """Load client configuration"""
-        config_file = self.config_path / 'config.yaml'
-        with open(config_file) as f:
-            return yaml.safe_load(f)
+        return load_yaml_cached(self.config_path / 'config.yaml')
 
     def _load_prompts(self) -> Dict[str, Any]:
         """Load extraction prompts"""
-        prompts_file = self.config_path / 'prompts.yaml'
-        with open(prompts_file) as f:
-            return yaml.safe_load(f)
+        return load_yaml_cached(self.config_path / 'prompts.yaml')
 
     def extract_insights(
         self,
@@ -177,6 +131,13 @@ class LLMExtractor:
         print(f"   ✅ Extracted {len(validated.get('pain_points', []))} pain points, "
               f"{len(validated.get('solutions', []))} solutions")
 
+        # The system prompt is the stable prefix shared by every chunk
+        cache_stats = getattr(self.llm, 'cache_stats', None)
+        if cache_stats is not None and cache_stats.calls:
+            stats = cache_stats.to_dict()
+            print(f"   🗄️  Prompt cache: {stats['cached_tokens']:,}/{stats['prompt_tokens']:,} "
+                  f"prompt tokens cached ({stats['hit_rate']:.0%})")
+
         return validated
 
     def _merge_sources(
@@ -318,10 +279,34 @@ class LLMExtractor:
 
         for attempt in range(max_retries + 1):
             try:
-                response = self.llm.chat(
-                    messages=messages,
-                    max_tokens=self.prompts.get('max_tokens', 4000)
-                )
+                if self.router:
+                    # Malformed JSON counts as a failed call so the router
+                    # fails over instead of waiting out the retry delay
+                    response = self.router.chat(
+                        self.subscription_tier,
+                        messages,
+                        request_class='extraction',
+                        validate=lambda r: json.loads(r['message']['content']),
+                        temperature=self.prompts.get('temperature', 0.3),
+                        max_tokens=self.prompts.get('max_tokens', 4000)
+                    )
+                elif self.stream and hasattr(self.llm, 'stream_chat'):
+                    insights, metrics = collect_json_stream(
+                        self.llm.stream_chat(
+                            messages=messages,
+                            max_tokens=self.prompts.get('max_tokens', 4000)
+                        ),
+                        schema=INSIGHTS_SCHEMA
+                    )
+                    self.stream_metrics.append(metrics.to_dict())
+                    print(f"      ⏱️  First token {metrics.time_to_first_token or 0:.2f}s, "
+                          f"done {metrics.total_seconds:.1f}s")
+                    return insights
+                else:
+                    response = self.llm.chat(
+                        messages=messages,
+                        max_tokens=self.prompts.get('max_tokens', 4000)
+                    )
 
                 # Parse JSON response
                 content = response['message']['content']
@@ -329,6 +314,15 @@ class LLMExtractor:
 
                 return insights
 
+            except OffSchemaError as e:
+                # Aborted mid-stream: retry right away, nothing to back off from
+                if e.metrics is not None:
+                    self.stream_metrics.append(e.metrics.to_dict())
+                print(f"      ⚠️  Off-schema output, aborted (attempt {attempt+1}/{max_retries+1}): {str(e)[:80]}")
+                if attempt == max_retries:
+                    print(f"      ❌ Failed to parse LLM response after {max_retries+1} attempts")
+                    return None
+
             except json.JSONDecodeError as e:
                 print(f"      ⚠️  JSON parse error (attempt {attempt+1}/{max_retries+1}): {str(e)[:50]}")
                 if attempt < max_retries:
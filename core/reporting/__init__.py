@@ -0,0 +1,10 @@
+"""Core reporting module"""
+from .deck import Asset, Deck, Slide
+from .excel_writer import Column, StreamingWorkbook, font_style, header_style
+from .html import NarrativeCache, TemplateRenderer
+
+__all__ = [
+    'Asset', 'Deck', 'Slide',
+    'Column', 'StreamingWorkbook', 'font_style', 'header_style',
+    'NarrativeCache', 'TemplateRenderer',
+]
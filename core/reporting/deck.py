@@ -0,0 +1,230 @@
+"""
+Deck Builder - Declarative slides with cached, parallel asset rendering
+Slides are described as builder + content; charts/images render once per data hash
+
+A deck is a list of ``Slide`` specs. Each spec names a builder function
+(which draws shapes onto a python-pptx slide) and the content it draws, so
+the content of a 60-slide deck reads as data rather than drawing code.
+
+Rendered assets (charts, generated images) are the expensive part of a
+build. Each ``Asset`` is keyed by its render function and data, stored in a
+cache directory, and only re-rendered when that key changes; misses render
+in a process pool. Assembling the pptx itself stays in-process (python-pptx
+objects cannot cross process boundaries) and takes milliseconds per slide,
+so editing one slide rebuilds the deck in seconds.
+"""
+
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .html import state_hash
+
+try:
+    from pptx import Presentation
+    HAS_PPTX = True
+except ImportError:
+    HAS_PPTX = False
+
+
+def _source(func: Callable) -> str:
+    """Function source (so editing a chart function invalidates its assets)"""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return ""
+
+
+@dataclass
+class Asset:
+    """
+    File rendered from data, e.g. a chart image
+
+    ``render(data, path)`` must be a module-level function (it runs in a
+    worker process) and must depend only on ``data``: the cache key covers
+    the function's own source and ``data``, not globals or helpers it calls.
+    """
+    render: Callable[[Dict[str, Any], Path], None]
+    data: Dict[str, Any] = field(default_factory=dict)
+    suffix: str = ".png"
+
+    def key(self) -> str:
+        return state_hash({
+            'render': f"{self.render.__module__}.{self.render.__qualname__}",
+            'source': _source(self.render),
+            'data': self.data,
+            'suffix': self.suffix,
+        })
+
+
+@dataclass
+class Slide:
+    """
+    One slide: ``builder(slide, **content, **asset_paths)``
+
+    Args:
+        builder: Draws the slide's shapes from keyword content
+        content: Text, rows and other values passed to the builder
+        assets: Name -> Asset; the builder receives each rendered file's Path
+            under that name
+        layout: Slide layout index for new slides
+        notes: Speaker notes
+        existing: Fill this existing template slide instead of adding one;
+            the spec is skipped if the template has no slide at that index
+    """
+    builder: Callable[..., None]
+    content: Dict[str, Any] = field(default_factory=dict)
+    assets: Dict[str, Asset] = field(default_factory=dict)
+    layout: int = 6
+    notes: str = ""
+    existing: Optional[int] = None
+
+
+def _render_asset(render: Callable, data: Dict[str, Any], path: str) -> str:
+    """Render to a temp file, then move into place (no partial cache entries)"""
+    target = Path(path)
+    # Keep the suffix: renderers pick the output format from it
+    tmp = target.with_name(f"{target.stem}.{os.getpid()}.tmp{target.suffix}")
+    render(data, tmp)
+    os.replace(tmp, target)
+    return path
+
+
+class Deck:
+    """
+    Declarative presentation, built onto a blank or template deck
+
+    Example:
+        deck = Deck(width=Inches(10), height=Inches(5.625))
+        deck.add(Slide(title_slide, {'title': "Market Overview"}))
+        deck.add(Slide(chart_slide, {'title': "Share"},
+                       assets={'chart': Asset(render_share_chart, {'shares': shares})}))
+        deck.build(OUTPUT_DIR / "deck.pptx")
+    """
+
+    def __init__(
+        self,
+        template: Optional[Path] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        clear_template: bool = False,
+        cache_dir: Optional[Path] = None
+    ):
+        """
+        Args:
+            template: Base .pptx (masters, layouts and any slides to keep)
+            width: Slide width in EMU (e.g. ``Inches(10)``); template size if None
+            height: Slide height in EMU
+            clear_template: Drop the template's existing slides, keep its layouts
+            cache_dir: Rendered asset cache (default: ``.deck_cache`` next to
+                the output file)
+        """
+        if not HAS_PPTX:
+            raise ImportError("python-pptx not installed. Run: pip install python-pptx")
+        self.template = Path(template) if template else None
+        self.width = width
+        self.height = height
+        self.clear_template = clear_template
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.slides: List[Slide] = []
+        self.rendered_assets = 0
+
+    def __len__(self) -> int:
+        return len(self.slides)
+
+    def add(self, *slides: Slide) -> "Deck":
+        self.slides.extend(slides)
+        return self
+
+    def extend(self, slides: Iterable[Slide]) -> "Deck":
+        self.slides.extend(slides)
+        return self
+
+    def render_assets(self, cache_dir: Path, max_workers: Optional[int] = None) -> Dict[str, Path]:
+        """
+        Render every asset not already cached
+
+        Args:
+            cache_dir: Directory holding ``<key><suffix>`` files
+            max_workers: Worker processes for cache misses (default: CPU count)
+
+        Returns:
+            asset key -> rendered file
+        """
+        cache_dir = Path(cache_dir)
+        paths: Dict[str, Path] = {}
+        # Slides sharing a chart share one render
+        pending: Dict[str, Asset] = {}
+        for spec in self.slides:
+            for asset in spec.assets.values():
+                key = asset.key()
+                path = cache_dir / f"{key}{asset.suffix}"
+                paths[key] = path
+                if not path.exists():
+                    pending.setdefault(key, asset)
+
+        self.rendered_assets = len(pending)
+        if not pending:
+            return paths
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        jobs = [(a.render, a.data, str(paths[key])) for key, a in pending.items()]
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            # A single miss is faster inline than starting a pool
+            for job in jobs:
+                _render_asset(*job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_render_asset, *zip(*jobs)))
+        return paths
+
+    def build(self, output_path: Path, max_workers: Optional[int] = None) -> Path:
+        """
+        Render changed assets, assemble every slide and save
+
+        Args:
+            output_path: Destination .pptx
+            max_workers: Worker processes for asset rendering
+
+        Returns:
+            Path of the saved presentation
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_dir = self.cache_dir or output_path.parent / ".deck_cache"
+        paths = self.render_assets(cache_dir, max_workers)
+
+        prs = Presentation(str(self.template)) if self.template else Presentation()
+        if self.width is not None:
+            prs.slide_width = self.width
+        if self.height is not None:
+            prs.slide_height = self.height
+        if self.clear_template:
+            _clear_slides(prs)
+
+        for spec in self.slides:
+            if spec.existing is not None:
+                if not 0 <= spec.existing < len(prs.slides):
+                    continue
+                slide = prs.slides[spec.existing]
+            else:
+                slide = prs.slides.add_slide(prs.slide_layouts[spec.layout])
+            asset_paths = {name: paths[asset.key()] for name, asset in spec.assets.items()}
+            spec.builder(slide, **spec.content, **asset_paths)
+            if spec.notes:
+                slide.notes_slide.notes_text_frame.text = spec.notes
+
+        prs.save(str(output_path))
+        return output_path
+
+
+def _clear_slides(prs) -> None:
+    """Remove all slides, keeping masters and layouts"""
+    while len(prs.slides) > 0:
+        rId = prs.slides._sldIdLst[0].rId
+        prs.part.drop_rel(rId)
+        del prs.slides._sldIdLst[0]
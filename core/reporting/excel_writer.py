@@ -0,0 +1,239 @@
+"""
+Streaming Excel Writer
+Write-only (constant memory) xlsx export with styles defined once per column
+
+openpyxl's regular workbooks keep every cell in memory, and styling them
+afterwards means visiting each cell again. Here rows are streamed straight
+to disk and each column's style is resolved once, then shared by every cell
+in that column, so large exports stay fast and memory stays flat.
+"""
+
+from copy import copy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.datavalidation import DataValidation
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+WRAP_STYLE = "wrap_top"
+
+
+@dataclass
+class Column:
+    """Column spec: header text, width and the named style for body cells"""
+    header: str
+    width: Optional[float] = None
+    style: Optional[str] = WRAP_STYLE
+
+
+def header_style(
+    name: str,
+    fill_color: Optional[str] = None,
+    font_color: Optional[str] = None,
+    wrap: bool = True
+) -> "NamedStyle":
+    """Bold, centered header style, optionally on a solid fill"""
+    style = NamedStyle(name=name)
+    style.font = Font(bold=True, color=font_color)
+    style.alignment = Alignment(horizontal="center", vertical="center", wrap_text=wrap)
+    if fill_color:
+        style.fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+    return style
+
+
+def font_style(name: str, **font) -> "NamedStyle":
+    """Named style that only sets a font (title and label cells)"""
+    style = NamedStyle(name=name)
+    style.font = Font(**font)
+    return style
+
+
+class StreamingWorkbook:
+    """
+    Write-only workbook; sheets are written in the order they are added
+
+    Example:
+        with StreamingWorkbook(path) as book:
+            book.add_named_style(header_style("header_blue", "0066CC", "FFFFFF"))
+            book.write_rows("Themes", [Column("#", 5), Column("Theme", 25)], rows,
+                            header="header_blue")
+
+    Rows may be any iterable (generators are consumed lazily). A sheet must
+    be complete before the next one starts: write-only sheets cannot be
+    revisited.
+    """
+
+    def __init__(self, path: Path):
+        if not HAS_OPENPYXL:
+            raise ImportError("openpyxl not installed. Run: pip install openpyxl")
+        self.path = Path(path)
+        self.workbook = Workbook(write_only=True)
+        self._styles: Dict[str, NamedStyle] = {}
+        self.add_named_style(header_style("header"))
+        wrap = NamedStyle(name=WRAP_STYLE)
+        wrap.font = DEFAULT_FONT
+        wrap.alignment = Alignment(wrap_text=True, vertical="top")
+        self.add_named_style(wrap)
+
+    def __enter__(self) -> "StreamingWorkbook":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.save()
+
+    def add_named_style(self, style: "NamedStyle") -> str:
+        """Register a style once; cells then refer to it by name"""
+        if style.name not in self._styles:
+            self.workbook.add_named_style(style)
+            self._styles[style.name] = style
+        return style.name
+
+    def _template(self, sheet, style: Optional[str]):
+        """Style array shared by every cell using ``style`` (None = default)"""
+        if style is None:
+            return None
+        if style not in self._styles:
+            raise KeyError(f"Unknown named style {style!r}; add it with add_named_style()")
+        cell = WriteOnlyCell(sheet)
+        cell.style = style
+        return cell._style
+
+    def cell(self, sheet, value: Any, style: Optional[str] = None):
+        """Single styled cell, for free-form rows passed to ``append``"""
+        cell = WriteOnlyCell(sheet, value)
+        if style is not None:
+            cell.style = style
+        return cell
+
+    def create_sheet(self, name: str, widths: Optional[Sequence[Optional[float]]] = None):
+        """Empty write-only sheet for free-form content (titles, label/value pairs)"""
+        sheet = self.workbook.create_sheet(name)
+        for index, width in enumerate(widths or [], 1):
+            if width:
+                sheet.column_dimensions[get_column_letter(index)].width = width
+        return sheet
+
+    def merge(self, sheet, cell_range: str) -> None:
+        """Merge a range (e.g. "A1:D1") on a write-only sheet"""
+        sheet.merged_cells.add(cell_range)
+
+    def write_rows(
+        self,
+        name: str,
+        columns: Sequence[Column],
+        rows: Iterable[Sequence[Any]],
+        header: Optional[str] = "header",
+        freeze_header: bool = True,
+        hidden: bool = False,
+        validations: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Stream a table into a new sheet
+
+        Args:
+            name: Sheet title
+            columns: Column specs, in order
+            rows: Row value sequences, matching ``columns``
+            header: Named style for the header row (None = unstyled)
+            freeze_header: Keep the header visible while scrolling
+            hidden: Hide the sheet (e.g. lookup lists for dropdowns)
+            validations: Column header -> list formula (e.g. "=Lists!$A$2:$A$5")
+                applied as an in-cell dropdown over all data rows
+
+        Returns:
+            Number of data rows written
+        """
+        sheet = self.create_sheet(name, [c.width for c in columns])
+        if hidden:
+            sheet.sheet_state = "hidden"
+        if freeze_header:
+            sheet.freeze_panes = "A2"
+
+        header_template = self._template(sheet, header)
+        sheet.append([self._styled(sheet, c.header, header_template) for c in columns])
+
+        templates = [self._template(sheet, c.style) for c in columns]
+        styled = [i for i, t in enumerate(templates) if t is not None]
+        count = 0
+        for values in rows:
+            values = list(values)
+            for i in styled:
+                if i < len(values):
+                    values[i] = self._styled(sheet, values[i], templates[i])
+            sheet.append(values)
+            count += 1
+
+        if validations:
+            index = {c.header: i for i, c in enumerate(columns, 1)}
+            for column_header, formula in validations.items():
+                letter = get_column_letter(index[column_header])
+                validation = DataValidation(type="list", formula1=formula, allow_blank=False)
+                validation.add(f"{letter}2:{letter}{max(count + 1, 2)}")
+                sheet.data_validations.append(validation)
+        return count
+
+    def write_dataframe(self, name: str, frame, columns: Optional[Sequence[Column]] = None, **kwargs) -> int:
+        """
+        Stream a pandas DataFrame (index dropped) via ``write_rows``
+
+        Args:
+            columns: Specs for the frame's columns, in order (default: headers
+                from the frame, wrapped body style, no widths)
+        """
+        if columns is None:
+            columns = [Column(str(c)) for c in frame.columns]
+        # itertuples avoids building a Series per row
+        rows = (
+            [None if _is_missing(v) else v for v in row]
+            for row in frame.itertuples(index=False, name=None)
+        )
+        return self.write_rows(name, columns, rows, **kwargs)
+
+    def save(self) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.workbook.save(self.path)
+        return self.path
+
+    @staticmethod
+    def _styled(sheet, value: Any, template):
+        if template is None:
+            return value
+        cell = WriteOnlyCell(sheet, value)
+        date_format = cell.number_format if cell.is_date else None
+        cell._style = template
+        if date_format and template.numFmtId == 0:
+            # The template's General format would show dates as serial
+            # numbers; give this cell its own copy with the date format
+            cell._style = copy(template)
+            cell.number_format = date_format
+        return cell
+
+
+def _is_missing(value: Any) -> bool:
+    """NaN/NaT check without importing pandas"""
+    return value is None or (isinstance(value, float) and value != value) or type(value).__name__ == "NaTType"
+
+
+def list_formula(sheet: str, column: int, count: int) -> str:
+    """Absolute range formula over rows 2..count+1 of a lookup column"""
+    letter = get_column_letter(column)
+    return f"={sheet}!${letter}$2:${letter}${count + 1}"
+
+
+def lists_rows(lists: Sequence[Sequence[Any]]) -> List[List[Any]]:
+    """Transpose value lists into rows for a lookup sheet (ragged columns padded)"""
+    height = max((len(values) for values in lists), default=0)
+    return [
+        [values[i] if i < len(values) else None for values in lists]
+        for i in range(height)
+    ]
@@ -0,0 +1,170 @@
+"""
+HTML Report Rendering - Shared Jinja environment and narrative cache
+Compiled templates are reused across renders; LLM narratives are cached by input hash
+
+Each module keeps its templates next to its reporter (``reporters/templates``)
+and renders them through ``TemplateRenderer``. Environments are shared per
+template directory, so a template is compiled once per process, and compiled
+bytecode is kept on disk so later runs skip parsing entirely.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined, select_autoescape
+    HAS_JINJA2 = True
+except ImportError:
+    HAS_JINJA2 = False
+
+
+def _thousands(value: Any) -> str:
+    """1234567 -> '1,234,567' (None -> '0')"""
+    return f"{value or 0:,}"
+
+
+def _title(value: Optional[str]) -> str:
+    """'pilot_stage' -> 'Pilot Stage'"""
+    return (value or '').replace('_', ' ').title()
+
+
+@lru_cache(maxsize=None)
+def _environment(template_dir: str) -> "Environment":
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html']),
+        bytecode_cache=FileSystemBytecodeCache(),
+        undefined=StrictUndefined,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates ship with the code; skip the per-render mtime check
+        auto_reload=False,
+    )
+    env.filters['thousands'] = _thousands
+    env.filters['title_words'] = _title
+    return env
+
+
+class TemplateRenderer:
+    """Render templates from one directory with a shared, compiled environment"""
+
+    def __init__(self, template_dir: Path):
+        """
+        Args:
+            template_dir: Directory holding the module's ``*.html`` templates
+        """
+        if not HAS_JINJA2:
+            raise ImportError("jinja2 not installed. Run: pip install jinja2")
+        self.template_dir = Path(template_dir)
+        self.env = _environment(str(self.template_dir.resolve()))
+
+    def render(self, template_name: str, **context) -> str:
+        """Render a template to a string"""
+        return self.env.get_template(template_name).render(**context)
+
+    def write(self, template_name: str, output_path: Path, **context) -> Path:
+        """Render a template and write it (UTF-8), creating parent directories"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(self.render(template_name, **context), encoding='utf-8')
+        return output_path
+
+
+def state_hash(state: Dict[str, Any]) -> str:
+    """Stable hash of the inputs a narrative is generated from"""
+    payload = json.dumps(state, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class NarrativeCache:
+    """
+    SQLite cache of generated narratives, keyed by input state hash
+
+    A narrative is regenerated only when the state it was written from
+    changes (new content counts, scores, bio, model...). Misses are generated
+    concurrently; failed generations (``generate`` returning None) are not
+    stored so they are retried next run.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS narratives (
+                state_hash TEXT PRIMARY KEY,
+                narrative TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        placeholders = ','.join('?' * len(keys))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT state_hash, narrative FROM narratives WHERE state_hash IN ({placeholders})",
+                keys
+            ).fetchall()
+        return dict(rows)
+
+    def put(self, key: str, narrative: str) -> None:
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO narratives (state_hash, narrative, created_at) VALUES (?, ?, ?)",
+                (key, narrative, datetime.now().isoformat())
+            )
+            self.conn.commit()
+
+    def resolve(
+        self,
+        states: Dict[Any, Dict[str, Any]],
+        generate: Callable[[Any], Optional[str]],
+        max_workers: int = 8
+    ) -> Dict[Any, Optional[str]]:
+        """
+        Narrative per item, generating only cache misses
+
+        Args:
+            states: item key -> the state its narrative depends on
+            generate: item key -> narrative (None on failure)
+            max_workers: Concurrent generations
+
+        Returns:
+            item key -> narrative (None where generation failed)
+        """
+        hashes = {item: state_hash(state) for item, state in states.items()}
+        cached = self.get_many(hashes.values())
+        results: Dict[Any, Optional[str]] = {
+            item: cached[key] for item, key in hashes.items() if key in cached
+        }
+        # Items with identical state share one generation
+        pending: Dict[str, Any] = {}
+        for item, key in hashes.items():
+            if key not in cached:
+                pending.setdefault(key, item)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+                generated = dict(zip(pending, pool.map(generate, pending.values())))
+            for key, narrative in generated.items():
+                if narrative is not None:
+                    self.put(key, narrative)
+            for item, key in hashes.items():
+                if key in generated:
+                    results[item] = generated[key]
+        return results
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,4 @@
+"""Core text utilities module"""
+from .keyword_matcher import KeywordMatcher
+
+__all__ = ['KeywordMatcher']
@@ -0,0 +1,176 @@
+"""
+Keyword Matcher
+Single-pass multi-pattern matching for rule-based theme and keyword detection
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+BOUNDARY_MODES = ("word", "prefix", "none")
+
+
+class KeywordMatcher:
+    """
+    Match many labelled keyword lists against text in one regex pass
+
+    All keywords are compiled into a single trie-shaped regex, so a document
+    is scanned once regardless of how many keywords there are. Matching runs
+    as a zero-width lookahead so overlapping keywords ("warm", "warm white",
+    "power supply", "supply") are all reported, and each hit is mapped back
+    to every label that owns it.
+
+    Boundary modes:
+        word:   keyword must be a whole word/phrase ("dim" != "dimmer")
+        prefix: keyword must start at a word boundary ("hook" -> "hooks",
+                but "bin" does not match inside "cabinet"). Any word that
+                starts with the keyword matches, so "led" also hits "ledge";
+                use word mode for short keywords like that
+        none:   plain substring matching (legacy ``keyword in text``)
+    """
+
+    def __init__(
+        self,
+        patterns: Mapping[str, Iterable[str]],
+        boundary: str = "prefix",
+        case_sensitive: bool = False
+    ):
+        """
+        Args:
+            patterns: label -> keywords. Label order is preserved in results.
+            boundary: One of BOUNDARY_MODES
+            case_sensitive: Match case exactly (default: case-insensitive)
+        """
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"boundary must be one of {BOUNDARY_MODES}, got {boundary!r}")
+
+        self.boundary = boundary
+        self.case_sensitive = case_sensitive
+        self.labels_order: List[str] = list(patterns)
+        self._label_rank = {label: i for i, label in enumerate(self.labels_order)}
+
+        # keyword (normalized) -> labels, in label order
+        self._keyword_labels: Dict[str, List[str]] = {}
+        # label -> keyword -> position in that label's own list
+        self._keyword_rank: Dict[str, Dict[str, int]] = {}
+        for label, keywords in patterns.items():
+            rank = self._keyword_rank.setdefault(label, {})
+            for keyword in keywords:
+                key = self._normalize(keyword)
+                if not key:
+                    continue
+                rank.setdefault(key, len(rank))
+                owners = self._keyword_labels.setdefault(key, [])
+                if label not in owners:
+                    owners.append(label)
+
+        # A lookahead reports one alternative per position (the longest), so
+        # precompute which shorter keywords a longer match implies.
+        self._implied: Dict[str, List[str]] = {
+            keyword: [k for k in self._keyword_labels if self._implies(keyword, k)]
+            for keyword in self._keyword_labels
+        }
+
+        self._regex = self._compile()
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _implies(self, longer: str, shorter: str) -> bool:
+        """Whether a match of `longer` at a position is also a match of `shorter`"""
+        if not longer.startswith(shorter):
+            return False
+        if self.boundary != "word" or len(shorter) == len(longer):
+            return True
+        # Whole-word mode: the shorter keyword must end on a word boundary
+        return not (longer[len(shorter) - 1].isalnum() and longer[len(shorter)].isalnum())
+
+    def _compile(self) -> "re.Pattern":
+        if not self._keyword_labels:
+            return re.compile(r"(?!x)x")  # matches nothing
+
+        # Trie-shaped alternation: each position is tried in O(keyword length)
+        # rather than once per keyword, and greedy optionals prefer the longest.
+        # Text is lowercased up front instead of using re.IGNORECASE, which
+        # is several times slower.
+        alternation = _trie_pattern(self._keyword_labels)
+
+        if self.boundary == "none":
+            return re.compile(f"(?=({alternation}))")
+
+        end = r"(?!\w)" if self.boundary == "word" else ""
+        if all(re.match(r"\w", k) for k in self._keyword_labels):
+            # \b outside the lookahead lets the engine skip mid-word positions fast
+            return re.compile(rf"\b(?=((?:{alternation}){end}))")
+        return re.compile(rf"(?=((?<!\w)(?:{alternation}){end}))")
+
+    def _distinct(self, text: str) -> List[str]:
+        """Distinct keywords occurring in text"""
+        found = set()
+        for longest in set(self._regex.findall(self._normalize(text))):
+            found.update(self._implied[longest])
+        return list(found)
+
+    def find(self, text: str) -> List[Tuple[str, str, int]]:
+        """All hits as (label, keyword, position), in text order"""
+        return [
+            (label, keyword, match.start())
+            for match in self._regex.finditer(self._normalize(text))
+            for keyword in self._implied[match.group(1)]
+            for label in self._keyword_labels[keyword]
+        ]
+
+    def labels(self, text: str) -> List[str]:
+        """Labels with at least one keyword in text, in pattern order"""
+        hit = set()
+        for keyword in self._distinct(text):
+            hit.update(self._keyword_labels[keyword])
+        return sorted(hit, key=self._label_rank.__getitem__)
+
+    def keywords(self, text: str) -> Dict[str, List[str]]:
+        """label -> distinct keywords found, for labels with hits (labels and keywords in pattern order)"""
+        found: Dict[str, List[str]] = {}
+        for keyword in self._distinct(text):
+            for label in self._keyword_labels[keyword]:
+                found.setdefault(label, []).append(keyword)
+        return {
+            label: sorted(found[label], key=self._keyword_rank[label].__getitem__)
+            for label in self.labels_order if label in found
+        }
+
+    def labels_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Batch version of labels()"""
+        return [self.labels(text) for text in texts]
+
+    def keywords_many(self, texts: Iterable[str]) -> List[Dict[str, List[str]]]:
+        """Batch version of keywords()"""
+        return [self.keywords(text) for text in texts]
+
+    def document_counts(self, texts: Iterable[str]) -> Counter:
+        """label -> number of documents with at least one hit"""
+        counts = Counter()
+        for labels in self.labels_many(texts):
+            counts.update(labels)
+        return counts
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation for `words` factored as a character trie"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # terminal marker
+
+    def build(node: dict) -> str:
+        terminal = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return build(trie)
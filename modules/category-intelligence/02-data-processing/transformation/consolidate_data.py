@@ -2,26 +2,127 @@
 """
 Data Consolidation Script for 3M Category Intelligence
 Handles heterogeneous schemas with zero data loss
+
+Source files are streamed and normalized in a process pool by the ingest
+engine (ingest_engine.py); dedup runs over the staged rows, and files whose
+manifests show them unchanged are not re-read on rerun.
 """
 
+import argparse
 import json
-import hashlib
+import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
+from itertools import groupby
 import uuid
 import re
 
+from ingest_engine import IngestEngine, SourceFile, write_json_collection
+
+MODULE_ROOT = Path(__file__).resolve().parents[2]
+if str(MODULE_ROOT) not in sys.path:
+    sys.path.insert(0, str(MODULE_ROOT))
+
+from src.analysis.entity_resolution import EntityResolver, listing_key, listings_from_records
+
 BASE_PATH = Path("modules/category-intelligence")
 OUTPUT_DIR = BASE_PATH / "data" / "consolidated"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+STAGING_DIR = BASE_PATH / "data" / "staging" / "consolidation"
+
+# Bump when normalization output changes so staged files are re-ingested
+NORMALIZER_VERSION = 1
+
+PRODUCT_FILES = [
+    "data/retailers/all_products_final_with_lowes.json",
+    "data/expanded_coverage/amazon_products_with_reviews_20251104_155959.json",
+    "outputs/garage_organizer_sample_20251104.json",
+    "data/walmart_products.json",
+    "data/homedepot_products.json",
+    "data/amazon_products.json",
+    "data/target_products.json",
+    "data/lowes_products.json",
+    "data/etsy_products.json",
+    "data/retailers/walmart_products.json",
+    "data/retailers/homedepot_products.json",
+    "data/retailers/amazon_products.json",
+    "data/retailers/target_products.json",
+    "data/retailers/lowes_products.json",
+    "data/retailers/etsy_products.json"
+]
+
+REVIEW_FILES = [
+    "data/reviews/amazon_reviews_authenticated_20251104_172901.json"
+]
+
+YOUTUBE_FILES = [
+    "outputs/3m_claw_all_videos_20251104_153723.json",
+    "outputs/3m_claw_new_videos.json",
+    "data/social_videos/youtube_3m_claw_20251104_160154.json",
+    "data/social_videos/youtube_3m_claw_20251104_160243.json",
+    "outputs/full_garage_organizer_videos.json",
+    "data/youtube_garage_consumer_insights.json"
+]
+
+TIKTOK_FILES = [
+    "outputs/3m_claw_tiktok_apify_20251104_161329.json",
+    "data/tiktok_garage_consumer_insights.json"
+]
+
+SOURCES = (
+    [SourceFile("products", path, ("records", "products")) for path in PRODUCT_FILES]
+    + [SourceFile("reviews", path, ("reviews",)) for path in REVIEW_FILES]
+    + [SourceFile("youtube", path, ("videos",)) for path in YOUTUBE_FILES]
+    + [SourceFile("tiktok", path, ("videos",)) for path in TIKTOK_FILES]
+)
+
+
+def product_dedup_key(product):
+    """Dedup key: sku, else asin, else name|brand|retailer"""
+    return product.get("sku") or product.get("asin") or f"{product.get('name')}|{product.get('brand')}|{product.get('retailer')}"
+
+
+def video_bucket(video):
+    """Classify a video as 3M Claw or general category by title"""
+    title = video.get("title", "").lower()
+    return "3M Claw" if "3m" in title or "claw" in title else "category"
+
+
+def normalize_source(kind, records, source_file, log):
+    """
+    Ingest-engine normalizer: yield (group, dedup_key, record) for one file
+
+    Runs in a worker process; validation counters accumulate in `log`,
+    which the engine stores in the file's manifest.
+    """
+    consolidator = DataConsolidator()
+    log.update(consolidator.validation_log)
+    consolidator.validation_log = log
+
+    for raw in records:
+        if kind == "products":
+            log["total_records_processed"] += 1
+            normalized = consolidator.normalize_product(raw, source_file)
+            if normalized:
+                yield normalized["brand"], product_dedup_key(normalized), normalized
+        elif kind == "reviews":
+            normalized = consolidator.normalize_review(raw, source_file)
+            if normalized:
+                yield normalized.get("brand", "Unknown"), normalized["review_id"], normalized
+        elif kind == "youtube":
+            normalized = consolidator.normalize_youtube_video(raw, source_file)
+            if normalized:
+                yield video_bucket(normalized), normalized.get("video_id"), normalized
+        elif kind == "tiktok":
+            normalized = consolidator.normalize_tiktok_video(raw, source_file)
+            if normalized:
+                yield video_bucket(normalized), normalized.get("video_id"), normalized
+
 
 class DataConsolidator:
-    def __init__(self):
-        self.products = defaultdict(list)  # brand -> [products]
-        self.reviews = defaultdict(list)   # brand -> [reviews]
-        self.videos_yt = defaultdict(list) # brand/category -> [videos]
-        self.videos_tt = defaultdict(list) # brand/category -> [videos]
+    def __init__(self, engine=None):
+        self.engine = engine  # IngestEngine; only needed for ingest/write steps
+        self.canonical = None  # CanonicalProductTable, set by resolve_products()
         self.validation_log = {
             "total_records_processed": 0,
             "total_records_valid": 0,
@@ -171,107 +272,34 @@ class DataConsolidator:
 
         return "unknown"
 
-    def deduplicate_products(self, products):
-        """Deduplicate by sku/asin/name+brand"""
-        seen = set()
-        unique = []
-
-        for p in products:
-            # Create dedup key
-            key = p.get("sku") or p.get("asin") or f"{p.get('name')}|{p.get('brand')}|{p.get('retailer')}"
-
-            if key not in seen:
-                seen.add(key)
-                unique.append(p)
-            else:
-                self.validation_log["errors_by_type"]["duplicate"] += 1
-
-        return unique
-
-    def process_product_files(self):
-        """Load and normalize all product files"""
-        product_files = [
-            "data/retailers/all_products_final_with_lowes.json",
-            "data/expanded_coverage/amazon_products_with_reviews_20251104_155959.json",
-            "outputs/garage_organizer_sample_20251104.json",
-            "data/walmart_products.json",
-            "data/homedepot_products.json",
-            "data/amazon_products.json",
-            "data/target_products.json",
-            "data/lowes_products.json",
-            "data/etsy_products.json",
-            "data/retailers/walmart_products.json",
-            "data/retailers/homedepot_products.json",
-            "data/retailers/amazon_products.json",
-            "data/retailers/target_products.json",
-            "data/retailers/lowes_products.json",
-            "data/retailers/etsy_products.json"
-        ]
-
-        for file_path in product_files:
-            full_path = BASE_PATH / file_path
-            if not full_path.exists():
-                print(f"  ⏭ Skipping {file_path} (not found)")
-                continue
-
-            print(f"  📂 Processing {file_path}...")
-            try:
-                with open(full_path) as f:
-                    data = json.load(f)
-
-                # Handle both array and object with "records" key
-                if isinstance(data, list):
-                    records = data
-                elif isinstance(data, dict):
-                    records = data.get("records") or data.get("products") or []
-                else:
-                    records = []
-
-                count = 0
-                for raw_product in records:
-                    self.validation_log["total_records_processed"] += 1
-                    normalized = self.normalize_product(raw_product, file_path)
-                    if normalized:
-                        brand = normalized["brand"]
-                        self.products[brand].append(normalized)
-                        count += 1
-
-                print(f"     ✓ {count} products added")
-
-            except Exception as e:
-                print(f"     ❌ Error: {e}")
-
-    def process_review_files(self):
-        """Load and normalize all review files"""
-        review_files = [
-            "data/reviews/amazon_reviews_authenticated_20251104_172901.json"
-        ]
-
-        for file_path in review_files:
-            full_path = BASE_PATH / file_path
-            if not full_path.exists():
-                print(f"  ⏭ Skipping {file_path} (not found)")
-                continue
-
-            print(f"  📂 Processing {file_path}...")
-            try:
-                with open(full_path) as f:
-                    data = json.load(f)
-
-                reviews = data if isinstance(data, list) else data.get("reviews", [])
-
-                count = 0
-                for raw_review in reviews:
-                    normalized = self.normalize_review(raw_review, file_path)
-                    if normalized:
-                        brand = normalized.get("brand", "Unknown")
-                        self.reviews[brand].append(normalized)
-                        count += 1
-
-                print(f"     ✓ {count} reviews added")
-
-            except Exception as e:
-                print(f"     ❌ Error: {e}")
+    def deduplicate_products(self, brand=None):
+        """
+        Deduplicate staged products (one brand, or all) by sku/asin/name+brand hash
+
+        Returns:
+            (unique count, stream of unique products in source order)
+        """
+        raw = self.engine.count("products", brand, unique=False)
+        unique = self.engine.count("products", brand)
+        self.validation_log["errors_by_type"]["duplicate"] += raw - unique
+        return unique, (product for _, product in self.engine.iter_records("products", brand))
+
+    def ingest_sources(self):
+        """Stream, normalize and stage all product, review and video files"""
+        self.engine.ingest(SOURCES)
+
+        # Fold the per-file validation counters recorded by the workers
+        merged = self.engine.validation_log()
+        for key in ("total_records_processed", "total_records_valid", "total_records_dropped"):
+            self.validation_log[key] += merged.get(key, 0)
+        for error_type, count in merged.get("errors_by_type", {}).items():
+            self.validation_log["errors_by_type"][error_type] += count
+        dropped = self.validation_log["dropped_records"]
+        dropped.extend(merged.get("dropped_records", [])[:max(0, 100 - len(dropped))])
+
+        for kind in ("products", "reviews", "youtube", "tiktok"):
+            staged = sum(self.engine.group_counts(kind).values())
+            print(f"     ✓ {staged:,} {kind} records staged")
 
     def normalize_review(self, raw_review, source_file):
         """Normalize review schema"""
@@ -295,75 +323,6 @@ class DataConsolidator:
         except:
             return None
 
-    def process_video_files(self):
-        """Load and normalize all video files"""
-        youtube_files = [
-            "outputs/3m_claw_all_videos_20251104_153723.json",
-            "outputs/3m_claw_new_videos.json",
-            "data/social_videos/youtube_3m_claw_20251104_160154.json",
-            "data/social_videos/youtube_3m_claw_20251104_160243.json",
-            "outputs/full_garage_organizer_videos.json",
-            "data/youtube_garage_consumer_insights.json"
-        ]
-
-        tiktok_files = [
-            "outputs/3m_claw_tiktok_apify_20251104_161329.json",
-            "data/tiktok_garage_consumer_insights.json"
-        ]
-
-        print("\n  📺 Processing YouTube videos...")
-        for file_path in youtube_files:
-            full_path = BASE_PATH / file_path
-            if not full_path.exists():
-                continue
-
-            try:
-                with open(full_path) as f:
-                    data = json.load(f)
-
-                videos = data.get("videos", []) if isinstance(data, dict) else data
-
-                for video in videos:
-                    normalized = self.normalize_youtube_video(video, file_path)
-                    if normalized:
-                        # Classify as 3M Claw or general category
-                        title = normalized.get("title", "").lower()
-                        if "3m" in title or "claw" in title:
-                            self.videos_yt["3M Claw"].append(normalized)
-                        else:
-                            self.videos_yt["category"].append(normalized)
-
-            except Exception as e:
-                print(f"     ❌ Error processing {file_path}: {e}")
-
-        print(f"     ✓ YouTube videos loaded")
-
-        print("\n  📱 Processing TikTok videos...")
-        for file_path in tiktok_files:
-            full_path = BASE_PATH / file_path
-            if not full_path.exists():
-                continue
-
-            try:
-                with open(full_path) as f:
-                    data = json.load(f)
-
-                videos = data.get("videos", []) if isinstance(data, dict) else data
-
-                for video in videos:
-                    normalized = self.normalize_tiktok_video(video, file_path)
-                    if normalized:
-                        title = normalized.get("title", "").lower()
-                        if "3m" in title or "claw" in title:
-                            self.videos_tt["3M Claw"].append(normalized)
-                        else:
-                            self.videos_tt["category"].append(normalized)
-
-            except Exception as e:
-                print(f"     ❌ Error processing {file_path}: {e}")
-
-        print(f"     ✓ TikTok videos loaded")
-
     def normalize_youtube_video(self, raw_video, source_file):
         """Normalize YouTube video schema"""
         try:
@@ -407,22 +366,19 @@ class DataConsolidator:
         except:
             return None
 
-    def deduplicate_videos(self, videos):
-        """Deduplicate videos by video_id"""
-        seen = set()
-        unique = []
+    def deduplicate_videos(self, platform, key):
+        """
+        Deduplicate staged videos for one platform/bucket by video_id hash
 
-        for v in videos:
-            vid = v.get("video_id")
-            if vid and vid not in seen:
-                seen.add(vid)
-                unique.append(v)
-
-        return unique
+        Returns:
+            (unique count, stream of unique videos in source order)
+        """
+        unique = self.engine.count(platform, key)
+        return unique, (video for _, video in self.engine.iter_records(platform, key))
 
     def get_top_brands(self, n=10):
         """Get top N brands by product count"""
-        brand_counts = [(brand, len(products)) for brand, products in self.products.items()]
+        brand_counts = list(self.engine.group_counts("products").items())
         brand_counts.sort(key=lambda x: x[1], reverse=True)
         return [(brand, count) for brand, count in brand_counts[:n]]
 
@@ -436,147 +392,128 @@ class DataConsolidator:
 
         print("\n💾 Writing brand-specific product files...")
         for brand, _ in top_brands:
-            products = self.deduplicate_products(self.products[brand])
+            count, products = self.deduplicate_products(brand)
             slug = brand.lower().replace(" ", "-").replace("&", "and")
 
-            output = {
-                "brand": brand,
-                "total_products": len(products),
-                "products": products
-            }
-
             output_file = OUTPUT_DIR / f"{slug}-products.json"
-            with open(output_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"  ✓ {output_file.name} ({len(products)} products)")
+            write_json_collection(
+                output_file, {"brand": brand, "total_products": count}, "products", products
+            )
+            print(f"  ✓ {output_file.name} ({count} products)")
 
     def write_brand_reviews(self):
         """Write brand-specific review files"""
-        if not self.reviews:
+        review_counts = self.engine.group_counts("reviews")
+        if not review_counts:
             print("\n⚠ No reviews to write")
             return
 
         print("\n💾 Writing brand-specific review files...")
-        for brand, reviews in self.reviews.items():
-            if not reviews:
-                continue
-
+        for brand, count in review_counts.items():
+            reviews = (review for _, review in self.engine.iter_records("reviews", brand, unique=False))
             slug = brand.lower().replace(" ", "-").replace("&", "and")
 
-            output = {
-                "brand": brand,
-                "total_reviews": len(reviews),
-                "reviews": reviews
-            }
-
             output_file = OUTPUT_DIR / f"{slug}-reviews.json"
-            with open(output_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"  ✓ {output_file.name} ({len(reviews)} reviews)")
+            write_json_collection(
+                output_file, {"brand": brand, "total_reviews": count}, "reviews", reviews
+            )
+            print(f"  ✓ {output_file.name} ({count} reviews)")
 
     def write_video_files(self):
         """Write video files (YouTube and TikTok)"""
         print("\n💾 Writing video files...")
 
-        # YouTube
-        for key, videos in self.videos_yt.items():
-            if not videos:
-                continue
-
-            videos = self.deduplicate_videos(videos)
-            slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
-
-            output = {
-                "brand_or_category": key,
-                "total_videos": len(videos),
-                "platform": "youtube",
-                "videos": videos
-            }
-
-            output_file = OUTPUT_DIR / f"{slug}-videos-youtube.json"
-            with open(output_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"  ✓ {output_file.name} ({len(videos)} videos)")
-
-        # TikTok
-        for key, videos in self.videos_tt.items():
-            if not videos:
-                continue
-
-            videos = self.deduplicate_videos(videos)
-            slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
-
-            output = {
-                "brand_or_category": key,
-                "total_videos": len(videos),
-                "platform": "tiktok",
-                "videos": videos
-            }
-
-            output_file = OUTPUT_DIR / f"{slug}-videos-tiktok.json"
-            with open(output_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"  ✓ {output_file.name} ({len(videos)} videos)")
+        for platform in ("youtube", "tiktok"):
+            for key in self.engine.group_counts(platform):
+                count, videos = self.deduplicate_videos(platform, key)
+                slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
+
+                output_file = OUTPUT_DIR / f"{slug}-videos-{platform}.json"
+                write_json_collection(
+                    output_file,
+                    {"brand_or_category": key, "total_videos": count, "platform": platform},
+                    "videos",
+                    videos
+                )
+                print(f"  ✓ {output_file.name} ({count} videos)")
+
+    def resolve_products(self):
+        """Cluster deduplicated listings into cross-retailer canonical products"""
+        print("\n🔗 Resolving cross-retailer product entities...")
+        products = (product for _, product in self.engine.iter_records("products"))
+        self.canonical = EntityResolver().resolve(listings_from_records(products))
+
+        output_file = OUTPUT_DIR / "garage-organizer-category-canonical-products.json"
+        self.canonical.write_json(output_file)
+        print(
+            f"  ✓ {output_file.name} ({len(self.canonical.assignments)} listings -> "
+            f"{len(self.canonical)} canonical products, "
+            f"{len(self.canonical.multi_retailer_ids())} at multiple retailers)"
+        )
 
     def write_category_aggregates(self):
         """Write category-level aggregate files"""
         print("\n💾 Writing category aggregate files...")
 
         # All products
-        all_products = []
-        for products in self.products.values():
-            all_products.extend(products)
-
-        all_products = self.deduplicate_products(all_products)
-
-        output = {
-            "category": "garage-organizer",
-            "total_products": len(all_products),
-            "products": all_products
-        }
+        count, all_products = self.deduplicate_products()
 
         output_file = OUTPUT_DIR / "garage-organizer-category-products.json"
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
-        print(f"  ✓ {output_file.name} ({len(all_products)} products)")
+        write_json_collection(
+            output_file,
+            {"category": "garage-organizer", "total_products": count},
+            "products",
+            all_products
+        )
+        print(f"  ✓ {output_file.name} ({count} products)")
 
         # All reviews
-        all_reviews = []
-        for reviews in self.reviews.values():
-            all_reviews.extend(reviews)
-
-        if all_reviews:
-            output = {
-                "category": "garage-organizer",
-                "total_reviews": len(all_reviews),
-                "reviews": all_reviews
-            }
-
+        review_total = sum(self.engine.group_counts("reviews").values())
+        if review_total:
             output_file = OUTPUT_DIR / "garage-organizer-category-reviews.json"
-            with open(output_file, 'w') as f:
-                json.dump(output, f, indent=2)
-            print(f"  ✓ {output_file.name} ({len(all_reviews)} reviews)")
+            write_json_collection(
+                output_file,
+                {"category": "garage-organizer", "total_reviews": review_total},
+                "reviews",
+                (review for _, review in self.engine.iter_records("reviews", unique=False))
+            )
+            print(f"  ✓ {output_file.name} ({review_total} reviews)")
+
+        # Brand summary: one pass over products deduplicated within each brand
+        raw_counts = self.engine.group_counts("products")
+        unique_counts = self.engine.unique_counts("products")
+        for brand, raw in raw_counts.items():
+            self.validation_log["errors_by_type"]["duplicate"] += raw - unique_counts.get(brand, 0)
 
-        # Brand summary
         brands_summary = []
-        for brand, products in self.products.items():
-            products = self.deduplicate_products(products)
-
-            prices = [p["price"] for p in products if p["price"] > 0]
-            ratings = [p["rating"] for p in products if p["rating"] > 0]
-            retailers = list(set(p["retailer"] for p in products))
+        staged = self.engine.iter_records("products", per_group=True)
+        for brand, rows in groupby(staged, key=lambda row: row[0]):
+            product_count = review_count = 0
+            prices, ratings, retailers, canonical_ids = [], [], set(), set()
+            for _, p in rows:
+                product_count += 1
+                if self.canonical is not None:
+                    key = listing_key(p["retailer"], p["product_id"])
+                    canonical_ids.add(self.canonical.canonical_id(key) or key)
+                review_count += p["review_count"]
+                if p["price"] > 0:
+                    prices.append(p["price"])
+                if p["rating"] > 0:
+                    ratings.append(p["rating"])
+                retailers.add(p["retailer"])
 
             brands_summary.append({
                 "brand": brand,
-                "product_count": len(products),
-                "review_count": sum(p["review_count"] for p in products),
+                "product_count": product_count,
+                "canonical_product_count": len(canonical_ids) if self.canonical is not None else product_count,
+                "review_count": review_count,
                 "avg_rating": round(sum(ratings) / len(ratings), 2) if ratings else 0,
                 "avg_price": round(sum(prices) / len(prices), 2) if prices else 0,
                 "price_range": {
                     "min": round(min(prices), 2) if prices else 0,
                     "max": round(max(prices), 2) if prices else 0
                 },
-                "retailers": retailers
+                "retailers": list(retailers)
             })
 
         brands_summary.sort(key=lambda x: x["product_count"], reverse=True)
@@ -640,21 +577,23 @@ class DataConsolidator:
             slug = brand.lower().replace(" ", "-").replace("&", "and")
             report += f"- `{slug}-products.json` ({count} products)\n"
 
+        product_counts = self.engine.group_counts("products")
+        review_counts = self.engine.group_counts("reviews")
+
         report += "\n### Category Aggregates\n"
-        report += f"- `garage-organizer-category-products.json` ({sum(len(p) for p in self.products.values())} products)\n"
-        report += f"- `garage-organizer-category-brands-summary.json` ({len(self.products)} brands)\n"
+        report += f"- `garage-organizer-category-products.json` ({sum(product_counts.values())} products)\n"
+        report += f"- `garage-organizer-category-brands-summary.json` ({len(product_counts)} brands)\n"
+        if self.canonical is not None:
+            report += f"- `garage-organizer-category-canonical-products.json` ({len(self.canonical)} canonical products)\n"
 
-        if self.reviews:
-            report += f"- `garage-organizer-category-reviews.json` ({sum(len(r) for r in self.reviews.values())} reviews)\n"
+        if review_counts:
+            report += f"- `garage-organizer-category-reviews.json` ({sum(review_counts.values())} reviews)\n"
 
         report += "\n### Videos\n"
-        for key, videos in self.videos_yt.items():
-            slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
-            report += f"- `{slug}-videos-youtube.json` ({len(videos)} videos)\n"
-
-        for key, videos in self.videos_tt.items():
-            slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
-            report += f"- `{slug}-videos-tiktok.json` ({len(videos)} videos)\n"
+        for platform in ("youtube", "tiktok"):
+            for key, count in self.engine.group_counts(platform).items():
+                slug = "3m-claw" if key == "3M Claw" else "garage-organizer-category"
+                report += f"- `{slug}-videos-{platform}.json` ({count} videos)\n"
 
         report += f"""
 ---
@@ -695,31 +634,45 @@ class DataConsolidator:
         print(f"  ✓ {output_file.name}")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Consolidate category intelligence source data")
+    parser.add_argument("--workers", type=int, default=None, help="Ingest process pool size")
+    parser.add_argument("--staging-dir", type=Path, default=STAGING_DIR, help="Staging area for parsed rows and manifests")
+    parser.add_argument("--force", action="store_true", help="Re-ingest files even if their manifests are current")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
     print("="*80)
     print("DATA CONSOLIDATION - 3M CATEGORY INTELLIGENCE")
     print("="*80)
 
-    consolidator = DataConsolidator()
+    engine = IngestEngine(
+        BASE_PATH,
+        args.staging_dir,
+        normalize_source,
+        normalizer_version=NORMALIZER_VERSION,
+        workers=args.workers,
+        force=args.force
+    )
+    consolidator = DataConsolidator(engine)
 
-    print("\n[1/6] Processing product files...")
-    consolidator.process_product_files()
+    print("\n[1/4] Ingesting product, review and video files...")
+    consolidator.ingest_sources()
 
-    print("\n[2/6] Processing review files...")
-    consolidator.process_review_files()
-
-    print("\n[3/6] Processing video files...")
-    consolidator.process_video_files()
-
-    print("\n[4/6] Writing brand-specific files...")
+    print("\n[2/4] Writing brand-specific files...")
     consolidator.write_brand_products()
     consolidator.write_brand_reviews()
     consolidator.write_video_files()
 
-    print("\n[5/6] Writing category aggregates...")
+    print("\n[3/4] Writing category aggregates...")
+    consolidator.resolve_products()
     consolidator.write_category_aggregates()
 
-    print("\n[6/6] Writing validation and reports...")
+    print("\n[4/4] Writing validation and reports...")
     consolidator.write_validation_log()
     consolidator.write_consolidation_report()
 
@@ -736,6 +689,8 @@ def main():
     print(f"Data integrity: {integrity:.2f}%")
     print(f"\n✅ Output directory: {OUTPUT_DIR}")
 
+    engine.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Streaming Ingest Engine for Category Intelligence consolidation
+Parses source JSON incrementally, normalizes files in a process pool and
+stages rows in columnar part files. Dedup and grouping run as hash-key
+queries over the staging area; per-file manifests skip unchanged sources.
+
+Optional dependencies (each degrades gracefully):
+    ijson    - incremental parsing (fallback: json.load per file)
+    pyarrow  - Parquet part files (fallback: JSON Lines parts)
+    duckdb   - queries straight over the parts (fallback: SQLite staging DB)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+try:  # pragma: no cover - optional dependency
+    import duckdb
+except ImportError:  # pragma: no cover
+    duckdb = None
+
+MANIFEST_VERSION = 1
+BATCH_SIZE = 5000
+HASH_CHUNK = 1 << 20
+
+# (kind, records, source_file, log) -> (group, dedup_key, record) rows.
+# The normalizer fills `log` with its validation counters; it is stored in
+# the file's manifest and merged across files by IngestEngine.validation_log().
+Normalizer = Callable[[str, Iterator[Dict], str, Dict], Iterator[Tuple[str, Optional[str], Dict]]]
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """One input file: record kind, path relative to base, and container keys"""
+    kind: str
+    path: str
+    containers: Tuple[str, ...] = ()
+
+
+def iter_json_records(path: Path, containers: Sequence[str] = ()) -> Iterator[Dict]:
+    """
+    Stream records from a JSON array, or from the first non-empty container
+    key of a JSON object (e.g. {"records": [...]} / {"products": [...]})
+    """
+    if ijson is None:
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict):
+            for key in containers:
+                if data.get(key):
+                    yield from data[key]
+                    return
+        return
+
+    with open(path, 'rb') as f:
+        first = _first_token(f)
+
+    if first == b'[':
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    elif first == b'{':
+        for key in containers:
+            found = False
+            with open(path, 'rb') as f:
+                for item in ijson.items(f, f'{key}.item', use_float=True):
+                    found = True
+                    yield item
+            if found:
+                return
+
+
+def _first_token(f) -> bytes:
+    while True:
+        char = f.read(1)
+        if not char or not char.isspace():
+            return char
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_key(key: Optional[str]) -> Optional[str]:
+    """Fixed-width dedup hash for a natural key (None/empty stays None)"""
+    if not key:
+        return None
+    return hashlib.sha1(str(key).encode('utf-8')).hexdigest()
+
+
+class _PartWriter:
+    """Batched writer for one staged part file (Parquet, else JSON Lines)"""
+
+    COLUMNS = ('grp', 'dedup_key', 'seq', 'payload')
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._batch: List[Tuple] = []
+        self._parquet = None
+        self._jsonl = None
+        if pa is not None:
+            self._schema = pa.schema([
+                ('grp', pa.string()),
+                ('dedup_key', pa.string()),
+                ('seq', pa.int64()),
+                ('payload', pa.string()),
+            ])
+            self._parquet = pq.ParquetWriter(str(path), self._schema)
+        else:
+            self._jsonl = open(path, 'w', encoding='utf-8')
+
+    def write(self, grp: str, dedup_key: Optional[str], seq: int, record: Dict):
+        self._batch.append((grp, dedup_key, seq, json.dumps(record, ensure_ascii=False)))
+        if len(self._batch) >= BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+        if self._parquet is not None:
+            columns = list(zip(*self._batch))
+            self._parquet.write_table(pa.Table.from_arrays(
+                [pa.array(col, type=field.type) for col, field in zip(columns, self._schema)],
+                schema=self._schema
+            ))
+        else:
+            for values in self._batch:
+                self._jsonl.write(json.dumps(dict(zip(self.COLUMNS, values)), ensure_ascii=False))
+                self._jsonl.write('\n')
+        self._batch = []
+
+    def close(self):
+        self._flush()
+        if self._parquet is not None:
+            self._parquet.close()
+        else:
+            self._jsonl.close()
+
+
+def _part_suffix() -> str:
+    return '.parquet' if pa is not None else '.jsonl'
+
+
+def iter_part_rows(path: Path) -> Iterator[Tuple]:
+    """Yield (grp, dedup_key, seq, payload) tuples from a staged part file"""
+    if path.suffix == '.parquet':
+        for batch in pq.ParquetFile(str(path)).iter_batches(batch_size=BATCH_SIZE):
+            yield from zip(*(batch.column(name).to_pylist() for name in _PartWriter.COLUMNS))
+    else:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                values = json.loads(line)
+                yield tuple(values[name] for name in _PartWriter.COLUMNS)
+
+
+def _ingest_file(task: Tuple) -> Dict:
+    """Process-pool worker: stream, normalize and stage one source file"""
+    source, full_path, part_path, normalizer, fingerprint = task
+
+    log: Dict = {}
+    groups: Dict[str, int] = {}
+    rows = 0
+    error = None
+
+    writer = _PartWriter(Path(part_path))
+    try:
+        records = iter_json_records(Path(full_path), source.containers)
+        for grp, key, record in normalizer(source.kind, records, source.path, log):
+            writer.write(grp, hash_key(key), rows, record)
+            groups[grp] = groups.get(grp, 0) + 1
+            rows += 1
+    except Exception as e:
+        # Rows staged before the failure are kept (as the in-memory loader
+        # did); the manifest records the error so the file is retried.
+        error = str(e)
+    finally:
+        writer.close()
+
+    return {
+        'version': MANIFEST_VERSION,
+        'kind': source.kind,
+        'source': source.path,
+        **fingerprint,
+        'part': Path(part_path).name,
+        'rows': rows,
+        'groups': groups,
+        'log': log,
+        'error': error,
+        'ingested_at': datetime.now().isoformat()
+    }
+
+
+class IngestEngine:
+    """
+    Manifest-tracked streaming ingest with a queryable staging area
+
+    Layout under staging_dir:
+        manifests/<slug>.json   fingerprint, row/group counts, validation log
+        parts/<slug>.parquet    staged rows (or .jsonl without pyarrow)
+        staged.sqlite           query DB (only without duckdb)
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        staging_dir: Path,
+        normalizer: Normalizer,
+        normalizer_version: int = 1,
+        workers: Optional[int] = None,
+        force: bool = False
+    ):
+        """
+        Args:
+            base_path: Directory source paths are relative to
+            staging_dir: Staging area root
+            normalizer: Module-level (picklable) row normalizer
+            normalizer_version: Bump to invalidate manifests when normalization changes
+            workers: Process pool size (default: min(4, cpu count))
+            force: Re-ingest every file regardless of manifests
+        """
+        self.base_path = Path(base_path)
+        self.staging_dir = Path(staging_dir)
+        self.normalizer = normalizer
+        self.normalizer_version = normalizer_version
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.force = force
+
+        self.manifest_dir = self.staging_dir / 'manifests'
+        self.part_dir = self.staging_dir / 'parts'
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        self.part_dir.mkdir(parents=True, exist_ok=True)
+
+        self.manifests: List[Dict] = []  # in source order, for the current run
+        self._conn = None
+
+    @staticmethod
+    def _slug(source: SourceFile) -> str:
+        digest = hashlib.sha1(f"{source.kind}|{source.path}".encode()).hexdigest()[:12]
+        return f"{source.kind}-{Path(source.path).stem}-{digest}"
+
+    def _load_manifest(self, slug: str) -> Optional[Dict]:
+        path = self.manifest_dir / f"{slug}.json"
+        if not path.exists():
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, slug: str, manifest: Dict):
+        with open(self.manifest_dir / f"{slug}.json", 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    def _is_current(self, manifest: Optional[Dict], full_path: Path, stat) -> bool:
+        """Unchanged since last ingest? Stat first, content hash only if stat moved"""
+        if self.force or not manifest or manifest.get('error'):
+            return False
+        if manifest.get('version') != MANIFEST_VERSION:
+            return False
+        if manifest.get('normalizer_version') != self.normalizer_version:
+            return False
+        if not (self.part_dir / manifest['part']).exists():
+            return False
+        if Path(manifest['part']).suffix != _part_suffix():
+            return False  # staged by an environment with different optional deps
+        if manifest['size'] == stat.st_size and manifest['mtime_ns'] == stat.st_mtime_ns:
+            return True
+        if manifest['size'] != stat.st_size:
+            return False
+        return manifest['sha256'] == file_sha256(full_path)
+
+    def ingest(self, sources: Sequence[SourceFile]) -> List[Dict]:
+        """
+        Stage every existing source file, skipping those unchanged since the
+        last run, and return manifests in source order
+
+        Missing files are reported and skipped; their stale manifests are
+        not used.
+        """
+        self._close_query()
+        manifests: List[Optional[Dict]] = [None] * len(sources)
+        tasks = []
+
+        for i, source in enumerate(sources):
+            full_path = self.base_path / source.path
+            if not full_path.exists():
+                print(f"  ⏭ Skipping {source.path} (not found)")
+                continue
+
+            slug = self._slug(source)
+            stat = full_path.stat()
+            manifest = self._load_manifest(slug)
+
+            if self._is_current(manifest, full_path, stat):
+                if manifest['mtime_ns'] != stat.st_mtime_ns:
+                    manifest['mtime_ns'] = stat.st_mtime_ns
+                    self._save_manifest(slug, manifest)
+                print(f"  ✓ {source.path} unchanged ({manifest['rows']} rows staged)")
+                manifests[i] = manifest
+                continue
+
+            fingerprint = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': file_sha256(full_path),
+                'normalizer_version': self.normalizer_version
+            }
+            if manifest and manifest.get('part'):
+                (self.part_dir / manifest['part']).unlink(missing_ok=True)
+            part_path = self.part_dir / f"{slug}{_part_suffix()}"
+            tasks.append((i, slug, (source, str(full_path), str(part_path), self.normalizer, fingerprint)))
+
+        if tasks:
+            print(f"  📂 Ingesting {len(tasks)} file(s) with {min(self.workers, len(tasks))} worker(s)...")
+            if self.workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as pool:
+                    results = list(pool.map(_ingest_file, [task for _, _, task in tasks]))
+            else:
+                results = [_ingest_file(task) for _, _, task in tasks]
+
+            for (i, slug, _), manifest in zip(tasks, results):
+                self._save_manifest(slug, manifest)
+                manifests[i] = manifest
+                if manifest['error']:
+                    print(f"     ❌ {manifest['source']}: {manifest['error']} ({manifest['rows']} rows kept)")
+                else:
+                    print(f"     ✓ {manifest['source']}: {manifest['rows']} rows")
+
+        self.manifests = [m for m in manifests if m is not None]
+        return self.manifests
+
+    # ------------------------------------------------------------------
+    # Manifest-level summaries (no staging scan needed)
+    # ------------------------------------------------------------------
+
+    def group_counts(self, kind: str) -> Dict[str, int]:
+        """group -> staged (pre-dedup) rows, in order of first appearance"""
+        counts: Dict[str, int] = {}
+        for manifest in self.manifests:
+            if manifest['kind'] != kind:
+                continue
+            for grp, count in manifest['groups'].items():
+                counts[grp] = counts.get(grp, 0) + count
+        return counts
+
+    def validation_log(self) -> Dict:
+        """Normalizer logs merged across files (ints and dicts summed, lists concatenated)"""
+        merged: Dict = {}
+        for manifest in self.manifests:
+            _merge_into(merged, manifest['log'])
+        return merged
+
+    # ------------------------------------------------------------------
+    # Staging queries (hash-key dedup)
+    # ------------------------------------------------------------------
+
+    def _query(self):
+        if self._conn is None:
+            self._conn = self._open_duckdb() if duckdb is not None else self._open_sqlite()
+        return self._conn
+
+    def _close_query(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self):
+        self._close_query()
+
+    def _part_selects(self) -> List[Tuple[Dict, int, Path]]:
+        return [
+            (manifest, file_idx, self.part_dir / manifest['part'])
+            for file_idx, manifest in enumerate(self.manifests)
+        ]
+
+    def _open_duckdb(self):
+        conn = duckdb.connect()
+        selects = []
+        for manifest, file_idx, path in self._part_selects():
+            literal = "'" + path.as_posix().replace("'", "''") + "'"
+            if path.suffix == '.parquet':
+                reader = f"read_parquet({literal})"
+            else:
+                reader = (
+                    f"read_json({literal}, format='newline_delimited', columns={{"
+                    "'grp': 'VARCHAR', 'dedup_key': 'VARCHAR', 'seq': 'BIGINT', 'payload': 'VARCHAR'})"
+                )
+            kind = manifest['kind'].replace("'", "''")
+            selects.append(
+                f"SELECT '{kind}' AS kind, {file_idx} AS file_idx, grp, dedup_key, seq, payload FROM {reader}"
+            )
+        if not selects:
+            selects.append(
+                "SELECT NULL::VARCHAR AS kind, 0 AS file_idx, NULL::VARCHAR AS grp, "
+                "NULL::VARCHAR AS dedup_key, 0::BIGINT AS seq, NULL::VARCHAR AS payload WHERE false"
+            )
+        conn.execute("CREATE VIEW staged AS " + " UNION ALL ".join(selects))
+        return conn
+
+    def _open_sqlite(self):
+        db_path = self.staging_dir / 'staged.sqlite'
+        db_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute('''
+            CREATE TABLE staged (
+                kind TEXT NOT NULL,
+                file_idx INTEGER NOT NULL,
+                grp TEXT,
+                dedup_key TEXT,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL
+            )
+        ''')
+        for manifest, file_idx, path in self._part_selects():
+            conn.executemany(
+                'INSERT INTO staged VALUES (?, ?, ?, ?, ?, ?)',
+                ((manifest['kind'], file_idx, *values) for values in iter_part_rows(path))
+            )
+        conn.execute('CREATE INDEX idx_staged_kind_grp ON staged(kind, grp)')
+        conn.commit()
+        return conn
+
+    def _iter(self, sql: str, params: Sequence) -> Iterator[Tuple]:
+        cursor = self._query().cursor()
+        cursor.execute(sql, list(params))
+        while True:
+            rows = cursor.fetchmany(BATCH_SIZE)
+            if not rows:
+                break
+            yield from rows
+
+    def iter_records(
+        self,
+        kind: str,
+        group: Optional[str] = None,
+        unique: bool = True,
+        per_group: bool = False
+    ) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream (group, record) for one kind, ordered group by group (groups
+        in first-appearance order, rows in source order)
+
+        Args:
+            group: Restrict to one group
+            unique: Keep only the first row per dedup hash (rows without a
+                key are dropped)
+            per_group: Dedup within each group rather than across the selection
+        """
+        where = 'kind = ?'
+        params: List = [kind]
+        if group is not None:
+            where += ' AND grp = ?'
+            params.append(group)
+
+        partition = 'grp, dedup_key' if per_group else 'dedup_key'
+        keep = 'WHERE rn = 1 AND dedup_key IS NOT NULL' if unique else ''
+
+        sql = f'''
+            WITH sel AS (
+                SELECT grp, dedup_key, file_idx, seq, payload,
+                       MIN(file_idx * 4294967296 + seq) OVER (PARTITION BY grp) AS grp_first
+                FROM staged WHERE {where}
+            ), ranked AS (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY {partition} ORDER BY grp_first, file_idx, seq
+                ) AS rn
+                FROM sel
+            )
+            SELECT grp, payload FROM ranked {keep}
+            ORDER BY grp_first, file_idx, seq
+        '''
+        for grp, payload in self._iter(sql, params):
+            yield grp, json.loads(payload)
+
+    def count(self, kind: str, group: Optional[str] = None, unique: bool = True) -> int:
+        """Rows (or distinct dedup hashes) for one kind/group"""
+        where = 'kind = ?'
+        params: List = [kind]
+        if group is not None:
+            where += ' AND grp = ?'
+            params.append(group)
+        measure = 'COUNT(DISTINCT dedup_key)' if unique else 'COUNT(*)'
+        cursor = self._query().cursor()
+        cursor.execute(f'SELECT {measure} FROM staged WHERE {where}', params)
+        return cursor.fetchone()[0]
+
+    def unique_counts(self, kind: str) -> Dict[str, int]:
+        """group -> distinct dedup hashes within that group"""
+        cursor = self._query().cursor()
+        cursor.execute(
+            'SELECT grp, COUNT(DISTINCT dedup_key) FROM staged WHERE kind = ? GROUP BY grp',
+            [kind]
+        )
+        return dict(cursor.fetchall())
+
+
+def _merge_into(target: Dict, source: Dict):
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_into(target.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            target.setdefault(key, []).extend(value)
+        elif isinstance(value, (int, float)):
+            target[key] = target.get(key, 0) + value
+        else:
+            target[key] = value
+
+
+def write_json_collection(path: Path, header: Dict, list_key: str, items: Iterable[Dict]):
+    """
+    Stream {**header, list_key: [items...]} to disk one item at a time
+
+    Output is byte-identical to json.dump(..., indent=2) of the same dict.
+    """
+    with open(path, 'w') as f:
+        f.write('{\n')
+        for key, value in header.items():
+            rendered = json.dumps(value, indent=2).replace('\n', '\n  ')
+            f.write(f'  {json.dumps(key)}: {rendered},\n')
+        f.write(f'  {json.dumps(list_key)}: [')
+        empty = True
+        for item in items:
+            f.write('\n    ' if empty else ',\n    ')
+            f.write(json.dumps(item, indent=2).replace('\n', '\n    '))
+            empty = False
+        f.write(']\n}' if empty else '\n  ]\n}')
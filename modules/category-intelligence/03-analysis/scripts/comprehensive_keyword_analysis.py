@@ -22,10 +22,15 @@ Analysis Outputs:
 
 import json
 import re
+import sys
 from pathlib import Path
-from collections import Counter, defaultdict
+from collections import defaultdict
 import statistics
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.analysis.corpus import CorpusEngine, corpus_cache_id
+
 print("="*80)
 print("COMPREHENSIVE GARAGE ORGANIZER CATEGORY - KEYWORD ANALYSIS")
 print("Full Data Extraction - Top 2% Quality")
@@ -131,12 +136,9 @@ def clean_text(text):
     text = re.sub(r'\s+', ' ', text)
     return text.strip()
 
-def extract_ngrams(text, n=1):
-    """Extract n-grams from text."""
-    words = clean_text(text).split()
-    if n == 1:
-        return words
-    return [' '.join(words[i:i+n]) for i in range(len(words)-n+1)]
+def tokenize(text):
+    """Split cleaned text into words."""
+    return clean_text(text).split()
 
 # Stop words (common words to filter out)
 STOP_WORDS = set([
@@ -148,9 +150,14 @@ STOP_WORDS = set([
     'nbsp', 'amp', 'quot', 'lt', 'gt', 'br', 'ul', 'li', 'p'
 ])
 
-def filter_keywords(word_list):
-    """Filter out stop words and very short words."""
-    return [w for w in word_list if w not in STOP_WORDS and len(w) > 2]
+def is_keyword(word):
+    """Keep non-stop words longer than two characters."""
+    return word not in STOP_WORDS and len(word) > 2
+
+# Tokenized corpora are cached by source-file fingerprint; bump the version
+# if clean_text/tokenize change
+TOKENIZER_ID = corpus_cache_id("comprehensive_keyword_analysis", 1)
+engine = CorpusEngine(data_dir / ".corpus_cache")
 
 print("Extracting keywords from retailer product data...")
 
@@ -167,20 +174,22 @@ for product in products:
     full_text = f"{name} {desc} {features}"
     retailer_text_corpus.append(full_text)
 
-# Combine all retailer text
-all_retailer_text = ' '.join(retailer_text_corpus)
-retailer_unigrams = extract_ngrams(all_retailer_text, 1)
-retailer_bigrams = extract_ngrams(all_retailer_text, 2)
-retailer_trigrams = extract_ngrams(all_retailer_text, 3)
+retailer_corpus = engine.corpus(
+    "retailer", lambda: retailer_text_corpus, tokenize, TOKENIZER_ID, sources=[product_file]
+)
 
-retailer_unigrams_filtered = filter_keywords(retailer_unigrams)
-retailer_bigrams_filtered = filter_keywords(retailer_bigrams)
-retailer_trigrams_filtered = filter_keywords(retailer_trigrams)
+# The corpora were historically analysed as one joined string, so n-grams
+# may span document boundaries; keep that for comparable counts.
+retailer_unigram_freq = retailer_corpus.ngram_counts(
+    1, keep=engine.vocabulary.mask(is_keyword), within_documents=False
+)
+retailer_bigram_freq = retailer_corpus.ngram_counts(2, within_documents=False)
+retailer_trigram_freq = retailer_corpus.ngram_counts(3, within_documents=False)
 
 print(f"✓ Retailer corpus: {len(retailer_text_corpus):,} products")
-print(f"✓ Unigrams: {len(retailer_unigrams_filtered):,}")
-print(f"✓ Bigrams: {len(retailer_bigrams_filtered):,}")
-print(f"✓ Trigrams: {len(retailer_trigrams_filtered):,}")
+print(f"✓ Unigrams: {retailer_unigram_freq.total:,}")
+print(f"✓ Bigrams: {retailer_bigram_freq.total:,}")
+print(f"✓ Trigrams: {retailer_trigram_freq.total:,}")
 
 print("\nExtracting keywords from consumer data...")
 
@@ -218,19 +227,21 @@ for transcript_file in tt_transcripts:
     with open(transcript_file, encoding='utf-8') as f:
         consumer_text_corpus.append(f.read())
 
-all_consumer_text = ' '.join(consumer_text_corpus)
-consumer_unigrams = extract_ngrams(all_consumer_text, 1)
-consumer_bigrams = extract_ngrams(all_consumer_text, 2)
-consumer_trigrams = extract_ngrams(all_consumer_text, 3)
+consumer_sources = [reddit_file, youtube_file, tiktok_file, *yt_transcripts, *tt_transcripts]
+consumer_corpus = engine.corpus(
+    "consumer", lambda: consumer_text_corpus, tokenize, TOKENIZER_ID, sources=consumer_sources
+)
 
-consumer_unigrams_filtered = filter_keywords(consumer_unigrams)
-consumer_bigrams_filtered = filter_keywords(consumer_bigrams)
-consumer_trigrams_filtered = filter_keywords(consumer_trigrams)
+consumer_unigram_freq = consumer_corpus.ngram_counts(
+    1, keep=engine.vocabulary.mask(is_keyword), within_documents=False
+)
+consumer_bigram_freq = consumer_corpus.ngram_counts(2, within_documents=False)
+consumer_trigram_freq = consumer_corpus.ngram_counts(3, within_documents=False)
 
 print(f"✓ Consumer corpus: {len(consumer_text_corpus):,} documents")
-print(f"✓ Unigrams: {len(consumer_unigrams_filtered):,}")
-print(f"✓ Bigrams: {len(consumer_bigrams_filtered):,}")
-print(f"✓ Trigrams: {len(consumer_trigrams_filtered):,}")
+print(f"✓ Unigrams: {consumer_unigram_freq.total:,}")
+print(f"✓ Bigrams: {consumer_bigram_freq.total:,}")
+print(f"✓ Trigrams: {consumer_trigram_freq.total:,}")
 
 print()
 
@@ -241,15 +252,6 @@ print()
 print("PHASE 3: FREQUENCY ANALYSIS")
 print("-" * 80)
 
-# Count frequencies
-retailer_unigram_freq = Counter(retailer_unigrams_filtered)
-retailer_bigram_freq = Counter(retailer_bigrams_filtered)
-retailer_trigram_freq = Counter(retailer_trigrams_filtered)
-
-consumer_unigram_freq = Counter(consumer_unigrams_filtered)
-consumer_bigram_freq = Counter(consumer_bigrams_filtered)
-consumer_trigram_freq = Counter(consumer_trigrams_filtered)
-
 print("Top 20 Retailer Keywords (Unigrams):")
 for i, (term, count) in enumerate(retailer_unigram_freq.most_common(20), 1):
     print(f"  {i:2d}. {term:20s} → {count:,}")
@@ -279,10 +281,10 @@ output_data = {
         "corpus_stats": {
             "retailer_documents": len(retailer_text_corpus),
             "consumer_documents": len(consumer_text_corpus),
-            "retailer_unigrams": len(retailer_unigrams_filtered),
-            "consumer_unigrams": len(consumer_unigrams_filtered),
-            "retailer_bigrams": len(retailer_bigrams_filtered),
-            "consumer_bigrams": len(consumer_bigrams_filtered)
+            "retailer_unigrams": retailer_unigram_freq.total,
+            "consumer_unigrams": consumer_unigram_freq.total,
+            "retailer_bigrams": retailer_bigram_freq.total,
+            "consumer_bigrams": consumer_bigram_freq.total
         }
     },
     "retailer_keywords": {
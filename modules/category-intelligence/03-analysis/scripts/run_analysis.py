@@ -7,7 +7,8 @@ import logging
 from pathlib import Path
 import yaml
 
-from src.analysis.summary import compute_summary
+from src.analysis.summary import SummaryAggregator
+from src.analysis.entity_resolution import EntityResolver, Listing, listings_from_products
 from src.analysis.keyword_language import (
     compute_keyword_language_summary,
     write_keyword_language_summary,
@@ -20,8 +21,8 @@ from src.pipeline.collectors.target import (
     TargetParser,
     TargetRequestConfig,
 )
-from src.pipeline.collectors import CompositeBrandCollector, CompositeProductCatalog
-from src.pipeline.orchestrator import CategoryIntelligencePipeline
+from src.pipeline.collectors import CompositeBrandCollector, CompositeProductCatalog, FetchScheduler, SnapshotStore
+from src.pipeline.orchestrator import CallbackSink, CategoryIntelligencePipeline
 from src.reporting.markdown_report import MarkdownReporter
 from src.storage.filesystem import FilesystemWriter
 from src.storage.postgres import PostgresWriter
@@ -80,6 +81,18 @@ def _target_request_config(collection_settings: dict) -> TargetRequestConfig:
     )
 
 
+def _end_sinks(sinks: list, method: str) -> None:
+    """Call ``close`` (commit) or ``abort`` (roll back) on every sink that has it."""
+    for sink in sinks:
+        end = getattr(sink, method, None)
+        if end is None:
+            continue
+        try:
+            end()
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.error("Failed to %s sink %s: %s", method, type(sink).__name__, exc)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run Category Intelligence pipeline")
     parser.add_argument("--category", required=True, help="Category label (e.g. 'garage organization')")
@@ -106,6 +119,19 @@ def main() -> None:
         default=[],
         help="Optional community language JSON files (e.g., Reddit) for keyword analysis",
     )
+    parser.add_argument(
+        "--snapshot-dir",
+        default=None,
+        help="Raw response snapshot store (default: <data-dir>/snapshots)",
+    )
+    parser.add_argument(
+        "--replay",
+        nargs="?",
+        const="latest",
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="Rebuild outputs from stored snapshots without network access (latest, or as of a date)",
+    )
     args = parser.parse_args()
 
     config = _load_config(args.config)
@@ -132,7 +158,24 @@ def main() -> None:
     stores = _build_shopify_configs(collection_settings)
     if not stores and collection_settings.get("use_default_shopify", True):
         stores = _default_shopify_stores()
-    api = ShopifyAPI()
+    # One scheduler so every collector shares pooled connections, per-host
+    # rate limits and the conditional-request cache
+    snapshot_dir = Path(
+        args.snapshot_dir
+        or config.get("outputs", {}).get("snapshot_dir")
+        or Path(args.data_dir) / "snapshots"
+    )
+    snapshots = SnapshotStore(snapshot_dir)
+    if args.replay and not snapshots.dates():
+        raise RuntimeError(f"No snapshots to replay in {snapshot_dir}")
+    scheduler = FetchScheduler(
+        max_workers=int(collection_settings.get("max_concurrent_requests", 8)),
+        cache_dir=Path(args.data_dir) / "http_cache",
+        snapshots=snapshots,
+        replay=bool(args.replay),
+        replay_as_of=None if args.replay in (None, "latest") else args.replay,
+    )
+    api = ShopifyAPI(scheduler=scheduler)
     collectors = []
     catalogs = []
     if stores:
@@ -140,7 +183,7 @@ def main() -> None:
         catalogs.append(ShopifyProductCatalog(stores, api))
 
     target_config = _target_request_config(collection_settings)
-    target_scraper = TargetScraper(target_config)
+    target_scraper = TargetScraper(target_config, scheduler=scheduler)
     target_parser = TargetParser()
     target_filters = collection_settings.get("target_filters", {})
     include_terms = target_filters.get("include_terms", [])
@@ -165,35 +208,79 @@ def main() -> None:
     composite_catalog = CompositeProductCatalog(catalogs)
     pipeline = CategoryIntelligencePipeline(composite_brand, composite_catalog, min_brands=args.min_brands)
 
-    _LOGGER.info("Collecting live data for category '%s' across %d Shopify stores + Target", args.category, len(stores))
-    results = pipeline.run(args.category)
-    brands = list(results["brands"])
-    products = list(results["products"])
-
-    if len(brands) < args.min_brands:
-        raise RuntimeError(f"Insufficient brands: {len(brands)} < {args.min_brands}")
-    if len(products) < args.min_products:
-        raise RuntimeError(f"Insufficient products: {len(products)} < {args.min_products}")
-
-    # Persist structured data
+    # Records stream to every sink as they are collected, so a failed run
+    # keeps what it gathered and nothing waits for the full crawl
     data_dir = Path(args.data_dir)
     writer = FilesystemWriter(data_dir)
-    writer.write_brands(args.category, brands)
-    writer.write_products(args.category, products)
+    aggregator = SummaryAggregator()
+    # Entity resolution only needs each listing's key/retailer/brand/title,
+    # so the full records are never held in memory
+    listings: list[Listing] = []
+    sinks: list = [
+        writer.stream_sink(args.category),
+        CallbackSink(on_brands=aggregator.add_brands, on_products=aggregator.add_products),
+        CallbackSink(on_products=lambda batch: listings.extend(listings_from_products(batch))),
+    ]
 
     duckdb_writer = None
     if args.duckdb_path:
         duckdb_path = Path(args.duckdb_path)
         try:
             duckdb_writer = DuckDBWriter(duckdb_path, project_key=args.project_key)
-            duckdb_writer.write_brands(args.category, brands)
-            duckdb_writer.write_products(args.category, products)
-            duckdb_writer.close()
-            _LOGGER.info("Persisted records to DuckDB at %s", duckdb_path)
+            sinks.append(duckdb_writer)
         except Exception as exc:  # pragma: no cover
-            _LOGGER.error("Failed to persist to DuckDB: %s", exc)
+            _LOGGER.error("Failed to open DuckDB at %s: %s", duckdb_path, exc)
+
+    if args.postgres_dsn and args.replay:
+        _LOGGER.info("Replay mode: skipping Postgres persistence")
+    elif args.postgres_dsn:
+        project_metadata = None
+        if args.project_key:
+            project_metadata = {
+                "client": args.project_client,
+                "project_name": args.project_name,
+                "description": args.project_description,
+            }
+        sinks.append(
+            PostgresWriter(
+                args.postgres_dsn,
+                project_key=args.project_key,
+                project_metadata=project_metadata,
+            )
+        )
+
+    if args.replay:
+        _LOGGER.info("Replaying snapshots (%s) from %s for category '%s'", args.replay, snapshot_dir, args.category)
+    else:
+        _LOGGER.info("Collecting live data for category '%s' across %d Shopify stores + Target", args.category, len(stores))
+    # Sinks commit only after a complete run; a failed run (or a sink the
+    # pipeline dropped) is rolled back so the last good outputs survive
+    try:
+        results = pipeline.stream(args.category, sinks, min_products=args.min_products, keep_records=False)
+    except BaseException:
+        _end_sinks(sinks, "abort")
+        raise
+    finally:
+        scheduler.close()
+    failed_sinks = results["failed_sinks"]
+    _end_sinks(failed_sinks, "abort")
+    _end_sinks([sink for sink in sinks if not any(sink is failed for failed in failed_sinks)], "close")
+    brand_count = results["counts"]["brands"]
+    product_count = results["counts"]["products"]
+    if duckdb_writer is not None:
+        _LOGGER.info("Persisted records to DuckDB at %s", args.duckdb_path)
+
+    canonical = EntityResolver().resolve(listings)
+    canonical_path = writer.write_canonical_products(args.category, canonical)
+    _LOGGER.info(
+        "Resolved %d listings to %d canonical products (%d sold at multiple retailers) -> %s",
+        product_count,
+        len(canonical),
+        len(canonical.multi_retailer_ids()),
+        canonical_path,
+    )
 
-    summary = compute_summary(brands, products)
+    summary = aggregator.summary(canonical)
     summary_path = data_dir / f"{args.category.replace(' ', '_')}_summary.json"
     summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False))
     _LOGGER.info("Retailer coverage: %s", summary.get("retailer_counts"))
@@ -201,41 +288,23 @@ def main() -> None:
     load_info = summary.get("load_capacity", {})
     _LOGGER.info("Products with load capacity: %s (max %s lbs)", load_info.get("with_capacity"), load_info.get("max_capacity"))
 
-    if args.postgres_dsn:
-        try:
-            project_metadata = None
-            if args.project_key:
-                project_metadata = {
-                    "client": args.project_client,
-                    "project_name": args.project_name,
-                    "description": args.project_description,
-                }
-            pg_writer = PostgresWriter(
-                args.postgres_dsn,
-                project_key=args.project_key,
-                project_metadata=project_metadata,
-            )
-            pg_writer.write_brands(args.category, brands)
-            pg_writer.write_products(args.category, products)
-            _LOGGER.info("Persisted records to Postgres")
-        except RuntimeError as err:
-            _LOGGER.error("Postgres writer unavailable: %s", err)
-        except Exception as exc:  # pragma: no cover - unexpected DB error
-            _LOGGER.error("Failed to persist to Postgres: %s", exc)
-
     # Render markdown summary
     outputs_dir = Path('outputs')
     outputs_dir.mkdir(exist_ok=True)
     reporter = MarkdownReporter()
-    reporter.render(args.category, brands, products, outputs_dir / f"{args.output}.md", summary=summary)
+    reporter.render(args.category, brand_count, product_count, outputs_dir / f"{args.output}.md", summary=summary)
 
-    _LOGGER.info("Collected %d brands and %d products", len(brands), len(products))
+    _LOGGER.info("Collected %d brands and %d products", brand_count, product_count)
     _LOGGER.info("Markdown report written to %s", outputs_dir / f"{args.output}.md")
 
     if args.ad_snapshots and args.community_snapshots:
         ad_paths = [Path(p) for p in args.ad_snapshots]
         community_paths = [Path(p) for p in args.community_snapshots]
-        keyword_summary = compute_keyword_language_summary(ad_paths, community_paths)
+        keyword_summary = compute_keyword_language_summary(
+            ad_paths,
+            community_paths,
+            cache_dir=outputs_dir / ".corpus_cache",
+        )
         keyword_output = outputs_dir / f"{args.output}_keyword_language.json"
         keyword_payload = write_keyword_language_summary(keyword_summary, keyword_output)
         keyword_store_path = writer.write_keyword_summary(
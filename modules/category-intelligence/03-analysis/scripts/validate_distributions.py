@@ -5,10 +5,15 @@ Checks for sampling bias across categories, price points, and subcategories.
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict, Counter
 import statistics
 
+# Shared keyword matcher lives in the repo-level core package
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+from core.text import KeywordMatcher
+
 DATA_FILE = Path(__file__).parent / "data" / "garage_organizers_final_b_plus.json"
 
 # Expected market distributions based on industry research & category expertise
@@ -53,29 +58,37 @@ def load_data():
         data = json.load(f)
     return data.get('products', [])
 
+# Category keywords, matched at word starts so e.g. "bin" no longer fires
+# inside "cabinet" and "rack" inside "bracket"
+CATEGORY_MATCHER = KeywordMatcher({
+    'Hooks & Hangers': ['hook', 'hanger', 'peg'],
+    'Cabinets & Storage': ['cabinet', 'locker'],
+    'Shelving': ['shelf', 'shelving', 'rack'],
+    'Bins & Containers': ['bin', 'container', 'tote'],
+    'Workbenches': ['workbench', 'work bench'],
+    'Wall Systems': ['pegboard', 'slatwall', 'wall panel'],
+    'Overhead Storage': ['ceiling', 'overhead'],
+    # Tool Storage needs both terms
+    '_tool': ['tool'],
+    '_organizer': ['organizer'],
+})
+
+
+def _categories_from_labels(labels):
+    categories = [label for label in labels if not label.startswith('_')]
+    if '_tool' in labels and '_organizer' in labels:
+        categories.append('Tool Storage')
+    return categories if categories else ['Other']
+
+
 def categorize_product(name):
     """Categorize products into main categories."""
-    name_lower = name.lower()
-    categories = []
-
-    if any(term in name_lower for term in ['hook', 'hanger', 'peg']):
-        categories.append('Hooks & Hangers')
-    if any(term in name_lower for term in ['cabinet', 'locker']):
-        categories.append('Cabinets & Storage')
-    if any(term in name_lower for term in ['shelf', 'shelving', 'rack']):
-        categories.append('Shelving')
-    if any(term in name_lower for term in ['bin', 'container', 'tote']):
-        categories.append('Bins & Containers')
-    if 'workbench' in name_lower or 'work bench' in name_lower:
-        categories.append('Workbenches')
-    if any(term in name_lower for term in ['pegboard', 'slatwall', 'wall panel']):
-        categories.append('Wall Systems')
-    if any(term in name_lower for term in ['ceiling', 'overhead']):
-        categories.append('Overhead Storage')
-    if 'tool' in name_lower and 'organizer' in name_lower:
-        categories.append('Tool Storage')
+    return _categories_from_labels(CATEGORY_MATCHER.labels(name))
 
-    return categories if categories else ['Other']
+
+def categorize_products(names):
+    """Categorize many product names in one batch."""
+    return [_categories_from_labels(labels) for labels in CATEGORY_MATCHER.labels_many(names)]
 
 def categorize_shelving_type(name):
     """Subcategorize shelving products."""
@@ -138,9 +151,8 @@ def validate_category_distribution(products):
 
     # Count products by category
     category_counts = defaultdict(int)
-    for product in products:
-        name = product.get('name') or product.get('title', '')
-        categories = categorize_product(name)
+    names = [product.get('name') or product.get('title', '') for product in products]
+    for categories in categorize_products(names):
         for cat in categories:
             category_counts[cat] += 1
 
@@ -0,0 +1,413 @@
+"""Tokenized corpus engine: integer token arrays, n-gram counts and contrasts."""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+CACHE_VERSION = 1
+# Token IDs are packed into one int64 per n-gram (up to trigrams), so the
+# shared vocabulary is limited to 2**21 distinct tokens.
+_ID_BITS = 21
+_MAX_N = 3
+
+Tokenizer = Callable[[str], Sequence[str]]
+
+
+class Vocabulary:
+    """Token <-> integer ID mapping shared by every corpus of an engine."""
+
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def add(self, token: str) -> int:
+        token_id = self._ids.get(token)
+        if token_id is None:
+            token_id = len(self.tokens)
+            if token_id >= 1 << _ID_BITS:
+                raise ValueError(f"Vocabulary exceeds {1 << _ID_BITS} tokens")
+            self._ids[token] = token_id
+            self.tokens.append(token)
+        return token_id
+
+    def get(self, token: str) -> int | None:
+        return self._ids.get(token)
+
+    def encode(self, tokens: Iterable[str]) -> np.ndarray:
+        add = self.add
+        return np.fromiter((add(token) for token in tokens), dtype=np.int32)
+
+    def mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Boolean array over token IDs, for vectorized token filters."""
+        return np.fromiter((predicate(token) for token in self.tokens), dtype=bool, count=len(self.tokens))
+
+
+@dataclass
+class NgramCounts:
+    """Counts of packed n-gram keys, sorted by key."""
+
+    vocabulary: Vocabulary
+    n: int
+    keys: np.ndarray
+    counts: np.ndarray
+    first_seen: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def decode(self, key: int) -> str:
+        mask = (1 << _ID_BITS) - 1
+        ids = [(int(key) >> (_ID_BITS * shift)) & mask for shift in range(self.n - 1, -1, -1)]
+        return " ".join(self.vocabulary.tokens[token_id] for token_id in ids)
+
+    def encode(self, term: str) -> int | None:
+        parts = term.split(" ")
+        if len(parts) != self.n:
+            return None
+        key = 0
+        for part in parts:
+            token_id = self.vocabulary.get(part)
+            if token_id is None:
+                return None
+            key = (key << _ID_BITS) | token_id
+        return key
+
+    def get(self, term: str, default: int = 0) -> int:
+        key = self.encode(term)
+        if key is None:
+            return default
+        index = int(np.searchsorted(self.keys, key))
+        if index < len(self.keys) and self.keys[index] == key:
+            return int(self.counts[index])
+        return default
+
+    def __getitem__(self, term: str) -> int:
+        return self.get(term)
+
+    def most_common(self, k: int | None = None) -> list[tuple[str, int]]:
+        """Like Counter.most_common: count descending, ties in first-seen order."""
+        order = np.lexsort((self.first_seen, -self.counts))
+        if k is not None:
+            order = order[:k]
+        return [(self.decode(self.keys[i]), int(self.counts[i])) for i in order]
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(self.most_common())
+
+
+@dataclass
+class TokenizedCorpus:
+    """A corpus as one flat token-ID array plus per-document offsets."""
+
+    name: str
+    vocabulary: Vocabulary
+    tokens: np.ndarray
+    offsets: np.ndarray
+
+    @property
+    def n_documents(self) -> int:
+        return len(self.offsets) - 1
+
+    def doc_ids(self) -> np.ndarray:
+        return np.repeat(np.arange(self.n_documents, dtype=np.int64), np.diff(self.offsets))
+
+    def _ngram_keys(self, n: int, keep: np.ndarray | None, within_documents: bool) -> tuple[np.ndarray, np.ndarray]:
+        """Packed keys and their start positions for every valid n-gram."""
+        if not 1 <= n <= _MAX_N:
+            raise ValueError(f"n must be between 1 and {_MAX_N}")
+        m = len(self.tokens) - n + 1
+        if m <= 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        columns = [self.tokens[i:i + m].astype(np.int64) for i in range(n)]
+        valid = np.ones(m, dtype=bool)
+        if within_documents and n > 1:
+            doc_ids = self.doc_ids()
+            valid &= doc_ids[:m] == doc_ids[n - 1:]
+        if keep is not None:
+            if len(keep) < len(self.vocabulary):
+                raise ValueError("keep mask is older than the vocabulary; rebuild it with Vocabulary.mask")
+            for column in columns:
+                valid &= keep[column]
+
+        keys = columns[0]
+        for column in columns[1:]:
+            keys = (keys << _ID_BITS) | column
+        positions = np.flatnonzero(valid)
+        return keys[positions], positions
+
+    def ngram_counts(
+        self,
+        n: int = 1,
+        keep: np.ndarray | None = None,
+        within_documents: bool = True,
+    ) -> NgramCounts:
+        """Count n-grams (n = 1..3).
+
+        Args:
+            keep: Boolean vocabulary mask; n-grams containing a token outside
+                the mask are dropped (see Vocabulary.mask)
+            within_documents: Drop n-grams that span a document boundary
+        """
+        keys, positions = self._ngram_keys(n, keep, within_documents)
+        unique, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+        return NgramCounts(self.vocabulary, n, unique, counts, positions[first_index])
+
+    def positional_index(self) -> "PositionalIndex":
+        """Term -> (document, token offset) postings over this corpus."""
+        order = np.argsort(self.tokens, kind="stable")
+        starts = np.searchsorted(self.tokens[order], np.arange(len(self.vocabulary) + 1))
+        return PositionalIndex(self, order, starts)
+
+    def document_frequency(self, n: int = 1, keep: np.ndarray | None = None) -> NgramCounts:
+        """Number of documents containing each n-gram."""
+        keys, positions = self._ngram_keys(n, keep, True)
+        doc_ids = self.doc_ids()[positions]
+        # Keep one entry per distinct (n-gram, document) pair
+        order = np.lexsort((doc_ids, keys))
+        keys, doc_ids = keys[order], doc_ids[order]
+        distinct = np.ones(len(keys), dtype=bool)
+        distinct[1:] = (keys[1:] != keys[:-1]) | (doc_ids[1:] != doc_ids[:-1])
+        unique, first_index, counts = np.unique(keys[distinct], return_index=True, return_counts=True)
+        return NgramCounts(self.vocabulary, n, unique, counts, first_index)
+
+
+@dataclass
+class PositionalIndex:
+    """Inverted index from token ID to its positions in a corpus.
+
+    Positions of each token are stored contiguously in ascending order, so a
+    lookup is a slice and documents come back in corpus order. Phrases are
+    matched by checking the following tokens at each position of the first.
+    """
+
+    corpus: TokenizedCorpus
+    order: np.ndarray
+    starts: np.ndarray
+
+    def _token_positions(self, token: str) -> np.ndarray:
+        token_id = self.corpus.vocabulary.get(token)
+        # Tokens added to the vocabulary after the index was built cannot occur
+        if token_id is None or token_id + 1 >= len(self.starts):
+            return np.empty(0, dtype=np.int64)
+        return self.order[self.starts[token_id]:self.starts[token_id + 1]]
+
+    def positions(self, term: str) -> np.ndarray:
+        """Flat corpus positions where ``term`` (one or more tokens) starts."""
+        parts = term.split(" ")
+        positions = self._token_positions(parts[0])
+        if len(parts) == 1 or not len(positions):
+            return positions
+        tokens, offsets = self.corpus.tokens, self.corpus.offsets
+        doc_ends = offsets[np.searchsorted(offsets, positions, side="right")]
+        positions = positions[positions + len(parts) <= doc_ends]
+        for shift, part in enumerate(parts[1:], start=1):
+            token_id = self.corpus.vocabulary.get(part)
+            if token_id is None:
+                return np.empty(0, dtype=np.int64)
+            positions = positions[tokens[positions + shift] == token_id]
+        return positions
+
+    def postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        """(document index, token offset within document) for every occurrence."""
+        positions = self.positions(term)
+        doc_ids = np.searchsorted(self.corpus.offsets, positions, side="right") - 1
+        return doc_ids, positions - self.corpus.offsets[doc_ids]
+
+    def documents(self, term: str) -> np.ndarray:
+        """Distinct documents containing ``term``, in corpus order."""
+        return np.unique(self.postings(term)[0])
+
+    def first(self, term: str) -> tuple[int, int] | None:
+        """(document, token offset) of the first occurrence, if any."""
+        doc_ids, token_offsets = self.postings(term)
+        if not len(doc_ids):
+            return None
+        return int(doc_ids[0]), int(token_offsets[0])
+
+
+def _aligned(target: NgramCounts, background: NgramCounts) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if target.vocabulary is not background.vocabulary or target.n != background.n:
+        raise ValueError("Contrast requires n-gram counts of the same order from one engine")
+    keys = np.union1d(target.keys, background.keys)
+    counts_target = np.zeros(len(keys), dtype=np.float64)
+    counts_background = np.zeros(len(keys), dtype=np.float64)
+    counts_target[np.searchsorted(keys, target.keys)] = target.counts
+    counts_background[np.searchsorted(keys, background.keys)] = background.counts
+    return keys, counts_target, counts_background
+
+
+def log_odds_contrast(
+    target: NgramCounts,
+    background: NgramCounts,
+    prior_scale: float = 10.0,
+    min_count: int = 1,
+    k: int | None = 25,
+) -> list[tuple[str, float, int, int]]:
+    """Terms most over-represented in target vs. background.
+
+    Weighted log-odds ratio with an informative Dirichlet prior (the pooled
+    frequencies), reported as a z-score so rare terms are not over-ranked.
+
+    Returns:
+        (term, z_score, target_count, background_count), highest z first
+    """
+    keys, y_target, y_background = _aligned(target, background)
+    if not len(keys):
+        return []
+    pooled = y_target + y_background
+    alpha = prior_scale * pooled / pooled.sum()
+    alpha_total = alpha.sum()
+    n_target, n_background = y_target.sum(), y_background.sum()
+
+    delta = (
+        np.log((y_target + alpha) / (n_target + alpha_total - y_target - alpha))
+        - np.log((y_background + alpha) / (n_background + alpha_total - y_background - alpha))
+    )
+    z_scores = delta / np.sqrt(1.0 / (y_target + alpha) + 1.0 / (y_background + alpha))
+
+    candidates = np.flatnonzero(y_target >= min_count)
+    order = candidates[np.argsort(-z_scores[candidates], kind="stable")]
+    if k is not None:
+        order = order[:k]
+    return [
+        (target.decode(keys[i]), round(float(z_scores[i]), 4), int(y_target[i]), int(y_background[i]))
+        for i in order
+    ]
+
+
+def tfidf_contrast(
+    target: TokenizedCorpus,
+    background: TokenizedCorpus,
+    n: int = 1,
+    keep: np.ndarray | None = None,
+    k: int | None = 25,
+) -> list[tuple[str, float]]:
+    """Terms whose TF-IDF weight in target most exceeds background.
+
+    Term frequencies are relative within each corpus; IDF is computed over
+    the documents of both corpora combined.
+    """
+    tf_target, tf_background = target.ngram_counts(n, keep), background.ngram_counts(n, keep)
+    keys, y_target, y_background = _aligned(tf_target, tf_background)
+    if not len(keys):
+        return []
+    _, df_target, df_background = _aligned(
+        target.document_frequency(n, keep), background.document_frequency(n, keep)
+    )
+    n_docs = target.n_documents + background.n_documents
+    idf = np.log((1 + n_docs) / (1 + df_target + df_background)) + 1.0
+
+    scores = (y_target / max(y_target.sum(), 1) - y_background / max(y_background.sum(), 1)) * idf
+    order = np.argsort(-scores, kind="stable")
+    if k is not None:
+        order = order[:k]
+    return [(tf_target.decode(keys[i]), round(float(scores[i]), 6)) for i in order]
+
+
+class CorpusEngine:
+    """Tokenizes corpora once into a shared vocabulary, with an optional disk cache.
+
+    Cached corpora are keyed by corpus name, tokenizer ID and the
+    fingerprints (path, size, mtime) of their source files, so reruns with
+    different thresholds load token arrays instead of re-tokenizing.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.vocabulary = Vocabulary()
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def corpus(
+        self,
+        name: str,
+        documents: Callable[[], Iterable[str]],
+        tokenizer: Tokenizer,
+        tokenizer_id: str,
+        sources: Sequence[Path] = (),
+    ) -> TokenizedCorpus:
+        """Tokenized corpus, loaded from cache when its sources are unchanged.
+
+        Args:
+            documents: Called only on a cache miss
+            tokenizer_id: Identifies the tokenizer's behavior; change it
+                whenever tokenization rules change
+            sources: Files the documents are derived from (enables caching)
+        """
+        cache_path = self._cache_path(name, tokenizer_id, sources)
+        if cache_path is not None and cache_path.exists():
+            return self._load(name, cache_path)
+
+        encode = self.vocabulary.add
+        token_ids: list[int] = []
+        offsets = [0]
+        for text in documents():
+            token_ids.extend(encode(token) for token in tokenizer(text))
+            offsets.append(len(token_ids))
+
+        corpus = TokenizedCorpus(
+            name,
+            self.vocabulary,
+            np.asarray(token_ids, dtype=np.int32),
+            np.asarray(offsets, dtype=np.int64),
+        )
+        if cache_path is not None:
+            self._save(corpus, cache_path)
+        return corpus
+
+    def _cache_path(self, name: str, tokenizer_id: str, sources: Sequence[Path]) -> Path | None:
+        if self.cache_dir is None or not sources:
+            return None
+        fingerprints = []
+        for source in sources:
+            source = Path(source)
+            if source.exists():
+                stat = source.stat()
+                fingerprints.append([str(source.resolve()), stat.st_size, stat.st_mtime_ns])
+            else:
+                fingerprints.append([str(source), None, None])
+        payload = json.dumps(
+            {"version": CACHE_VERSION, "name": name, "tokenizer": tokenizer_id, "sources": fingerprints},
+            sort_keys=True,
+        )
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{name}-{digest}.npz"
+
+    def _save(self, corpus: TokenizedCorpus, path: Path) -> None:
+        # Store only the tokens this corpus uses, with locally renumbered IDs
+        used, local_tokens = np.unique(corpus.tokens, return_inverse=True)
+        vocab_blob = json.dumps([self.vocabulary.tokens[i] for i in used], ensure_ascii=False).encode("utf-8")
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            tokens=local_tokens.astype(np.int32),
+            offsets=corpus.offsets,
+            vocabulary=np.frombuffer(vocab_blob, dtype=np.uint8),
+        )
+        tmp_path.replace(path)
+
+    def _load(self, name: str, path: Path) -> TokenizedCorpus:
+        with np.load(path) as data:
+            local_vocab = json.loads(data["vocabulary"].tobytes().decode("utf-8"))
+            remap = self.vocabulary.encode(local_vocab)
+            tokens = remap[data["tokens"]] if len(remap) else data["tokens"].astype(np.int32)
+            return TokenizedCorpus(name, self.vocabulary, tokens.astype(np.int32), data["offsets"].astype(np.int64))
+
+
+def corpus_cache_id(*parts: object) -> str:
+    """Short stable ID for tokenizer settings (e.g. stopword lists)."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:12]
@@ -0,0 +1,314 @@
+"""Cross-retailer product entity resolution."""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+from ..pipeline.product_catalog import ProductRecord
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_MODEL_PATTERN = re.compile(r"[a-z0-9]+(?:[-./][a-z0-9]+)*")
+_MODEL_SEPARATORS = re.compile(r"[-./]")
+_UNIT_PATTERN = re.compile(
+    r"^\d+(?:\.\d+)?(?:lb|lbs|in|inch|ft|pk|pack|ct|count|oz|mm|cm|kg|g|pc|pcs|piece|x\d*)?$"
+)
+_BRAND_SUFFIXES = {"inc", "llc", "co", "corp", "company", "brand", "brands", "ltd"}
+_STOPWORDS = {"the", "and", "for", "with", "of", "a", "to", "in", "by", "&"}
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+@dataclass(frozen=True)
+class Listing:
+    """One retailer listing as seen by the resolver."""
+
+    key: str
+    retailer: str
+    brand: str
+    title: str
+
+
+def listing_key(retailer: str | None, identifier: str | None) -> str:
+    return f"{retailer or ''}|{identifier or ''}"
+
+
+def product_listing_key(product: ProductRecord) -> str:
+    return listing_key(product.retailer, product.sku or product.url)
+
+
+def listings_from_products(products: Iterable[ProductRecord]) -> list[Listing]:
+    listings = []
+    for product in products:
+        brand = product.attributes.get("vendor") or product.attributes.get("brand") or ""
+        listings.append(
+            Listing(
+                key=product_listing_key(product),
+                retailer=product.retailer or "",
+                brand=brand if isinstance(brand, str) else "",
+                title=product.name or "",
+            )
+        )
+    return listings
+
+
+def listings_from_records(records: Iterable[Mapping[str, Any]]) -> list[Listing]:
+    """Listings from consolidated product dicts (product_id/retailer/brand/name)."""
+    return [
+        Listing(
+            key=listing_key(record.get("retailer"), record.get("product_id")),
+            retailer=record.get("retailer") or "",
+            brand=record.get("brand") or "",
+            title=record.get("name") or "",
+        )
+        for record in records
+    ]
+
+
+def normalize_brand(brand: str | None) -> str:
+    if not brand:
+        return ""
+    tokens = [t for t in re.findall(r"[a-z0-9]+", brand.lower()) if t not in _BRAND_SUFFIXES]
+    normalized = "".join(tokens)
+    return "" if normalized == "unknown" else normalized
+
+
+def title_tokens(title: str) -> list[str]:
+    return [t for t in _TOKEN_PATTERN.findall(title.lower()) if t not in _STOPWORDS]
+
+
+def model_tokens(title: str) -> set[str]:
+    """Model-number-like tokens ("ST-1234", "17031"), excluding sizes and pack counts."""
+    models = set()
+    for token in _MODEL_PATTERN.findall(title.lower()):
+        compact = _MODEL_SEPARATORS.sub("", token)
+        if len(compact) < 4 or not any(c.isdigit() for c in compact):
+            continue
+        if _UNIT_PATTERN.match(compact):
+            continue
+        models.add(compact)
+    return models
+
+
+@dataclass
+class CanonicalProductTable:
+    """Listing key -> canonical product ID assignments produced by EntityResolver."""
+
+    listings: dict[str, Listing]
+    assignments: dict[str, str]
+    members: dict[str, list[str]]
+    match_scores: dict[str, float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def canonical_id(self, key: str) -> str | None:
+        return self.assignments.get(key)
+
+    def canonical_id_for(self, product: ProductRecord) -> str | None:
+        return self.assignments.get(product_listing_key(product))
+
+    def multi_retailer_ids(self) -> list[str]:
+        return [
+            canonical_id
+            for canonical_id, keys in self.members.items()
+            if len({self.listings[key].retailer for key in keys}) > 1
+        ]
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "listing_key": key,
+                "canonical_id": canonical_id,
+                "retailer": self.listings[key].retailer,
+                "brand": self.listings[key].brand,
+                "title": self.listings[key].title,
+                "match_score": self.match_scores.get(key),
+            }
+            for key, canonical_id in self.assignments.items()
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_listings": len(self.assignments),
+            "total_canonical_products": len(self),
+            "multi_retailer_products": len(self.multi_retailer_ids()),
+            "listings": self.rows(),
+        }
+
+    def write_json(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False))
+        return path
+
+
+@dataclass
+class EntityResolver:
+    """Clusters listings of the same physical product across retailers.
+
+    Candidate pairs come from two blocking schemes so that scoring never
+    touches the full n^2 space:
+
+    * model blocks - listings sharing a model-number token
+    * MinHash LSH - listings of the same brand whose title token sets land in
+      a common band bucket (approximate Jaccard >= ~0.5 with the defaults)
+
+    Candidates are scored by TF-IDF cosine over title tokens and merged
+    best-first with union-find. Pairs with conflicting brands or disjoint
+    model numbers are never merged, and with ``cross_retailer_only`` a
+    cluster never holds two listings from the same retailer (same-retailer
+    duplicates are left to the exact sku/url dedup upstream).
+    """
+
+    similarity_threshold: float = 0.6
+    model_match_threshold: float = 0.3
+    num_perm: int = 64
+    bands: int = 16
+    max_bucket_size: int = 200
+    cross_retailer_only: bool = True
+    seed: int = 13
+
+    def __post_init__(self) -> None:
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = random.Random(self.seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(self.num_perm)
+        ]
+        self._token_hashes: dict[str, tuple[int, ...]] = {}
+
+    def resolve(self, listings: Iterable[Listing]) -> CanonicalProductTable:
+        unique: dict[str, Listing] = {}
+        for listing in listings:
+            unique.setdefault(listing.key, listing)
+        items = list(unique.values())
+
+        tokens = [title_tokens(item.title) for item in items]
+        brands = [normalize_brand(item.brand) for item in items]
+        models = [model_tokens(item.title) for item in items]
+        vectors = _tfidf_vectors(tokens)
+
+        scored = []
+        for i, j in self._candidate_pairs(brands, tokens, models):
+            if self.cross_retailer_only and items[i].retailer == items[j].retailer:
+                continue
+            if brands[i] and brands[j] and brands[i] != brands[j]:
+                continue
+            shared_model = models[i] & models[j]
+            if models[i] and models[j] and not shared_model:
+                continue
+            score = _cosine(vectors[i], vectors[j])
+            threshold = self.model_match_threshold if shared_model else self.similarity_threshold
+            if score >= threshold:
+                scored.append((-score, i, j))
+        scored.sort()
+
+        parent = list(range(len(items)))
+        retailers = [{item.retailer} for item in items]
+        best_score: dict[int, float] = {}
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for neg_score, i, j in scored:
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                continue
+            if self.cross_retailer_only and not retailers[root_i].isdisjoint(retailers[root_j]):
+                continue
+            parent[root_j] = root_i
+            retailers[root_i] |= retailers[root_j]
+            for index in (i, j):
+                best_score[index] = max(best_score.get(index, 0.0), -neg_score)
+
+        clusters: dict[int, list[str]] = defaultdict(list)
+        for index, item in enumerate(items):
+            clusters[find(index)].append(item.key)
+
+        assignments: dict[str, str] = {}
+        members: dict[str, list[str]] = {}
+        for keys in clusters.values():
+            canonical_id = "cp-" + hashlib.sha1(min(keys).encode("utf-8")).hexdigest()[:12]
+            members[canonical_id] = keys
+            for key in keys:
+                assignments[key] = canonical_id
+
+        # Keep assignments in input order
+        ordered = {item.key: assignments[item.key] for item in items}
+        match_scores = {items[index].key: round(score, 4) for index, score in best_score.items()}
+        return CanonicalProductTable(unique, ordered, members, match_scores)
+
+    def _candidate_pairs(
+        self,
+        brands: Sequence[str],
+        tokens: Sequence[Sequence[str]],
+        models: Sequence[set[str]],
+    ) -> set[tuple[int, int]]:
+        buckets: dict[tuple, list[int]] = defaultdict(list)
+
+        for index, model_set in enumerate(models):
+            for model in model_set:
+                buckets[("model", model)].append(index)
+
+        rows = self.num_perm // self.bands
+        for index, (brand, token_list) in enumerate(zip(brands, tokens)):
+            if not brand or not token_list:
+                continue
+            signature = self._signature(token_list)
+            for band in range(self.bands):
+                start = band * rows
+                buckets[("lsh", brand, band, signature[start:start + rows])].append(index)
+
+        pairs: set[tuple[int, int]] = set()
+        for bucket in buckets.values():
+            if 1 < len(bucket) <= self.max_bucket_size:
+                pairs.update(combinations(bucket, 2))
+        return pairs
+
+    def _signature(self, token_list: Sequence[str]) -> tuple[int, ...]:
+        hashes = [self._token_hash(token) for token in set(token_list)]
+        if len(hashes) == 1:
+            return hashes[0]
+        return tuple(map(min, *hashes))
+
+    def _token_hash(self, token: str) -> tuple[int, ...]:
+        cached = self._token_hashes.get(token)
+        if cached is None:
+            base = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+            cached = tuple((a * base + b) % _MERSENNE_PRIME for a, b in self._perms)
+            self._token_hashes[token] = cached
+        return cached
+
+
+def _tfidf_vectors(tokens: Sequence[Sequence[str]]) -> list[dict[str, float]]:
+    document_frequency = Counter()
+    for token_list in tokens:
+        document_frequency.update(set(token_list))
+    total = len(tokens)
+    idf = {token: math.log((1 + total) / (1 + df)) + 1.0 for token, df in document_frequency.items()}
+
+    vectors = []
+    for token_list in tokens:
+        weights = {token: count * idf[token] for token, count in Counter(token_list).items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors.append({token: w / norm for token, w in weights.items()})
+    return vectors
+
+
+def _cosine(left: Mapping[str, float], right: Mapping[str, float]) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(weight * right.get(token, 0.0) for token, weight in left.items())
+
+
+def resolve_products(products: Iterable[ProductRecord], resolver: EntityResolver | None = None) -> CanonicalProductTable:
+    return (resolver or EntityResolver()).resolve(listings_from_products(products))
@@ -5,10 +5,12 @@ import json
 import math
 import re
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Sequence
 
+from .corpus import CorpusEngine, PositionalIndex, corpus_cache_id, log_odds_contrast
+
 _URL_PATTERN = re.compile(r"https?://\S+")
 _TOKEN_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z\-\d']+")
 _STOPWORDS = {
@@ -109,6 +111,8 @@ _STOPWORDS = {
     "two",
     "three",
 }
+# Tokens of context kept on each side of a term in example snippets
+_SNIPPET_WINDOW = 12
 
 
 @dataclass(frozen=True)
@@ -121,6 +125,8 @@ class HiddenTerm:
     example: str | None = None
     source_url: str | None = None
     subreddit: str | None = None
+    snippet: str | None = None
+    subreddit_counts: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -131,22 +137,32 @@ class KeywordLanguageSummary:
     total_community_records: int
     top_ad_terms: list[tuple[str, int]]
     hidden_terms: list[HiddenTerm]
+    distinctive_community_terms: list[tuple[str, float, int, int]] = field(default_factory=list)
 
 
 def _strip_urls(text: str) -> str:
     return _URL_PATTERN.sub(" ", text)
 
 
-def _tokenise(text: str) -> list[str]:
-    cleaned = _strip_urls(text.lower())
-    tokens = [match.group(0) for match in _TOKEN_PATTERN.finditer(cleaned)]
+def _token_spans(text: str) -> list[tuple[str, int, int]]:
+    """Kept tokens with their character spans in ``text.lower()``."""
+    # Blank URLs out with same-length padding so spans stay aligned
+    cleaned = _URL_PATTERN.sub(lambda match: " " * len(match.group(0)), text.lower())
     return [
-        token
-        for token in tokens
-        if token not in _STOPWORDS and len(token) > 2 and not token.isdigit()
+        (match.group(0), match.start(), match.end())
+        for match in _TOKEN_PATTERN.finditer(cleaned)
+        if match.group(0) not in _STOPWORDS and len(match.group(0)) > 2 and not match.group(0).isdigit()
     ]
 
 
+def _tokenise(text: str) -> list[str]:
+    return [token for token, _, _ in _token_spans(text)]
+
+
+# Bump the trailing version when _tokenise changes behavior
+_TOKENIZER_ID = corpus_cache_id(_TOKEN_PATTERN.pattern, _URL_PATTERN.pattern, sorted(_STOPWORDS), 1)
+
+
 def _load_json_lines(paths: Sequence[Path]) -> list[dict]:
     data: list[dict] = []
     for path in paths:
@@ -197,31 +213,51 @@ def _extract_community_corpus(community_records: Iterable[dict]) -> tuple[list[s
     return corpus, total
 
 
+def _snippet(text: str, token_offset: int, length: int = 1, window: int = _SNIPPET_WINDOW) -> str:
+    """Text around the term at ``token_offset``, ``window`` kept tokens each side."""
+    spans = _token_spans(text)
+    if not spans:
+        return " ".join(text.split())
+    first = max(0, token_offset - window)
+    last = min(len(spans) - 1, token_offset + length - 1 + window)
+    start = 0 if first == 0 else spans[first][1]
+    end = len(text) if last == len(spans) - 1 else spans[last][2]
+    # Spans index the lowercased text; use the original unless lowering changed lengths
+    source = text if len(text) == len(text.lower()) else text.lower()
+    snippet = " ".join(source[start:end].split())
+    return f"{'... ' if start else ''}{snippet}{' ...' if end < len(text) else ''}"
+
+
 def _select_examples(
     candidates: Sequence[str],
-    community_records: Iterable[dict],
-    max_examples: int = 15,
+    community_records: Sequence[dict],
+    index: PositionalIndex,
 ) -> dict[str, HiddenTerm]:
+    """Example quote, snippet and subreddit breakdown per term via the index.
+
+    ``community_records`` must be aligned with the indexed corpus documents.
+    """
     examples: dict[str, HiddenTerm] = {}
-    for record in community_records:
-        body = record.get("body")
-        if not isinstance(body, str):
+    for term in candidates:
+        doc_ids, token_offsets = index.postings(term)
+        if not len(doc_ids):
             continue
-        lower_body = body.lower()
-        for term in candidates:
-            if term in examples:
-                continue
-            if term in lower_body:
-                examples[term] = HiddenTerm(
-                    term=term,
-                    community_freq=0,
-                    ad_freq=0,
-                    example=body.strip(),
-                    source_url=record.get("permalink"),
-                    subreddit=record.get("subreddit"),
-                )
-                if len(examples) >= max_examples:
-                    return examples
+        record = community_records[int(doc_ids[0])]
+        body = record["body"]
+        subreddits = Counter(
+            community_records[doc_id].get("subreddit") for doc_id in set(doc_ids.tolist())
+        )
+        subreddits.pop(None, None)
+        examples[term] = HiddenTerm(
+            term=term,
+            community_freq=0,
+            ad_freq=0,
+            example=body.strip(),
+            source_url=record.get("permalink"),
+            subreddit=record.get("subreddit"),
+            snippet=_snippet(body, int(token_offsets[0]), len(term.split(" "))),
+            subreddit_counts=dict(subreddits.most_common()),
+        )
     return examples
 
 
@@ -230,22 +266,39 @@ def compute_keyword_language_summary(
     community_files: Sequence[Path],
     min_community_freq: int = 5,
     max_hidden_terms: int = 20,
+    cache_dir: Path | None = None,
 ) -> KeywordLanguageSummary:
-    """Compare ad-language and community-language corpora."""
+    """Compare ad-language and community-language corpora.
 
-    ad_records = _load_json_lines(ad_files)
-    community_records = _load_json_lines(community_files)
+    With ``cache_dir``, tokenized corpora are cached on disk keyed by their
+    source files, so reruns with different thresholds skip tokenization.
+    """
 
-    ad_corpus, ad_total = _extract_ad_corpus(ad_records)
-    community_corpus, community_total = _extract_community_corpus(community_records)
+    engine = CorpusEngine(cache_dir)
+    # Records with a body, aligned with the community corpus documents
+    community_records = [
+        record for record in _load_json_lines(community_files) if isinstance(record.get("body"), str)
+    ]
 
-    ad_tokens = Counter()
-    for text in ad_corpus:
-        ad_tokens.update(_tokenise(text))
+    ad_corpus = engine.corpus(
+        "ad",
+        lambda: _extract_ad_corpus(_load_json_lines(ad_files))[0],
+        _tokenise,
+        _TOKENIZER_ID,
+        sources=ad_files,
+    )
+    community_corpus = engine.corpus(
+        "community",
+        lambda: _extract_community_corpus(community_records)[0],
+        _tokenise,
+        _TOKENIZER_ID,
+        sources=community_files,
+    )
+    ad_total = ad_corpus.n_documents
+    community_total = community_corpus.n_documents
 
-    community_tokens = Counter()
-    for text in community_corpus:
-        community_tokens.update(_tokenise(text))
+    ad_tokens = ad_corpus.ngram_counts(1)
+    community_tokens = community_corpus.ngram_counts(1)
 
     top_ad_terms = ad_tokens.most_common(25)
 
@@ -264,7 +317,9 @@ def compute_keyword_language_summary(
         if len(base_candidates) >= max_hidden_terms:
             break
 
-    example_mapping = _select_examples(base_candidates, community_records)
+    example_mapping = _select_examples(
+        base_candidates, community_records, community_corpus.positional_index()
+    )
 
     for term in base_candidates:
         example = example_mapping.get(term)
@@ -276,14 +331,25 @@ def compute_keyword_language_summary(
                 example=example.example if example else None,
                 source_url=example.source_url if example else None,
                 subreddit=example.subreddit if example else None,
+                snippet=example.snippet if example else None,
+                subreddit_counts=example.subreddit_counts if example else {},
             )
         )
 
+    distinctive = sorted(
+        log_odds_contrast(community_tokens, ad_tokens, min_count=min_community_freq)
+        + log_odds_contrast(
+            community_corpus.ngram_counts(2), ad_corpus.ngram_counts(2), min_count=min_community_freq
+        ),
+        key=lambda item: -item[1],
+    )[:25]
+
     return KeywordLanguageSummary(
         total_ad_records=ad_total,
         total_community_records=community_total,
         top_ad_terms=top_ad_terms,
         hidden_terms=hidden,
+        distinctive_community_terms=distinctive,
     )
 
 
@@ -302,9 +368,15 @@ def keyword_language_summary_to_dict(summary: KeywordLanguageSummary) -> dict:
                 "example": term.example,
                 "source_url": term.source_url,
                 "subreddit": term.subreddit,
+                "snippet": term.snippet,
+                "subreddit_counts": term.subreddit_counts,
             }
             for term in summary.hidden_terms
         ],
+        "distinctive_community_terms": [
+            {"term": term, "z_score": z_score, "community_freq": community_freq, "ad_freq": ad_freq}
+            for term, z_score, community_freq, ad_freq in summary.distinctive_community_terms
+        ],
     }
 
 
@@ -1,69 +1,211 @@
 """Summarize category intelligence datasets."""
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from statistics import mean
-from typing import Any, Iterable, Mapping
+from collections import Counter
+from typing import Any, Iterable, Iterator, Mapping
 
 from ..pipeline.brand_collector import BrandRecord
 from ..pipeline.product_catalog import ProductRecord
+from .entity_resolution import CanonicalProductTable, product_listing_key
+from .sketches import RunningStats
 
 
-def compute_summary(brands: Iterable[BrandRecord], products: Iterable[ProductRecord]) -> dict[str, Any]:
-    brand_list = list(brands)
-    product_list = list(products)
+def _price_stats(stats: RunningStats) -> dict[str, float | None]:
+    def rounded(value: float | None) -> float | None:
+        return round(value, 2) if value is not None else None
 
-    retailer_counts = Counter(p.retailer for p in product_list if p.retailer)
-    segment_counts = Counter()
-    load_values = []
-    retailer_prices: dict[str, list[float]] = defaultdict(list)
-    segment_prices: dict[str, list[float]] = defaultdict(list)
-    vendor_counts = Counter()
+    return {
+        "avg_price": rounded(stats.mean),
+        "min_price": rounded(stats.minimum),
+        "max_price": rounded(stats.maximum),
+        "median_price": rounded(stats.sketch.quantile(0.5)),
+        "p90_price": rounded(stats.sketch.quantile(0.9)),
+    }
+
+
+class SummaryAggregator:
+    """Single-pass, mergeable state behind compute_summary.
+
+    Records are folded in one at a time, so a collector generator can be
+    summarized without materializing it; ``consume`` passes records through
+    for other consumers. Aggregators built over separate shards or days
+    combine with ``merge`` and round-trip through ``to_dict``/``from_dict``.
+
+    Prices keep running count/sum/min/max plus a quantile sketch per
+    retailer, segment and vendor. Only listing keys are retained per
+    product, so vendor share can be recounted over canonical products once
+    entity resolution has run.
+    """
+
+    def __init__(self) -> None:
+        self.brand_names: set[str] = set()
+        self.total_products = 0
+        self.retailer_counts: Counter = Counter()
+        self.segment_counts: Counter = Counter()
+        self.retailer_prices: dict[str, RunningStats] = {}
+        self.segment_prices: dict[str, RunningStats] = {}
+        self.vendor_prices: dict[str, RunningStats] = {}
+        self.vendor_counts: Counter = Counter()
+        self.vendor_listings: dict[str, set[str]] = {}
+        self.listing_keys: set[str] = set()
+        self.load_capacity = RunningStats()
+
+    def add_brand(self, brand: BrandRecord) -> None:
+        self.brand_names.add(brand.name.strip().lower())
+
+    def add_brands(self, brands: Iterable[BrandRecord]) -> SummaryAggregator:
+        for brand in brands:
+            self.add_brand(brand)
+        return self
 
-    for product in product_list:
+    def add_product(self, product: ProductRecord) -> None:
+        self.total_products += 1
+        if product.retailer:
+            self.retailer_counts[product.retailer] += 1
         segment = product.taxonomy_path[1] if len(product.taxonomy_path) > 1 else "Unclassified"
-        segment_counts[segment] += 1
+        self.segment_counts[segment] += 1
+        listing = product_listing_key(product)
+        self.listing_keys.add(listing)
+
         load_capacity = product.attributes.get("load_capacity_lbs")
         if isinstance(load_capacity, (int, float)):
-            load_values.append(float(load_capacity))
+            self.load_capacity.add(float(load_capacity))
+
+        vendor = product.attributes.get("vendor") or product.attributes.get("brand")
+        vendor = vendor.strip() if isinstance(vendor, str) else ""
+        if vendor:
+            self.vendor_counts[vendor] += 1
+            self.vendor_listings.setdefault(vendor, set()).add(listing)
+
         if product.price is not None:
             price_value = float(product.price)
-            retailer_prices[product.retailer].append(price_value)
-            segment_prices[segment].append(price_value)
-        vendor = product.attributes.get("vendor") or product.attributes.get("brand")
-        if isinstance(vendor, str) and vendor.strip():
-            vendor_counts[vendor.strip()] += 1
-
-    retailer_price_stats = {
-        retailer: {
-            "avg_price": round(mean(values), 2) if values else None,
-            "min_price": round(min(values), 2) if values else None,
-            "max_price": round(max(values), 2) if values else None,
+            self.retailer_prices.setdefault(product.retailer, RunningStats()).add(price_value)
+            self.segment_prices.setdefault(segment, RunningStats()).add(price_value)
+            if vendor:
+                self.vendor_prices.setdefault(vendor, RunningStats()).add(price_value)
+
+    def add_products(self, products: Iterable[ProductRecord]) -> SummaryAggregator:
+        for product in products:
+            self.add_product(product)
+        return self
+
+    def consume(self, products: Iterable[ProductRecord]) -> Iterator[ProductRecord]:
+        """Fold products in while passing them through unchanged."""
+        for product in products:
+            self.add_product(product)
+            yield product
+
+    def merge(self, other: SummaryAggregator) -> SummaryAggregator:
+        self.brand_names |= other.brand_names
+        self.total_products += other.total_products
+        self.retailer_counts.update(other.retailer_counts)
+        self.segment_counts.update(other.segment_counts)
+        self.vendor_counts.update(other.vendor_counts)
+        for mine, theirs in (
+            (self.retailer_prices, other.retailer_prices),
+            (self.segment_prices, other.segment_prices),
+            (self.vendor_prices, other.vendor_prices),
+        ):
+            for key, stats in theirs.items():
+                mine.setdefault(key, RunningStats()).merge(stats)
+        for vendor, listings in other.vendor_listings.items():
+            self.vendor_listings.setdefault(vendor, set()).update(listings)
+        self.listing_keys |= other.listing_keys
+        self.load_capacity.merge(other.load_capacity)
+        return self
+
+    def summary(self, canonical: CanonicalProductTable | None = None) -> dict[str, Any]:
+        """Summary dict; with a canonical table vendor share counts each physical product once."""
+
+        def product_id(listing: str) -> str:
+            return (canonical.canonical_id(listing) if canonical is not None else None) or listing
+
+        vendor_counts = self.vendor_counts
+        if canonical is not None:
+            vendor_counts = Counter(
+                {
+                    vendor: len({product_id(listing) for listing in listings})
+                    for vendor, listings in self.vendor_listings.items()
+                }
+            )
+        top_vendors = vendor_counts.most_common(10)
+
+        summary: dict[str, Any] = {
+            "total_brands": len(self.brand_names),
+            "total_products": self.total_products,
+            "retailer_counts": dict(sorted(self.retailer_counts.items(), key=lambda x: (-x[1], x[0]))),
+            "segment_counts": dict(sorted(self.segment_counts.items(), key=lambda x: (-x[1], x[0]))),
+            "top_vendors": top_vendors,
+            "retailer_price_stats": {key: _price_stats(stats) for key, stats in self.retailer_prices.items()},
+            "segment_price_stats": {key: _price_stats(stats) for key, stats in self.segment_prices.items()},
+            "vendor_price_stats": {
+                vendor: _price_stats(self.vendor_prices[vendor])
+                for vendor, _ in top_vendors
+                if vendor in self.vendor_prices
+            },
+            "load_capacity": {
+                "with_capacity": self.load_capacity.count,
+                "max_capacity": round(self.load_capacity.maximum, 2) if self.load_capacity.count else None,
+            },
         }
-        for retailer, values in retailer_prices.items()
-    }
 
-    segment_price_stats = {
-        segment: {
-            "avg_price": round(mean(values), 2) if values else None,
-            "min_price": round(min(values), 2) if values else None,
-            "max_price": round(max(values), 2) if values else None,
+        if canonical is not None:
+            canonical_ids = {product_id(listing) for listing in self.listing_keys}
+            summary["canonical_products"] = {
+                "total": len(canonical_ids),
+                "multi_retailer": len(set(canonical.multi_retailer_ids()) & canonical_ids),
+            }
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable partial summary state."""
+
+        def stats_map(stats: Mapping[str, RunningStats]) -> dict[str, Any]:
+            return {key: value.to_dict() for key, value in stats.items()}
+
+        return {
+            "brand_names": sorted(self.brand_names),
+            "total_products": self.total_products,
+            "retailer_counts": dict(self.retailer_counts),
+            "segment_counts": dict(self.segment_counts),
+            "vendor_counts": dict(self.vendor_counts),
+            "retailer_prices": stats_map(self.retailer_prices),
+            "segment_prices": stats_map(self.segment_prices),
+            "vendor_prices": stats_map(self.vendor_prices),
+            "vendor_listings": {vendor: sorted(listings) for vendor, listings in self.vendor_listings.items()},
+            "listing_keys": sorted(self.listing_keys),
+            "load_capacity": self.load_capacity.to_dict(),
         }
-        for segment, values in segment_prices.items()
-    }
 
-    summary: dict[str, Any] = {
-        "total_brands": len(brand_list),
-        "total_products": len(product_list),
-        "retailer_counts": dict(sorted(retailer_counts.items(), key=lambda x: (-x[1], x[0]))),
-        "segment_counts": dict(sorted(segment_counts.items(), key=lambda x: (-x[1], x[0]))),
-        "top_vendors": vendor_counts.most_common(10),
-        "retailer_price_stats": retailer_price_stats,
-        "segment_price_stats": segment_price_stats,
-        "load_capacity": {
-            "with_capacity": len(load_values),
-            "max_capacity": round(max(load_values), 2) if load_values else None,
-        },
-    }
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SummaryAggregator:
+        def stats_map(raw: Mapping[str, Any]) -> dict[str, RunningStats]:
+            return {key: RunningStats.from_dict(value) for key, value in raw.items()}
+
+        aggregator = cls()
+        aggregator.brand_names = set(data["brand_names"])
+        aggregator.total_products = data["total_products"]
+        aggregator.retailer_counts = Counter(data["retailer_counts"])
+        aggregator.segment_counts = Counter(data["segment_counts"])
+        aggregator.vendor_counts = Counter(data["vendor_counts"])
+        aggregator.retailer_prices = stats_map(data["retailer_prices"])
+        aggregator.segment_prices = stats_map(data["segment_prices"])
+        aggregator.vendor_prices = stats_map(data["vendor_prices"])
+        aggregator.vendor_listings = {vendor: set(listings) for vendor, listings in data["vendor_listings"].items()}
+        aggregator.listing_keys = set(data["listing_keys"])
+        aggregator.load_capacity = RunningStats.from_dict(data["load_capacity"])
+        return aggregator
+
+
+def compute_summary(
+    brands: Iterable[BrandRecord],
+    products: Iterable[ProductRecord],
+    canonical: CanonicalProductTable | None = None,
+) -> dict[str, Any]:
+    """Summarize collected brands and products.
 
-    return summary
+    When a canonical product table is given, vendor share counts each
+    physical product once across retailers instead of once per listing.
+    """
+    aggregator = SummaryAggregator().add_brands(brands).add_products(products)
+    return aggregator.summary(canonical)
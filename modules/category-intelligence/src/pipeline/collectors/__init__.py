@@ -5,18 +5,23 @@ from typing import Iterable, Sequence
 
 from ..brand_collector import BrandCollector, BrandRecord
 from ..product_catalog import ProductCatalogBuilder, ProductRecord
+from .scheduler import FetchScheduler, collect_concurrently
+from .snapshots import SnapshotMissing, SnapshotStore
 
 
 class CompositeBrandCollector(BrandCollector):
-    """Combines multiple brand collectors into a single stream."""
+    """Combines multiple brand collectors into a single stream.
+
+    Collectors run concurrently; brands are emitted in collector order.
+    """
 
     def __init__(self, collectors: Sequence[BrandCollector]) -> None:
         self._collectors = collectors
 
     def collect(self, category: str) -> Iterable[BrandRecord]:
         seen: set[str] = set()
-        for collector in self._collectors:
-            for brand in collector.collect(category):
+        for brands in collect_concurrently(self._collectors, lambda collector: collector.collect(category)):
+            for brand in brands:
                 identifier = brand.name.strip().lower()
                 if identifier and identifier not in seen:
                     seen.add(identifier)
@@ -24,17 +29,21 @@ class CompositeBrandCollector(BrandCollector):
 
 
 class CompositeProductCatalog(ProductCatalogBuilder):
-    """Concatenates product records from multiple collectors."""
+    """Concatenates product records from multiple collectors.
+
+    Catalogs run concurrently; records are emitted in catalog order.
+    """
 
     def __init__(self, catalogs: Sequence[ProductCatalogBuilder]) -> None:
         self._catalogs = catalogs
 
     def collect(self, category: str) -> Iterable[ProductRecord]:
         seen: set[tuple[str, str]] = set()
-        for catalog in self._catalogs:
-            for product in catalog.collect(category):
+        for products in collect_concurrently(self._catalogs, lambda catalog: catalog.collect(category)):
+            for product in products:
                 identifier = (product.retailer or "", product.url)
                 if identifier in seen:
                     continue
                 seen.add(identifier)
                 yield product
+
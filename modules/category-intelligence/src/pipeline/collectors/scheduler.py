@@ -0,0 +1,245 @@
+"""Concurrent HTTP fetching with per-host politeness and conditional requests."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Sequence, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .snapshots import SnapshotMissing, SnapshotStore
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _host(url_or_host: str) -> str:
+    return (urlsplit(url_or_host).netloc or url_or_host).lower()
+
+
+class HostRateLimiter:
+    """Spaces request start times per host; different hosts never wait on each other."""
+
+    def __init__(self, default_interval: float = 1.0, intervals: Mapping[str, float] | None = None) -> None:
+        self._default_interval = default_interval
+        self._intervals = {_host(host): interval for host, interval in (intervals or {}).items()}
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set_interval(self, url_or_host: str, interval: float) -> None:
+        with self._lock:
+            self._intervals[_host(url_or_host)] = interval
+
+    def wait(self, url: str) -> None:
+        host = _host(url)
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._intervals.get(host, self._default_interval)
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    text: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ValidatorCache:
+    """Response bodies with their ETag/Last-Modified validators.
+
+    Kept in memory, and on disk when ``cache_dir`` is set so validators
+    survive between runs.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._cache_dir = cache_dir
+        self._entries: dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path | None:
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is not None:
+            return entry
+        path = self._path(url)
+        if path is None or not path.exists():
+            return None
+        try:
+            entry = CachedResponse(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+        with self._lock:
+            self._entries[url] = entry
+        return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[entry.url] = entry
+        path = self._path(entry.url)
+        if path is not None:
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+            tmp_path.replace(path)
+
+
+class FetchScheduler:
+    """Shared thread pool, pooled session and per-host rate limits for collectors.
+
+    Requests to different hosts run concurrently while each host sees at
+    most one request start per interval, so a crawl is bounded by its
+    slowest host rather than the sum of all hosts. Responses carrying an
+    ETag or Last-Modified header are revalidated with conditional requests
+    and a 304 reuses the cached body.
+
+    With a SnapshotStore every body is also recorded by URL and fetch date;
+    ``replay=True`` serves requests from the store (as of ``replay_as_of``,
+    default latest) without touching the network.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        max_workers: int = 8,
+        default_interval: float = 1.0,
+        host_intervals: Mapping[str, float] | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        cache_dir: Path | None = None,
+        timeout: float = 30,
+        snapshots: SnapshotStore | None = None,
+        replay: bool = False,
+        replay_as_of: str | None = None,
+    ) -> None:
+        if replay and snapshots is None:
+            raise ValueError("replay requires a snapshot store")
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.limiter = HostRateLimiter(default_interval, host_intervals)
+        self.cache = ValidatorCache(cache_dir)
+        self.snapshots = snapshots
+        self.replay = replay
+        self._replay_as_of = replay_as_of
+        self._max_workers = max_workers
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._timeout = timeout
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def limit_host(self, url_or_host: str, interval: float) -> None:
+        self.limiter.set_interval(url_or_host, interval)
+
+    def get_text(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        max_retries: int | None = None,
+        retry_delay: float | None = None,
+    ) -> str:
+        """GET ``url`` politely, retrying failures; raises after the last attempt."""
+        if self.replay:
+            text = self.snapshots.get(url, self._replay_as_of)
+            if text is None:
+                raise SnapshotMissing(f"No stored snapshot for {url}")
+            return text
+
+        max_retries = self._max_retries if max_retries is None else max_retries
+        retry_delay = self._retry_delay if retry_delay is None else retry_delay
+        attempt = 0
+        while True:
+            try:
+                text = self._get_once(url, headers)
+                if self.snapshots is not None:
+                    self.snapshots.put(url, text)
+                return text
+            except Exception as exc:  # pylint: disable=broad-except
+                attempt += 1
+                if attempt >= max_retries:
+                    raise
+                _LOGGER.warning("Retrying %s (%s/%s) due to %s", url, attempt, max_retries, exc)
+                time.sleep(retry_delay)
+
+    def _get_once(self, url: str, headers: Mapping[str, str] | None) -> str:
+        request_headers = dict(headers or {})
+        cached = self.cache.get(url)
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        self.limiter.wait(url)
+        resp = self.session.get(url, headers=request_headers, timeout=self._timeout)
+        if resp.status_code == 304 and cached is not None:
+            return cached.text
+        resp.raise_for_status()
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.cache.put(CachedResponse(url, resp.text, etag, last_modified))
+        return resp.text
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R | Exception]:
+        """Run ``fn`` over items concurrently; results (or raised exceptions) in input order."""
+
+        def call(item: T) -> R | Exception:
+            try:
+                return fn(item)
+            except Exception as exc:  # pylint: disable=broad-except
+                return exc
+
+        items = list(items)
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        return list(self._pool().map(call, items))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="fetch")
+            return self._executor
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+def collect_concurrently(sources: Sequence[T], collect: Callable[[T], Iterable[R]]) -> Iterable[list[R]]:
+    """Run ``collect`` for every source in parallel, yielding result lists in source order."""
+    if len(sources) <= 1:
+        for source in sources:
+            yield list(collect(source))
+        return
+    with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="collect") as executor:
+        futures = [executor.submit(lambda source=source: list(collect(source))) for source in sources]
+        for future in futures:
+            yield future.result()
@@ -1,19 +1,26 @@
 """Shopify-based collectors for garage organization products."""
 from __future__ import annotations
 
+import json
 import logging
 import re
-import time
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
 
 import requests
 
 from ..brand_collector import BrandCollector, BrandRecord
 from ..product_catalog import ProductCatalogBuilder, ProductRecord
+from .scheduler import FetchScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0 Safari/537.36",
+    "Accept": "application/json",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
 
 @dataclass(frozen=True)
 class ShopifyStoreConfig:
@@ -31,33 +38,32 @@ class ShopifyStoreConfig:
 class ShopifyAPI:
     """Thin wrapper around Shopify collection/product JSON endpoints."""
 
-    def __init__(self, session: requests.Session | None = None, max_retries: int = 3, retry_delay: float = 1.0) -> None:
-        self._session = session or requests.Session()
-        self._session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0 Safari/537.36",
-            "Accept": "application/json",
-            "Accept-Language": "en-US,en;q=0.9",
-        })
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        scheduler: FetchScheduler | None = None,
+    ) -> None:
+        self._scheduler = scheduler or FetchScheduler(session)
         self._max_retries = max_retries
         self._retry_delay = retry_delay
 
     def fetch_products(self, endpoint: str) -> List[dict]:
-        attempt = 0
-        while True:
-            try:
-                resp = self._session.get(endpoint, timeout=30)
-                resp.raise_for_status()
-                payload = resp.json()
-                products = payload.get("products", [])
-                if not isinstance(products, list):
-                    raise ValueError(f"Unexpected response structure from {endpoint}")
-                return products
-            except Exception as exc:  # pylint: disable=broad-except
-                attempt += 1
-                if attempt >= self._max_retries:
-                    raise
-                _LOGGER.warning("Retrying Shopify fetch (%s/%s) for %s due to %s", attempt, self._max_retries, endpoint, exc)
-                time.sleep(self._retry_delay)
+        text = self._scheduler.get_text(
+            endpoint,
+            headers=_HEADERS,
+            max_retries=self._max_retries,
+            retry_delay=self._retry_delay,
+        )
+        products = json.loads(text).get("products", [])
+        if not isinstance(products, list):
+            raise ValueError(f"Unexpected response structure from {endpoint}")
+        return products
+
+    def fetch_many(self, endpoints: Sequence[str]) -> List[List[dict] | Exception]:
+        """Fetch endpoints concurrently; results (or errors) in endpoint order."""
+        return self._scheduler.map(self.fetch_products, endpoints)
 
 
 class ShopifyBrandCollector(BrandCollector):
@@ -69,12 +75,10 @@ class ShopifyBrandCollector(BrandCollector):
 
     def collect(self, category: str) -> Iterable[BrandRecord]:
         seen: set[str] = set()
-        for store in self._stores:
-            endpoint = store.products_endpoint()
-            try:
-                products = self._api.fetch_products(endpoint)
-            except Exception as exc:  # pylint: disable=broad-except
-                _LOGGER.warning("Failed to fetch products from %s: %s", endpoint, exc)
+        endpoints = [store.products_endpoint() for store in self._stores]
+        for store, endpoint, products in zip(self._stores, endpoints, self._api.fetch_many(endpoints)):
+            if isinstance(products, Exception):
+                _LOGGER.warning("Failed to fetch products from %s: %s", endpoint, products)
                 continue
 
             for product in products:
@@ -154,12 +158,10 @@ class ShopifyProductCatalog(ProductCatalogBuilder):
             return None
 
     def collect(self, category: str) -> Iterable[ProductRecord]:
-        for store in self._stores:
-            endpoint = store.products_endpoint()
-            try:
-                products = self._api.fetch_products(endpoint)
-            except Exception as exc:  # pylint: disable=broad-except
-                _LOGGER.warning("Failed to fetch products from %s: %s", endpoint, exc)
+        endpoints = [store.products_endpoint() for store in self._stores]
+        for store, endpoint, products in zip(self._stores, endpoints, self._api.fetch_many(endpoints)):
+            if isinstance(products, Exception):
+                _LOGGER.warning("Failed to fetch products from %s: %s", endpoint, products)
                 continue
 
             for product in products:
@@ -0,0 +1,79 @@
+"""Content-addressed store of raw collector responses."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+
+class SnapshotMissing(LookupError):
+    """Raised in replay mode when no stored snapshot exists for a URL."""
+
+
+class SnapshotStore:
+    """Raw response bodies keyed by URL and fetch date.
+
+    Layout under ``root``::
+
+        objects/<sha256[:2]>/<sha256>   response body, stored once per content
+        index/<YYYY-MM-DD>.jsonl        {"url", "sha256", "fetched_at"} per fetch
+
+    Lookups return the latest snapshot fetched on or before a given date,
+    so any past run can be replayed against exactly the pages it saw.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._objects = root / "objects"
+        self._index = root / "index"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._index.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._views: dict[str, dict[str, str]] = {}
+
+    def dates(self) -> list[str]:
+        return sorted(path.stem for path in self._index.glob("*.jsonl"))
+
+    def put(self, url: str, text: str, fetched_at: datetime | None = None) -> str:
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        body = text.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._objects / digest[:2] / digest
+        entry = json.dumps({"url": url, "sha256": digest, "fetched_at": fetched_at.isoformat()})
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(body)
+                tmp_path.replace(path)
+            with (self._index / f"{fetched_at.date().isoformat()}.jsonl").open("a", encoding="utf-8") as handle:
+                handle.write(entry + "\n")
+            self._views.clear()
+        return digest
+
+    def get(self, url: str, as_of: str | date | None = None) -> str | None:
+        """Body of the latest snapshot of ``url`` fetched on or before ``as_of``."""
+        digest = self._view(as_of).get(url)
+        if digest is None:
+            return None
+        return (self._objects / digest[:2] / digest).read_text(encoding="utf-8")
+
+    def _view(self, as_of: str | date | None) -> dict[str, str]:
+        cutoff = as_of.isoformat() if isinstance(as_of, date) else as_of
+        key = cutoff or "latest"
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                return view
+            view = {}
+            for day in self.dates():
+                if cutoff and day > cutoff:
+                    break
+                for line in (self._index / f"{day}.jsonl").read_text(encoding="utf-8").splitlines():
+                    if line.strip():
+                        record = json.loads(line)
+                        view[record["url"]] = record["sha256"]
+            self._views[key] = view
+            return view
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import logging
 import re
-import time
 from dataclasses import dataclass
 from typing import Iterable, List
 
@@ -11,6 +10,7 @@ import requests
 
 from ..brand_collector import BrandCollector, BrandRecord
 from ..product_catalog import ProductCatalogBuilder, ProductRecord
+from .scheduler import FetchScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,11 +22,16 @@ _PAGE_SIZE = 24  # observed items per page in markup snapshot
 class TargetRequestConfig:
     query: str = "garage hooks"
     max_pages: int = 4
-    delay_seconds: float = 1.0  # be polite and avoid hammering
+    delay_seconds: float = 1.0  # minimum spacing between requests to the snapshot host
 
 
 class TargetScraper:
-    """Retrieves markdown snapshots of Target search results via jina.ai."""
+    """Retrieves markdown snapshots of Target search results via jina.ai.
+
+    Pages are requested concurrently through a FetchScheduler that spaces
+    requests to the snapshot host by ``delay_seconds``; pass a shared
+    scheduler to pool connections with other collectors.
+    """
 
     def __init__(
         self,
@@ -34,32 +39,29 @@ class TargetScraper:
         session: requests.Session | None = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        scheduler: FetchScheduler | None = None,
     ) -> None:
         self._config = config or TargetRequestConfig()
-        self._session = session or requests.Session()
+        self._scheduler = scheduler or FetchScheduler(session)
+        self._scheduler.limit_host(_TARGET_TEMPLATE, self._config.delay_seconds)
         self._max_retries = max_retries
         self._retry_delay = retry_delay
 
+    def _fetch(self, url: str) -> str:
+        return self._scheduler.get_text(url, max_retries=self._max_retries, retry_delay=self._retry_delay)
+
     def fetch_pages(self) -> Iterable[str]:
         query = self._config.query.replace(" ", "+")
-        for page in range(self._config.max_pages):
-            offset = page * _PAGE_SIZE
-            url = _TARGET_TEMPLATE.format(query=query, offset=offset)
-            attempt = 0
-            while True:
-                try:
-                    resp = self._session.get(url, timeout=30)
-                    resp.raise_for_status()
-                    yield resp.text
-                    time.sleep(self._config.delay_seconds)
-                    break
-                except Exception as exc:  # pylint: disable=broad-except
-                    attempt += 1
-                    if attempt >= self._max_retries:
-                        _LOGGER.warning("Failed to fetch Target page %s after retries: %s", url, exc)
-                        return
-                    _LOGGER.warning("Retrying Target page %s (%s/%s) due to %s", url, attempt, self._max_retries, exc)
-                    time.sleep(self._retry_delay)
+        urls = [
+            _TARGET_TEMPLATE.format(query=query, offset=page * _PAGE_SIZE)
+            for page in range(self._config.max_pages)
+        ]
+        for url, page in zip(urls, self._scheduler.map(self._fetch, urls)):
+            # Stop at the first missing page so results stay contiguous
+            if isinstance(page, Exception):
+                _LOGGER.warning("Failed to fetch Target page %s after retries: %s", url, page)
+                return
+            yield page
 
 
 @dataclass
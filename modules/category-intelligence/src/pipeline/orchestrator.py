@@ -1,7 +1,35 @@
 """High-level orchestration for category intelligence."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
 from dataclasses import dataclass
-from .brand_collector import BrandCollector
-from .product_catalog import ProductCatalogBuilder
+from typing import Any, Callable, Iterable, Sequence
+
+from .brand_collector import BrandCollector, BrandRecord
+from .product_catalog import ProductCatalogBuilder, ProductRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class CallbackSink:
+    """Adapts plain callables (e.g. SummaryAggregator.add_products) to the sink interface."""
+
+    on_brands: Callable[[list[BrandRecord]], Any] | None = None
+    on_products: Callable[[list[ProductRecord]], Any] | None = None
+
+    def write_brands(self, category: str, brands: list[BrandRecord]) -> None:  # pylint: disable=unused-argument
+        if self.on_brands is not None:
+            self.on_brands(brands)
+
+    def write_products(self, category: str, products: list[ProductRecord]) -> None:  # pylint: disable=unused-argument
+        if self.on_products is not None:
+            self.on_products(products)
+
 
 @dataclass
 class CategoryIntelligencePipeline:
@@ -24,3 +52,111 @@ class CategoryIntelligencePipeline:
             "brands": brands,
             "products": products,
         }
+
+    def stream(
+        self,
+        category: str,
+        sinks: Sequence[Any] = (),
+        min_products: int = 0,
+        batch_size: int = 200,
+        keep_records: bool = True,
+    ) -> dict:
+        """Collect brands and products concurrently, teeing batches to sinks as they arrive.
+
+        Sinks are objects with ``write_brands(category, records)`` and
+        ``write_products(category, records)`` (FilesystemWriter's streaming
+        sink, DuckDBWriter, PostgresWriter, CallbackSink). They are called
+        from this thread only; a sink that raises is logged and dropped so
+        the others keep receiving records and the dropped ones are returned
+        under ``failed_sinks``. Sinks are not closed here: the caller commits
+        them (``close``) on success and rolls them back (``abort``) on failure
+        or when they were dropped.
+
+        Raises:
+            RuntimeError: if coverage minimums are not met, as soon as the
+                relevant collector finishes.
+        """
+        records: dict[str, list] = {"brands": [], "products": []}
+        counts = {"brands": 0, "products": 0}
+        pending: dict[str, list] = {"brands": [], "products": []}
+        active_sinks = list(sinks)
+        failed_sinks: list = []
+        stop = threading.Event()
+        inbox: queue.Queue = queue.Queue(maxsize=batch_size * 4)
+
+        def put(item: tuple) -> None:
+            while not stop.is_set():
+                try:
+                    inbox.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce(kind: str, collect: Callable[[], Iterable]) -> None:
+            try:
+                for record in collect():
+                    if stop.is_set():
+                        break
+                    put((kind, record))
+            except BaseException as exc:  # pylint: disable=broad-except
+                put((kind, exc))
+            finally:
+                put((kind, _DONE))
+
+        def flush(kind: str) -> None:
+            batch, pending[kind] = pending[kind], []
+            if not batch:
+                return
+            for sink in list(active_sinks):
+                try:
+                    getattr(sink, f"write_{kind}")(category, batch)
+                except Exception as exc:  # pylint: disable=broad-except
+                    _LOGGER.error("Sink %s failed on %s; disabling it: %s", type(sink).__name__, kind, exc)
+                    active_sinks.remove(sink)
+                    failed_sinks.append(sink)
+
+        threads = [
+            threading.Thread(target=produce, args=("brands", lambda: self.brand_collector.collect(category)), daemon=True),
+            threading.Thread(target=produce, args=("products", lambda: self.product_builder.collect(category)), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        running = {"brands", "products"}
+        try:
+            while running:
+                kind, item = inbox.get()
+                if item is _DONE:
+                    running.discard(kind)
+                    flush(kind)
+                    if kind == "brands" and counts["brands"] < self.min_brands:
+                        raise RuntimeError(f"Insufficient brand coverage: {counts['brands']} discovered")
+                    if kind == "products" and counts["products"] < min_products:
+                        raise RuntimeError(f"Insufficient products: {counts['products']} < {min_products}")
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+
+                counts[kind] += 1
+                pending[kind].append(item)
+                if keep_records:
+                    records[kind].append(item)
+                if kind == "brands" and counts[kind] == self.min_brands:
+                    _LOGGER.info("Brand coverage minimum (%d) reached", self.min_brands)
+                if kind == "products" and counts[kind] == min_products:
+                    _LOGGER.info("Product coverage minimum (%d) reached", min_products)
+                if len(pending[kind]) >= batch_size:
+                    flush(kind)
+        finally:
+            stop.set()
+            flush("brands")
+            flush("products")
+            for thread in threads:
+                thread.join(timeout=1.0)
+
+        return {
+            "brands": records["brands"],
+            "products": records["products"],
+            "counts": counts,
+            "failed_sinks": failed_sinks,
+        }
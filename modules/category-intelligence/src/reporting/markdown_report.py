@@ -31,6 +31,10 @@ Maximum load observed: {max_load}
 """
 
 
+def _count(records: Sequence[object] | int) -> int:
+    return records if isinstance(records, int) else len(records)
+
+
 def _format_counter(counter: Mapping[str, int]) -> str:
     if not counter:
         return "(no data)"
@@ -64,11 +68,12 @@ class MarkdownReporter:
     def render(
         self,
         category: str,
-        brands: Sequence[BrandRecord],
-        products: Sequence[ProductRecord],
+        brands: Sequence[BrandRecord] | int,
+        products: Sequence[ProductRecord] | int,
         output_path: Path,
         summary: Mapping[str, object] | None = None,
     ) -> None:
+        """Write the report; ``brands``/``products`` may be the records or just their counts."""
         summary = summary or {}
         retailer_breakdown = _format_counter(summary.get("retailer_counts", {}))
         segment_breakdown = _format_counter(summary.get("segment_counts", {}))
@@ -81,8 +86,8 @@ class MarkdownReporter:
         output_path.write_text(
             REPORT_TEMPLATE.format(
                 category=category,
-                brand_count=len(brands),
-                product_count=len(products),
+                brand_count=_count(brands),
+                product_count=_count(products),
                 retailer_breakdown=retailer_breakdown,
                 segment_breakdown=segment_breakdown,
                 segment_price_breakdown=segment_price_breakdown,
@@ -7,7 +7,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
-import duckdb
+try:  # pragma: no cover - optional dependency
+    import duckdb
+except ImportError as exc:  # pragma: no cover
+    duckdb = None  # type: ignore
+    _IMPORT_ERROR = exc
+else:
+    _IMPORT_ERROR = None
 
 from ..pipeline.brand_collector import BrandRecord
 from ..pipeline.product_catalog import ProductRecord
@@ -17,15 +23,25 @@ _LOGGER = logging.getLogger(__name__)
 
 @dataclass
 class DuckDBWriter:
-    """Stores brand and product tables in a DuckDB file."""
+    """Stores brand and product tables in a DuckDB file.
+
+    Everything written through one writer is a single transaction: ``close``
+    commits it, ``abort`` rolls it back, so a failed run leaves no partial
+    rows behind to duplicate on the rerun.
+    """
 
     db_path: Path
     project_key: str | None = None
 
     def __post_init__(self) -> None:
+        if duckdb is None:
+            raise RuntimeError(
+                "duckdb is required for DuckDBWriter. Install via 'pip install duckdb'."
+            ) from _IMPORT_ERROR
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = duckdb.connect(self.db_path.as_posix())
         self._init_schema()
+        self._conn.begin()
 
     def _init_schema(self) -> None:
         self._conn.execute(
@@ -110,4 +126,13 @@ class DuckDBWriter:
         )
 
     def close(self) -> None:
-        self._conn.close()
+        try:
+            self._conn.commit()
+        finally:
+            self._conn.close()
+
+    def abort(self) -> None:
+        try:
+            self._conn.rollback()
+        finally:
+            self._conn.close()
@@ -6,9 +6,40 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Iterable
 
+from ..analysis.entity_resolution import CanonicalProductTable
 from ..pipeline.brand_collector import BrandRecord
 from ..pipeline.product_catalog import ProductRecord
 
+def _product_dict(p: ProductRecord) -> dict:
+    return {
+        "retailer": p.retailer,
+        "sku": p.sku,
+        "name": p.name,
+        "url": p.url,
+        "price": p.price,
+        "rating": p.rating,
+        "taxonomy_path": p.taxonomy_path,
+        "attributes": p.attributes,
+    }
+
+
+def _jsonl_to_json_array(source: Path, output: Path) -> None:
+    """Rewrite a JSONL file as a JSON array, formatted like json.dumps(indent=2)."""
+    tmp_path = output.with_suffix(".tmp")
+    with source.open(encoding="utf-8") as src, tmp_path.open("w", encoding="utf-8") as out:
+        out.write("[")
+        first = True
+        for line in src:
+            if not line.strip():
+                continue
+            item = json.dumps(json.loads(line), indent=2, ensure_ascii=False)
+            out.write("\n" if first else ",\n")
+            out.write("\n".join("  " + part for part in item.split("\n")))
+            first = False
+        out.write("]" if first else "\n]")
+    tmp_path.replace(output)
+
+
 @dataclass
 class FilesystemWriter:
     base_dir: Path
@@ -16,31 +47,90 @@ class FilesystemWriter:
     def __post_init__(self) -> None:
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+    def _path(self, category: str, name: str, suffix: str = ".json") -> Path:
+        return self.base_dir / f"{category.replace(' ', '_')}_{name}{suffix}"
+
     def write_brands(self, category: str, brands: Iterable[BrandRecord]) -> Path:
         data = [asdict(b) for b in brands]
-        output = self.base_dir / f"{category.replace(' ', '_')}_brands.json"
+        output = self._path(category, "brands")
         output.write_text(json.dumps(data, indent=2, ensure_ascii=False))
         return output
 
     def write_products(self, category: str, products: Iterable[ProductRecord]) -> Path:
-        data = [
-            {
-                "retailer": p.retailer,
-                "sku": p.sku,
-                "name": p.name,
-                "url": p.url,
-                "price": p.price,
-                "rating": p.rating,
-                "taxonomy_path": p.taxonomy_path,
-                "attributes": p.attributes,
-            }
-            for p in products
-        ]
-        output = self.base_dir / f"{category.replace(' ', '_')}_products.json"
+        data = [_product_dict(p) for p in products]
+        output = self._path(category, "products")
         output.write_text(json.dumps(data, indent=2, ensure_ascii=False))
         return output
 
+    def _append(self, category: str, name: str, rows: Iterable[dict]) -> Path:
+        output = self._path(category, name, ".partial.jsonl")
+        with output.open("a", encoding="utf-8") as handle:
+            for row in rows:
+                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            handle.flush()
+        return output
+
+    def append_brands(self, category: str, brands: Iterable[BrandRecord]) -> Path:
+        """Append brands to the category's in-progress JSONL file."""
+        return self._append(category, "brands", (asdict(b) for b in brands))
+
+    def append_products(self, category: str, products: Iterable[ProductRecord]) -> Path:
+        """Append products to the category's in-progress JSONL file."""
+        return self._append(category, "products", (_product_dict(p) for p in products))
+
+    def reset_partial(self, category: str) -> None:
+        for name in ("brands", "products"):
+            self._path(category, name, ".partial.jsonl").unlink(missing_ok=True)
+
+    def finalize(self, category: str) -> list[Path]:
+        """Turn in-progress JSONL files into the usual ``*_brands.json``/``*_products.json``."""
+        outputs = []
+        for name in ("brands", "products"):
+            partial = self._path(category, name, ".partial.jsonl")
+            if partial.exists():
+                output = self._path(category, name)
+                _jsonl_to_json_array(partial, output)
+                partial.unlink()
+                outputs.append(output)
+        return outputs
+
+    def stream_sink(self, category: str) -> FilesystemStreamSink:
+        """Pipeline sink that appends records as they arrive; ``close`` finalizes, ``abort`` does not."""
+        self.reset_partial(category)
+        return FilesystemStreamSink(self, category)
+
     def write_keyword_summary(self, category: str, summary: dict) -> Path:
         output = self.base_dir / f"{category.replace(' ', '_')}_keyword_language.json"
         output.write_text(json.dumps(summary, indent=2, ensure_ascii=False))
         return output
+
+    def write_canonical_products(self, category: str, table: CanonicalProductTable) -> Path:
+        output = self.base_dir / f"{category.replace(' ', '_')}_canonical_products.json"
+        return table.write_json(output)
+
+
+@dataclass
+class FilesystemStreamSink:
+    """Streaming sink for CategoryIntelligencePipeline.stream.
+
+    Records land in ``*.partial.jsonl`` files as batches arrive, so a crash
+    keeps everything collected so far. ``close`` (successful run) replaces the
+    JSON arrays; ``abort`` (failed run) leaves the previous arrays untouched
+    and keeps the partial files for inspection.
+    """
+
+    writer: FilesystemWriter
+    category: str
+
+    def write_brands(self, category: str, brands: Iterable[BrandRecord]) -> None:
+        self.writer.append_brands(category, brands)
+
+    def write_products(self, category: str, products: Iterable[ProductRecord]) -> None:
+        self.writer.append_products(category, products)
+
+    def close(self) -> list[Path]:
+        return self.writer.finalize(self.category)
+
+    def abort(self) -> list[Path]:
+        partials = [self.writer._path(self.category, name, ".partial.jsonl") for name in ("brands", "products")]
+        return [path for path in partials if path.exists()]
@@ -100,12 +100,20 @@ VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
 
 @dataclass
 class PostgresWriter:
-    """Writes category data to Postgres with simple audit tables."""
+    """Writes category data to Postgres with simple audit tables.
+
+    All batches written through one writer share a single connection and
+    transaction: ``close`` commits it, ``abort`` rolls it back, so a failed
+    run leaves no partial rows behind to duplicate on the rerun.
+    """
 
     dsn: str
     project_key: str | None = None
     project_metadata: Mapping[str, str] | None = None
 
+    def __post_init__(self) -> None:
+        self._conn = None
+
     def _connect(self):  # pragma: no cover - simple wrapper
         if _connect is None:
             raise RuntimeError(
@@ -114,6 +122,16 @@ class PostgresWriter:
             ) from _IMPORT_ERROR
         return _connect(self.dsn)
 
+    def _connection(self):
+        """Open the run's connection on first use and prepare schema/project rows in it."""
+        if self._conn is None:
+            conn = self._connect()
+            with conn.cursor() as cur:
+                self._ensure_schema(cur)
+                self._ensure_project(cur)
+            self._conn = conn
+        return self._conn
+
     def _ensure_schema(self, cur) -> None:
         cur.execute(_CREATE_SCHEMA_SQL)
         cur.execute(_CREATE_PROJECTS_SQL)
@@ -140,9 +158,7 @@ class PostgresWriter:
             _LOGGER.info("No brands to persist for category %s", category)
             return
         try:
-            with self._connect() as conn, conn.cursor() as cur:
-                self._ensure_schema(cur)
-                self._ensure_project(cur)
+            with self._connection().cursor() as cur:
                 params = [
                     (self.project_key, category, brand.name, brand.tier, brand.source_url)
                     for brand in rows
@@ -158,9 +174,7 @@ class PostgresWriter:
             _LOGGER.info("No products to persist for category %s", category)
             return
         try:
-            with self._connect() as conn, conn.cursor() as cur:
-                self._ensure_schema(cur)
-                self._ensure_project(cur)
+            with self._connection().cursor() as cur:
                 params = []
                 for product in rows:
                     params.append(
@@ -181,3 +195,23 @@ class PostgresWriter:
         except Exception as exc:  # pragma: no cover
             _LOGGER.error("Failed to persist product data: %s", exc)
             raise
+
+    def close(self) -> None:
+        """Commit everything written in this run."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def abort(self) -> None:
+        """Discard everything written in this run."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.rollback()
+        finally:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,78 @@
+"""Tests for the tokenized corpus engine."""
+from __future__ import annotations
+
+from collections import Counter
+
+from src.analysis.corpus import CorpusEngine, log_odds_contrast
+
+
+def _tokenize(text: str) -> list[str]:
+    return text.lower().split()
+
+
+DOCS = ["Heavy duty hook", "hook rail hook", "bike hook heavy duty"]
+
+
+def test_ngram_counts_match_counter():
+    corpus = CorpusEngine().corpus("docs", lambda: DOCS, _tokenize, "t1")
+
+    expected = Counter(token for doc in DOCS for token in _tokenize(doc))
+    assert corpus.ngram_counts(1).most_common() == expected.most_common()
+
+    bigrams = corpus.ngram_counts(2)
+    assert bigrams["heavy duty"] == 2
+    assert bigrams["hook bike"] == 0  # spans a document boundary
+    assert corpus.ngram_counts(2, within_documents=False)["hook bike"] == 1
+    assert corpus.document_frequency(1)["hook"] == 3
+
+
+def test_keep_mask_filters_ngrams():
+    engine = CorpusEngine()
+    corpus = engine.corpus("docs", lambda: DOCS, _tokenize, "t1")
+    keep = engine.vocabulary.mask(lambda token: token != "hook")
+
+    assert "hook" not in corpus.ngram_counts(1, keep=keep).as_dict()
+    assert corpus.ngram_counts(2, keep=keep).as_dict() == {"heavy duty": 2}
+
+
+def test_corpus_cache_round_trip(tmp_path):
+    source = tmp_path / "docs.txt"
+    source.write_text("\n".join(DOCS))
+    calls = []
+
+    def documents():
+        calls.append(1)
+        return source.read_text().splitlines()
+
+    first = CorpusEngine(tmp_path / "cache").corpus("docs", documents, _tokenize, "t1", sources=[source])
+    # A fresh engine assigns different IDs; counts must survive the remap
+    engine = CorpusEngine(tmp_path / "cache")
+    engine.vocabulary.add("unrelated")
+    second = engine.corpus("docs", documents, _tokenize, "t1", sources=[source])
+
+    assert len(calls) == 1
+    assert second.ngram_counts(2).as_dict() == first.ngram_counts(2).as_dict()
+
+
+def test_log_odds_contrast_ranks_distinctive_terms():
+    engine = CorpusEngine()
+    community = engine.corpus("community", lambda: ["command strip hook"] * 5 + ["hook"], _tokenize, "t1")
+    ads = engine.corpus("ads", lambda: ["premium hook"] * 5, _tokenize, "t1")
+
+    ranked = log_odds_contrast(community.ngram_counts(1), ads.ngram_counts(1), k=None)
+    terms = [term for term, *_ in ranked]
+    assert terms.index("command") < terms.index("hook")
+    assert "premium" not in terms  # below min_count in the target
+
+
+def test_positional_index_postings_and_phrases():
+    corpus = CorpusEngine().corpus("docs", lambda: DOCS, _tokenize, "t1")
+    index = corpus.positional_index()
+
+    doc_ids, offsets = index.postings("hook")
+    assert doc_ids.tolist() == [0, 1, 1, 2]
+    assert offsets.tolist() == [2, 0, 2, 1]
+    assert index.documents("heavy duty").tolist() == [0, 2]
+    assert index.first("rail hook") == (1, 1)
+    assert index.first("hook bike") is None  # spans a document boundary
+    assert index.first("missing") is None
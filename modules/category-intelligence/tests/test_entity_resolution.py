@@ -0,0 +1,60 @@
+"""Tests for cross-retailer entity resolution."""
+from __future__ import annotations
+
+from src.analysis.entity_resolution import EntityResolver, Listing, resolve_products
+from src.analysis.summary import compute_summary
+from src.pipeline.product_catalog import ProductRecord
+
+
+def _product(retailer: str, sku: str, name: str, vendor: str) -> ProductRecord:
+    return ProductRecord(
+        retailer=retailer,
+        sku=sku,
+        name=name,
+        url=f"http://example.com/{retailer}/{sku}",
+        price=10.0,
+        rating=None,
+        taxonomy_path=(retailer, "Hooks & Hangers"),
+        attributes={"vendor": vendor},
+    )
+
+
+def test_resolver_merges_same_product_across_retailers():
+    listings = [
+        Listing("Amazon|1", "Amazon", "Gladiator", "Gladiator GAWEXXDHDH Heavy Duty Double Hook"),
+        Listing("Home Depot|2", "Home Depot", "GLADIATOR", "Heavy-Duty Double Hook GAWEXXDHDH"),
+        Listing("Walmart|3", "Walmart", "Gladiator Inc", "Gladiator Double Hook, Heavy Duty"),
+        Listing("Amazon|4", "Amazon", "Gladiator", "Gladiator GAWEXXBKHK Bike Hook"),
+        Listing("Walmart|5", "Walmart", "Rubbermaid", "Rubbermaid Heavy Duty Double Hook"),
+    ]
+    table = EntityResolver().resolve(listings)
+
+    assert table.canonical_id("Amazon|1") == table.canonical_id("Home Depot|2")
+    assert table.canonical_id("Amazon|1") == table.canonical_id("Walmart|3")
+    assert table.canonical_id("Amazon|4") != table.canonical_id("Amazon|1")
+    assert table.canonical_id("Walmart|5") != table.canonical_id("Walmart|3")
+    assert len(table) == 3
+    assert len(table.multi_retailer_ids()) == 1
+
+
+def test_resolver_keeps_same_retailer_listings_apart():
+    listings = [
+        Listing("Amazon|1", "Amazon", "Husky", "Husky Utility Hook 2-Pack"),
+        Listing("Amazon|2", "Amazon", "Husky", "Husky Utility Hook 2-Pack"),
+    ]
+    table = EntityResolver().resolve(listings)
+    assert len(table) == 2
+
+
+def test_compute_summary_counts_canonical_vendor_share():
+    products = [
+        _product("Amazon", "1", "Gladiator GAWEXXDHDH Heavy Duty Double Hook", "Gladiator"),
+        _product("Home Depot", "2", "Heavy-Duty Double Hook GAWEXXDHDH", "Gladiator"),
+        _product("Walmart", "3", "Rubbermaid FastTrack Utility Hook", "Rubbermaid"),
+    ]
+    canonical = resolve_products(products)
+    summary = compute_summary([], products, canonical=canonical)
+
+    assert summary["total_products"] == 3
+    assert summary["canonical_products"] == {"total": 2, "multi_retailer": 1}
+    assert dict(summary["top_vendors"]) == {"Gladiator": 1, "Rubbermaid": 1}
@@ -0,0 +1,142 @@
+"""Unit tests for the collector fetch scheduler."""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from src.pipeline.collectors import CompositeProductCatalog, FetchScheduler, SnapshotMissing, SnapshotStore
+from src.pipeline.collectors.target import TargetRequestConfig, TargetScraper
+from src.pipeline.product_catalog import ProductCatalogBuilder, ProductRecord
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "", headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """Serves pages by URL, honouring If-None-Match, and records request times."""
+
+    def __init__(self, pages: dict[str, str], latency: float = 0.0) -> None:
+        self.pages = pages
+        self.latency = latency
+        self.calls: list[tuple[str, dict, float]] = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):  # pylint: disable=unused-argument
+        with self._lock:
+            self.calls.append((url, dict(headers or {}), time.monotonic()))
+        time.sleep(self.latency)
+        if url not in self.pages:
+            return FakeResponse(404)
+        etag = f'"{hash(self.pages[url])}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.pages[url], {"ETag": etag})
+
+
+def test_map_preserves_order_and_overlaps_hosts():
+    pages = {f"https://host{i}.example.com/products.json": f"page-{i}" for i in range(6)}
+    scheduler = FetchScheduler(FakeSession(pages, latency=0.1), max_workers=6, default_interval=0)
+
+    start = time.monotonic()
+    results = scheduler.map(scheduler.get_text, list(pages))
+    elapsed = time.monotonic() - start
+    scheduler.close()
+
+    assert results == [f"page-{i}" for i in range(6)]
+    assert elapsed < 0.4  # concurrent, not 6 x 0.1s
+
+
+def test_host_interval_spaces_requests_to_same_host():
+    pages = {f"https://r.example.com/p{i}": str(i) for i in range(3)}
+    session = FakeSession(pages)
+    scheduler = FetchScheduler(session, max_workers=3, default_interval=0)
+    scheduler.limit_host("https://r.example.com", 0.05)
+
+    scheduler.map(scheduler.get_text, list(pages))
+    scheduler.close()
+
+    starts = sorted(timestamp for _, _, timestamp in session.calls)
+    assert all(later - earlier >= 0.045 for earlier, later in zip(starts, starts[1:]))
+
+
+def test_conditional_request_reuses_cached_body(tmp_path):
+    url = "https://shop.example.com/products.json"
+    session = FakeSession({url: '{"products": []}'})
+
+    FetchScheduler(session, default_interval=0, cache_dir=tmp_path).get_text(url)
+    # A new scheduler (next run) revalidates from the on-disk validators
+    text = FetchScheduler(session, default_interval=0, cache_dir=tmp_path).get_text(url)
+
+    assert text == '{"products": []}'
+    assert "If-None-Match" in session.calls[-1][1]
+
+
+def test_target_scraper_stops_at_first_failed_page():
+    config = TargetRequestConfig(query="hooks", max_pages=3, delay_seconds=0)
+    urls = [f"https://r.jina.ai/https://www.target.com/s?searchTerm=hooks&Nao={offset}" for offset in (0, 24, 48)]
+    session = FakeSession({urls[0]: "first", urls[2]: "third"})
+    scraper = TargetScraper(config, max_retries=1, retry_delay=0, scheduler=FetchScheduler(session, default_interval=0))
+
+    assert list(scraper.fetch_pages()) == ["first"]
+
+
+def test_snapshot_store_returns_latest_as_of_date(tmp_path):
+    store = SnapshotStore(tmp_path)
+    url = "https://shop.example.com/products.json"
+    store.put(url, "v1", datetime(2026, 1, 1, tzinfo=timezone.utc))
+    store.put(url, "v2", datetime(2026, 2, 1, tzinfo=timezone.utc))
+    store.put("https://other.example.com/", "v1", datetime(2026, 2, 1, tzinfo=timezone.utc))
+
+    assert store.get(url) == "v2"
+    assert store.get(url, "2026-01-15") == "v1"
+    assert store.get(url, "2025-12-31") is None
+    assert len(list((tmp_path / "objects").rglob("*"))) == 4  # 2 shards + 2 distinct bodies
+
+
+def test_replay_serves_snapshots_without_network(tmp_path):
+    url = "https://shop.example.com/products.json"
+    store = SnapshotStore(tmp_path)
+    FetchScheduler(FakeSession({url: "live"}), default_interval=0, snapshots=store).get_text(url)
+
+    offline = FakeSession({})
+    replay = FetchScheduler(offline, snapshots=store, replay=True)
+
+    assert replay.get_text(url) == "live"
+    with pytest.raises(SnapshotMissing):
+        replay.get_text("https://shop.example.com/missing.json")
+    assert offline.calls == []
+
+
+class SlowCatalog(ProductCatalogBuilder):
+    def __init__(self, retailer: str, delay: float) -> None:
+        self.retailer = retailer
+        self.delay = delay
+
+    def collect(self, category: str):
+        time.sleep(self.delay)
+        for sku in ("1", "2"):
+            yield ProductRecord(self.retailer, sku, category, f"http://{self.retailer}/{sku}", None, None, (), {})
+
+
+def test_composite_catalog_runs_concurrently_in_catalog_order():
+    catalog = CompositeProductCatalog([SlowCatalog("a", 0.15), SlowCatalog("b", 0.0), SlowCatalog("c", 0.15)])
+
+    start = time.monotonic()
+    products = list(catalog.collect("hooks"))
+
+    assert time.monotonic() - start < 0.28
+    assert [(p.retailer, p.sku) for p in products] == [
+        ("a", "1"), ("a", "2"), ("b", "1"), ("b", "2"), ("c", "1"), ("c", "2")
+    ]
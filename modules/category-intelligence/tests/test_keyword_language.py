@@ -0,0 +1,33 @@
+"""Tests for keyword vs. community language analysis."""
+from __future__ import annotations
+
+import json
+
+from src.analysis.keyword_language import compute_keyword_language_summary
+
+
+def test_hidden_terms_get_examples_from_index(tmp_path):
+    ads = tmp_path / "ads.json"
+    community = tmp_path / "community.json"
+    ads.write_text(json.dumps([{"title": "Premium steel garage hook"}] * 3))
+    community.write_text(
+        json.dumps(
+            [
+                {"body": "No photos here", "subreddit": "DIY"},
+                {"body": "My French cleat wall holds every tool.", "permalink": "/r/1", "subreddit": "garage"},
+                {"body": "Built a cleat rack for clamps", "permalink": "/r/2", "subreddit": "DIY"},
+                {"body": "cleats! cleat cleat", "subreddit": "garage"},
+                {"title": "no body"},
+            ]
+        )
+    )
+
+    summary = compute_keyword_language_summary([ads], [community], min_community_freq=2)
+    (cleat,) = [term for term in summary.hidden_terms if term.term == "cleat"]
+
+    assert summary.total_community_records == 4
+    assert cleat.community_freq == 4
+    assert cleat.source_url == "/r/1"
+    assert cleat.example == "My French cleat wall holds every tool."
+    assert cleat.subreddit_counts == {"garage": 2, "DIY": 1}
+    assert "cleat" in cleat.snippet
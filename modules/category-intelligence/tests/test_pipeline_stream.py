@@ -0,0 +1,130 @@
+"""Tests for streaming pipeline execution."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.analysis.entity_resolution import EntityResolver, listings_from_products, resolve_products
+from src.analysis.summary import SummaryAggregator
+from src.pipeline.brand_collector import BrandCollector, BrandRecord
+from src.pipeline.orchestrator import CallbackSink, CategoryIntelligencePipeline
+from src.pipeline.product_catalog import ProductCatalogBuilder, ProductRecord
+from src.storage.filesystem import FilesystemWriter
+
+
+class FakeBrands(BrandCollector):
+    def __init__(self, count: int, barrier: threading.Barrier | None = None) -> None:
+        self.count = count
+        self.barrier = barrier
+
+    def collect(self, category: str):
+        if self.barrier is not None:
+            self.barrier.wait()
+        for i in range(self.count):
+            yield BrandRecord(name=f"Brand{i}", tier="test", source_url="url")
+
+
+class FakeProducts(ProductCatalogBuilder):
+    def __init__(
+        self,
+        count: int,
+        fail_after: int | None = None,
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.count = count
+        self.fail_after = fail_after
+        self.barrier = barrier
+
+    def collect(self, category: str):
+        if self.barrier is not None:
+            self.barrier.wait()
+        for i in range(self.count):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("retailer went away")
+            yield ProductRecord("Retailer1", str(i), f"Hook {i}", f"http://example.com/{i}", 10.0 + i, None, ("Retailer1", "Hooks"), {"vendor": "BrandA"})
+
+
+class FailingSink:
+    def write_brands(self, category, brands):
+        raise RuntimeError("database unavailable")
+
+    def write_products(self, category, products):
+        raise RuntimeError("database unavailable")
+
+
+def test_stream_collects_concurrently_and_tees_to_sinks(tmp_path):
+    # Each collector waits for the other to start: a sequential pipeline
+    # would break the barrier after the timeout and fail the run
+    barrier = threading.Barrier(2, timeout=5)
+    pipeline = CategoryIntelligencePipeline(
+        FakeBrands(5, barrier=barrier), FakeProducts(5, barrier=barrier), min_brands=3
+    )
+    aggregator = SummaryAggregator()
+    writer = FilesystemWriter(tmp_path)
+    file_sink = writer.stream_sink("garage")
+    sinks = [file_sink, CallbackSink(aggregator.add_brands, aggregator.add_products), FailingSink()]
+
+    results = pipeline.stream("garage", sinks, min_products=5, batch_size=2)
+    file_sink.close()
+
+    assert len(results["brands"]) == 5 and len(results["products"]) == 5
+    assert aggregator.summary()["total_products"] == 5
+    expected = FilesystemWriter(tmp_path / "batch")
+    expected.write_products("garage", results["products"])
+    assert (tmp_path / "garage_products.json").read_text() == (tmp_path / "batch" / "garage_products.json").read_text()
+
+
+def test_stream_persists_records_collected_before_failure(tmp_path):
+    pipeline = CategoryIntelligencePipeline(FakeBrands(2), FakeProducts(10, fail_after=7), min_brands=1)
+    writer = FilesystemWriter(tmp_path)
+
+    with pytest.raises(ConnectionError):
+        pipeline.stream("garage", [writer.stream_sink("garage")], batch_size=3)
+
+    lines = (tmp_path / "garage_products.partial.jsonl").read_text().splitlines()
+    assert len(lines) == 7
+
+
+def test_aborted_stream_keeps_previous_outputs(tmp_path):
+    writer = FilesystemWriter(tmp_path)
+    good = CategoryIntelligencePipeline(FakeBrands(2), FakeProducts(3), min_brands=1)
+    good_sink = writer.stream_sink("garage")
+    good.stream("garage", [good_sink])
+    good_sink.close()
+    previous = (tmp_path / "garage_products.json").read_text()
+
+    short = CategoryIntelligencePipeline(FakeBrands(2), FakeProducts(2), min_brands=1)
+    sink = writer.stream_sink("garage")
+    with pytest.raises(RuntimeError, match="Insufficient products"):
+        short.stream("garage", [sink], min_products=5)
+    kept = sink.abort()
+
+    assert (tmp_path / "garage_products.json").read_text() == previous
+    assert tmp_path / "garage_products.partial.jsonl" in kept
+    assert len((tmp_path / "garage_products.partial.jsonl").read_text().splitlines()) == 2
+
+
+def test_stream_reports_dropped_sinks():
+    pipeline = CategoryIntelligencePipeline(FakeBrands(2), FakeProducts(2), min_brands=1)
+    failing = FailingSink()
+    results = pipeline.stream("garage", [CallbackSink(), failing])
+    assert results["failed_sinks"] == [failing]
+
+
+def test_stream_enforces_brand_minimum():
+    pipeline = CategoryIntelligencePipeline(FakeBrands(2), FakeProducts(3), min_brands=5)
+    with pytest.raises(RuntimeError, match="Insufficient brand coverage"):
+        pipeline.stream("garage")
+
+
+def test_stream_without_records_feeds_entity_resolution_from_sinks():
+    pipeline = CategoryIntelligencePipeline(FakeBrands(3), FakeProducts(7), min_brands=1)
+    listings = []
+    sink = CallbackSink(on_products=lambda batch: listings.extend(listings_from_products(batch)))
+
+    results = pipeline.stream("garage", [sink], batch_size=2, keep_records=False)
+
+    assert results["products"] == [] and results["counts"] == {"brands": 3, "products": 7}
+    expected = resolve_products(FakeProducts(7).collect("garage"))
+    assert EntityResolver().resolve(listings).rows() == expected.rows()
@@ -1,7 +1,10 @@
 """Tests for summary analysis."""
 from __future__ import annotations
 
-from src.analysis.summary import compute_summary
+import json
+
+from src.analysis.sketches import QuantileSketch
+from src.analysis.summary import SummaryAggregator, compute_summary
 from src.pipeline.brand_collector import BrandRecord
 from src.pipeline.product_catalog import ProductRecord
 
@@ -51,3 +54,39 @@ def test_compute_summary_counts():
     assert summary["segment_counts"]["Hooks & Hangers"] == 1
     assert summary["load_capacity"]["with_capacity"] == 1
     assert summary["load_capacity"]["max_capacity"] == 25.0
+
+
+def _priced(retailer: str, sku: str, price: float) -> ProductRecord:
+    return ProductRecord(
+        retailer=retailer,
+        sku=sku,
+        name="Hook",
+        url=f"http://example.com/{sku}",
+        price=price,
+        rating=None,
+        taxonomy_path=(retailer, "Hooks & Hangers"),
+        attributes={"vendor": "BrandA"},
+    )
+
+
+def test_summary_aggregator_merges_shards():
+    products = [_priced("Retailer1" if i % 2 else "Retailer2", str(i), float(i)) for i in range(1, 101)]
+    whole = compute_summary([], products)
+
+    first = SummaryAggregator().add_products(products[:40])
+    second = SummaryAggregator().add_products(products[40:])
+    # Partial summaries survive a JSON round trip before merging
+    restored = SummaryAggregator.from_dict(json.loads(json.dumps(first.to_dict())))
+
+    assert restored.merge(second).summary() == whole
+    assert whole["segment_price_stats"]["Hooks & Hangers"]["avg_price"] == 50.5
+
+
+def test_quantile_sketch_relative_error():
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in range(1, 1001):
+        sketch.add(float(value))
+
+    assert abs(sketch.quantile(0.5) - 500) / 500 <= 0.01
+    assert abs(sketch.quantile(0.9) - 900) / 900 <= 0.01
+    assert QuantileSketch().quantile(0.5) is None
@@ -7,11 +7,15 @@ Following Clayton Christensen framework properly
 from config import PATHS
 
 import json
+import sys
 from pathlib import Path
-from pptx import Presentation
 from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from collections import defaultdict
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from core.reporting.deck import Deck, Slide
 
 # Paths
 PROCESSED_DIR = Path(PATHS["processed"])
@@ -123,26 +127,54 @@ def extract_jtbd_jobs(transcripts):
 
     return sorted(jobs, key=lambda x: x['consumer_count'], reverse=True)
 
-def create_presentation(jobs, transcripts):
-    """Populate Offbrain template with JTBD content"""
+def title_slide(slide, title, subtitle):
+    """Fill the template's own title slide"""
+    if hasattr(slide.shapes, 'title') and slide.shapes.title:
+        slide.shapes.title.text = title
+        if len(slide.placeholders) > 1:
+            slide.placeholders[1].text = subtitle
 
-    prs = Presentation(str(TEMPLATE_PATH))
+def bullet_slide(slide, title, bullets):
+    """Blank-layout slide with a title and a bullet list"""
+    _add_title(slide, title)
+    _add_bullets(slide, bullets)
 
-    # Slide 1: Title (already exists in template, modify if needed)
-    if len(prs.slides) > 0:
-        title_slide = prs.slides[0]
-        if hasattr(title_slide.shapes, 'title') and title_slide.shapes.title:
-            title_slide.shapes.title.text = "3M Lighting Consumer Research"
-            if len(title_slide.placeholders) > 1:
-                title_slide.placeholders[1].text = "Jobs-to-be-Done Framework\nConsumer Insights & Strategic Opportunities"
+def job_bullets(job):
+    """Bullets for one job slide"""
+    bullets = [
+        "JOB STATEMENT:",
+        job['statement'],
+        "",
+        f"EVIDENCE: {job['consumer_count']} consumers",
+        "",
+        "DIMENSIONS:",
+        f"• Functional: {job['functional']}",
+        f"• Emotional: {job['emotional']}",
+        f"• Social: {job['social']}",
+        "",
+        "CONSUMER VOICE:"
+    ]
 
-    # Add new content slides
-    blank_layout = prs.slide_layouts[6]  # Blank layout
+    # Add top quote with citation
+    if job['top_quotes']:
+        quote = job['top_quotes'][0]
+        bullets.append(f'"{quote["quote"]}"')
+        bullets.append(f"— {quote['consumer']} | {quote['source'].split('_')[1]}")
+
+    return bullets
+
+def build_slides(jobs, transcripts):
+    """Slide specs for the Offbrain template"""
+    # Slide 1: Title (already exists in template, modify if needed)
+    slides = [
+        Slide(title_slide, {
+            'title': "3M Lighting Consumer Research",
+            'subtitle': "Jobs-to-be-Done Framework\nConsumer Insights & Strategic Opportunities"
+        }, existing=0)
+    ]
 
     # Slide 2: Executive Summary
-    slide = prs.slides.add_slide(blank_layout)
-    _add_title(slide, "Executive Summary")
-    _add_bullets(slide, [
+    slides.append(Slide(bullet_slide, {'title': "Executive Summary", 'bullets': [
         f"{len(transcripts)} consumers analyzed across 82 video interviews",
         f"{len(jobs)} core jobs identified using Clayton Christensen framework",
         "Focus: Understanding progress consumers seek, not just tasks",
@@ -150,12 +182,10 @@ def create_presentation(jobs, transcripts):
         "KEY FINDING:",
         "Consumers hire lighting solutions to feel capable and in control",
         "They want to avoid contractor complexity while achieving sophisticated aesthetics"
-    ])
+    ]}))
 
     # Slide 3: Methodology
-    slide = prs.slides.add_slide(blank_layout)
-    _add_title(slide, "Jobs-to-be-Done Framework")
-    _add_bullets(slide, [
+    slides.append(Slide(bullet_slide, {'title': "Jobs-to-be-Done Framework", 'bullets': [
         "A job is the progress a person wants to achieve in specific circumstances",
         "",
         "Job Format: When [situation], I want to [progress], So I can [outcome]",
@@ -166,48 +196,21 @@ def create_presentation(jobs, transcripts):
         "  • Social: How they want to be perceived",
         "",
         "Jobs are solution-agnostic and stable over time"
-    ])
+    ]}))
 
     # Slides 4-7: Each Job
     for i, job in enumerate(jobs, 1):
-        slide = prs.slides.add_slide(blank_layout)
-        _add_title(slide, f"Job {i}: {job['name']}")
-
-        bullets = [
-            "JOB STATEMENT:",
-            job['statement'],
-            "",
-            f"EVIDENCE: {job['consumer_count']} consumers",
-            "",
-            "DIMENSIONS:",
-            f"• Functional: {job['functional']}",
-            f"• Emotional: {job['emotional']}",
-            f"• Social: {job['social']}",
-            "",
-            "CONSUMER VOICE:"
-        ]
-
-        # Add top quote with citation
-        if job['top_quotes']:
-            quote = job['top_quotes'][0]
-            bullets.append(f'"{quote["quote"]}"')
-            bullets.append(f"— {quote['consumer']} | {quote['source'].split('_')[1]}")
-
-        _add_bullets(slide, bullets)
+        slides.append(Slide(bullet_slide, {'title': f"Job {i}: {job['name']}", 'bullets': job_bullets(job)}))
 
     # Slide 8: Prioritization
-    slide = prs.slides.add_slide(blank_layout)
-    _add_title(slide, "Job Prioritization")
     bullets = ["PRIORITY RANKING (by consumer count):", ""]
     for i, job in enumerate(jobs, 1):
         bullets.append(f"{i}. {job['name']}: {job['consumer_count']} consumers")
     bullets.extend(["", "All jobs validated with minimum 4 consumers"])
-    _add_bullets(slide, bullets)
+    slides.append(Slide(bullet_slide, {'title': "Job Prioritization", 'bullets': bullets}))
 
     # Slide 9: Strategic Opportunities
-    slide = prs.slides.add_slide(blank_layout)
-    _add_title(slide, "Strategic Opportunities")
-    _add_bullets(slide, [
+    slides.append(Slide(bullet_slide, {'title': "Strategic Opportunities", 'bullets': [
         "1. WIRELESS PREMIUM:",
         "   Battery solutions that don't sacrifice aesthetic quality",
         "",
@@ -219,12 +222,10 @@ def create_presentation(jobs, transcripts):
         "",
         "4. DESIGN-FORWARD DIY:",
         "   Position as the choice for design-conscious DIYers"
-    ])
+    ]}))
 
     # Slide 10: Next Steps
-    slide = prs.slides.add_slide(blank_layout)
-    _add_title(slide, "Next Steps")
-    _add_bullets(slide, [
+    slides.append(Slide(bullet_slide, {'title': "Next Steps", 'bullets': [
         "IMMEDIATE (2 weeks):",
         "• Internal workshop to review findings",
         "• Prioritization vote with cross-functional team",
@@ -237,11 +238,17 @@ def create_presentation(jobs, transcripts):
         "• Prototype development",
         "• In-home testing",
         "• Go-to-market planning"
-    ])
+    ]}))
+
+    return slides
+
+def create_presentation(jobs, transcripts):
+    """Populate Offbrain template with JTBD content"""
+    deck = Deck(template=TEMPLATE_PATH).extend(build_slides(jobs, transcripts))
 
     # Save
     output_path = TEMPLATE_PATH.parent / "3M_Lighting_JTBD_Final_Complete.pptx"
-    prs.save(str(output_path))
+    deck.build(output_path)
 
     return output_path, jobs
 
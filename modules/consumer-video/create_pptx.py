@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
 Create PowerPoint presentation directly using python-pptx
+Slides are described declaratively and assembled by core.reporting.deck
 """
 
 import json
@@ -13,17 +14,17 @@ from config import PATHS
 
 # Auto-install python-pptx if needed
 try:
-    from pptx import Presentation
     from pptx.util import Inches, Pt
-    from pptx.enum.text import PP_ALIGN
-    from pptx.dml.color import RGBColor
 except ImportError:
     print("Installing python-pptx...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "python-pptx", "--quiet"])
-    from pptx import Presentation
     from pptx.util import Inches, Pt
-    from pptx.enum.text import PP_ALIGN
-    from pptx.dml.color import RGBColor
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from core.reporting.deck import Deck, Slide
 
 # Load analysis
 PROCESSED_DIR = Path(PATHS["processed"])
@@ -33,17 +34,14 @@ def load_analysis():
     with open(ANALYSIS_PATH, 'r') as f:
         return json.load(f)
 
-def add_title_slide(prs, title, subtitle=""):
-    """Add a title slide"""
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
+def title_slide(slide, title, subtitle=""):
+    """Title slide (layout 0)"""
     slide.shapes.title.text = title
     if subtitle and len(slide.placeholders) > 1:
         slide.placeholders[1].text = subtitle
-    return slide
 
-def add_content_slide(prs, title, bullets, notes=""):
-    """Add a content slide with bullets"""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+def content_slide(slide, title, bullets):
+    """Content slide with bullets (layout 1)"""
     slide.shapes.title.text = title
 
     # Add bullets
@@ -58,17 +56,8 @@ def add_content_slide(prs, title, bullets, notes=""):
             p.text = bullet
             p.level = 0
 
-    # Add speaker notes if provided
-    if notes:
-        notes_slide = slide.notes_slide
-        notes_slide.notes_text_frame.text = notes
-
-    return slide
-
-def add_table_slide(prs, title, headers, rows, notes=""):
-    """Add a slide with a table"""
-    slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
-
+def table_slide(slide, title, headers, rows):
+    """Slide with a title and a table (layout 5)"""
     # Add title
     left = Inches(0.5)
     top = Inches(0.5)
@@ -109,232 +98,258 @@ def add_table_slide(prs, title, headers, rows, notes=""):
             cell.text = str(cell_text)
             cell.text_frame.paragraphs[0].font.size = Pt(12)
 
-    # Add speaker notes if provided
-    if notes:
-        notes_slide = slide.notes_slide
-        notes_slide.notes_text_frame.text = notes
-
-    return slide
-
 def create_presentation(analysis):
-    """Create the full PowerPoint presentation"""
-    prs = Presentation()
+    """Describe the full PowerPoint presentation"""
+    deck = Deck()
 
     # Slide 1: Title
-    add_title_slide(
-        prs,
-        "3M Lighting Consumer Research",
-        "Jobs-to-be-Done Analysis\nRungs of the Ladder Framework"
-    )
+    deck.add(Slide(
+        title_slide,
+        {
+            'title': "3M Lighting Consumer Research",
+            'subtitle': "Jobs-to-be-Done Analysis\nRungs of the Ladder Framework",
+        },
+        layout=0
+    ))
 
     # Slide 2: Research Overview
-    add_content_slide(
-        prs,
-        "Research Overview",
-        [
-            f"{analysis['summary']['total_consumers']} consumers analyzed across 82 video interviews",
-            f"{analysis['summary']['total_jobs']} distinct jobs extracted from verbatim quotes",
-            "Framework: Jobs-to-be-Done 'Rungs of the Ladder'",
-            "Focus: Understanding not just what consumers do, but why they care"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Research Overview",
+            'bullets': [
+                f"{analysis['summary']['total_consumers']} consumers analyzed across 82 video interviews",
+                f"{analysis['summary']['total_jobs']} distinct jobs extracted from verbatim quotes",
+                "Framework: Jobs-to-be-Done 'Rungs of the Ladder'",
+                "Focus: Understanding not just what consumers do, but why they care"
+            ],
+        },
+        layout=1,
         notes="Emphasize depth of analysis - real consumer voices, not survey data. All insights are directly quoted and verifiable."
-    )
+    ))
 
     # Slide 3: Rungs of the Ladder Framework
-    add_content_slide(
-        prs,
-        "The Rungs of the Ladder Approach",
-        [
-            "Bottom Rung - Functional Jobs: What consumers are trying to accomplish",
-            "  Example: Install accent lighting, illuminate artwork",
-            "",
-            "Middle Rungs - Emotional Jobs: How consumers want to feel",
-            "  Example: Feel capable, keep it simple, avoid regret",
-            "",
-            "Top Rungs - Social Jobs: How consumers want to be perceived",
-            "  Example: Appear modern/sophisticated, demonstrate competence"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "The Rungs of the Ladder Approach",
+            'bullets': [
+                "Bottom Rung - Functional Jobs: What consumers are trying to accomplish",
+                "  Example: Install accent lighting, illuminate artwork",
+                "",
+                "Middle Rungs - Emotional Jobs: How consumers want to feel",
+                "  Example: Feel capable, keep it simple, avoid regret",
+                "",
+                "Top Rungs - Social Jobs: How consumers want to be perceived",
+                "  Example: Appear modern/sophisticated, demonstrate competence"
+            ],
+        },
+        layout=1,
         notes="Higher rungs reveal the true value drivers. Consumers don't just want lighting - they want to feel capable and appear resourceful."
-    )
+    ))
 
     # Slide 4: Functional Jobs
-    add_content_slide(
-        prs,
-        "Functional Jobs - What They're Trying to Do",
-        [
-            "Control Lighting (7 consumers): Remote, timers, motion sensors",
-            "Avoid Cords/Wiring (9 consumers): Battery, rechargeable solutions",
-            "Illuminate Space (5 consumers): Light up art, features",
-            "Highlight Features (3 consumers): Draw attention to design elements",
-            "",
-            "Consumer Voice:",
-            "\"I didn't want wires hanging on walls... no ability to create electrical work inside walls\" - GeneK"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Functional Jobs - What They're Trying to Do",
+            'bullets': [
+                "Control Lighting (7 consumers): Remote, timers, motion sensors",
+                "Avoid Cords/Wiring (9 consumers): Battery, rechargeable solutions",
+                "Illuminate Space (5 consumers): Light up art, features",
+                "Highlight Features (3 consumers): Draw attention to design elements",
+                "",
+                "Consumer Voice:",
+                "\"I didn't want wires hanging on walls... no ability to create electrical work inside walls\" - GeneK"
+            ],
+        },
+        layout=1,
         notes="Wireless/battery solutions are table stakes, not differentiators. Control features serve multiple jobs simultaneously."
-    )
+    ))
 
     # Slide 5: Emotional Jobs
-    add_content_slide(
-        prs,
-        "Emotional Jobs - How They Want to Feel",
-        [
-            "Keep It Simple (7 consumers): Avoid hassle, maintain control",
-            "Achieve Desired Aesthetic (6 consumers): Modern, luxury, elegant look",
-            "Avoid High Costs (4 consumers): \"$1000 every time electrician comes\"",
-            "Feel Capable (6 consumers): Pride in DIY accomplishment",
-            "Avoid Regret (3 consumers): Get it right the first time",
-            "",
-            "Consumer Voice:",
-            "\"It still gives me that modern luxury aspect... didn't have to invest much money\" - TylrD"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Emotional Jobs - How They Want to Feel",
+            'bullets': [
+                "Keep It Simple (7 consumers): Avoid hassle, maintain control",
+                "Achieve Desired Aesthetic (6 consumers): Modern, luxury, elegant look",
+                "Avoid High Costs (4 consumers): \"$1000 every time electrician comes\"",
+                "Feel Capable (6 consumers): Pride in DIY accomplishment",
+                "Avoid Regret (3 consumers): Get it right the first time",
+                "",
+                "Consumer Voice:",
+                "\"It still gives me that modern luxury aspect... didn't have to invest much money\" - TylrD"
+            ],
+        },
+        layout=1,
         notes="Emotional jobs often drive more value than functional jobs. Aesthetic is non-negotiable, but must be achievable."
-    )
+    ))
 
     # Slide 6: Social Jobs
-    add_content_slide(
-        prs,
-        "Social Jobs - How They Want to Be Perceived",
-        [
-            "Be Seen as Creative (7 consumers): Design-conscious choices",
-            "Showcase Home (5 consumers): Impress visitors, display identity",
-            "Appear Modern/Sophisticated (5 consumers): Tech-savvy, upscale",
-            "Display Personal Identity (3 consumers): Family photos, art collection",
-            "Demonstrate DIY Competence: \"No need to hire\"",
-            "",
-            "Consumer Voice:",
-            "\"Motion detected... still get that same look as modern and classic design\" - TylrD"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Social Jobs - How They Want to Be Perceived",
+            'bullets': [
+                "Be Seen as Creative (7 consumers): Design-conscious choices",
+                "Showcase Home (5 consumers): Impress visitors, display identity",
+                "Appear Modern/Sophisticated (5 consumers): Tech-savvy, upscale",
+                "Display Personal Identity (3 consumers): Family photos, art collection",
+                "Demonstrate DIY Competence: \"No need to hire\"",
+                "",
+                "Consumer Voice:",
+                "\"Motion detected... still get that same look as modern and classic design\" - TylrD"
+            ],
+        },
+        layout=1,
         notes="Social signaling matters - lighting is a design statement. DIY capability creates pride when achievable but not trivial."
-    )
+    ))
 
     # Slide 7: Opportunity Map
-    add_content_slide(
-        prs,
-        "Opportunity Map: Ease of Implementation vs Aspirational Value",
-        [
-            "HIGH Ease, HIGH Aspirational (Sweet Spot):",
-            "  • Wireless Premium Positioning",
-            "  • Smart Control as Standard",
-            "  • Design-Forward DIY",
-            "",
-            "Gap in Market: Current options force choice between:",
-            "  • Easy install (but basic/ugly) OR",
-            "  • High-end look (but expensive/difficult)",
-            "",
-            "3M Opportunity: Premium DIY without sacrificing aesthetics"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Opportunity Map: Ease of Implementation vs Aspirational Value",
+            'bullets': [
+                "HIGH Ease, HIGH Aspirational (Sweet Spot):",
+                "  • Wireless Premium Positioning",
+                "  • Smart Control as Standard",
+                "  • Design-Forward DIY",
+                "",
+                "Gap in Market: Current options force choice between:",
+                "  • Easy install (but basic/ugly) OR",
+                "  • High-end look (but expensive/difficult)",
+                "",
+                "3M Opportunity: Premium DIY without sacrificing aesthetics"
+            ],
+        },
+        layout=1,
         notes="Sweet spot is HIGH Ease + HIGH Aspirational quadrant. Current market forces consumers to choose between easy install and high-end look."
-    )
+    ))
 
     # Slide 8: Jobs Summary Table
-    add_table_slide(
-        prs,
-        "Jobs Summary by Priority",
-        ["Job", "Type", "Consumers", "Priority"],
-        [
-            ["Avoid Cords/Wiring", "Functional", "9", "HIGH"],
-            ["Control Lighting", "Functional", "7", "HIGH"],
-            ["Keep It Simple", "Emotional", "7", "HIGH"],
-            ["Be Seen as Creative", "Social", "7", "HIGH"],
-            ["Achieve Desired Aesthetic", "Emotional", "6", "HIGH"],
-            ["Feel Capable", "Emotional", "6", "HIGH"],
-            ["Showcase Home", "Social", "5", "MEDIUM"],
-            ["Appear Modern/Sophisticated", "Social", "5", "MEDIUM"],
-            ["Illuminate Space", "Functional", "5", "MEDIUM"]
-        ],
+    deck.add(Slide(
+        table_slide,
+        {
+            'title': "Jobs Summary by Priority",
+            'headers': ["Job", "Type", "Consumers", "Priority"],
+            'rows': [
+                ["Avoid Cords/Wiring", "Functional", "9", "HIGH"],
+                ["Control Lighting", "Functional", "7", "HIGH"],
+                ["Keep It Simple", "Emotional", "7", "HIGH"],
+                ["Be Seen as Creative", "Social", "7", "HIGH"],
+                ["Achieve Desired Aesthetic", "Emotional", "6", "HIGH"],
+                ["Feel Capable", "Emotional", "6", "HIGH"],
+                ["Showcase Home", "Social", "5", "MEDIUM"],
+                ["Appear Modern/Sophisticated", "Social", "5", "MEDIUM"],
+                ["Illuminate Space", "Functional", "5", "MEDIUM"]
+            ],
+        },
+        layout=5,
         notes="Priority based on consumer diversity and mention frequency. Jobs with 5+ consumers represent validated opportunities."
-    )
+    ))
 
     # Slide 9: Recommended Focus Areas
-    add_content_slide(
-        prs,
-        "Recommended Focus Areas",
-        [
-            "1. Wireless Premium Positioning:",
-            "   Premium battery solutions without sacrificing aesthetic",
-            "   Serves: Avoid electrician + Look finished + Appear modern",
-            "",
-            "2. Smart Control as Standard:",
-            "   Make remote, timers, dimming standard features",
-            "   Serves: Control flexibility + Feel capable + Signal sophistication",
-            "",
-            "3. Installation Confidence System:",
-            "   Tools/guides for right product selection and placement",
-            "   Serves: Feel capable + Avoid regret + Demonstrate competence",
-            "",
-            "4. Design-Forward DIY:",
-            "   Position as choice for design-conscious DIYers",
-            "   Serves: Achieve aesthetic + Be creative + Showcase home"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Recommended Focus Areas",
+            'bullets': [
+                "1. Wireless Premium Positioning:",
+                "   Premium battery solutions without sacrificing aesthetic",
+                "   Serves: Avoid electrician + Look finished + Appear modern",
+                "",
+                "2. Smart Control as Standard:",
+                "   Make remote, timers, dimming standard features",
+                "   Serves: Control flexibility + Feel capable + Signal sophistication",
+                "",
+                "3. Installation Confidence System:",
+                "   Tools/guides for right product selection and placement",
+                "   Serves: Feel capable + Avoid regret + Demonstrate competence",
+                "",
+                "4. Design-Forward DIY:",
+                "   Position as choice for design-conscious DIYers",
+                "   Serves: Achieve aesthetic + Be creative + Showcase home"
+            ],
+        },
+        layout=1,
         notes="Each opportunity serves multiple ladder rungs simultaneously. Gap exists between contractor-grade ugly and designer-grade expensive."
-    )
+    ))
 
     # Slide 10: Key Insights
-    add_content_slide(
-        prs,
-        "Key Insights & Patterns",
-        [
-            "Pattern 1: The Electrician Avoidance",
-            "  9 of 15 consumers explicitly avoided electricians",
-            "  Not just cost - it's about control, speed, DIY pride",
-            "",
-            "Pattern 2: Control as Feature Multiplier",
-            "  Remote, timers, motion sensors serve multiple jobs",
-            "  Functional + Emotional + Social value simultaneously",
-            "",
-            "Pattern 3: Regret is Real",
-            "  3 consumers expressed regret about choices",
-            "  Opportunity for better upfront guidance",
-            "",
-            "Pattern 4: Aesthetic Non-Negotiable",
-            "  6 consumers used 'modern,' 'luxury,' 'elegant'",
-            "  Lighting is a design statement, not just illumination"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Key Insights & Patterns",
+            'bullets': [
+                "Pattern 1: The Electrician Avoidance",
+                "  9 of 15 consumers explicitly avoided electricians",
+                "  Not just cost - it's about control, speed, DIY pride",
+                "",
+                "Pattern 2: Control as Feature Multiplier",
+                "  Remote, timers, motion sensors serve multiple jobs",
+                "  Functional + Emotional + Social value simultaneously",
+                "",
+                "Pattern 3: Regret is Real",
+                "  3 consumers expressed regret about choices",
+                "  Opportunity for better upfront guidance",
+                "",
+                "Pattern 4: Aesthetic Non-Negotiable",
+                "  6 consumers used 'modern,' 'luxury,' 'elegant'",
+                "  Lighting is a design statement, not just illumination"
+            ],
+        },
+        layout=1,
         notes="These patterns reveal unmet needs and innovation opportunities."
-    )
+    ))
 
     # Slide 11: Next Steps
-    add_content_slide(
-        prs,
-        "Next Steps",
-        [
-            "Immediate (2 weeks):",
-            "  • Internal workshop with product and marketing teams",
-            "  • Opportunity prioritization vote",
-            "  • Competitive mapping against opportunity matrix",
-            "",
-            "Short Term (4-6 weeks):",
-            "  • Concept development for high-priority jobs",
-            "  • Consumer validation with 20-30 participants",
-            "  • Messaging framework addressing emotional/social jobs",
-            "",
-            "Medium Term (3 months):",
-            "  • Prototype development for top 2-3 opportunities",
-            "  • In-home testing and extended trials",
-            "  • Go-to-market planning based on ladder insights"
-        ],
+    deck.add(Slide(
+        content_slide,
+        {
+            'title': "Next Steps",
+            'bullets': [
+                "Immediate (2 weeks):",
+                "  • Internal workshop with product and marketing teams",
+                "  • Opportunity prioritization vote",
+                "  • Competitive mapping against opportunity matrix",
+                "",
+                "Short Term (4-6 weeks):",
+                "  • Concept development for high-priority jobs",
+                "  • Consumer validation with 20-30 participants",
+                "  • Messaging framework addressing emotional/social jobs",
+                "",
+                "Medium Term (3 months):",
+                "  • Prototype development for top 2-3 opportunities",
+                "  • In-home testing and extended trials",
+                "  • Go-to-market planning based on ladder insights"
+            ],
+        },
+        layout=1,
         notes="All 82 videos and transcripts available for deeper exploration. Source files verifiable for any insight cited."
-    )
+    ))
 
-    return prs
+    return deck
 
 def main():
     print("Loading JTBD analysis...")
     analysis = load_analysis()
 
     print("Creating PowerPoint presentation...")
-    prs = create_presentation(analysis)
+    deck = create_presentation(analysis)
 
     # Save with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = Path(PATHS["outputs"])
     output_dir.mkdir(parents=True, exist_ok=True)
     filename = output_dir / f"3M_Lighting_JTBD_Presentation_{timestamp}.pptx"
-    prs.save(filename)
+    deck.build(filename)
 
     print(f"\n✓ PowerPoint created successfully!")
     print(f"  File: {filename}")
-    print(f"  Total slides: {len(prs.slides)}")
+    print(f"  Total slides: {len(deck)}")
 
 if __name__ == "__main__":
     main()
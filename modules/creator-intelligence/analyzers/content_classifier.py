@@ -17,17 +17,16 @@ class ContentClassifier:
     Classifies content relevance and extracts pain points and consumer language.
     """
 
+    # Stable prefix, set once as the model's system instruction; only the
+    # per-item content is sent with each request. No CachedContent is created
+    # (the prefix is far below Gemini's minimum for explicit caches), so it is
+    # billed on every call unless the model caches implicitly
     CLASSIFICATION_PROMPT = """You are analyzing creator content for the lighting industry.
 
-Content to analyze:
-Title: {title}
-Description: {description}
-Platform: {platform}
-
-Task: Classify this content and extract insights.
+Task: Classify the content in each message and extract insights.
 
 Respond with valid JSON only (no markdown, no explanation):
-{{
+{
   "classification": "highly_relevant" | "relevant" | "tangentially_relevant" | "not_relevant",
   "relevance_score": 0.0-1.0,
   "relevance_reasoning": "brief explanation",
@@ -35,7 +34,7 @@ Respond with valid JSON only (no markdown, no explanation):
   "consumer_language": ["phrase 1", "phrase 2"],
   "lighting_topics": ["LED strips", "ambient lighting", etc],
   "job_to_be_done": "what job is the content helping with"
-}}
+}
 
 Classification guide:
 - highly_relevant: Directly about lighting products, installation, or use cases
@@ -45,6 +44,13 @@ Classification guide:
 
 Pain points: Problems, frustrations, or challenges mentioned
 Consumer language: Exact phrases consumers use (not technical jargon)
+"""
+
+    # Variable suffix, one per item
+    CONTENT_TEMPLATE = """Content to analyze:
+Title: {title}
+Description: {description}
+Platform: {platform}
 """
 
     def __init__(self, api_key: str, model: str = "gemini-1.5-flash"):
@@ -56,8 +62,9 @@ Consumer language: Exact phrases consumers use (not technical jargon)
             model: Model name (default: gemini-1.5-flash for cost efficiency)
         """
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model = genai.GenerativeModel(model, system_instruction=self.CLASSIFICATION_PROMPT)
         self.total_tokens_used = 0
+        self.cached_tokens_used = 0
         logger.info(f"✅ ContentClassifier initialized with {model}")
 
     def classify_content(self, content: Dict) -> Dict:
@@ -71,7 +78,7 @@ Consumer language: Exact phrases consumers use (not technical jargon)
             Classification results
         """
         try:
-            prompt = self.CLASSIFICATION_PROMPT.format(
+            prompt = self.CONTENT_TEMPLATE.format(
                 title=content.get('title', '')[:500],
                 description=content.get('description', '')[:2000],
                 platform=content.get('platform', 'unknown')
@@ -80,7 +87,10 @@ Consumer language: Exact phrases consumers use (not technical jargon)
             logger.debug(f"Classifying content: {content.get('title', 'Untitled')[:50]}")
 
             response = self.model.generate_content(prompt)
-            self.total_tokens_used += response.usage_metadata.total_token_count if hasattr(response, 'usage_metadata') else 0
+            usage = getattr(response, 'usage_metadata', None)
+            if usage is not None:
+                self.total_tokens_used += usage.total_token_count
+                self.cached_tokens_used += getattr(usage, 'cached_content_token_count', 0) or 0
 
             # Parse JSON response
             response_text = response.text.strip()
@@ -135,6 +145,9 @@ Consumer language: Exact phrases consumers use (not technical jargon)
 
         logger.info(f"✅ Classified {len(results)} pieces of content")
         logger.info(f"📊 Total tokens used: {self.total_tokens_used}")
+        if self.cached_tokens_used:
+            # Only reported when the model applied implicit prompt caching
+            logger.info(f"📊 Tokens served from Gemini's implicit cache: {self.cached_tokens_used}")
 
         return results
 
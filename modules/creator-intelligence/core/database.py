@@ -278,6 +278,97 @@ class CreatorDatabase:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_creator_content_aggregates(self, creator_ids: List[int], sample_size: int = 5) -> Dict[int, Dict]:
+        """
+        Per-creator content aggregates for reporting, in one query.
+
+        Args:
+            creator_ids: Creators to aggregate
+            sample_size: Top content titles to return per creator
+
+        Returns:
+            creator_id -> {content_stats, engagement_rate, avg_relevance_score,
+            sample_titles}; creators without content get zeroed entries
+        """
+        creator_ids = [cid for cid in dict.fromkeys(creator_ids) if cid]
+        aggregates = {
+            cid: {
+                'sample_titles': [],
+                'content_stats': {'highly_relevant': 0, 'relevant': 0, 'tangential': 0, 'not_relevant': 0},
+                'engagement_rate': 0.0,
+                'avg_relevance_score': 0.0
+            }
+            for cid in creator_ids
+        }
+        if not creator_ids:
+            return aggregates
+
+        placeholders = ','.join('?' * len(creator_ids))
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            WITH content AS (
+                SELECT * FROM creator_content WHERE creator_id IN ({placeholders})
+            ),
+            ranked AS (
+                SELECT creator_id, title,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY creator_id
+                        ORDER BY
+                            CASE classification
+                                WHEN 'highly_relevant' THEN 1
+                                WHEN 'relevant' THEN 2
+                                WHEN 'tangentially_relevant' THEN 3
+                                ELSE 4
+                            END,
+                            relevance_score DESC,
+                            id
+                    ) AS position
+                FROM content
+                WHERE title IS NOT NULL AND title != ''
+            ),
+            samples AS (
+                SELECT creator_id, json_group_array(title) AS sample_titles
+                FROM (SELECT * FROM ranked WHERE position <= ? ORDER BY creator_id, position)
+                GROUP BY creator_id
+            )
+            SELECT
+                content.creator_id,
+                SUM(classification = 'highly_relevant') AS highly_relevant,
+                SUM(classification = 'relevant') AS relevant,
+                SUM(classification = 'tangentially_relevant') AS tangential,
+                SUM(classification = 'not_relevant') AS not_relevant,
+                SUM(CASE WHEN view_count > 0 THEN view_count END) AS total_views,
+                SUM(CASE WHEN view_count > 0 THEN like_count END) AS total_likes,
+                SUM(CASE WHEN view_count > 0 THEN comment_count END) AS total_comments,
+                AVG(relevance_score) AS avg_relevance_score,
+                samples.sample_titles
+            FROM content
+            LEFT JOIN samples ON samples.creator_id = content.creator_id
+            GROUP BY content.creator_id
+        """, (*creator_ids, sample_size))
+
+        for row in cursor.fetchall():
+            total_views = row['total_views'] or 0
+            engagement_rate = 0.0
+            if total_views:
+                # Engagement Rate = (Total Likes + Total Comments) / Total Views * 100
+                engagement = (row['total_likes'] or 0) + (row['total_comments'] or 0)
+                engagement_rate = round(engagement / total_views * 100, 2)
+
+            aggregates[row['creator_id']] = {
+                'sample_titles': json.loads(row['sample_titles']) if row['sample_titles'] else [],
+                'content_stats': {
+                    'highly_relevant': row['highly_relevant'] or 0,
+                    'relevant': row['relevant'] or 0,
+                    'tangential': row['tangential'] or 0,
+                    'not_relevant': row['not_relevant'] or 0
+                },
+                'engagement_rate': engagement_rate,
+                'avg_relevance_score': round(row['avg_relevance_score'], 2) if row['avg_relevance_score'] is not None else 0.0
+            }
+
+        return aggregates
+
     def get_consumer_language_by_category(self, category: str = None, min_frequency: int = 1) -> List[Dict]:
         """
         Get consumer language phrases.
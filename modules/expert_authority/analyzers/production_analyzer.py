@@ -8,10 +8,12 @@ NO FABRICATION - All insights must be traceable to source discussions
 import json
 import hashlib
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from pathlib import Path
 import logging
 import re
+import sys
 
 try:
     from anthropic import Anthropic
@@ -21,18 +23,99 @@ except ImportError:
 
 from ..core.config import Config
 
+# Shared text utilities live in the repo-level core package
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
+
+from core.models.prompt_cache import PromptCacheStats, anthropic_system_blocks, anthropic_usage
+from core.text import KeywordMatcher
+
+# Rule-based theme patterns (keyword-based)
+THEME_PATTERNS = {
+    "adhesive_mounting": ["adhesive", "tape", "stick", "mount", "falling", "attach", "3m tape", "vhb"],
+    "heat_issues": ["heat", "hot", "temperature", "overheat", "warm", "cooling", "thermal"],
+    "electrical_safety": ["shock", "ground", "gfci", "breaker", "wire", "voltage", "amperage", "code"],
+    "dimmer_compatibility": ["dimmer", "dim", "flicker", "brightness", "control", "switch"],
+    "power_supply": ["transformer", "driver", "power supply", "watts", "voltage", "12v", "24v"],
+    "installation_difficulty": ["install", "difficult", "complicated", "hard to", "struggle", "confusing"],
+    "color_accuracy": ["color", "cri", "kelvin", "warm white", "cool white", "rgb", "color temp"],
+    "durability": ["lifespan", "fail", "broken", "lasted", "died", "replacement", "warranty"]
+}
+
+SAFETY_KEYWORDS = ["code", "nec", "safety", "fire", "shock", "ground", "gfci", "permit", "inspector"]
+
+# Compiled once; keywords must start a word ("code" no longer hits "decoded")
+THEME_MATCHER = KeywordMatcher(THEME_PATTERNS)
+SAFETY_MATCHER = KeywordMatcher({keyword: [keyword] for keyword in SAFETY_KEYWORDS})
+
+THEMES_OUTPUT_FORMAT = """**Output format (JSON):**
+```json
+[
+  {
+    "theme": "Theme Name",
+    "description": "Brief description of the pattern",
+    "frequency_estimate": <number of discussions mentioning this>,
+    "evidence_ids": ["id1", "id2", "id3"],
+    "strategic_insight": "Why this matters for product development"
+  }
+]
+```
+
+Return ONLY the JSON array, no other text.
+"""
+
+# Stable system prompts (cacheable prefix); the discussions or candidate
+# themes follow in the user message
+THEME_DISCOVERY_INSTRUCTIONS = """You are analyzing expert discussions about lighting products and installations.
+
+**CRITICAL INSTRUCTIONS:**
+1. ONLY identify themes that appear in the provided discussions
+2. DO NOT invent or fabricate themes
+3. Every theme MUST cite specific discussion IDs as evidence
+4. Focus on emergent patterns, not just keywords
+
+**Task:** Identify 6-10 major themes from the discussions in the user message.
+
+""" + THEMES_OUTPUT_FORMAT
+
+THEME_MERGE_INSTRUCTIONS = """You are consolidating themes discovered independently in batches of expert discussions about lighting products and installations.
+
+**CRITICAL INSTRUCTIONS:**
+1. Merge candidate themes that describe the same underlying pattern
+2. DO NOT invent themes that are not among the candidates
+3. Sum frequency estimates of merged candidates
+4. Keep the union of evidence IDs of merged candidates (exact IDs only)
+
+**Task:** Produce the 6-10 most significant consolidated themes from the candidates in the user message.
+
+""" + THEMES_OUTPUT_FORMAT
+
 class ProductionAnalyzer:
     """Production analyzer with LLM semantic analysis and rule-based fallback"""
 
-    def __init__(self, tier: int = 1, config: Optional[Config] = None):
+    # Map-reduce sizing: discussions are sharded so each map prompt stays
+    # within this many (estimated) input tokens
+    SHARD_TOKEN_BUDGET = 12000
+    CHARS_PER_TOKEN = 4
+    SNIPPET_CHARS = 500
+    MAX_LLM_WORKERS = 4
+
+    # Legacy single-call mode only looks at this many discussions
+    SINGLE_CALL_LIMIT = 50
+
+    def __init__(self, tier: int = 1, config: Optional[Config] = None, map_reduce: bool = True):
         """
         Initialize analyzer
 
         Args:
             tier: Analysis tier (1 = rule-based, 2 = LLM semantic, 3 = extended)
             config: Configuration object
+            map_reduce: Analyze every discussion via sharded map-reduce LLM calls
+                (False = legacy single call over the first 50 discussions)
         """
         self.tier = tier
+        self.map_reduce = map_reduce
         self.config = config or Config()
         self.tier_config = self.config.get_tier_config(tier)
 
@@ -41,6 +124,7 @@ class ProductionAnalyzer:
 
         # Initialize LLM client if available and needed
         self.anthropic_client = None
+        self.cache_stats = PromptCacheStats()
         if tier >= 2 and HAS_ANTHROPIC and self.config.anthropic_api_key:
             self.anthropic_client = Anthropic(api_key=self.config.anthropic_api_key)
             self.logger.info("✅ Anthropic LLM client initialized")
@@ -99,36 +183,19 @@ class ProductionAnalyzer:
         """Rule-based theme extraction using keyword patterns"""
         self.logger.info("📊 Running rule-based analysis...")
 
-        # Define theme patterns (keyword-based)
-        theme_patterns = {
-            "adhesive_mounting": ["adhesive", "tape", "stick", "mount", "falling", "attach", "3m tape", "vhb"],
-            "heat_issues": ["heat", "hot", "temperature", "overheat", "warm", "cooling", "thermal"],
-            "electrical_safety": ["shock", "ground", "gfci", "breaker", "wire", "voltage", "amperage", "code"],
-            "dimmer_compatibility": ["dimmer", "dim", "flicker", "brightness", "control", "switch"],
-            "power_supply": ["transformer", "driver", "power supply", "watts", "voltage", "12v", "24v"],
-            "installation_difficulty": ["install", "difficult", "complicated", "hard to", "struggle", "confusing"],
-            "color_accuracy": ["color", "cri", "kelvin", "warm white", "cool white", "rgb", "color temp"],
-            "durability": ["lifespan", "fail", "broken", "lasted", "died", "replacement", "warranty"]
-        }
-
-        # Count matches for each theme
-        theme_counts = {theme: {"count": 0, "examples": []} for theme in theme_patterns}
+        # Count matches for each theme (one pass per discussion, all themes at once)
+        theme_counts = {theme: {"count": 0, "examples": []} for theme in THEME_PATTERNS}
+        texts = [self._extract_text(discussion) for discussion in discussions]
 
-        for discussion in discussions:
-            # Combine title, body, and comments for analysis
-            full_text = self._extract_text(discussion).lower()
-
-            for theme, keywords in theme_patterns.items():
-                for keyword in keywords:
-                    if keyword in full_text:
-                        theme_counts[theme]["count"] += 1
-                        if len(theme_counts[theme]["examples"]) < 3:
-                            theme_counts[theme]["examples"].append({
-                                "title": discussion.get('title', ''),
-                                "url": discussion.get('url', ''),
-                                "id": discussion.get('id', '')
-                            })
-                        break  # Don't double-count same discussion
+        for discussion, themes_hit in zip(discussions, THEME_MATCHER.labels_many(texts)):
+            for theme in themes_hit:
+                theme_counts[theme]["count"] += 1
+                if len(theme_counts[theme]["examples"]) < 3:
+                    theme_counts[theme]["examples"].append({
+                        "title": discussion.get('title', ''),
+                        "url": discussion.get('url', ''),
+                        "id": discussion.get('id', '')
+                    })
 
         # Convert to theme list with frequency percentages
         total_discussions = len(discussions)
@@ -160,31 +227,36 @@ class ProductionAnalyzer:
             self.logger.warning("⚠️ No LLM model available - falling back to rule-based")
             return self._rule_based_analysis(discussions)
 
+        if self.map_reduce:
+            selected = discussions
+        else:
+            selected = discussions[:self.SINGLE_CALL_LIMIT]  # Legacy cap for token efficiency
+
         # Prepare discussion summaries for LLM
-        discussion_summaries = []
-        for i, d in enumerate(discussions[:50]):  # Limit to 50 for token efficiency
-            discussion_summaries.append({
-                "id": d.get('id', str(i)),
-                "title": d.get('title', ''),
-                "platform": d.get('platform', ''),
-                "url": d.get('url', ''),
-                "snippet": self._extract_text(d)[:500]  # First 500 chars
-            })
-
-        # Build LLM prompt
-        prompt = self._build_theme_discovery_prompt(discussion_summaries)
-
-        # Call Claude API with configured model
+        discussion_summaries = [
+            self._summarize_discussion(d, i) for i, d in enumerate(selected)
+        ]
+        shards = self._shard_summaries(discussion_summaries)
+
         try:
             self.logger.info(f"🤖 Using model: {llm_config['model']} ({llm_config['provider']})")
-            response = self.anthropic_client.messages.create(
-                model=llm_config['model'],
-                max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}]
+
+            if len(shards) == 1:
+                # Everything fits in one prompt
+                response_text = self._call_llm(
+                    llm_config['model'], THEME_DISCOVERY_INSTRUCTIONS,
+                    self._build_theme_discovery_prompt(shards[0])
+                )
+            else:
+                response_text = self._map_reduce_themes(llm_config['model'], shards)
+
+            stats = self.cache_stats.to_dict()
+            self.logger.info(
+                f"🗄️ Prompt cache: {stats['cached_tokens']}/{stats['prompt_tokens']} input tokens cached"
             )
 
             # Parse LLM response
-            themes = self._parse_llm_themes(response.content[0].text, discussions)
+            themes = self._parse_llm_themes(response_text, discussions)
             self.logger.info(f"✅ LLM discovered {len(themes)} themes")
             return themes
 
@@ -193,17 +265,116 @@ class ProductionAnalyzer:
             self.logger.info("⚠️ Falling back to rule-based analysis")
             return self._rule_based_analysis(discussions)
 
-    def _build_theme_discovery_prompt(self, discussion_summaries: List[Dict]) -> str:
-        """Build prompt for LLM theme discovery"""
-        prompt = f"""You are analyzing expert discussions about lighting products and installations.
+    def _summarize_discussion(self, discussion: Dict, index: int) -> Dict:
+        """Compact discussion summary used in theme discovery prompts"""
+        return {
+            "id": str(discussion.get('id', index)),
+            "title": discussion.get('title', ''),
+            "platform": discussion.get('platform', ''),
+            "url": discussion.get('url', ''),
+            "snippet": self._extract_text(discussion)[:self.SNIPPET_CHARS]
+        }
 
-**CRITICAL INSTRUCTIONS:**
-1. ONLY identify themes that appear in the provided discussions
-2. DO NOT invent or fabricate themes
-3. Every theme MUST cite specific discussion IDs as evidence
-4. Focus on emergent patterns, not just keywords
+    def _shard_summaries(self, summaries: List[Dict]) -> List[List[Dict]]:
+        """Split summaries into shards that fit the per-call token budget"""
+        shards = [[]]
+        budget_chars = self.SHARD_TOKEN_BUDGET * self.CHARS_PER_TOKEN
+        used = 0
+
+        for summary in summaries:
+            size = sum(len(str(v)) for v in summary.values()) + 60  # field labels/separators
+            if shards[-1] and used + size > budget_chars:
+                shards.append([])
+                used = 0
+            shards[-1].append(summary)
+            used += size
+
+        return shards
+
+    def _map_reduce_themes(self, model: str, shards: List[List[Dict]]) -> str:
+        """
+        Discover candidate themes per shard concurrently, then merge them
+
+        Returns the reduce step's raw response (same JSON shape as a single call)
+        """
+        self.logger.info(f"🗺️ Map: {len(shards)} shards across {self.MAX_LLM_WORKERS} workers")
+
+        def map_shard(shard: List[Dict]) -> List[Dict]:
+            try:
+                text = self._call_llm(model, THEME_DISCOVERY_INSTRUCTIONS, self._build_theme_discovery_prompt(shard))
+                return self._extract_json_array(text)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Shard of {len(shard)} discussions failed: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.MAX_LLM_WORKERS) as executor:
+            shard_themes = list(executor.map(map_shard, shards))
+
+        candidates = [theme for themes in shard_themes for theme in themes]
+        if not candidates:
+            raise ValueError("No candidate themes returned by any shard")
+
+        self.logger.info(f"🔗 Reduce: merging {len(candidates)} candidate themes")
+        try:
+            return self._call_llm(model, THEME_MERGE_INSTRUCTIONS, self._build_theme_merge_prompt(candidates))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Reduce call failed ({e}) - merging candidates by name")
+            return json.dumps(self._merge_candidates_by_name(candidates))
+
+    def _call_llm(self, model: str, system: str, prompt: str) -> str:
+        """Single Claude API call (system prompt cached) returning the response text"""
+        response = self.anthropic_client.messages.create(
+            model=model,
+            max_tokens=4000,
+            system=anthropic_system_blocks(system),
+            messages=[{"role": "user", "content": prompt}]
+        )
+        self.cache_stats.record(anthropic_usage(response.usage))
+        return response.content[0].text
+
+    def _build_theme_merge_prompt(self, candidates: List[Dict]) -> str:
+        """Build reduce prompt body listing per-shard candidate themes"""
+        prompt = """**Candidate themes:**
+
+"""
+        for c in candidates:
+            prompt += f"""
+Theme: {c.get('theme', '')}
+Description: {c.get('description', '')}
+Frequency: {c.get('frequency_estimate', 0)}
+Evidence IDs: {', '.join(str(e) for e in c.get('evidence_ids', []))}
+Insight: {c.get('strategic_insight', '')}
+---
+"""
+        return prompt
+
+    def _merge_candidates_by_name(self, candidates: List[Dict]) -> List[Dict]:
+        """Deterministic reduce fallback: merge candidates sharing a normalized name"""
+        merged: Dict[str, Dict] = {}
+
+        for c in candidates:
+            key = re.sub(r'[^a-z0-9]+', ' ', str(c.get('theme', '')).lower()).strip()
+            if not key:
+                continue
+            if key not in merged:
+                merged[key] = {
+                    "theme": c.get('theme'),
+                    "description": c.get('description', ''),
+                    "frequency_estimate": 0,
+                    "evidence_ids": [],
+                    "strategic_insight": c.get('strategic_insight', '')
+                }
+            theme = merged[key]
+            theme["frequency_estimate"] += int(c.get('frequency_estimate') or 0)
+            for eid in c.get('evidence_ids', []):
+                if eid not in theme["evidence_ids"]:
+                    theme["evidence_ids"].append(eid)
+
+        return sorted(merged.values(), key=lambda t: t["frequency_estimate"], reverse=True)[:10]
 
-**Discussions to analyze:**
+    def _build_theme_discovery_prompt(self, discussion_summaries: List[Dict]) -> str:
+        """Build prompt body listing discussions for theme discovery"""
+        prompt = """**Discussions to analyze:**
 
 """
         for d in discussion_summaries:
@@ -214,42 +385,20 @@ Title: {d['title']}
 Snippet: {d['snippet']}
 URL: {d['url']}
 ---
-"""
-
-        prompt += """
-
-**Task:** Identify 6-10 major themes from these discussions.
-
-**Output format (JSON):**
-```json
-[
-  {
-    "theme": "Theme Name",
-    "description": "Brief description of the pattern",
-    "frequency_estimate": <number of discussions mentioning this>,
-    "evidence_ids": ["id1", "id2", "id3"],
-    "strategic_insight": "Why this matters for product development"
-  }
-]
-```
-
-Return ONLY the JSON array, no other text.
 """
         return prompt
 
     def _parse_llm_themes(self, llm_response: str, discussions: List[Dict]) -> List[Dict]:
         """Parse LLM response into theme structure"""
         try:
-            # Extract JSON from response
-            json_match = re.search(r'\[.*\]', llm_response, re.DOTALL)
-            if json_match:
-                themes_raw = json.loads(json_match.group(0))
-            else:
-                raise ValueError("No JSON found in LLM response")
+            themes_raw = self._extract_json_array(llm_response)
 
             # Validate and format themes
             themes = []
             total_discussions = len(discussions)
+            discussions_by_id = {
+                str(d.get('id', i)): d for i, d in enumerate(discussions)
+            }
 
             for theme in themes_raw:
                 # Validate evidence exists
@@ -257,14 +406,13 @@ Return ONLY the JSON array, no other text.
                 examples = []
 
                 for eid in evidence_ids[:3]:  # Max 3 examples
-                    for d in discussions:
-                        if d.get('id') == eid:
-                            examples.append({
-                                "title": d.get('title', ''),
-                                "url": d.get('url', ''),
-                                "id": d.get('id', '')
-                            })
-                            break
+                    d = discussions_by_id.get(str(eid))
+                    if d is not None:
+                        examples.append({
+                            "title": d.get('title', ''),
+                            "url": d.get('url', ''),
+                            "id": d.get('id', '')
+                        })
 
                 frequency = theme.get('frequency_estimate', 0)
 
@@ -284,6 +432,13 @@ Return ONLY the JSON array, no other text.
             self.logger.error(f"❌ Failed to parse LLM themes: {e}")
             return []
 
+    def _extract_json_array(self, llm_response: str) -> List[Dict]:
+        """Extract the JSON array from an LLM response"""
+        json_match = re.search(r'\[.*\]', llm_response, re.DOTALL)
+        if not json_match:
+            raise ValueError("No JSON found in LLM response")
+        return json.loads(json_match.group(0))
+
     def _extract_consensus(self, discussions: List[Dict], themes: List[Dict]) -> List[Dict]:
         """Extract consensus patterns (widely-agreed solutions)"""
         self.logger.info("🔍 Extracting consensus patterns...")
@@ -344,22 +499,18 @@ Return ONLY the JSON array, no other text.
 
     def _extract_safety_warnings(self, discussions: List[Dict]) -> List[Dict]:
         """Extract safety warnings and code compliance mentions"""
-        safety_keywords = ["code", "nec", "safety", "fire", "shock", "ground", "gfci", "permit", "inspector"]
-
         safety_warnings = []
 
         for discussion in discussions:
-            full_text = self._extract_text(discussion).lower()
-
-            for keyword in safety_keywords:
-                if keyword in full_text:
-                    safety_warnings.append({
-                        "warning": discussion.get('title', ''),
-                        "url": discussion.get('url', ''),
-                        "platform": discussion.get('platform', ''),
-                        "keyword": keyword
-                    })
-                    break
+            # First safety keyword in list order, as before
+            keywords_hit = SAFETY_MATCHER.labels(self._extract_text(discussion))
+            if keywords_hit:
+                safety_warnings.append({
+                    "warning": discussion.get('title', ''),
+                    "url": discussion.get('url', ''),
+                    "platform": discussion.get('platform', ''),
+                    "keyword": keywords_hit[0]
+                })
 
         return safety_warnings[:10]
 
@@ -1,5 +1,6 @@
 """Expert Authority Core - Configuration and utilities"""
 
 from .config import Config
+from .discussion_store import DiscussionStore
 
-__all__ = ['Config']
+__all__ = ['Config', 'DiscussionStore']
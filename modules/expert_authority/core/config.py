@@ -32,6 +32,11 @@ class Config:
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
         self.togetherai_api_key = os.getenv("TOGETHERAI_API_KEY")
 
+        # Discussion cache: how long a query's results are served without
+        # re-scraping, and how far back a refresh re-reads scores/comment counts
+        self.discussion_cache_ttl_hours = float(os.getenv("DISCUSSION_CACHE_TTL_HOURS", "24"))
+        self.discussion_refresh_days = float(os.getenv("DISCUSSION_REFRESH_DAYS", "7"))
+
         # Tier configurations with model fallback priorities
         self.tier_configs = {
             1: {
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Discussion Store - Indexed SQLite cache for scraped discussions
+Keyed by platform + post ID, with per-query membership and TTLs so repeat
+runs can be served locally or refreshed incrementally
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class DiscussionStore:
+    """SQLite-backed discussion cache shared by the expert authority scrapers"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize the store
+
+        Args:
+            db_path: SQLite file (default: data/cache/discussions.db)
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent.parent / "data" / "cache" / "discussions.db"
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Scrapers write from worker threads; serialize access to one connection
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._initialize()
+
+    def _initialize(self):
+        """Create schema if it doesn't exist"""
+        with self._lock:
+            self.conn.executescript('''
+                CREATE TABLE IF NOT EXISTS discussions (
+                    platform TEXT NOT NULL,
+                    post_id TEXT NOT NULL,
+                    created_utc INTEGER,
+                    score INTEGER,
+                    num_comments INTEGER,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (platform, post_id)
+                );
+
+                CREATE TABLE IF NOT EXISTS queries (
+                    query_key TEXT PRIMARY KEY,
+                    platform TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    ttl_seconds REAL NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    newest_created_utc INTEGER
+                );
+
+                CREATE TABLE IF NOT EXISTS query_members (
+                    query_key TEXT NOT NULL,
+                    post_id TEXT NOT NULL,
+                    rank INTEGER NOT NULL,
+                    PRIMARY KEY (query_key, post_id)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_query_members_rank
+                ON query_members(query_key, rank);
+            ''')
+            self.conn.commit()
+
+    @staticmethod
+    def query_key(platform: str, query: str, scope: str, **params) -> str:
+        """Stable key for one (platform, query, subreddit/site, params) search"""
+        payload = json.dumps(
+            {"platform": platform, "query": query.strip().lower(), "scope": scope.lower(), **params},
+            sort_keys=True
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def get_query_state(self, query_key: str) -> Optional[Dict]:
+        """Return fetch metadata for a query, or None if never fetched"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT * FROM queries WHERE query_key = ?', (query_key,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def is_fresh(state: Optional[Dict], ttl_seconds: Optional[float] = None) -> bool:
+        """Whether a query's last fetch is within its TTL (or the override)"""
+        if not state:
+            return False
+        ttl = state['ttl_seconds'] if ttl_seconds is None else ttl_seconds
+        return time.time() - state['fetched_at'] < ttl
+
+    def load_query(self, query_key: str, limit: Optional[int] = None) -> List[Dict]:
+        """Load a query's discussions in rank order"""
+        sql = '''
+            SELECT d.data
+            FROM query_members m
+            JOIN queries q ON q.query_key = m.query_key
+            JOIN discussions d ON d.platform = q.platform AND d.post_id = m.post_id
+            WHERE m.query_key = ?
+            ORDER BY m.rank
+        '''
+        params: list = [query_key]
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def save_query(
+        self,
+        query_key: str,
+        platform: str,
+        query: str,
+        scope: str,
+        discussions: List[Dict],
+        ttl_seconds: float,
+        prepend: bool = False
+    ):
+        """
+        Store discussions for a query and mark it fetched now
+
+        Args:
+            prepend: Rank these discussions ahead of the query's existing
+                members (used for incremental refreshes of newer posts)
+        """
+        now = time.time()
+        newest = max((int(d['created_utc']) for d in discussions), default=None)
+
+        with self._lock:
+            self._upsert(platform, discussions, now)
+
+            if prepend:
+                row = self.conn.execute(
+                    'SELECT MIN(rank) FROM query_members WHERE query_key = ?', (query_key,)
+                ).fetchone()
+                start = (row[0] if row[0] is not None else 0) - len(discussions)
+            else:
+                self.conn.execute('DELETE FROM query_members WHERE query_key = ?', (query_key,))
+                start = 0
+
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO query_members (query_key, post_id, rank) VALUES (?, ?, ?)',
+                [(query_key, str(d['id']), start + i) for i, d in enumerate(discussions)]
+            )
+
+            self.conn.execute('''
+                INSERT INTO queries (query_key, platform, query, scope, ttl_seconds, fetched_at, newest_created_utc)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(query_key) DO UPDATE SET
+                    ttl_seconds = excluded.ttl_seconds,
+                    fetched_at = excluded.fetched_at,
+                    newest_created_utc = MAX(
+                        COALESCE(queries.newest_created_utc, 0),
+                        COALESCE(excluded.newest_created_utc, 0)
+                    )
+            ''', (query_key, platform, query, scope, ttl_seconds, now, newest))
+            self.conn.commit()
+
+    def upsert_discussions(self, platform: str, discussions: Iterable[Dict]) -> int:
+        """Insert or replace discussions without touching query membership"""
+        discussions = list(discussions)
+        with self._lock:
+            self._upsert(platform, discussions, time.time())
+            self.conn.commit()
+        return len(discussions)
+
+    def recent_post_ids(self, query_key: str, since_utc: float) -> List[str]:
+        """Post IDs in a query created at or after since_utc"""
+        with self._lock:
+            rows = self.conn.execute('''
+                SELECT d.post_id
+                FROM query_members m
+                JOIN queries q ON q.query_key = m.query_key
+                JOIN discussions d ON d.platform = q.platform AND d.post_id = m.post_id
+                WHERE m.query_key = ? AND d.created_utc >= ?
+            ''', (query_key, since_utc)).fetchall()
+        return [row['post_id'] for row in rows]
+
+    def update_counts(self, platform: str, updates: Dict[str, Dict]):
+        """
+        Patch engagement fields (score, comment/answer counts, ...) on stored posts
+
+        Args:
+            updates: post_id -> dict of fields to overwrite in the stored discussion
+        """
+        if not updates:
+            return
+
+        now = time.time()
+        with self._lock:
+            for post_id, fields in updates.items():
+                row = self.conn.execute(
+                    'SELECT data FROM discussions WHERE platform = ? AND post_id = ?',
+                    (platform, str(post_id))
+                ).fetchone()
+                if not row:
+                    continue
+
+                data = json.loads(row['data'])
+                data.update(fields)
+                self.conn.execute('''
+                    UPDATE discussions
+                    SET data = ?, score = ?, num_comments = ?, updated_at = ?
+                    WHERE platform = ? AND post_id = ?
+                ''', (
+                    json.dumps(data, ensure_ascii=False),
+                    data.get('score'),
+                    self._comment_count(data),
+                    now,
+                    platform,
+                    str(post_id)
+                ))
+            self.conn.commit()
+
+    def import_json(self, cache_file: Path, platform: str) -> List[Dict]:
+        """Load a legacy timestamped JSON cache file and fold it into the store"""
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            discussions = json.load(f)['discussions']
+        self.upsert_discussions(platform, discussions)
+        return discussions
+
+    def close(self):
+        """Close database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def _upsert(self, platform: str, discussions: List[Dict], now: float):
+        self.conn.executemany('''
+            INSERT INTO discussions (platform, post_id, created_utc, score, num_comments, data, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(platform, post_id) DO UPDATE SET
+                created_utc = excluded.created_utc,
+                score = excluded.score,
+                num_comments = excluded.num_comments,
+                data = excluded.data,
+                updated_at = excluded.updated_at
+        ''', [
+            (
+                platform,
+                str(d['id']),
+                d.get('created_utc'),
+                d.get('score'),
+                self._comment_count(d),
+                json.dumps(d, ensure_ascii=False),
+                now
+            )
+            for d in discussions
+        ])
+
+    @staticmethod
+    def _comment_count(discussion: Dict) -> Optional[int]:
+        if 'num_comments' in discussion:
+            return discussion['num_comments']
+        return discussion.get('answer_count')
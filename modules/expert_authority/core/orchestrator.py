@@ -5,6 +5,7 @@ Coordinates scraping, analysis, and reporting with error handling
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -109,48 +110,25 @@ class ExpertAuthorityOrchestrator:
             self.logger.info("STAGE 1: DATA COLLECTION")
             self.logger.info("=" * 60)
 
-            all_discussions = []
-
-            # Scrape Reddit
-            try:
-                self.logger.info(f"📡 Scraping Reddit ({', '.join(reddit_subreddits)})...")
-                reddit_discussions = self.reddit_scraper.scrape(
-                    query=query,
-                    subreddits=reddit_subreddits,
-                    limit=self.tier_config['discussion_limit'] // len(reddit_subreddits)
+            # Reddit and Stack Exchange have independent rate limits,
+            # so both platforms are scraped concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                reddit_future = executor.submit(
+                    self._scrape_reddit, query, reddit_subreddits, results
                 )
-                all_discussions.extend(reddit_discussions)
-                results['platforms_used'].append('reddit')
-                self.logger.info(f"✅ Reddit: {len(reddit_discussions)} discussions scraped")
-
-                # Save Reddit cache
-                reddit_cache = self.reddit_scraper.save_to_cache(reddit_discussions, f"{project_name}_reddit")
-                results['reddit_cache'] = str(reddit_cache)
-
-            except Exception as e:
-                self.logger.error(f"❌ Reddit scraping failed: {e}")
-                results['errors'].append(f"Reddit scraping failed: {e}")
-
-            # Scrape Stack Exchange (Tier 2+)
-            if self.stackexchange_scraper:
-                try:
-                    self.logger.info(f"📡 Scraping Stack Exchange ({', '.join(stackexchange_sites)})...")
-                    se_discussions = self.stackexchange_scraper.scrape(
-                        query=query,
-                        sites=stackexchange_sites,
-                        limit=self.tier_config['discussion_limit'] // (len(stackexchange_sites) * 2)
+                se_future = None
+                if self.stackexchange_scraper:
+                    se_future = executor.submit(
+                        self._scrape_stackexchange, query, stackexchange_sites, results
                     )
-                    all_discussions.extend(se_discussions)
-                    results['platforms_used'].append('stackexchange')
-                    self.logger.info(f"✅ Stack Exchange: {len(se_discussions)} discussions scraped")
 
-                    # Save Stack Exchange cache
-                    se_cache = self.stackexchange_scraper.save_to_cache(se_discussions, f"{project_name}_stackexchange")
-                    results['stackexchange_cache'] = str(se_cache)
-
-                except Exception as e:
-                    self.logger.error(f"❌ Stack Exchange scraping failed: {e}")
-                    results['errors'].append(f"Stack Exchange scraping failed: {e}")
+                # Collect in a fixed order: Reddit first, then Stack Exchange
+                all_discussions = []
+                for platform, future in [('reddit', reddit_future), ('stackexchange', se_future)]:
+                    discussions = future.result() if future else None
+                    if discussions is not None:
+                        all_discussions.extend(discussions)
+                        results['platforms_used'].append(platform)
 
             if not all_discussions:
                 raise ValueError("No discussions scraped from any platform")
@@ -209,6 +187,56 @@ class ExpertAuthorityOrchestrator:
             results['errors'].append(f"Pipeline failed: {e}")
             raise
 
+    def _scrape_reddit(
+        self,
+        query: str,
+        subreddits: List[str],
+        results: Dict
+    ) -> Optional[List[Dict]]:
+        """Scrape Reddit and cache the discussions; returns None on failure (recorded in results)"""
+        try:
+            self.logger.info(f"📡 Scraping Reddit ({', '.join(subreddits)})...")
+            discussions = self.reddit_scraper.scrape(
+                query=query,
+                subreddits=subreddits,
+                limit=self.tier_config['discussion_limit'] // len(subreddits)
+            )
+            self.logger.info(f"✅ Reddit: {len(discussions)} discussions scraped")
+
+            # scrape() already persisted these to the discussion store
+            results['reddit_cache'] = str(self.reddit_scraper.store.db_path)
+            return discussions
+
+        except Exception as e:
+            self.logger.error(f"❌ Reddit scraping failed: {e}")
+            results['errors'].append(f"Reddit scraping failed: {e}")
+            return None
+
+    def _scrape_stackexchange(
+        self,
+        query: str,
+        sites: List[str],
+        results: Dict
+    ) -> Optional[List[Dict]]:
+        """Scrape Stack Exchange and cache the discussions; returns None on failure (recorded in results)"""
+        try:
+            self.logger.info(f"📡 Scraping Stack Exchange ({', '.join(sites)})...")
+            discussions = self.stackexchange_scraper.scrape(
+                query=query,
+                sites=sites,
+                limit=self.tier_config['discussion_limit'] // (len(sites) * 2)
+            )
+            self.logger.info(f"✅ Stack Exchange: {len(discussions)} discussions scraped")
+
+            # scrape() already persisted these to the discussion store
+            results['stackexchange_cache'] = str(self.stackexchange_scraper.store.db_path)
+            return discussions
+
+        except Exception as e:
+            self.logger.error(f"❌ Stack Exchange scraping failed: {e}")
+            results['errors'].append(f"Stack Exchange scraping failed: {e}")
+            return None
+
 
 if __name__ == "__main__":
     """Example usage - Run Tier 1 analysis"""
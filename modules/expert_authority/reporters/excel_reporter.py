@@ -6,21 +6,30 @@ Generates Excel spreadsheets with structured data and citations
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import logging
 
-try:
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
-
 from ..core.config import Config
 
+# Shared streaming writer lives in the repo-level core package
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
+
+from core.reporting.excel_writer import HAS_OPENPYXL, Column, StreamingWorkbook, font_style, header_style
+
+# Header fill per sheet (white bold text on a solid fill)
+SHEET_COLORS = {
+    "Themes": "0066CC",
+    "Consensus": "28A745",
+    "Controversies": "FFC107",
+    "Safety": "DC3545",
+    "Raw Data": "6C757D",
+}
+
 
 class ExcelReporter:
     """Production Excel report generator with citation validation"""
@@ -69,59 +78,58 @@ class ExcelReporter:
         """
         self.logger.info(f"📊 Generating Tier {self.tier} Excel report...")
 
-        # Create workbook
-        wb = openpyxl.Workbook()
-
-        # Remove default sheet
-        if "Sheet" in wb.sheetnames:
-            wb.remove(wb["Sheet"])
-
-        # Create sheets
-        self._create_summary_sheet(wb, analysis, project_name)
-        self._create_themes_sheet(wb, analysis)
-        self._create_consensus_sheet(wb, analysis)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        report_file = self.output_dir / f"{project_name.replace(' ', '_')}_tier{self.tier}_{timestamp}.xlsx"
 
-        if self.tier >= 2:
-            if analysis.get('controversies'):
-                self._create_controversies_sheet(wb, analysis)
-            if analysis.get('safety_warnings'):
-                self._create_safety_sheet(wb, analysis)
+        # Write-only workbook: rows stream straight to disk; styles are
+        # registered once and shared by every cell in a column
+        with StreamingWorkbook(report_file) as book:
+            self._register_styles(book)
 
-        self._create_discussions_sheet(wb, discussions)
+            self._create_summary_sheet(book, analysis, project_name)
+            self._create_themes_sheet(book, analysis)
+            self._create_consensus_sheet(book, analysis)
 
-        # Save report
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_file = self.output_dir / f"{project_name.replace(' ', '_')}_tier{self.tier}_{timestamp}.xlsx"
+            if self.tier >= 2:
+                if analysis.get('controversies'):
+                    self._create_controversies_sheet(book, analysis)
+                if analysis.get('safety_warnings'):
+                    self._create_safety_sheet(book, analysis)
 
-        wb.save(report_file)
+            self._create_discussions_sheet(book, discussions)
 
         self.logger.info(f"✅ Excel report generated: {report_file}")
         return report_file
 
-    def _create_summary_sheet(self, wb, analysis: Dict, project_name: str):
+    def _register_styles(self, book: StreamingWorkbook):
+        """Named styles for titles, labels and the per-sheet header fills"""
+        book.add_named_style(font_style("title", size=18, bold=True, color="0066CC"))
+        book.add_named_style(font_style("tier_badge", size=12, bold=True))
+        book.add_named_style(font_style("timestamp", italic=True, color="666666"))
+        book.add_named_style(font_style("section", size=14, bold=True))
+        book.add_named_style(font_style("label", bold=True))
+        for sheet_name, color in SHEET_COLORS.items():
+            book.add_named_style(header_style(self._header(sheet_name), color, "FFFFFF", wrap=False))
+
+    @staticmethod
+    def _header(sheet_name: str) -> str:
+        return f"header_{sheet_name.lower().replace(' ', '_')}"
+
+    def _create_summary_sheet(self, book: StreamingWorkbook, analysis: Dict, project_name: str):
         """Create summary sheet"""
-        ws = wb.create_sheet("Summary", 0)
-
-        # Title
-        ws['A1'] = project_name
-        ws['A1'].font = Font(size=18, bold=True, color="0066CC")
-        ws.merge_cells('A1:D1')
+        ws = book.create_sheet("Summary", widths=[30, 40])
 
-        # Tier badge
-        ws['A2'] = f"Tier {self.tier} - {self.tier_config['name']}"
-        ws['A2'].font = Font(size=12, bold=True)
-        ws.merge_cells('A2:D2')
-
-        # Timestamp
-        ws['A3'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws['A3'].font = Font(italic=True, color="666666")
-        ws.merge_cells('A3:D3')
+        # Title, tier badge and timestamp, each merged across A:D
+        ws.append([book.cell(ws, project_name, "title")])
+        ws.append([book.cell(ws, f"Tier {self.tier} - {self.tier_config['name']}", "tier_badge")])
+        ws.append([book.cell(ws, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "timestamp")])
+        for row in (1, 2, 3):
+            book.merge(ws, f"A{row}:D{row}")
 
         # Stats
-        row = 5
-        ws[f'A{row}'] = "ANALYSIS SUMMARY"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        row += 2
+        ws.append([])
+        ws.append([book.cell(ws, "ANALYSIS SUMMARY", "section")])
+        ws.append([])
 
         stats = [
             ("Total Discussions Analyzed:", analysis['metadata']['total_discussions']),
@@ -132,200 +140,97 @@ class ExcelReporter:
         ]
 
         for label, value in stats:
-            ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'B{row}'] = value
-            row += 1
-
-        # Column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 40
+            ws.append([book.cell(ws, label, "label"), value])
 
-    def _create_themes_sheet(self, wb, analysis: Dict):
+    def _create_themes_sheet(self, book: StreamingWorkbook, analysis: Dict):
         """Create themes sheet"""
-        ws = wb.create_sheet("Themes")
-
-        # Headers
-        headers = ["#", "Theme", "Frequency", "Frequency %", "Method", "Description", "Strategic Insight", "Example URLs"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Data
-        for i, theme in enumerate(analysis['themes'], 1):
-            row = i + 1
-            ws.cell(row, 1, i)
-            ws.cell(row, 2, theme['theme'])
-            ws.cell(row, 3, theme['frequency'])
-            ws.cell(row, 4, f"{theme['frequency_pct']}%")
-            ws.cell(row, 5, theme.get('method', 'N/A'))
-            ws.cell(row, 6, theme.get('description', 'N/A'))
-            ws.cell(row, 7, theme.get('strategic_insight', 'N/A'))
-
-            # Example URLs
-            example_urls = [ex['url'] for ex in theme.get('examples', [])]
-            ws.cell(row, 8, '\n'.join(example_urls[:3]))
-
-        # Column widths
-        ws.column_dimensions['A'].width = 5
-        ws.column_dimensions['B'].width = 25
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 40
-        ws.column_dimensions['G'].width = 40
-        ws.column_dimensions['H'].width = 60
-
-        # Enable text wrapping
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    def _create_consensus_sheet(self, wb, analysis: Dict):
+        columns = [
+            Column("#", 5), Column("Theme", 25), Column("Frequency", 12), Column("Frequency %", 12),
+            Column("Method", 15), Column("Description", 40), Column("Strategic Insight", 40),
+            Column("Example URLs", 60)
+        ]
+
+        def rows() -> Iterator[list]:
+            for i, theme in enumerate(analysis['themes'], 1):
+                example_urls = [ex['url'] for ex in theme.get('examples', [])]
+                yield [
+                    i,
+                    theme['theme'],
+                    theme['frequency'],
+                    f"{theme['frequency_pct']}%",
+                    theme.get('method', 'N/A'),
+                    theme.get('description', 'N/A'),
+                    theme.get('strategic_insight', 'N/A'),
+                    '\n'.join(example_urls[:3])
+                ]
+
+        book.write_rows("Themes", columns, rows(), header=self._header("Themes"), freeze_header=False)
+
+    def _create_consensus_sheet(self, book: StreamingWorkbook, analysis: Dict):
         """Create consensus patterns sheet"""
-        ws = wb.create_sheet("Consensus")
-
-        # Headers
-        headers = ["#", "Pattern", "Score", "Platform", "Source Discussion", "Source URL", "Accepted Answer"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="28A745", end_color="28A745", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Data
-        for i, pattern in enumerate(analysis['consensus_patterns'], 1):
-            row = i + 1
-            ws.cell(row, 1, i)
-            ws.cell(row, 2, pattern['pattern'])
-            ws.cell(row, 3, pattern['score'])
-            ws.cell(row, 4, pattern['platform'])
-            ws.cell(row, 5, pattern['source_discussion'])
-            ws.cell(row, 6, pattern['source_url'])
-            ws.cell(row, 7, "Yes" if pattern.get('is_accepted') else "No")
-
-        # Column widths
-        ws.column_dimensions['A'].width = 5
-        ws.column_dimensions['B'].width = 60
-        ws.column_dimensions['C'].width = 10
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 40
-        ws.column_dimensions['F'].width = 60
-        ws.column_dimensions['G'].width = 15
-
-        # Enable text wrapping
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    def _create_controversies_sheet(self, wb, analysis: Dict):
+        columns = [
+            Column("#", 5), Column("Pattern", 60), Column("Score", 10), Column("Platform", 15),
+            Column("Source Discussion", 40), Column("Source URL", 60), Column("Accepted Answer", 15)
+        ]
+        rows = (
+            [
+                i,
+                pattern['pattern'],
+                pattern['score'],
+                pattern['platform'],
+                pattern['source_discussion'],
+                pattern['source_url'],
+                "Yes" if pattern.get('is_accepted') else "No"
+            ]
+            for i, pattern in enumerate(analysis['consensus_patterns'], 1)
+        )
+        book.write_rows("Consensus", columns, rows, header=self._header("Consensus"), freeze_header=False)
+
+    def _create_controversies_sheet(self, book: StreamingWorkbook, analysis: Dict):
         """Create controversies sheet"""
-        ws = wb.create_sheet("Controversies")
-
-        # Headers
-        headers = ["#", "Topic", "Comments", "Score", "Platform", "URL"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="FFC107", end_color="FFC107", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Data
-        for i, controversy in enumerate(analysis['controversies'], 1):
-            row = i + 1
-            ws.cell(row, 1, i)
-            ws.cell(row, 2, controversy['topic'])
-            ws.cell(row, 3, controversy['num_comments'])
-            ws.cell(row, 4, controversy['score'])
-            ws.cell(row, 5, controversy['platform'])
-            ws.cell(row, 6, controversy['url'])
-
-        # Column widths
-        ws.column_dimensions['A'].width = 5
-        ws.column_dimensions['B'].width = 60
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 10
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 60
-
-        # Enable text wrapping
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    def _create_safety_sheet(self, wb, analysis: Dict):
+        columns = [
+            Column("#", 5), Column("Topic", 60), Column("Comments", 12), Column("Score", 10),
+            Column("Platform", 15), Column("URL", 60)
+        ]
+        rows = (
+            [i, c['topic'], c['num_comments'], c['score'], c['platform'], c['url']]
+            for i, c in enumerate(analysis['controversies'], 1)
+        )
+        book.write_rows("Controversies", columns, rows, header=self._header("Controversies"), freeze_header=False)
+
+    def _create_safety_sheet(self, book: StreamingWorkbook, analysis: Dict):
         """Create safety warnings sheet"""
-        ws = wb.create_sheet("Safety")
-
-        # Headers
-        headers = ["#", "Warning", "Keyword", "Platform", "URL"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="DC3545", end_color="DC3545", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Data
-        for i, warning in enumerate(analysis['safety_warnings'], 1):
-            row = i + 1
-            ws.cell(row, 1, i)
-            ws.cell(row, 2, warning['warning'])
-            ws.cell(row, 3, warning['keyword'])
-            ws.cell(row, 4, warning['platform'])
-            ws.cell(row, 5, warning['url'])
-
-        # Column widths
-        ws.column_dimensions['A'].width = 5
-        ws.column_dimensions['B'].width = 60
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 60
-
-        # Enable text wrapping
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    def _create_discussions_sheet(self, wb, discussions: List[Dict]):
+        columns = [
+            Column("#", 5), Column("Warning", 60), Column("Keyword", 15), Column("Platform", 15),
+            Column("URL", 60)
+        ]
+        rows = (
+            [i, w['warning'], w['keyword'], w['platform'], w['url']]
+            for i, w in enumerate(analysis['safety_warnings'], 1)
+        )
+        book.write_rows("Safety", columns, rows, header=self._header("Safety"), freeze_header=False)
+
+    def _create_discussions_sheet(self, book: StreamingWorkbook, discussions: List[Dict]):
         """Create raw discussions data sheet"""
-        ws = wb.create_sheet("Raw Data")
-
-        # Headers
-        headers = ["ID", "Platform", "Title", "Author", "Score", "Comments/Answers", "Created Date", "URL"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(1, col, header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="6C757D", end_color="6C757D", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Data
-        for i, disc in enumerate(discussions, 1):
-            row = i + 1
-            ws.cell(row, 1, disc.get('id', ''))
-            ws.cell(row, 2, disc.get('platform', ''))
-            ws.cell(row, 3, disc.get('title', ''))
-            ws.cell(row, 4, disc.get('author', ''))
-            ws.cell(row, 5, disc.get('score', 0))
-            ws.cell(row, 6, disc.get('num_comments', 0) or disc.get('answer_count', 0))
-            ws.cell(row, 7, disc.get('created_date', ''))
-            ws.cell(row, 8, disc.get('url', ''))
-
-        # Column widths
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 50
-        ws.column_dimensions['D'].width = 20
-        ws.column_dimensions['E'].width = 10
-        ws.column_dimensions['F'].width = 15
-        ws.column_dimensions['G'].width = 20
-        ws.column_dimensions['H'].width = 60
-
-        # Enable text wrapping
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
+        columns = [
+            Column("ID", 15), Column("Platform", 15), Column("Title", 50), Column("Author", 20),
+            Column("Score", 10), Column("Comments/Answers", 15), Column("Created Date", 20),
+            Column("URL", 60)
+        ]
+        rows = (
+            [
+                disc.get('id', ''),
+                disc.get('platform', ''),
+                disc.get('title', ''),
+                disc.get('author', ''),
+                disc.get('score', 0),
+                disc.get('num_comments', 0) or disc.get('answer_count', 0),
+                disc.get('created_date', ''),
+                disc.get('url', '')
+            ]
+            for disc in discussions
+        )
+        book.write_rows("Raw Data", columns, rows, header=self._header("Raw Data"), freeze_header=False)
 
 
 if __name__ == "__main__":
@@ -11,9 +11,20 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 import hashlib
+import sys
 
 from ..core.config import Config
 
+# Shared reporting layer lives in the repo-level core package
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
+
+from core.reporting.html import TemplateRenderer
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
 class HTMLReporter:
     """Production HTML report generator with citation validation"""
 
@@ -32,6 +43,8 @@ class HTMLReporter:
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
+        self.renderer = TemplateRenderer(TEMPLATE_DIR)
+
         # Output directory
         self.output_dir = Path(__file__).parent.parent / "data" / "reports"
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -113,178 +126,18 @@ class HTMLReporter:
 
     def _build_html(self, analysis: Dict, discussions: List[Dict], project_name: str) -> str:
         """Build complete HTML report"""
-
-        # Get tier badge
-        tier_badge = self._get_tier_badge()
-
-        # Build HTML structure
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{project_name} - Expert Authority Analysis</title>
-    <style>
-        {self._get_css()}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>{project_name}</h1>
-            <div class="tier-badge {tier_badge['class']}">{tier_badge['label']}</div>
-            <p class="subtitle">Expert Authority Analysis - Tier {self.tier}</p>
-            <p class="metadata">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </header>
-
-        <section class="summary">
-            <h2>📊 Analysis Summary</h2>
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value">{analysis['metadata']['total_discussions']}</div>
-                    <div class="stat-label">Discussions Analyzed</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{len(analysis['themes'])}</div>
-                    <div class="stat-label">Themes Discovered</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{len(analysis['consensus_patterns'])}</div>
-                    <div class="stat-label">Consensus Patterns</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value">{', '.join(analysis['metadata']['platforms'])}</div>
-                    <div class="stat-label">Data Sources</div>
-                </div>
-            </div>
-        </section>
-
-        <section class="themes">
-            <h2>🎯 Key Themes</h2>
-            {self._build_themes_section(analysis['themes'])}
-        </section>
-
-        <section class="consensus">
-            <h2>✅ Consensus Patterns</h2>
-            <p class="section-description">Widely-agreed solutions and best practices from expert community</p>
-            {self._build_consensus_section(analysis['consensus_patterns'])}
-        </section>
-
-        {self._build_tier2_sections(analysis) if self.tier >= 2 else ''}
-
-        <section class="methodology">
-            <h2>📋 Methodology</h2>
-            <p><strong>Analysis Method:</strong> {analysis['metadata']['analysis_method']}</p>
-            <p><strong>Platforms:</strong> {', '.join(analysis['metadata']['platforms'])}</p>
-            <p><strong>Total Discussions:</strong> {analysis['metadata']['total_discussions']}</p>
-            <p><strong>Citation Integrity:</strong> All insights are linked to original expert discussions. Click "View Original" to verify source.</p>
-        </section>
-
-        <footer>
-            <p>Expert Authority Module - 3M Lighting Project</p>
-            <p>100% Real Data - No Synthetic Content - Full Citation Validation</p>
-        </footer>
-    </div>
-</body>
-</html>"""
-
-        return html
-
-    def _build_themes_section(self, themes: List[Dict]) -> str:
-        """Build themes section HTML"""
-        html = ""
-
-        for i, theme in enumerate(themes, 1):
-            html += f"""
-        <div class="theme-card">
-            <h3>{i}. {theme['theme']}</h3>
-            <div class="theme-stats">
-                <span class="frequency">{theme['frequency_pct']}%</span>
-                <span class="count">({theme['frequency']} discussions)</span>
-            </div>
-            {f'<p class="theme-description">{theme["description"]}</p>' if 'description' in theme else ''}
-            {f'<p class="strategic-insight"><strong>Strategic Insight:</strong> {theme["strategic_insight"]}</p>' if 'strategic_insight' in theme else ''}
-
-            <div class="examples">
-                <h4>Examples:</h4>
-                <ul>
-"""
-            for example in theme.get('examples', [])[:3]:
-                html += f'                    <li><a href="{example["url"]}" target="_blank" class="citation-link">{example["title"]}</a> [<a href="{example["url"]}" target="_blank" class="view-original">View Original</a>]</li>\n'
-
-            html += """                </ul>
-            </div>
-        </div>
-"""
-
-        return html
-
-    def _build_consensus_section(self, consensus_patterns: List[Dict]) -> str:
-        """Build consensus patterns section HTML"""
-        html = '<div class="consensus-list">\n'
-
-        for i, pattern in enumerate(consensus_patterns, 1):
-            html += f"""
-        <div class="consensus-item">
-            <div class="consensus-header">
-                <span class="consensus-number">#{i}</span>
-                <span class="consensus-score">Score: {pattern['score']}</span>
-                <span class="platform-badge">{pattern['platform']}</span>
-                {f'<span class="accepted-badge">✓ Accepted Answer</span>' if pattern.get('is_accepted') else ''}
-            </div>
-            <p class="consensus-pattern">{pattern['pattern']}</p>
-            <p class="consensus-source">From: <em>{pattern['source_discussion']}</em></p>
-            <a href="{pattern['source_url']}" target="_blank" class="view-original">View Original Discussion</a>
-        </div>
-"""
-
-        html += '</div>\n'
-        return html
-
-    def _build_tier2_sections(self, analysis: Dict) -> str:
-        """Build Tier 2+ exclusive sections"""
-        html = ""
-
-        # Controversies section
-        if analysis.get('controversies'):
-            html += """
-        <section class="controversies">
-            <h2>⚠️ Controversial Topics</h2>
-            <p class="section-description">Topics where experts show significant disagreement</p>
-            <div class="controversy-list">
-"""
-            for controversy in analysis['controversies']:
-                html += f"""
-                <div class="controversy-item">
-                    <h4>{controversy['topic']}</h4>
-                    <p>Comments: {controversy['num_comments']} | Score: {controversy['score']} | Platform: {controversy['platform']}</p>
-                    <a href="{controversy['url']}" target="_blank" class="view-original">View Discussion</a>
-                </div>
-"""
-            html += """            </div>
-        </section>
-"""
-
-        # Safety warnings section
-        if analysis.get('safety_warnings'):
-            html += """
-        <section class="safety-warnings">
-            <h2>🚨 Safety Warnings & Code Compliance</h2>
-            <p class="section-description">Expert discussions mentioning electrical codes and safety concerns</p>
-            <ul class="warning-list">
-"""
-            for warning in analysis['safety_warnings']:
-                html += f"""
-                <li>
-                    <strong>{warning['warning']}</strong> (Keyword: {warning['keyword']})
-                    [<a href="{warning['url']}" target="_blank" class="view-original">View Original</a>]
-                </li>
-"""
-            html += """            </ul>
-        </section>
-"""
-
-        return html
+        return self.renderer.render(
+            "expert_report.html",
+            project_name=project_name,
+            tier=self.tier,
+            tier_badge=self._get_tier_badge(),
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            metadata=analysis['metadata'],
+            themes=analysis['themes'],
+            consensus_patterns=analysis['consensus_patterns'],
+            controversies=analysis.get('controversies') or [],
+            safety_warnings=analysis.get('safety_warnings') or []
+        )
 
     def _get_tier_badge(self) -> Dict:
         """Get tier badge configuration"""
@@ -295,274 +148,6 @@ class HTMLReporter:
         }
         return badges.get(self.tier, badges[1])
 
-    def _get_css(self) -> str:
-        """Get CSS styles for report"""
-        return """
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 3px solid #0066cc;
-        }
-
-        h1 {
-            font-size: 2.5em;
-            color: #0066cc;
-            margin-bottom: 10px;
-        }
-
-        .tier-badge {
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-            margin: 10px 0;
-        }
-
-        .tier-1 { background: #95a5a6; color: white; }
-        .tier-2 { background: #1abc9c; color: white; }
-        .tier-3 { background: #f39c12; color: white; }
-
-        .subtitle {
-            font-size: 1.2em;
-            color: #666;
-        }
-
-        .metadata {
-            color: #999;
-            font-size: 0.9em;
-        }
-
-        section {
-            margin: 40px 0;
-        }
-
-        h2 {
-            font-size: 1.8em;
-            color: #0066cc;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-
-        .section-description {
-            color: #666;
-            font-style: italic;
-            margin-bottom: 20px;
-        }
-
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }
-
-        .stat-card {
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-        }
-
-        .stat-value {
-            font-size: 2em;
-            font-weight: bold;
-            color: #0066cc;
-        }
-
-        .stat-label {
-            color: #666;
-            font-size: 0.9em;
-            margin-top: 8px;
-        }
-
-        .theme-card {
-            background: #f8f9fa;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 8px;
-            border-left: 4px solid #0066cc;
-        }
-
-        .theme-card h3 {
-            color: #333;
-            margin-bottom: 10px;
-        }
-
-        .theme-stats {
-            margin: 10px 0;
-        }
-
-        .frequency {
-            background: #0066cc;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-weight: bold;
-        }
-
-        .count {
-            color: #666;
-            margin-left: 10px;
-        }
-
-        .theme-description {
-            margin: 15px 0;
-            color: #555;
-        }
-
-        .strategic-insight {
-            background: #fff3cd;
-            padding: 10px;
-            border-radius: 4px;
-            margin: 10px 0;
-            border-left: 3px solid #ffc107;
-        }
-
-        .examples {
-            margin-top: 15px;
-        }
-
-        .examples h4 {
-            color: #666;
-            font-size: 1em;
-            margin-bottom: 8px;
-        }
-
-        .examples ul {
-            list-style: none;
-            padding-left: 0;
-        }
-
-        .examples li {
-            margin: 8px 0;
-            padding-left: 20px;
-            position: relative;
-        }
-
-        .examples li:before {
-            content: "→";
-            position: absolute;
-            left: 0;
-            color: #0066cc;
-        }
-
-        .citation-link {
-            color: #0066cc;
-            text-decoration: none;
-            font-weight: 500;
-        }
-
-        .citation-link:hover {
-            text-decoration: underline;
-        }
-
-        .view-original {
-            color: #28a745;
-            text-decoration: none;
-            font-size: 0.9em;
-            font-weight: bold;
-        }
-
-        .view-original:hover {
-            text-decoration: underline;
-        }
-
-        .consensus-item {
-            background: #e8f5e9;
-            padding: 15px;
-            margin: 15px 0;
-            border-radius: 8px;
-            border-left: 4px solid #28a745;
-        }
-
-        .consensus-header {
-            display: flex;
-            gap: 10px;
-            align-items: center;
-            margin-bottom: 10px;
-        }
-
-        .consensus-number {
-            background: #28a745;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-weight: bold;
-        }
-
-        .consensus-score {
-            background: #ffc107;
-            color: #333;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.9em;
-            font-weight: bold;
-        }
-
-        .platform-badge {
-            background: #6c757d;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.8em;
-        }
-
-        .accepted-badge {
-            background: #28a745;
-            color: white;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 0.8em;
-        }
-
-        .consensus-pattern {
-            margin: 10px 0;
-            color: #333;
-            font-size: 0.95em;
-        }
-
-        .consensus-source {
-            color: #666;
-            font-size: 0.9em;
-            font-style: italic;
-        }
-
-        footer {
-            text-align: center;
-            margin-top: 60px;
-            padding-top: 20px;
-            border-top: 2px solid #e0e0e0;
-            color: #999;
-            font-size: 0.9em;
-        }
-        """
-
 
 if __name__ == "__main__":
     # Example usage
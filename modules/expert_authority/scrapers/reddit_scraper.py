@@ -7,13 +7,14 @@ NO SYNTHETIC DATA - 100% real discussions only
 
 import praw
 import hashlib
-import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 
 from ..core.config import Config
+from ..core.discussion_store import DiscussionStore
 
 class RedditScraper:
     """Production Reddit scraper using PRAW official API"""
@@ -35,9 +36,8 @@ class RedditScraper:
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
-        # Cache directory
-        self.cache_dir = Path(__file__).parent.parent / "data" / "cache" / "reddit"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Indexed discussion cache (shared with other scrapers)
+        self.store = DiscussionStore()
 
     def scrape(
         self,
@@ -45,42 +45,67 @@ class RedditScraper:
         subreddits: List[str],
         limit: int = 100,
         time_filter: str = "all",
-        sort: str = "relevance"
+        sort: str = "relevance",
+        cache_ttl_hours: Optional[float] = None
     ) -> List[Dict]:
         """
         Scrape Reddit discussions using PRAW API
 
+        Subreddit searches still within their cache TTL are served from the
+        discussion store. Expired searches are refreshed incrementally: only
+        posts newer than the last one seen are fetched in full, and recent
+        posts get their score/comment counts updated.
+
         Args:
             query: Search query (e.g., "LED lighting")
             subreddits: List of subreddit names (e.g., ["electricians", "homeimprovement"])
             limit: Max discussions to scrape per subreddit
             time_filter: Time filter ("all", "year", "month", "week", "day")
             sort: Sort method ("relevance", "hot", "top", "new")
+            cache_ttl_hours: Cache TTL for this query (default: config value)
 
         Returns:
             List of discussion dictionaries with full metadata
         """
+        ttl_seconds = 3600 * (
+            cache_ttl_hours if cache_ttl_hours is not None else self.config.discussion_cache_ttl_hours
+        )
         all_discussions = []
 
         for subreddit_name in subreddits:
             self.logger.info(f"Scraping r/{subreddit_name} for '{query}'...")
 
             try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-
-                # Search subreddit
-                posts = subreddit.search(
-                    query=query,
-                    limit=limit,
-                    time_filter=time_filter,
-                    sort=sort
+                key = self.store.query_key(
+                    "reddit", query, subreddit_name, sort=sort, time_filter=time_filter
                 )
+                state = self.store.get_query_state(key)
+
+                if self.store.is_fresh(state, ttl_seconds):
+                    discussions = self.store.load_query(key, limit)
+                    self.logger.info(f"📂 r/{subreddit_name}: {len(discussions)} posts served from cache")
+
+                elif state:
+                    self._refresh_subreddit(key, state, query, subreddit_name, limit, time_filter, ttl_seconds)
+                    discussions = self.store.load_query(key, limit)
+                    self.logger.info(f"✅ Refreshed r/{subreddit_name}: {len(discussions)} posts")
+
+                else:
+                    subreddit = self.reddit.subreddit(subreddit_name)
+
+                    # Search subreddit
+                    posts = subreddit.search(
+                        query=query,
+                        limit=limit,
+                        time_filter=time_filter,
+                        sort=sort
+                    )
 
-                for post in posts:
-                    discussion = self._extract_post_data(post, subreddit_name)
-                    all_discussions.append(discussion)
+                    discussions = [self._extract_post_data(post, subreddit_name) for post in posts]
+                    self.store.save_query(key, "reddit", query, subreddit_name, discussions, ttl_seconds)
+                    self.logger.info(f"✅ Scraped {len(discussions)} posts from r/{subreddit_name}")
 
-                self.logger.info(f"✅ Scraped {len([d for d in all_discussions if d['subreddit'] == subreddit_name])} posts from r/{subreddit_name}")
+                all_discussions.extend(discussions)
 
             except Exception as e:
                 self.logger.error(f"❌ Error scraping r/{subreddit_name}: {e}")
@@ -89,6 +114,52 @@ class RedditScraper:
         self.logger.info(f"🎯 Total scraped: {len(all_discussions)} discussions")
         return all_discussions
 
+    def _refresh_subreddit(
+        self,
+        key: str,
+        state: Dict,
+        query: str,
+        subreddit_name: str,
+        limit: int,
+        time_filter: str,
+        ttl_seconds: float
+    ):
+        """Fetch posts newer than the last one seen and update recent engagement counts"""
+        newest_seen = state.get('newest_created_utc') or 0
+
+        # Newest-first search, stopping at the first already-seen post
+        new_discussions = []
+        posts = self.reddit.subreddit(subreddit_name).search(
+            query=query,
+            limit=limit,
+            time_filter=time_filter,
+            sort="new"
+        )
+        for post in posts:
+            if post.created_utc <= newest_seen:
+                break
+            new_discussions.append(self._extract_post_data(post, subreddit_name))
+
+        # Score/comment counts only move meaningfully on recent posts
+        since = time.time() - self.config.discussion_refresh_days * 86400
+        recent_ids = self.store.recent_post_ids(key, since)
+        updates = {}
+        if recent_ids:
+            for submission in self.reddit.info(fullnames=[f"t3_{post_id}" for post_id in recent_ids]):
+                updates[submission.id] = {
+                    "score": submission.score,
+                    "upvote_ratio": submission.upvote_ratio,
+                    "num_comments": submission.num_comments
+                }
+        self.store.update_counts("reddit", updates)
+
+        self.store.save_query(
+            key, "reddit", query, subreddit_name, new_discussions, ttl_seconds, prepend=True
+        )
+        self.logger.info(
+            f"🔄 r/{subreddit_name}: {len(new_discussions)} new posts, {len(updates)} counts updated"
+        )
+
     def _extract_post_data(self, post, subreddit_name: str) -> Dict:
         """Extract complete post data including comments"""
 
@@ -147,30 +218,30 @@ class RedditScraper:
 
         return top_comments
 
-    def save_to_cache(self, discussions: List[Dict], filename: str) -> Path:
-        """Save scraped discussions to JSON cache"""
-        cache_file = self.cache_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "metadata": {
-                    "scraped_at": datetime.now().isoformat(),
-                    "total_discussions": len(discussions),
-                    "source": "reddit_praw_official"
-                },
-                "discussions": discussions
-            }, f, indent=2, ensure_ascii=False)
+    def save_to_cache(self, discussions: List[Dict]) -> Path:
+        """Upsert discussions into the discussion store and return its path"""
+        self.store.upsert_discussions("reddit", discussions)
+        self.logger.info(f"💾 Stored {len(discussions)} discussions in {self.store.db_path}")
+        return self.store.db_path
 
-        self.logger.info(f"💾 Saved {len(discussions)} discussions to {cache_file}")
-        return cache_file
-
-    def load_from_cache(self, cache_file: Path) -> List[Dict]:
-        """Load discussions from cache file"""
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load_from_cache(
+        self,
+        query: str,
+        subreddits: List[str],
+        limit: int = 100,
+        time_filter: str = "all",
+        sort: str = "relevance"
+    ) -> List[Dict]:
+        """Serve a whole query from the discussion store without touching the network"""
+        discussions = []
+        for subreddit_name in subreddits:
+            key = self.store.query_key(
+                "reddit", query, subreddit_name, sort=sort, time_filter=time_filter
+            )
+            discussions.extend(self.store.load_query(key, limit))
 
-        self.logger.info(f"📂 Loaded {len(data['discussions'])} discussions from cache")
-        return data['discussions']
+        self.logger.info(f"📂 Loaded {len(discussions)} discussions from cache")
+        return discussions
 
     def validate_url_accessibility(self, url: str) -> bool:
         """Validate that Reddit post URL is still accessible"""
@@ -195,8 +266,12 @@ if __name__ == "__main__":
         limit=30
     )
 
-    # Save to cache
-    scraper.save_to_cache(discussions, "led_lighting_discussions")
+    # Repeat runs within the TTL are now served locally
+    cached = scraper.load_from_cache(
+        query="LED strip lighting",
+        subreddits=["electricians", "homeimprovement", "DIY"],
+        limit=30
+    )
 
     print(f"✅ Scraped {len(discussions)} real Reddit discussions")
     print(f"📊 Example discussion: {discussions[0]['title']}")
@@ -6,19 +6,27 @@ NO SYNTHETIC DATA - 100% real discussions only
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
-import json
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 
 from ..core.config import Config
+from ..core.discussion_store import DiscussionStore
 
 class StackExchangeScraper:
     """Production Stack Exchange scraper using official REST API"""
 
+    # Vectorized endpoints accept at most 100 semicolon-joined IDs
+    MAX_IDS_PER_REQUEST = 100
+    max_workers = 4
+
     def __init__(self, config: Optional[Config] = None):
         """Initialize Stack Exchange scraper with credentials from config"""
         self.config = config or Config()
@@ -34,13 +42,19 @@ class StackExchangeScraper:
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
-        # Cache directory
-        self.cache_dir = Path(__file__).parent.parent / "data" / "cache" / "stackexchange"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Indexed discussion cache (shared with other scrapers)
+        self.store = DiscussionStore()
+
+        # Pooled HTTP session shared by all site workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
 
-        # Rate limiting
+        # Rate limiting (shared across threads)
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 10 requests per second max
+        self.backoff_until = 0
+        self._rate_lock = threading.Lock()
 
     def scrape(
         self,
@@ -48,66 +62,179 @@ class StackExchangeScraper:
         sites: List[str],
         limit: int = 100,
         sort: str = "relevance",
-        tagged: Optional[List[str]] = None
+        tagged: Optional[List[str]] = None,
+        cache_ttl_hours: Optional[float] = None
     ) -> List[Dict]:
         """
         Scrape Stack Exchange discussions using official REST API
 
+        Site searches still within their cache TTL are served from the
+        discussion store; expired ones only fetch questions created since the
+        newest one seen and refresh score/answer counts for recent questions.
+
         Args:
             query: Search query (e.g., "LED lighting")
             sites: List of Stack Exchange sites (e.g., ["diy.stackexchange.com", "electronics.stackexchange.com"])
             limit: Max questions to scrape per site
             sort: Sort method ("relevance", "votes", "creation", "activity")
             tagged: Optional list of tags to filter by
+            cache_ttl_hours: Cache TTL for this query (default: config value)
 
         Returns:
             List of Q&A dictionaries with full metadata
         """
-        all_discussions = []
+        if not sites:
+            return []
 
-        for site in sites:
-            self.logger.info(f"Scraping {site} for '{query}'...")
-
-            try:
-                questions = self._search_questions(
-                    query=query,
-                    site=site,
-                    limit=limit,
-                    sort=sort,
-                    tagged=tagged
-                )
+        ttl_seconds = 3600 * (
+            cache_ttl_hours if cache_ttl_hours is not None else self.config.discussion_cache_ttl_hours
+        )
 
-                for question in questions:
-                    # Get full question details including body
-                    question_data = self._get_question_details(question['question_id'], site)
+        # Sites are independent; the shared rate limiter keeps the total
+        # request rate within the API limit
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sites))) as executor:
+            site_results = list(executor.map(
+                lambda site: self._scrape_site(query, site, limit, sort, tagged, ttl_seconds),
+                sites
+            ))
 
-                    # Get answers
-                    answers = self._get_answers(question['question_id'], site)
+        all_discussions = [d for discussions in site_results for d in discussions]
 
-                    # Build discussion object
-                    discussion = self._build_discussion(question_data, answers, site)
-                    all_discussions.append(discussion)
+        self.logger.info(f"🎯 Total scraped: {len(all_discussions)} discussions")
+        return all_discussions
 
-                self.logger.info(f"✅ Scraped {len([d for d in all_discussions if d['site'] == site])} questions from {site}")
+    def _scrape_site(
+        self,
+        query: str,
+        site: str,
+        limit: int,
+        sort: str,
+        tagged: Optional[List[str]],
+        ttl_seconds: float
+    ) -> List[Dict]:
+        """Scrape one site, serving from or incrementally refreshing the discussion store"""
+        self.logger.info(f"Scraping {site} for '{query}'...")
+
+        try:
+            key = self._query_key(query, site, sort, tagged)
+            state = self.store.get_query_state(key)
+
+            if self.store.is_fresh(state, ttl_seconds):
+                discussions = self.store.load_query(key, limit)
+                self.logger.info(f"📂 {site}: {len(discussions)} questions served from cache")
+                return discussions
+
+            # Incremental refresh: only questions created after the newest one seen
+            from_date = state['newest_created_utc'] + 1 if state and state.get('newest_created_utc') else None
+            new_discussions = self._fetch_discussions(query, site, limit, sort, tagged, from_date)
+
+            if state:
+                updated = self._refresh_recent_counts(key, site)
+                self.store.save_query(key, "stackexchange", query, site, new_discussions, ttl_seconds, prepend=True)
+                discussions = self.store.load_query(key, limit)
+                self.logger.info(
+                    f"🔄 {site}: {len(new_discussions)} new questions, {updated} counts updated"
+                )
+            else:
+                self.store.save_query(key, "stackexchange", query, site, new_discussions, ttl_seconds)
+                discussions = new_discussions
 
-            except Exception as e:
-                self.logger.error(f"❌ Error scraping {site}: {e}")
-                continue
+            self.logger.info(f"✅ Scraped {len(discussions)} questions from {site}")
+            return discussions
 
-        self.logger.info(f"🎯 Total scraped: {len(all_discussions)} discussions")
-        return all_discussions
+        except Exception as e:
+            self.logger.error(f"❌ Error scraping {site}: {e}")
+            return []
 
-    def _search_questions(
+    def _fetch_discussions(
         self,
         query: str,
         site: str,
         limit: int,
         sort: str,
-        tagged: Optional[List[str]]
+        tagged: Optional[List[str]],
+        from_date: Optional[int] = None
     ) -> List[Dict]:
-        """Search for questions matching query"""
-        self._rate_limit()
+        """Search, then fetch batched question details and answers"""
+        questions = self._search_questions(
+            query=query,
+            site=site,
+            limit=limit,
+            sort=sort,
+            tagged=tagged,
+            from_date=from_date
+        )
+
+        question_ids = [q['question_id'] for q in questions]
+        details = self._get_questions_details(question_ids, site)
+        answers = self._get_answers_batch(question_ids, site)
+
+        discussions = []
+        for question in questions:
+            question_data = details.get(question['question_id'], question)
+            discussions.append(
+                self._build_discussion(question_data, answers.get(question['question_id'], []), site)
+            )
+
+        return discussions
+
+    def _refresh_recent_counts(self, key: str, site: str) -> int:
+        """Update score/answer/view counts for recently created stored questions"""
+        since = time.time() - self.config.discussion_refresh_days * 86400
+        recent_ids = [self._question_id(post_id) for post_id in self.store.recent_post_ids(key, since)]
+        if not recent_ids:
+            return 0
+
+        updates = {}
+        for batch in self._id_batches(recent_ids):
+            # Default filter omits bodies; only the counters are needed here
+            data = self._get(
+                f"/questions/{';'.join(map(str, batch))}",
+                {"site": site, "pagesize": len(batch)}
+            )
+            for item in data.get('items', []):
+                updates[self._post_id(site, item['question_id'])] = {
+                    "score": item['score'],
+                    "answer_count": item.get('answer_count', 0),
+                    "view_count": item.get('view_count', 0),
+                    "is_answered": item.get('is_answered', False),
+                    "accepted_answer_id": item.get('accepted_answer_id')
+                }
+
+        self.store.update_counts("stackexchange", updates)
+        return len(updates)
+
+    def _query_key(
+        self,
+        query: str,
+        site: str,
+        sort: str = "relevance",
+        tagged: Optional[List[str]] = None
+    ) -> str:
+        # id_format: memberships stored before post ids carried the site are not reused
+        return self.store.query_key(
+            "stackexchange", query, site, sort=sort, tagged=sorted(tagged or []), id_format=2
+        )
 
+    @staticmethod
+    def _post_id(site: str, question_id: int) -> str:
+        """Store/discussion id; question ids are only unique within one site"""
+        return f"{site}:{question_id}"
+
+    @staticmethod
+    def _question_id(post_id: str) -> int:
+        return int(str(post_id).rsplit(':', 1)[-1])
+
+    def _search_questions(
+        self,
+        query: str,
+        site: str,
+        limit: int,
+        sort: str,
+        tagged: Optional[List[str]],
+        from_date: Optional[int] = None
+    ) -> List[Dict]:
+        """Search for questions matching query (optionally created on/after from_date)"""
         params = {
             "intitle": query,
             "site": site,
@@ -117,61 +244,94 @@ class StackExchangeScraper:
             "filter": "withbody"  # Include question body
         }
 
-        if self.api_key:
-            params["key"] = self.api_key
-
         if tagged:
             params["tagged"] = ";".join(tagged)
 
-        response = requests.get(f"{self.base_url}/search", params=params)
-        response.raise_for_status()
+        if from_date:
+            params["fromdate"] = from_date
 
-        data = response.json()
+        data = self._get("/search", params)
+        return data.get('items', [])
 
-        # Log quota info
-        if 'quota_remaining' in data:
-            self.logger.info(f"📊 API quota remaining: {data['quota_remaining']}")
+    def _get_questions_details(self, question_ids: List[int], site: str) -> Dict[int, Dict]:
+        """Get full details for many questions via /questions/{ids}"""
+        details = {}
 
-        return data.get('items', [])
+        for batch in self._id_batches(question_ids):
+            params = {
+                "site": site,
+                "pagesize": len(batch),
+                "filter": "withbody"
+            }
+            data = self._get(f"/questions/{';'.join(map(str, batch))}", params)
+            for item in data.get('items', []):
+                details[item['question_id']] = item
 
-    def _get_question_details(self, question_id: int, site: str) -> Dict:
-        """Get full question details"""
-        self._rate_limit()
+        return details
 
-        params = {
-            "site": site,
-            "filter": "withbody"
-        }
+    def _get_answers_batch(
+        self,
+        question_ids: List[int],
+        site: str,
+        limit: int = 10
+    ) -> Dict[int, List[Dict]]:
+        """Get top answers for many questions via /questions/{ids}/answers"""
+        answers = defaultdict(list)
+
+        for batch in self._id_batches(question_ids):
+            ids = ';'.join(map(str, batch))
+            page = 1
+            while True:
+                params = {
+                    "site": site,
+                    "page": page,
+                    "pagesize": 100,
+                    "order": "desc",
+                    "sort": "votes",
+                    "filter": "withbody"
+                }
+                data = self._get(f"/questions/{ids}/answers", params)
+
+                # Results arrive sorted by votes, so the first `limit` per question are its top answers
+                for item in data.get('items', []):
+                    bucket = answers[item['question_id']]
+                    if len(bucket) < limit:
+                        bucket.append(item)
+
+                if not data.get('has_more'):
+                    break
+                page += 1
+
+        return dict(answers)
+
+    def _id_batches(self, ids: List[int]) -> List[List[int]]:
+        """Split IDs into chunks accepted by vectorized endpoints"""
+        size = self.MAX_IDS_PER_REQUEST
+        return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+    def _get(self, path: str, params: Dict) -> Dict:
+        """Rate-limited GET against the API through the pooled session"""
+        self._rate_limit()
 
         if self.api_key:
-            params["key"] = self.api_key
+            params = {**params, "key": self.api_key}
 
-        response = requests.get(f"{self.base_url}/questions/{question_id}", params=params)
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=30)
         response.raise_for_status()
 
         data = response.json()
-        return data['items'][0] if data['items'] else {}
-
-    def _get_answers(self, question_id: int, site: str, limit: int = 10) -> List[Dict]:
-        """Get answers for a question"""
-        self._rate_limit()
 
-        params = {
-            "site": site,
-            "pagesize": limit,
-            "order": "desc",
-            "sort": "votes",
-            "filter": "withbody"
-        }
+        # Log quota info
+        if 'quota_remaining' in data:
+            self.logger.debug(f"📊 API quota remaining: {data['quota_remaining']}")
 
-        if self.api_key:
-            params["key"] = self.api_key
+        # Honour server-requested backoff before the next request
+        if data.get('backoff'):
+            self.logger.warning(f"⏳ API requested backoff of {data['backoff']}s")
+            with self._rate_lock:
+                self.backoff_until = max(self.backoff_until, time.time() + data['backoff'])
 
-        response = requests.get(f"{self.base_url}/questions/{question_id}/answers", params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        return data.get('items', [])
+        return data
 
     def _build_discussion(self, question: Dict, answers: List[Dict], site: str) -> Dict:
         """Build discussion object from question and answers"""
@@ -181,7 +341,7 @@ class StackExchangeScraper:
         validation_hash = hashlib.sha256(content.encode()).hexdigest()
 
         discussion = {
-            "id": str(question['question_id']),
+            "id": self._post_id(site, question['question_id']),
             "platform": "stackexchange",
             "site": site,
             "title": question['title'],
@@ -230,44 +390,45 @@ class StackExchangeScraper:
         return formatted_answers
 
     def _rate_limit(self):
-        """Enforce rate limiting (10 requests/second max)"""
-        now = time.time()
-        time_since_last = now - self.last_request_time
-
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-
-        self.last_request_time = time.time()
-
-    def save_to_cache(self, discussions: List[Dict], filename: str) -> Path:
-        """Save scraped discussions to JSON cache"""
-        cache_file = self.cache_dir / f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "metadata": {
-                    "scraped_at": datetime.now().isoformat(),
-                    "total_discussions": len(discussions),
-                    "source": "stackexchange_rest_api_official"
-                },
-                "discussions": discussions
-            }, f, indent=2, ensure_ascii=False)
-
-        self.logger.info(f"💾 Saved {len(discussions)} discussions to {cache_file}")
-        return cache_file
-
-    def load_from_cache(self, cache_file: Path) -> List[Dict]:
-        """Load discussions from cache file"""
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """Enforce rate limiting (10 requests/second max) across all threads"""
+        with self._rate_lock:
+            now = time.time()
+            next_allowed = max(
+                self.last_request_time + self.min_request_interval,
+                self.backoff_until
+            )
+
+            if now < next_allowed:
+                time.sleep(next_allowed - now)
+
+            self.last_request_time = time.time()
+
+    def save_to_cache(self, discussions: List[Dict]) -> Path:
+        """Upsert discussions into the discussion store and return its path"""
+        self.store.upsert_discussions("stackexchange", discussions)
+        self.logger.info(f"💾 Stored {len(discussions)} discussions in {self.store.db_path}")
+        return self.store.db_path
+
+    def load_from_cache(
+        self,
+        query: str,
+        sites: List[str],
+        limit: int = 100,
+        sort: str = "relevance",
+        tagged: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Serve a whole query from the discussion store without touching the network"""
+        discussions = []
+        for site in sites:
+            discussions.extend(self.store.load_query(self._query_key(query, site, sort, tagged), limit))
 
-        self.logger.info(f"📂 Loaded {len(data['discussions'])} discussions from cache")
-        return data['discussions']
+        self.logger.info(f"📂 Loaded {len(discussions)} discussions from cache")
+        return discussions
 
     def validate_url_accessibility(self, url: str) -> bool:
         """Validate that Stack Exchange URL is still accessible"""
         try:
-            response = requests.head(url, timeout=5)
+            response = self.session.head(url, timeout=5)
             return response.status_code == 200
         except Exception as e:
             self.logger.warning(f"⚠️ URL validation failed for {url}: {e}")
@@ -288,8 +449,13 @@ if __name__ == "__main__":
         tagged=["led", "lighting"]
     )
 
-    # Save to cache
-    scraper.save_to_cache(discussions, "led_lighting_discussions")
+    # Repeat runs within the TTL are now served locally
+    cached = scraper.load_from_cache(
+        query="LED lighting",
+        sites=["diy.stackexchange.com", "electronics.stackexchange.com"],
+        limit=30,
+        tagged=["led", "lighting"]
+    )
 
     print(f"✅ Scraped {len(discussions)} real Stack Exchange discussions")
     print(f"📊 Example discussion: {discussions[0]['title']}")
@@ -8,9 +8,15 @@ import json
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict
 import sqlite3
 
+from core.rollups import (
+    TRACKED_COMPETITORS,
+    sync_rollups,
+    window_activity,
+)
+
 class CompetitiveAnalyzer:
     """Analyze competitive patent landscape"""
 
@@ -22,42 +28,45 @@ class CompetitiveAnalyzer:
             db_path: Path to patent database
         """
         self.db_path = db_path
-        self.competitors = [
-            "Philips", "Signify", "Osram", "Cree", "Acuity Brands",
-            "GE Lighting", "Lumileds", "Samsung Electronics",
-            "LG Electronics", "Nichia", "Seoul Semiconductor"
-        ]
+        self.competitors = list(TRACKED_COMPETITORS)
 
     def generate_competitor_summary(
         self,
         time_period_days: int = 90,
-        comparison_period_days: int = 90
+        comparison_period_days: int = 90,
+        as_of: Optional[datetime] = None
     ) -> Dict:
         """
         Generate competitive intelligence summary
 
+        Counts, velocity and technology focus are read from the monthly
+        rollups maintained by PatentDatabase, so cost grows with the number
+        of months in the windows rather than the number of patents.
+
         Args:
             time_period_days: Current analysis period in days
             comparison_period_days: Previous period for velocity comparison
+            as_of: End of the current period (defaults to now)
 
         Returns:
             Dict with competitive intelligence insights
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        sync_rollups(conn)
         cursor = conn.cursor()
 
         # Calculate date ranges
-        current_end = datetime.now()
+        current_end = as_of or datetime.now()
         current_start = current_end - timedelta(days=time_period_days)
         prior_start = current_start - timedelta(days=comparison_period_days)
 
-        # Get patents by competitor and time period
-        current_patents = self._get_patents_by_period(
-            cursor, current_start, current_end
+        # Per-competitor activity from the rollups
+        current_activity = window_activity(
+            cursor, self.competitors, current_start, current_end
         )
-        prior_patents = self._get_patents_by_period(
-            cursor, prior_start, current_start
+        prior_activity = window_activity(
+            cursor, self.competitors, prior_start, current_start
         )
 
         # Analyze each competitor
@@ -67,9 +76,11 @@ class CompetitiveAnalyzer:
         for competitor in self.competitors:
             analysis = self._analyze_competitor(
                 competitor,
-                current_patents,
-                prior_patents,
-                cursor
+                current_activity[competitor],
+                prior_activity[competitor],
+                cursor,
+                current_start,
+                current_end
             )
 
             if analysis['current_count'] > 0:
@@ -109,25 +120,26 @@ class CompetitiveAnalyzer:
             'technology_gaps': self._identify_technology_gaps(competitor_analysis)
         }
 
-    def _get_patents_by_period(
+    def _get_competitor_patents(
         self,
         cursor,
+        competitor: str,
         start_date: datetime,
         end_date: datetime
     ) -> List[Dict]:
-        """Get all patents within date range"""
+        """Get one competitor's patents within date range via the rollup membership index"""
         cursor.execute("""
             SELECT
-                id,
-                title,
-                abstract,
-                assignees,
-                cpc_codes,
-                filing_date,
-                extracted_at
-            FROM patents
-            WHERE filing_date >= ? AND filing_date < ?
-        """, (start_date.isoformat(), end_date.isoformat()))
+                p.id,
+                p.title,
+                p.abstract,
+                p.cpc_codes,
+                p.filing_date
+            FROM rollup_patent_assignees pa
+            JOIN patents p ON p.id = pa.patent_id
+            WHERE pa.assignee = ?
+            AND pa.filing_date >= ? AND pa.filing_date < ?
+        """, (competitor, start_date.isoformat(), end_date.isoformat()))
 
         patents = []
         for row in cursor.fetchall():
@@ -135,10 +147,8 @@ class CompetitiveAnalyzer:
                 'id': row['id'],
                 'title': row['title'],
                 'abstract': row['abstract'],
-                'assignees': json.loads(row['assignees']) if row['assignees'] else [],
                 'cpc_codes': json.loads(row['cpc_codes']) if row['cpc_codes'] else [],
-                'filing_date': row['filing_date'],
-                'extracted_at': row['extracted_at']
+                'filing_date': row['filing_date']
             })
 
         return patents
@@ -146,18 +156,16 @@ class CompetitiveAnalyzer:
     def _analyze_competitor(
         self,
         competitor: str,
-        current_patents: List[Dict],
-        prior_patents: List[Dict],
-        cursor
+        current_activity: Dict,
+        prior_activity: Dict,
+        cursor,
+        current_start: datetime,
+        current_end: datetime
     ) -> Dict:
         """Analyze single competitor's patent activity"""
 
-        # Filter patents for this competitor
-        current = [p for p in current_patents if self._is_assignee(competitor, p)]
-        prior = [p for p in prior_patents if self._is_assignee(competitor, p)]
-
-        current_count = len(current)
-        prior_count = len(prior)
+        current_count = current_activity['patent_count']
+        prior_count = prior_activity['patent_count']
 
         # Calculate velocity change
         if prior_count > 0:
@@ -165,12 +173,11 @@ class CompetitiveAnalyzer:
         else:
             velocity_change_pct = 100.0 if current_count > 0 else 0.0
 
-        # Analyze technology focus areas (CPC codes)
-        cpc_codes = []
-        for patent in current:
-            cpc_codes.extend(patent.get('cpc_codes', []))
-
-        top_technologies = self._categorize_cpc_codes(cpc_codes)
+        # Technology focus areas (CPC categories)
+        top_technologies = [
+            {'category': cat, 'count': count}
+            for cat, count in current_activity['cpc_counts'].most_common()
+        ]
 
         # Assess threat level
         threat_level = self._assess_threat_level(
@@ -179,10 +186,27 @@ class CompetitiveAnalyzer:
             top_technologies
         )
 
+        if current_count == 0:
+            return {
+                'current_count': 0,
+                'prior_count': prior_count,
+                'velocity_change_pct': round(velocity_change_pct, 1),
+                'top_technologies': top_technologies,
+                'threat_level': threat_level,
+                'innovation_quality': None,
+                'key_patents': []
+            }
+
         # Get innovation quality metrics if available
         innovation_quality = self._get_innovation_metrics(
             cursor,
-            [p['id'] for p in current]
+            competitor,
+            current_start,
+            current_end
+        )
+
+        current = self._get_competitor_patents(
+            cursor, competitor, current_start, current_end
         )
 
         return {
@@ -192,52 +216,9 @@ class CompetitiveAnalyzer:
             'top_technologies': top_technologies,
             'threat_level': threat_level,
             'innovation_quality': innovation_quality,
-            'key_patents': self._identify_key_patents(current)[:3]
-        }
-
-    def _is_assignee(self, competitor: str, patent: Dict) -> bool:
-        """Check if competitor is assignee of patent"""
-        assignees = patent.get('assignees', [])
-        competitor_lower = competitor.lower()
-
-        for assignee in assignees:
-            if competitor_lower in assignee.lower():
-                return True
-
-        return False
-
-    def _categorize_cpc_codes(self, cpc_codes: List[str]) -> List[Dict]:
-        """Categorize and count CPC technology codes"""
-
-        # CPC code to human-readable categories
-        cpc_categories = {
-            'F21K': 'LED Light Sources',
-            'F21V': 'Lighting Fixtures & Optics',
-            'F21Y': 'Lighting Applications',
-            'H05B': 'LED Drivers & Power Supply',
-            'H01L': 'LED Semiconductor Devices',
-            'G09G': 'Display Control',
-            'H04N': 'Image Capture/Processing',
-            'G01J': 'Light Measurement',
-            'F21S': 'Vehicle Lighting',
-            'A61N': 'Medical Lighting Therapy'
+            'key_patents': self._identify_key_patents(current, current_end)[:3]
         }
 
-        # Count codes by category
-        category_counts = Counter()
-
-        for code in cpc_codes:
-            # Extract main class (first 4 chars)
-            main_class = code[:4] if len(code) >= 4 else code
-            category = cpc_categories.get(main_class, 'Other')
-            category_counts[category] += 1
-
-        # Return sorted list
-        return [
-            {'category': cat, 'count': count}
-            for cat, count in category_counts.most_common()
-        ]
-
     def _assess_threat_level(
         self,
         patent_count: int,
@@ -268,13 +249,12 @@ class CompetitiveAnalyzer:
     def _get_innovation_metrics(
         self,
         cursor,
-        patent_ids: List[str]
+        competitor: str,
+        start_date: datetime,
+        end_date: datetime
     ) -> Optional[Dict]:
         """Get aggregated innovation metrics from LLM analysis"""
 
-        if not patent_ids:
-            return None
-
         try:
             # Check if innovation analysis table exists
             cursor.execute("""
@@ -285,16 +265,17 @@ class CompetitiveAnalyzer:
             if not cursor.fetchone():
                 return None
 
-            # Get metrics for these patents
-            placeholders = ','.join(['?' for _ in patent_ids])
-            cursor.execute(f"""
+            # Join through the membership index instead of an IN-list of IDs
+            cursor.execute("""
                 SELECT
-                    AVG(market_potential_score) as avg_market_potential,
-                    COUNT(CASE WHEN threat_level = 'high' THEN 1 END) as high_threat_count,
-                    COUNT(CASE WHEN technology_readiness = 'production_ready' THEN 1 END) as production_ready_count
-                FROM innovation_analysis
-                WHERE patent_id IN ({placeholders})
-            """, patent_ids)
+                    AVG(ia.market_potential_score) as avg_market_potential,
+                    COUNT(CASE WHEN ia.threat_level = 'high' THEN 1 END) as high_threat_count,
+                    COUNT(CASE WHEN ia.technology_readiness = 'production_ready' THEN 1 END) as production_ready_count
+                FROM rollup_patent_assignees pa
+                JOIN innovation_analysis ia ON ia.patent_id = pa.patent_id
+                WHERE pa.assignee = ?
+                AND pa.filing_date >= ? AND pa.filing_date < ?
+            """, (competitor, start_date.isoformat(), end_date.isoformat()))
 
             row = cursor.fetchone()
 
@@ -311,8 +292,20 @@ class CompetitiveAnalyzer:
 
         return None
 
-    def _identify_key_patents(self, patents: List[Dict]) -> List[Dict]:
-        """Identify most important patents based on various signals"""
+    def _identify_key_patents(
+        self,
+        patents: List[Dict],
+        as_of: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Identify most important patents based on various signals
+
+        Args:
+            patents: Candidate patents
+            as_of: Reference date for recency (the report's period end;
+                defaults to now)
+        """
+        as_of = as_of or datetime.now()
 
         # Score patents by importance signals
         scored_patents = []
@@ -331,7 +324,7 @@ class CompetitiveAnalyzer:
             # Recent patents are more relevant
             try:
                 filing_date = datetime.fromisoformat(patent['filing_date'])
-                days_old = (datetime.now() - filing_date).days
+                days_old = (as_of - filing_date).days
                 recency_score = max(0, 5 - (days_old / 30))
                 score += recency_score
             except (ValueError, KeyError):
@@ -4,14 +4,91 @@ Extracts actionable insights from patent data using Claude Sonnet 4
 """
 
 import os
+import re
+import sys
 import json
 import anthropic
 from typing import Dict, List, Optional
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+MODULE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_BATCH_DB = MODULE_DIR / "data" / "batches.sqlite"
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from core.models.prompt_cache import (
+    ANTHROPIC_CACHE_READ_MULTIPLIER,
+    ANTHROPIC_CACHE_WRITE_MULTIPLIER,
+    anthropic_system_blocks,
+    anthropic_usage,
+)
+
 class InnovationExtractor:
     """Extract innovation insights from patents using LLM"""
 
+    # Stable prefix shared by every patent; sent as the system prompt with a
+    # cache breakpoint so repeat calls read it from the prompt cache
+    INNOVATION_INSTRUCTIONS = """You are a patent intelligence analyst for 3M Corporation, analyzing lighting technology patents.
+
+**Task**: Analyze the patent in the user message and extract actionable innovation intelligence.
+
+---
+
+**Extract the following insights**:
+
+1. **Core Innovation** (1-2 sentences): What is the key technical breakthrough or novel approach?
+
+2. **Problem Solved** (1-2 sentences): What specific customer or technical problem does this address?
+
+3. **Market Potential** (1-10 score with reasoning):
+   - 1-3: Niche research, limited commercial potential
+   - 4-6: Specialized applications, moderate market
+   - 7-8: Significant commercial opportunity
+   - 9-10: Game-changing, mass market potential
+
+4. **Technology Readiness**:
+   - "research_stage": Early R&D, years from production
+   - "pilot_stage": Prototyping, 1-2 years from production
+   - "production_ready": Mature technology, ready for manufacturing
+
+5. **Applications** (3-5 use cases): List specific product applications or market segments.
+
+6. **Competitive Position**: How does this compare to 3M's position? Are we ahead, behind, or on par with this innovation?
+
+7. **Threat Level** (if not 3M patent):
+   - "low": Different technology direction, no overlap
+   - "medium": Adjacent technology, potential future competition
+   - "high": Direct competition, could block 3M products or markets
+
+8. **Recommended Action** (1-2 sentences): What should 3M do in response?
+
+---
+
+**Output Format** (JSON only, no additional text):
+
+{
+  "core_innovation": "...",
+  "problem_solved": "...",
+  "market_potential": {
+    "score": 7,
+    "reasoning": "..."
+  },
+  "technology_readiness": "pilot_stage",
+  "applications": [
+    "Hospital lighting systems",
+    "Senior living facilities",
+    "Hotel room automation"
+  ],
+  "competitive_position": "...",
+  "threat_level": "medium",
+  "recommended_action": "..."
+}
+
+**Important**: Output ONLY valid JSON. No additional commentary.
+"""
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize innovation extractor
@@ -26,9 +103,13 @@ class InnovationExtractor:
         self.client = anthropic.Anthropic(api_key=self.api_key)
         self.model = "claude-sonnet-4-20250514"
 
-        # Track costs
+        # Track costs (Message Batches usage is billed at half price)
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.batch_input_tokens = 0
+        self.batch_output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
 
     def analyze_patent(self, patent: Dict) -> Dict:
         """
@@ -47,19 +128,31 @@ class InnovationExtractor:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=1500,
+            system=anthropic_system_blocks(self.INNOVATION_INSTRUCTIONS),
             messages=[{
                 "role": "user",
                 "content": prompt
             }]
         )
 
-        # Track usage
-        self.total_input_tokens += response.usage.input_tokens
-        self.total_output_tokens += response.usage.output_tokens
+        # Track usage; total_input_tokens holds the uncached part only
+        usage = anthropic_usage(response.usage)
+        self.total_input_tokens += usage['prompt_tokens'] - usage['cached_tokens'] - usage['cache_write_tokens']
+        self.total_output_tokens += usage['completion_tokens']
+        self.cache_read_tokens += usage['cached_tokens']
+        self.cache_write_tokens += usage['cache_write_tokens']
+
+        return self._parse_insights(
+            patent,
+            response.content[0].text,
+            usage['prompt_tokens'],
+            usage['completion_tokens']
+        )
 
-        # Parse JSON response
+    def _parse_insights(self, patent: Dict, content: str, input_tokens: int, output_tokens: int) -> Dict:
+        """Parse the JSON reply for one patent and attach metadata"""
+        raw = content
         try:
-            content = response.content[0].text
             # Extract JSON from response (may have markdown code blocks)
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0].strip()
@@ -71,27 +164,43 @@ class InnovationExtractor:
             # Add metadata
             insights['patent_id'] = patent['id']
             insights['analysis_model'] = self.model
-            insights['input_tokens'] = response.usage.input_tokens
-            insights['output_tokens'] = response.usage.output_tokens
+            insights['input_tokens'] = input_tokens
+            insights['output_tokens'] = output_tokens
 
             return insights
 
         except json.JSONDecodeError as e:
             print(f"⚠️ Failed to parse LLM response for {patent['id']}: {e}")
-            print(f"Raw response: {response.content[0].text[:500]}")
+            print(f"Raw response: {raw[:500]}")
             return self._empty_analysis(patent['id'], error=str(e))
 
-    def analyze_batch(self, patents: List[Dict], progress_callback=None) -> List[Dict]:
+    def analyze_batch(
+        self,
+        patents: List[Dict],
+        progress_callback=None,
+        use_batch_api: bool = False,
+        batch_db: Optional[Path] = None,
+        poll_interval: float = 60.0,
+        base_url: Optional[str] = None
+    ) -> List[Dict]:
         """
         Analyze multiple patents in batch
 
         Args:
             patents: List of patent dicts
             progress_callback: Optional callback function(current, total, patent_id)
+            use_batch_api: Submit one Message Batch instead of sequential calls
+                (half price, results within 24h; for offline runs)
+            batch_db: SQLite file tracking submitted batches
+            poll_interval: Seconds between batch status checks
+            base_url: Anthropic API root override (e.g. a local fake server)
 
         Returns:
             List of innovation insights
         """
+        if use_batch_api:
+            return self._analyze_via_batch_api(patents, batch_db, poll_interval, base_url)
+
         results = []
 
         for i, patent in enumerate(patents, 1):
@@ -107,8 +216,77 @@ class InnovationExtractor:
 
         return results
 
+    def _analyze_via_batch_api(
+        self,
+        patents: List[Dict],
+        batch_db: Optional[Path],
+        poll_interval: float,
+        base_url: Optional[str]
+    ) -> List[Dict]:
+        """Submit all patents as one Message Batch and wait for the results"""
+        from core.models.batch import AnthropicBatchBackend, BatchJobStore, BatchRequest, BatchRunner
+
+        runner = BatchRunner(
+            AnthropicBatchBackend(self.api_key, base_url or 'https://api.anthropic.com/v1'),
+            self.model,
+            BatchJobStore(batch_db or DEFAULT_BATCH_DB),
+            poll_interval=poll_interval
+        )
+        # custom_ids derive from the patent ids (not list positions), so
+        # results stored by runner.resume() after a restart still map back
+        custom_ids = self._batch_custom_ids(patents)
+        requests = [
+            BatchRequest(
+                custom_id=custom_id,
+                messages=[
+                    {"role": "system", "content": self.INNOVATION_INSTRUCTIONS},
+                    {"role": "user", "content": self._build_innovation_prompt(patent)}
+                ],
+                max_tokens=1500
+            )
+            for custom_id, patent in zip(custom_ids, patents)
+        ]
+        batch_id = runner.submit(requests)
+        print(f"📦 Submitted {len(requests)} patents as batch {batch_id}")
+        replies = runner.wait(batch_id)
+
+        results = []
+        for custom_id, patent in zip(custom_ids, patents):
+            reply = replies.get(custom_id) or {}
+            response = reply.get('response')
+            if response is None:
+                error = reply.get('error') or reply.get('status', 'missing from batch results')
+                print(f"❌ Error analyzing {patent['id']}: {error}")
+                results.append(self._empty_analysis(patent['id'], error=error))
+                continue
+            usage = response['usage']
+            self.batch_input_tokens += usage['prompt_tokens']
+            self.batch_output_tokens += usage['completion_tokens']
+            results.append(self._parse_insights(
+                patent,
+                response['message']['content'],
+                usage['prompt_tokens'],
+                usage['completion_tokens']
+            ))
+        return results
+
+    @staticmethod
+    def _batch_custom_ids(patents: List[Dict]) -> List[str]:
+        """Batch custom_ids from patent ids: [a-zA-Z0-9_-], at most 64 chars, unique"""
+        custom_ids = []
+        seen = set()
+        for patent in patents:
+            base = re.sub(r'[^A-Za-z0-9_-]', '_', str(patent['id']))[:56] or 'patent'
+            custom_id, n = base, 1
+            while custom_id in seen:
+                n += 1
+                custom_id = f"{base}-{n}"
+            seen.add(custom_id)
+            custom_ids.append(custom_id)
+        return custom_ids
+
     def _build_innovation_prompt(self, patent: Dict) -> str:
-        """Build analysis prompt for patent"""
+        """Build the per-patent part of the prompt (follows INNOVATION_INSTRUCTIONS)"""
 
         # Get assignee name (company)
         assignees = patent.get('assignees', [])
@@ -118,11 +296,7 @@ class InnovationExtractor:
         cpc_codes = patent.get('cpc_codes', [])
         cpc_str = ", ".join(cpc_codes[:3]) if cpc_codes else "Not specified"
 
-        prompt = f"""You are a patent intelligence analyst for 3M Corporation, analyzing lighting technology patents.
-
-**Task**: Analyze this patent and extract actionable innovation intelligence.
-
-**Patent Information**:
+        prompt = f"""**Patent Information**:
 - Patent ID: {patent['id']}
 - Title: {patent['title']}
 - Assignee: {assignee_str}
@@ -134,60 +308,6 @@ class InnovationExtractor:
 
 **Claims** (if available):
 {patent.get('claims_text', 'Claims not available')[:1000]}
-
----
-
-**Extract the following insights**:
-
-1. **Core Innovation** (1-2 sentences): What is the key technical breakthrough or novel approach?
-
-2. **Problem Solved** (1-2 sentences): What specific customer or technical problem does this address?
-
-3. **Market Potential** (1-10 score with reasoning):
-   - 1-3: Niche research, limited commercial potential
-   - 4-6: Specialized applications, moderate market
-   - 7-8: Significant commercial opportunity
-   - 9-10: Game-changing, mass market potential
-
-4. **Technology Readiness**:
-   - "research_stage": Early R&D, years from production
-   - "pilot_stage": Prototyping, 1-2 years from production
-   - "production_ready": Mature technology, ready for manufacturing
-
-5. **Applications** (3-5 use cases): List specific product applications or market segments.
-
-6. **Competitive Position**: How does this compare to 3M's position? Are we ahead, behind, or on par with this innovation?
-
-7. **Threat Level** (if not 3M patent):
-   - "low": Different technology direction, no overlap
-   - "medium": Adjacent technology, potential future competition
-   - "high": Direct competition, could block 3M products or markets
-
-8. **Recommended Action** (1-2 sentences): What should 3M do in response?
-
----
-
-**Output Format** (JSON only, no additional text):
-
-{{
-  "core_innovation": "...",
-  "problem_solved": "...",
-  "market_potential": {{
-    "score": 7,
-    "reasoning": "..."
-  }},
-  "technology_readiness": "pilot_stage",
-  "applications": [
-    "Hospital lighting systems",
-    "Senior living facilities",
-    "Hotel room automation"
-  ],
-  "competitive_position": "...",
-  "threat_level": "medium",
-  "recommended_action": "..."
-}}
-
-**Important**: Output ONLY valid JSON. No additional commentary.
 """
 
         return prompt
@@ -217,14 +337,29 @@ class InnovationExtractor:
         # Claude Sonnet 4 pricing (as of 2025)
         # Input: $3 per 1M tokens
         # Output: $15 per 1M tokens
-        input_cost = (self.total_input_tokens / 1_000_000) * 3.0
-        output_cost = (self.total_output_tokens / 1_000_000) * 15.0
+        # Message Batches: 50% of the above
+        # Prompt cache: writes 1.25x, reads 0.1x the input price
+        billed_input = (
+            self.total_input_tokens
+            + self.batch_input_tokens * 0.5
+            + self.cache_write_tokens * ANTHROPIC_CACHE_WRITE_MULTIPLIER
+            + self.cache_read_tokens * ANTHROPIC_CACHE_READ_MULTIPLIER
+        )
+        input_cost = billed_input / 1_000_000 * 3.0
+        output_cost = (self.total_output_tokens + self.batch_output_tokens * 0.5) / 1_000_000 * 15.0
         total_cost = input_cost + output_cost
+        input_tokens = (
+            self.total_input_tokens + self.batch_input_tokens + self.cache_write_tokens + self.cache_read_tokens
+        )
+        output_tokens = self.total_output_tokens + self.batch_output_tokens
 
         return {
-            'input_tokens': self.total_input_tokens,
-            'output_tokens': self.total_output_tokens,
-            'total_tokens': self.total_input_tokens + self.total_output_tokens,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'batch_tokens': self.batch_input_tokens + self.batch_output_tokens,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_write_tokens': self.cache_write_tokens,
             'input_cost_usd': round(input_cost, 4),
             'output_cost_usd': round(output_cost, 4),
             'total_cost_usd': round(total_cost, 4)
@@ -234,6 +369,10 @@ class InnovationExtractor:
         """Reset cost counters"""
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.batch_input_tokens = 0
+        self.batch_output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
 
 
 # Example usage
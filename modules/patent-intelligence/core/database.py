@@ -9,6 +9,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from core.rollups import apply_patent, create_rollup_tables
+
 class PatentDatabase:
     """Manage patent data in SQLite with validation"""
 
@@ -119,6 +121,9 @@ class PatentDatabase:
             )
         ''')
 
+        # Materialized monthly rollups for competitive analysis
+        create_rollup_tables(cursor)
+
         self.conn.commit()
         print(f"✅ Database initialized: {self.db_path}")
 
@@ -183,6 +188,15 @@ class PatentDatabase:
             data_complete
         ))
 
+        # Keep competitive rollups in step with the raw table
+        apply_patent(
+            cursor,
+            patent_data['id'],
+            patent_data.get('filing_date'),
+            patent_data.get('assignees', []),
+            patent_data.get('cpc_codes', [])
+        )
+
         self.conn.commit()
         return True
 
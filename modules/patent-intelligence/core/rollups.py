@@ -0,0 +1,293 @@
+"""
+Patent Intelligence - Materialized Rollups
+Monthly patent and CPC-category counts per canonical assignee, maintained
+incrementally on insert so competitive windows are answered in O(months)
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Major lighting competitors tracked by the competitive analyzer
+TRACKED_COMPETITORS = [
+    "Philips", "Signify", "Osram", "Cree", "Acuity Brands",
+    "GE Lighting", "Lumileds", "Samsung Electronics",
+    "LG Electronics", "Nichia", "Seoul Semiconductor"
+]
+
+# CPC main class (first 4 chars) to human-readable category
+CPC_CATEGORIES = {
+    'F21K': 'LED Light Sources',
+    'F21V': 'Lighting Fixtures & Optics',
+    'F21Y': 'Lighting Applications',
+    'H05B': 'LED Drivers & Power Supply',
+    'H01L': 'LED Semiconductor Devices',
+    'G09G': 'Display Control',
+    'H04N': 'Image Capture/Processing',
+    'G01J': 'Light Measurement',
+    'F21S': 'Vehicle Lighting',
+    'A61N': 'Medical Lighting Therapy'
+}
+
+
+def cpc_category(code: str) -> str:
+    """Map a CPC code to its technology category"""
+    main_class = code[:4] if len(code) >= 4 else code
+    return CPC_CATEGORIES.get(main_class, 'Other')
+
+
+def canonical_assignees(assignees: Iterable[str]) -> List[str]:
+    """
+    Resolve raw assignee strings to canonical names
+
+    Tracked competitors match by case-insensitive substring (so
+    "Signify Holding B.V." -> "Signify"); anything else keeps its
+    whitespace-normalized name. Each canonical name appears once.
+    """
+    canonical = []
+    for assignee in assignees:
+        if not assignee:
+            continue
+        assignee_lower = assignee.lower()
+        matches = [c for c in TRACKED_COMPETITORS if c.lower() in assignee_lower]
+        if not matches:
+            matches = [' '.join(assignee.split())]
+        for name in matches:
+            if name not in canonical:
+                canonical.append(name)
+    return canonical
+
+
+def filing_month(filing_date: Optional[str]) -> Optional[str]:
+    """Return the YYYY-MM bucket for an ISO filing date"""
+    if not filing_date or len(filing_date) < 7:
+        return None
+    return filing_date[:7]
+
+
+def _next_month(month: str) -> str:
+    year, mon = int(month[:4]), int(month[5:7])
+    if mon == 12:
+        return f"{year + 1:04d}-01"
+    return f"{year:04d}-{mon + 1:02d}"
+
+
+def create_rollup_tables(cursor):
+    """Create rollup tables and indexes if they don't exist"""
+
+    # Which patents have been folded into the rollups (makes apply idempotent)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_applied (
+            patent_id TEXT PRIMARY KEY
+        )
+    ''')
+
+    # Patent -> canonical assignee membership, for edge-of-window and key-patent lookups
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_patent_assignees (
+            patent_id TEXT NOT NULL,
+            assignee TEXT NOT NULL,
+            filing_date DATE NOT NULL,
+            month TEXT NOT NULL,
+            PRIMARY KEY (patent_id, assignee)
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_rollup_pa_assignee_date
+        ON rollup_patent_assignees(assignee, filing_date)
+    ''')
+
+    # Monthly patent counts per canonical assignee
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_assignee_monthly (
+            assignee TEXT NOT NULL,
+            month TEXT NOT NULL,
+            patent_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (assignee, month)
+        )
+    ''')
+
+    # Monthly CPC code counts per (canonical assignee, CPC category)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS rollup_assignee_cpc_monthly (
+            assignee TEXT NOT NULL,
+            cpc_category TEXT NOT NULL,
+            month TEXT NOT NULL,
+            code_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (assignee, cpc_category, month)
+        )
+    ''')
+
+
+def apply_patent(
+    cursor,
+    patent_id: str,
+    filing_date: Optional[str],
+    assignees: Iterable[str],
+    cpc_codes: Iterable[str]
+) -> bool:
+    """
+    Fold one patent into the rollups
+
+    Returns True if the patent was applied, False if it was already
+    applied or has no filing date.
+    """
+    month = filing_month(filing_date)
+    if month is None:
+        return False
+
+    cursor.execute('INSERT OR IGNORE INTO rollup_applied (patent_id) VALUES (?)', (patent_id,))
+    if cursor.rowcount == 0:
+        return False
+
+    category_counts = Counter(cpc_category(code) for code in cpc_codes)
+
+    for assignee in canonical_assignees(assignees):
+        cursor.execute('''
+            INSERT OR IGNORE INTO rollup_patent_assignees (patent_id, assignee, filing_date, month)
+            VALUES (?, ?, ?, ?)
+        ''', (patent_id, assignee, filing_date, month))
+
+        cursor.execute('''
+            INSERT INTO rollup_assignee_monthly (assignee, month, patent_count)
+            VALUES (?, ?, 1)
+            ON CONFLICT(assignee, month) DO UPDATE SET patent_count = patent_count + 1
+        ''', (assignee, month))
+
+        for category, count in category_counts.items():
+            cursor.execute('''
+                INSERT INTO rollup_assignee_cpc_monthly (assignee, cpc_category, month, code_count)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(assignee, cpc_category, month)
+                DO UPDATE SET code_count = code_count + excluded.code_count
+            ''', (assignee, category, month, count))
+
+    return True
+
+
+def sync_rollups(conn: sqlite3.Connection) -> int:
+    """
+    Backfill rollups for patents inserted outside PatentDatabase.insert_patent
+
+    Cheap when already in sync (two counts); otherwise applies only the
+    missing patents. Returns the number of patents applied.
+    """
+    cursor = conn.cursor()
+    create_rollup_tables(cursor)
+
+    cursor.execute('SELECT COUNT(*) FROM patents WHERE filing_date IS NOT NULL')
+    total = cursor.fetchone()[0]
+    cursor.execute('SELECT COUNT(*) FROM rollup_applied')
+    applied = cursor.fetchone()[0]
+    if applied >= total:
+        return 0
+
+    cursor.execute('''
+        SELECT p.id, p.filing_date, p.assignees, p.cpc_codes
+        FROM patents p
+        LEFT JOIN rollup_applied r ON r.patent_id = p.id
+        WHERE r.patent_id IS NULL AND p.filing_date IS NOT NULL
+    ''')
+    pending = cursor.fetchall()
+
+    count = 0
+    for patent_id, filing_date, assignees, cpc_codes in pending:
+        if apply_patent(
+            cursor,
+            patent_id,
+            filing_date,
+            json.loads(assignees) if assignees else [],
+            json.loads(cpc_codes) if cpc_codes else []
+        ):
+            count += 1
+
+    conn.commit()
+    return count
+
+
+def _full_months(start_iso: str, end_iso: str) -> List[str]:
+    """Months whose every day falls inside [start_iso, end_iso)"""
+    month = start_iso[:7]
+    if f"{month}-01" < start_iso:
+        month = _next_month(month)
+
+    months = []
+    while f"{_next_month(month)}-01" <= end_iso:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def window_activity(
+    cursor,
+    assignees: List[str],
+    start_date: datetime,
+    end_date: datetime
+) -> Dict[str, Dict]:
+    """
+    Patent and CPC-category counts per assignee for [start_date, end_date)
+
+    Whole months inside the window are read from the monthly rollups; the
+    partial months at either edge are counted from the membership index,
+    so results match a raw scan of the patents table exactly.
+
+    Returns:
+        Dict of assignee -> {'patent_count': int, 'cpc_counts': Counter}
+    """
+    start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+    activity = {
+        name: {'patent_count': 0, 'cpc_counts': Counter()}
+        for name in assignees
+    }
+    if not assignees:
+        return activity
+
+    months = _full_months(start_iso, end_iso)
+    name_placeholders = ','.join('?' for _ in assignees)
+    edges: List[Tuple[str, str]] = []
+
+    if months:
+        first_full, after_full = f"{months[0]}-01", f"{_next_month(months[-1])}-01"
+
+        cursor.execute(f"""
+            SELECT assignee, SUM(patent_count)
+            FROM rollup_assignee_monthly
+            WHERE assignee IN ({name_placeholders}) AND month >= ? AND month <= ?
+            GROUP BY assignee
+        """, (*assignees, months[0], months[-1]))
+        for assignee, count in cursor.fetchall():
+            activity[assignee]['patent_count'] += count
+
+        cursor.execute(f"""
+            SELECT assignee, cpc_category, SUM(code_count)
+            FROM rollup_assignee_cpc_monthly
+            WHERE assignee IN ({name_placeholders}) AND month >= ? AND month <= ?
+            GROUP BY assignee, cpc_category
+        """, (*assignees, months[0], months[-1]))
+        for assignee, category, count in cursor.fetchall():
+            activity[assignee]['cpc_counts'][category] += count
+
+        if start_iso < first_full:
+            edges.append((start_iso, first_full))
+        if after_full < end_iso:
+            edges.append((after_full, end_iso))
+    else:
+        edges.append((start_iso, end_iso))
+
+    for edge_start, edge_end in edges:
+        cursor.execute(f"""
+            SELECT pa.assignee, p.cpc_codes
+            FROM rollup_patent_assignees pa
+            JOIN patents p ON p.id = pa.patent_id
+            WHERE pa.assignee IN ({name_placeholders})
+            AND pa.filing_date >= ? AND pa.filing_date < ?
+        """, (*assignees, edge_start, edge_end))
+        for assignee, cpc_codes in cursor.fetchall():
+            activity[assignee]['patent_count'] += 1
+            for code in json.loads(cpc_codes) if cpc_codes else []:
+                activity[assignee]['cpc_counts'][cpc_category(code)] += 1
+
+    return activity
+
@@ -9,15 +9,21 @@ using free tools:
 - Claude API (content generation)
 
 Run this to create: poc_output/proof_of_concept.pptx
+(the chart is cached in poc_output/.deck_cache and only re-rendered when its data changes)
 """
 
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
 import plotly.graph_objects as go
-import os
-import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from core.reporting.deck import Asset, Deck, Slide
 
 # ============================================================================
 # CONFIGURATION
@@ -40,49 +46,43 @@ FONTS = {
 }
 
 # ============================================================================
-# STEP 1: CREATE CHART USING PLOTLY
+# STEP 1: CHART (RENDERED BY PLOTLY, CACHED BY DATA)
 # ============================================================================
 
-def create_comparison_chart():
+# Data from actual garage organizer analysis
+PAIN_POINT_CHART = {
+    'title': 'Consumer Pain Point Breakdown by Platform',
+    'categories': ['Wall Damage', 'Time/Effort', 'Capacity', 'Drilling/Adhesive'],
+    'series': [
+        # Reddit segment (Problem-Solvers)
+        {'name': 'Reddit (Problem-Solvers)', 'label': 'Reddit', 'color': '#16A085', 'values': [30.6, 8.1, 4.2, 6.6]},
+        # YouTube segment (Decision-Makers)
+        {'name': 'YouTube (Decision-Makers)', 'label': 'YouTube', 'color': '#111827', 'values': [9.0, 8.0, 12.6, 7.6]},
+    ],
+}
+
+def render_comparison_chart(data, output_path):
     """
-    Create complex data visualization like Garage Organizer Slide 9
+    Render a grouped bar chart like Garage Organizer Slide 9
     (Reddit vs YouTube consumer segments)
     """
-    print("[1/5] Creating visualization with Plotly...")
-
-    # Data from actual garage organizer analysis
-    categories = ['Wall Damage', 'Time/Effort', 'Capacity', 'Drilling/Adhesive']
-    reddit_values = [30.6, 8.1, 4.2, 6.6]      # Problem-solvers
-    youtube_values = [9.0, 8.0, 12.6, 7.6]     # Decision-makers
-
     fig = go.Figure()
 
-    # Reddit segment (Problem-Solvers)
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=reddit_values,
-        name='Reddit (Problem-Solvers)',
-        marker_color='#16A085',  # Teal
-        text=[f'{v:.1f}%' for v in reddit_values],
-        textposition='outside',
-        hovertemplate='<b>%{x}</b><br>Reddit: %{y:.1f}%<extra></extra>'
-    ))
-
-    # YouTube segment (Decision-Makers)
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=youtube_values,
-        name='YouTube (Decision-Makers)',
-        marker_color='#111827',  # Charcoal
-        text=[f'{v:.1f}%' for v in youtube_values],
-        textposition='outside',
-        hovertemplate='<b>%{x}</b><br>YouTube: %{y:.1f}%<extra></extra>'
-    ))
+    for series in data['series']:
+        fig.add_trace(go.Bar(
+            x=data['categories'],
+            y=series['values'],
+            name=series['name'],
+            marker_color=series['color'],
+            text=[f'{v:.1f}%' for v in series['values']],
+            textposition='outside',
+            hovertemplate=f"<b>%{{x}}</b><br>{series['label']}: %{{y:.1f}}%<extra></extra>"
+        ))
 
     # Professional styling
     fig.update_layout(
         title={
-            'text': 'Consumer Pain Point Breakdown by Platform',
+            'text': data['title'],
             'font': {'size': 24, 'color': '#111827', 'family': 'Inter'},
             'x': 0.5,
             'xanchor': 'center'
@@ -126,36 +126,20 @@ def create_comparison_chart():
     )
 
     # Export at high resolution (2x scale for crisp rendering)
-    os.makedirs('poc_output', exist_ok=True)
-    output_path = 'poc_output/slide_chart.png'
-    fig.write_image(output_path, width=1280, height=720, scale=2)
-
-    print(f"   ✓ Chart created: {output_path}")
-    return output_path
+    fig.write_image(str(output_path), width=1280, height=720, scale=2)
 
 # ============================================================================
-# STEP 2: CREATE PROFESSIONAL PPTX PRESENTATION
+# STEP 2: PROFESSIONAL PPTX SLIDES
 # ============================================================================
 
 def create_presentation():
     """
-    Build a presentation using python-pptx with professional design
+    Describe a presentation with professional design (16:9 widescreen)
     """
-    print("[2/5] Creating presentation template...")
+    return Deck(width=Inches(13.333), height=Inches(7.5))
 
-    # Create presentation (16:9 widescreen)
-    prs = Presentation()
-    prs.slide_width = Inches(13.333)
-    prs.slide_height = Inches(7.5)
-
-    print("   ✓ Presentation created (16:9 format)")
-    return prs
-
-def add_title_slide(prs, title, subtitle=""):
-    """Add professionally designed title slide"""
-    print("[3/5] Adding title slide...")
-
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+def title_slide(slide, title, subtitle=""):
+    """Professionally designed title slide"""
 
     # White background
     background = slide.background
@@ -199,14 +183,8 @@ def add_title_slide(prs, title, subtitle=""):
     line.line.color.rgb = COLORS['teal']
     line.line.width = Pt(4)
 
-    print("   ✓ Title slide created")
-    return slide
-
-def add_data_slide(prs, title, chart_path, description=""):
-    """Add slide with chart and data context"""
-    print("[4/5] Adding data visualization slide...")
-
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+def data_slide(slide, title, chart, description="", footer=""):
+    """Slide with chart and data context"""
 
     # White background
     background = slide.background
@@ -235,12 +213,11 @@ def add_data_slide(prs, title, chart_path, description=""):
     line.line.width = Pt(3)
 
     # Add chart image
-    if os.path.exists(chart_path):
-        slide.shapes.add_picture(
-            chart_path,
-            Inches(0.4), Inches(1.3),
-            width=Inches(12.533), height=Inches(4.5)
-        )
+    slide.shapes.add_picture(
+        str(chart),
+        Inches(0.4), Inches(1.3),
+        width=Inches(12.533), height=Inches(4.5)
+    )
 
     # Add description/context
     if description:
@@ -262,20 +239,14 @@ def add_data_slide(prs, title, chart_path, description=""):
     footer_frame = footer_box.text_frame
     footer_frame.word_wrap = True
     p = footer_frame.paragraphs[0]
-    p.text = "Data: 1,829 consumer records (Reddit: 1,129, YouTube: 700) | Method: Keyword pattern matching | Confidence: MEDIUM-HIGH | Limitations: Platform bias"
+    p.text = footer
     p.font.name = 'Inter'
     p.font.size = Pt(9)
     p.font.italic = True
     p.font.color.rgb = COLORS['gray']
 
-    print("   ✓ Data slide created")
-    return slide
-
-def add_insights_slide(prs, title, insights):
-    """Add slide with key insights in three-column format"""
-    print("[5/5] Adding insights summary slide...")
-
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+def insights_slide(slide, title, insights):
+    """Slide with key insights in three-column format"""
 
     # White background
     background = slide.background
@@ -342,70 +313,61 @@ def add_insights_slide(prs, title, insights):
         p.font.color.rgb = COLORS['gray']
         p.line_spacing = 1.3
 
-    print("   ✓ Insights slide created")
-    return slide
-
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
+def build_slides():
+    """Title, chart and insights slides"""
+    return [
+        Slide(title_slide, {
+            'title': "Installation Reality Check",
+            'subtitle': "What Consumers Actually Care About"
+        }),
+        Slide(data_slide, {
+            'title': "Boulder #2 Evidence: Consumer Pain Point Breakdown",
+            'description': "Platform effect explains apparent differences. Time/prioritization emerges as real adoption barrier.",
+            'footer': "Data: 1,829 consumer records (Reddit: 1,129, YouTube: 700) | Method: Keyword pattern matching | Confidence: MEDIUM-HIGH | Limitations: Platform bias"
+        }, assets={'chart': Asset(render_comparison_chart, PAIN_POINT_CHART)}),
+        Slide(insights_slide, {
+            'title': "Key Implications",
+            'insights': [
+                {
+                    'title': 'Wall Damage Concern',
+                    'description': 'Problem-solvers asking "How to fix?" not "Should I avoid?" Concern exists but doesn\'t prevent adoption.'
+                },
+                {
+                    'title': 'Capacity Validation',
+                    'description': 'Consumers testing before purchase, not avoiding. Needs transparency, not a barrier to adoption.'
+                },
+                {
+                    'title': 'Time Prioritization',
+                    'description': 'Garage is low priority; understated in data. Real barrier is project deprioritization, not installation difficulty.'
+                }
+            ]
+        }),
+    ]
+
 def main():
     """Run the proof of concept"""
     print("\n" + "=" * 80)
     print("PROOF OF CONCEPT: Create Slides Matching GenSpark Quality")
     print("=" * 80 + "\n")
 
-    # Create chart
-    chart_path = create_comparison_chart()
-
-    # Create presentation
-    prs = create_presentation()
-
-    # Add Title Slide
-    add_title_slide(
-        prs,
-        "Installation Reality Check",
-        "What Consumers Actually Care About"
-    )
-
-    # Add Data Slide
-    add_data_slide(
-        prs,
-        "Boulder #2 Evidence: Consumer Pain Point Breakdown",
-        chart_path,
-        "Platform effect explains apparent differences. Time/prioritization emerges as real adoption barrier."
-    )
-
-    # Add Insights Slide
-    add_insights_slide(
-        prs,
-        "Key Implications",
-        [
-            {
-                'title': 'Wall Damage Concern',
-                'description': 'Problem-solvers asking "How to fix?" not "Should I avoid?" Concern exists but doesn\'t prevent adoption.'
-            },
-            {
-                'title': 'Capacity Validation',
-                'description': 'Consumers testing before purchase, not avoiding. Needs transparency, not a barrier to adoption.'
-            },
-            {
-                'title': 'Time Prioritization',
-                'description': 'Garage is low priority; understated in data. Real barrier is project deprioritization, not installation difficulty.'
-            }
-        ]
-    )
+    print("[1/2] Describing slides...")
+    deck = create_presentation().extend(build_slides())
+    print(f"   ✓ {len(deck)} slides (16:9 format)")
 
-    # Save presentation
-    os.makedirs('poc_output', exist_ok=True)
-    output_file = 'poc_output/proof_of_concept.pptx'
-    prs.save(output_file)
+    # Render changed charts (Plotly), then assemble and save
+    print("[2/2] Rendering charts and assembling presentation...")
+    output_file = deck.build('poc_output/proof_of_concept.pptx')
+    print(f"   ✓ Charts rendered: {deck.rendered_assets} (others reused from cache)")
 
     print("\n" + "=" * 80)
     print("✓ PROOF OF CONCEPT COMPLETE")
     print("=" * 80)
     print(f"\nOutput file: {output_file}")
-    print(f"Slides created: {len(prs.slides)}")
+    print(f"Slides created: {len(deck)}")
     print("\nQuality verification:")
     print("  ✓ Design consistency (Charcoal + Teal color scheme)")
     print("  ✓ Typography hierarchy (Inter fonts, proper sizes)")
@@ -4,24 +4,35 @@ Step 2: Download Videos
 
 Downloads TikTok videos using yt-dlp from search results.
 Preserves metadata and organizes into structured folders.
+Downloads run concurrently through a resumable SQLite job queue
+(download_queue.sqlite in the output directory).
 """
 
 import os
 import sys
 import json
-import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+# Repository root, for the shared download manager in core/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from core.data_sources.video_downloads import DownloadJob, DownloadResult, VideoDownloadManager
+
 
 class VideoDownloader:
     """Download videos using yt-dlp"""
 
-    def __init__(self, search_results_path: Path, output_dir: Path):
+    def __init__(self, search_results_path: Path, output_dir: Path, max_workers: int = 6):
         self.search_results_path = search_results_path
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.manager = VideoDownloadManager(
+            self.output_dir / 'download_queue.sqlite',
+            max_workers=max_workers,
+            format='best',
+        )
 
         # Load search results
         with open(search_results_path) as f:
@@ -31,6 +42,18 @@ class VideoDownloader:
 
         print(f"Loaded {len(self.videos)} videos from search results")
 
+    def close(self):
+        """Release the download queue's SQLite connection"""
+        self.manager.close()
+
+    def _video_job(self, video: Dict) -> DownloadJob:
+        video_id = video['id']
+        return DownloadJob(
+            video_id,
+            video.get('webVideoUrl') or video.get('shareUrl'),
+            self.output_dir / 'videos' / video_id / 'video.mp4'
+        )
+
     def download_video(self, video: Dict) -> bool:
         """
         Download single video using yt-dlp
@@ -41,69 +64,20 @@ class VideoDownloader:
         Returns:
             True if successful, False otherwise
         """
-        video_id = video.get('id')
-        if not video_id:
+        if not video.get('id'):
             print("  Error: No video ID")
             return False
-
-        # Create video directory
-        video_dir = self.output_dir / 'videos' / video_id
-        video_dir.mkdir(parents=True, exist_ok=True)
-
-        # Check if already downloaded
-        video_file = video_dir / 'video.mp4'
-        if video_file.exists():
-            print(f"  Already downloaded: {video_id}")
-            return True
-
-        # Get video URL
-        video_url = video.get('webVideoUrl') or video.get('shareUrl')
-        if not video_url:
-            print(f"  Error: No video URL for {video_id}")
+        if not (video.get('webVideoUrl') or video.get('shareUrl')):
+            print(f"  Error: No video URL for {video['id']}")
             return False
 
-        print(f"  Downloading: {video_id}")
-        print(f"    URL: {video_url}")
-
-        # yt-dlp command
-        cmd = [
-            'yt-dlp',
-            '--quiet',
-            '--no-warnings',
-            '--output', str(video_file),
-            '--format', 'best',
-            '--no-playlist',
-            video_url
-        ]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=120,
-                check=True
-            )
-
-            if video_file.exists():
-                size_mb = video_file.stat().st_size / (1024 * 1024)
-                print(f"    ✅ Downloaded: {size_mb:.1f} MB")
-
-                # Save metadata
-                self._save_video_metadata(video, video_dir)
-                return True
-            else:
-                print(f"    ❌ Download failed: File not created")
-                return False
-
-        except subprocess.TimeoutExpired:
-            print(f"    ❌ Timeout downloading video")
-            return False
-        except subprocess.CalledProcessError as e:
-            print(f"    ❌ Error: {e.stderr.decode()[:100] if e.stderr else 'Unknown'}")
-            return False
-        except Exception as e:
-            print(f"    ❌ Error: {str(e)[:100]}")
-            return False
+        def on_complete(result: DownloadResult):
+            self._save_video_metadata(video, result.job.output_path.parent)
+
+        result = self.manager.run([self._video_job(video)], on_complete=on_complete)[0]
+        if not result.ok:
+            print(f"    ❌ Error: {result.reason[:100]}")
+        return result.ok
 
     def _save_video_metadata(self, video: Dict, video_dir: Path):
         """Save video metadata to JSON"""
@@ -143,27 +117,36 @@ class VideoDownloader:
         print("Downloading Videos")
         print("="*60)
 
-        success_count = 0
+        jobs = []
+        videos_by_id = {}
         fail_count = 0
-        skip_count = 0
+        for video in self.videos:
+            video_id = video.get('id')
+            if not video_id:
+                print("  Error: No video ID")
+                fail_count += 1
+                continue
+            if not (video.get('webVideoUrl') or video.get('shareUrl')):
+                print(f"  Error: No video URL for {video_id}")
+                fail_count += 1
+                continue
+            videos_by_id[video_id] = video
+            jobs.append(self._video_job(video))
 
-        for i, video in enumerate(self.videos, 1):
-            print(f"\n[{i}/{len(self.videos)}]")
+        print(f"Queued {len(jobs)} videos ({self.manager.max_workers} concurrent downloads)")
 
-            video_id = video.get('id')
-            video_dir = self.output_dir / 'videos' / video_id
-            video_file = video_dir / 'video.mp4'
+        def on_complete(result: DownloadResult):
+            size_mb = result.size_bytes / (1024 * 1024)
+            print(f"  ✅ Downloaded {result.job.job_id}: {size_mb:.1f} MB")
+            self._save_video_metadata(videos_by_id[result.job.job_id], result.job.output_path.parent)
 
-            # Check if already downloaded
-            if video_file.exists():
-                print(f"  Skipping (already downloaded): {video_id}")
-                skip_count += 1
-                continue
+        results = self.manager.run(jobs, on_complete=on_complete)
 
-            # Download
-            if self.download_video(video):
-                success_count += 1
-            else:
+        success_count = sum(result.status == 'downloaded' for result in results)
+        skip_count = sum(result.status == 'skipped' for result in results)
+        for result in results:
+            if result.status == 'failed':
+                print(f"  ❌ {result.job.job_id}: {result.reason[:100]}")
                 fail_count += 1
 
         # Save summary
@@ -204,6 +187,12 @@ def main():
         type=Path,
         help='Output directory for downloaded videos'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=6,
+        help='Concurrent downloads (per-site caps still apply)'
+    )
 
     args = parser.parse_args()
 
@@ -228,8 +217,11 @@ def main():
         args.output = args.search_results.parent
 
     # Download
-    downloader = VideoDownloader(args.search_results, args.output)
-    summary = downloader.download_all()
+    downloader = VideoDownloader(args.search_results, args.output, max_workers=args.workers)
+    try:
+        summary = downloader.download_all()
+    finally:
+        downloader.close()
 
     if summary['downloaded'] == 0 and summary['skipped'] == 0:
         print("\nWarning: No videos downloaded!")
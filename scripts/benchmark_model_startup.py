@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Model Startup Benchmark
+Measures how long a fresh process takes to import core.models and get a
+ModelRegistry, the fixed cost every CLI invocation and worker pays
+
+Usage:
+    python scripts/benchmark_model_startup.py [--runs 20]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+STAGES = {
+    'python': 'pass',
+    'import core.models': 'import core.models',
+    'get_registry()': 'from core.models import get_registry; get_registry()',
+    'LLMExtractor import': 'import core.pipeline.extraction',
+}
+
+
+def time_process(code: str) -> float:
+    """Wall time in ms for a fresh interpreter running code"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=project_root,
+        check=True,
+        capture_output=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20, help='Processes per stage')
+    args = parser.parse_args()
+
+    print(f"{'stage':<22} {'median ms':>10} {'p90 ms':>8} {'over python':>12}")
+    baseline = None
+    for label, code in STAGES.items():
+        samples = sorted(time_process(code) for _ in range(args.runs))
+        median = statistics.median(samples)
+        p90 = samples[min(len(samples) - 1, int(0.9 * len(samples)))]
+        if baseline is None:
+            baseline = median
+        print(f"{label:<22} {median:>10.1f} {p90:>8.1f} {median - baseline:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
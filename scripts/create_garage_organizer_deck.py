@@ -3,13 +3,18 @@ Create 3M Garage Organization Category Intelligence Deck
 Complete client-ready PowerPoint presentation with content from research reports
 """
 
+import sys
 from pathlib import Path
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.reporting.deck import Deck, Slide
+
 # === COLOR PALETTE (offbrain Design System) ===
 CHARCOAL = RGBColor(45, 55, 72)        # #2D3748 primary
 ACCENT = RGBColor(20, 184, 166)        # #14B8A6 teal
@@ -32,10 +37,7 @@ GAP = Inches(0.31)  # 60px
 
 def create_presentation():
     """Create blank presentation with 16:9 aspect ratio."""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(5.625)
-    return prs
+    return Deck(width=SLIDE_WIDTH, height=SLIDE_HEIGHT)
 
 def add_text_box(slide, left, top, width, height, text, **kwargs):
     """Add formatted text box to slide."""
@@ -155,20 +157,11 @@ def add_data_card(slide, left, top, width, height, value, label, accent_color=AC
         label, font_size=11, color=TEXT_LIGHT, align=PP_ALIGN.CENTER
     )
 
-def create_slide_1_executive_summary(prs):
-    """Slide 1: Executive Summary with dataset stats and key insights."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-
-    add_headline(slide, "3M Garage Organization Market Intelligence: Executive Summary")
+def executive_summary_slide(slide, headline, stats, insights, footer):
+    """Executive Summary: dataset stat cards and numbered key insights."""
+    add_headline(slide, headline)
 
     # Dataset stats (4 cards)
-    stats = [
-        ("9,555", "Products Analyzed"),
-        ("5", "Major Retailers"),
-        ("571+", "Consumer Videos"),
-        ("$518K", "Monthly Revenue\n(Top 20 SKUs)")
-    ]
-
     card_width = Inches(2.0)
     card_height = Inches(0.9)
     start_left = MARGIN
@@ -189,13 +182,6 @@ def create_slide_1_executive_summary(prs):
     insights_top = top + Inches(1.2)
     add_section_header(slide, MARGIN, insights_top, "KEY INSIGHTS")
 
-    insights = [
-        ("Quality Crisis", "90% of best-selling products generate negative quality sentiment despite $518K monthly revenue"),
-        ("Premium Gap", "Less than 3% of market in $40-80 premium segment presents untapped opportunity"),
-        ("Technology Advantage", "VHB™ adhesive addresses #1 consumer pain point: damage-free mounting"),
-        ("Purchase Evolution", "Customers shift from price-focus (34%) to quality-focus (41%) after initial purchase")
-    ]
-
     insight_top = insights_top + Inches(0.3)
     for i, (title, desc) in enumerate(insights):
         y = insight_top + i * Inches(0.5)
@@ -208,36 +194,24 @@ def create_slide_1_executive_summary(prs):
             desc, font_size=10, color=TEXT, line_spacing=1.4
         )
 
-    add_footer(slide, "3M Category Intelligence Analysis | October 2025")
-    return slide
+    add_footer(slide, footer)
 
-def create_slide_2_market_opportunity(prs):
-    """Slide 2: Market Opportunity - Quality Gap Analysis."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    add_headline(slide, "Massive Quality Gap Despite Strong Sales Performance")
+def market_opportunity_slide(slide, headline, pattern, insight, hard_truth, units, revenue,
+                             negative_share, failures, footer):
+    """Market Opportunity: narrative, Hard Truth, KPI cards, sentiment bar and failure modes."""
+    add_headline(slide, headline)
 
     # Left column - Narrative
     left_top = MARGIN + Inches(0.8)
 
     add_section_header(slide, MARGIN, left_top, "THE PATTERN")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH,
-        "Market demonstrates concentrated demand with top 20 SKUs generating 28,770 units/month, yet 90% of best-sellers produce negative quality sentiment."
-    )
+    add_body_text(slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH, pattern)
 
     add_section_header(slide, MARGIN, left_top + Inches(1.0), "THE INSIGHT")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(1.3), LEFT_COL_WIDTH,
-        "Consumers accept poor quality due to lack of premium alternatives, creating opportunity for differentiated positioning."
-    )
+    add_body_text(slide, MARGIN, left_top + Inches(1.3), LEFT_COL_WIDTH, insight)
 
     # Hard Truth Panel
-    add_hard_truth_panel(
-        slide, MARGIN, left_top + Inches(2.2), LEFT_COL_WIDTH,
-        "Current market accepts systemic failure as normal",
-        "Products routinely fail at 30% of rated capacity. Catastrophic mounting failures cause property damage. Premium segment is virtually non-existent."
-    )
+    add_hard_truth_panel(slide, MARGIN, left_top + Inches(2.2), LEFT_COL_WIDTH, *hard_truth)
 
     # Right column - Data visualization
     right_left = MARGIN + LEFT_COL_WIDTH + GAP
@@ -245,13 +219,13 @@ def create_slide_2_market_opportunity(prs):
     # Top 20 Performance Card
     add_data_card(
         slide, right_left, left_top, RIGHT_COL_WIDTH * 0.48, Inches(1.0),
-        "28,770", "Units/Month\n(Top 20 SKUs)"
+        *units
     )
 
     # Revenue Card
     add_data_card(
         slide, right_left + RIGHT_COL_WIDTH * 0.52, left_top, RIGHT_COL_WIDTH * 0.48, Inches(1.0),
-        "$518K", "Monthly Revenue\n(Top 20 SKUs)"
+        *revenue
     )
 
     # Quality Sentiment Bar
@@ -262,7 +236,7 @@ def create_slide_2_market_opportunity(prs):
     )
 
     # Negative bar
-    neg_width = RIGHT_COL_WIDTH * 0.90
+    neg_width = RIGHT_COL_WIDTH * negative_share
     bar_height = Inches(0.35)
     neg_bar = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
@@ -274,11 +248,11 @@ def create_slide_2_market_opportunity(prs):
 
     add_text_box(
         slide, right_left + Inches(0.1), sentiment_top + Inches(0.38), neg_width, Inches(0.2),
-        "90% Negative Sentiment", font_size=12, bold=True, color=WHITE
+        f"{negative_share:.0%} Negative Sentiment", font_size=12, bold=True, color=WHITE
     )
 
     # Positive bar
-    pos_width = RIGHT_COL_WIDTH * 0.10
+    pos_width = RIGHT_COL_WIDTH * (1 - negative_share)
     pos_bar = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
         right_left + neg_width, sentiment_top + Inches(0.3), pos_width, bar_height
@@ -294,12 +268,6 @@ def create_slide_2_market_opportunity(prs):
         "Primary Failure Categories", font_size=11, bold=True, color=CHARCOAL
     )
 
-    failures = [
-        ("Weight Capacity Failures", "67%"),
-        ("Mounting System Failures", "41%"),
-        ("Durability Issues", "38%")
-    ]
-
     for i, (failure, pct) in enumerate(failures):
         y = table_top + Inches(0.3) + i * Inches(0.28)
         add_text_box(
@@ -311,29 +279,19 @@ def create_slide_2_market_opportunity(prs):
             pct, font_size=12, bold=True, color=RGBColor(239, 68, 68), align=PP_ALIGN.RIGHT
         )
 
-    add_footer(slide, "Analysis of 2,847 negative reviews across 5 retail channels")
-    return slide
-
-def create_slide_3_competitive_positioning(prs):
-    """Slide 3: Competitive Positioning Matrix."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_footer(slide, footer)
 
-    add_headline(slide, "Strategic Premium Gap in Competitive Landscape")
+def competitive_positioning_slide(slide, headline, structure, hard_truth, headers, rows, footer):
+    """Competitive Positioning: market structure and segmentation table."""
+    add_headline(slide, headline)
 
     # Left column
     left_top = MARGIN + Inches(0.8)
 
     add_section_header(slide, MARGIN, left_top, "MARKET STRUCTURE")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH,
-        "85% of market concentrated in commodity segment ($5-20), with premium tier ($40-80) representing less than 3% of products but demonstrating higher satisfaction rates."
-    )
+    add_body_text(slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH, structure)
 
-    add_hard_truth_panel(
-        slide, MARGIN, left_top + Inches(1.2), LEFT_COL_WIDTH,
-        "$40-80 premium gap is virtually uncontested",
-        "Current market structure creates race-to-bottom in commodity tier while professional tier ($80+) remains fragmented. White space opportunity for premium performance positioning."
-    )
+    add_hard_truth_panel(slide, MARGIN, left_top + Inches(1.2), LEFT_COL_WIDTH, *hard_truth)
 
     # Right column - Positioning table
     right_left = MARGIN + LEFT_COL_WIDTH + GAP
@@ -344,7 +302,6 @@ def create_slide_3_competitive_positioning(prs):
     )
 
     # Table headers
-    headers = ["Segment", "Price Range", "Share", "Key Players"]
     header_y = left_top + Inches(0.35)
     col_widths = [Inches(1.3), Inches(1.0), Inches(0.8), Inches(1.5)]
 
@@ -357,13 +314,6 @@ def create_slide_3_competitive_positioning(prs):
         x_pos += col_widths[i]
 
     # Table rows
-    rows = [
-        ("Commodity", "$5-20", "85%", "Rubbermaid, Everbilt"),
-        ("Value", "$20-40", "12%", "Gladiator, Husky"),
-        ("Premium Gap", "$40-80", "<3%", "3M OPPORTUNITY"),
-        ("Professional", "$80+", "<1%", "StoreWall, Monkey Bar")
-    ]
-
     row_y = header_y + Inches(0.3)
     for row_data in rows:
         x_pos = right_left
@@ -391,35 +341,20 @@ def create_slide_3_competitive_positioning(prs):
             x_pos += col_widths[i]
         row_y += Inches(0.3)
 
-    add_footer(slide, "Market share analysis from 9,555 products across 5 retailers")
-    return slide
-
-def create_slide_4_technology_advantage(prs):
-    """Slide 4: 3M Technology Advantage."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_footer(slide, footer)
 
-    add_headline(slide, "3M Technology Directly Addresses Top Consumer Pain Points")
+def technology_advantage_slide(slide, headline, sections, hard_truth, metrics, footer):
+    """Technology Advantage: capability sections and score bars."""
+    add_headline(slide, headline)
 
     # Left column
     left_top = MARGIN + Inches(0.8)
 
-    add_section_header(slide, MARGIN, left_top, "VHB™ ADHESIVE TECHNOLOGY")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH,
-        "Addresses #1 consumer pain point: mounting without wall damage. 10x stronger than mechanical fasteners, temperature stable -40°F to 200°F, proven in architectural applications supporting 1000+ lbs."
-    )
-
-    add_section_header(slide, MARGIN, left_top + Inches(1.1), "ADVANCED MATERIALS SCIENCE")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(1.4), LEFT_COL_WIDTH,
-        "Powder coating expertise eliminates rust issues (38% of current complaints). Composite materials for weight optimization. Surface treatments for enhanced durability."
-    )
+    for (header, body), offset in zip(sections, (Inches(0), Inches(1.1))):
+        add_section_header(slide, MARGIN, left_top + offset, header)
+        add_body_text(slide, MARGIN, left_top + offset + Inches(0.3), LEFT_COL_WIDTH, body)
 
-    add_hard_truth_panel(
-        slide, MARGIN, left_top + Inches(2.3), LEFT_COL_WIDTH,
-        "Technology advantage creates sustainable moat",
-        "Competitors lack adhesive expertise and materials science capabilities. 3M's existing retail relationships accelerate distribution. Scale manufacturing maintains quality at volume."
-    )
+    add_hard_truth_panel(slide, MARGIN, left_top + Inches(2.3), LEFT_COL_WIDTH, *hard_truth)
 
     # Right column - Performance bars
     right_left = MARGIN + LEFT_COL_WIDTH + GAP
@@ -430,12 +365,6 @@ def create_slide_4_technology_advantage(prs):
     )
 
     # Performance bars
-    metrics = [
-        ("VHB™ Adhesion Strength", 95, "10x vs. mechanical fasteners"),
-        ("Temperature Stability", 92, "-40°F to 200°F range"),
-        ("Durability/Anti-Rust", 88, "Powder coating expertise")
-    ]
-
     bar_top = left_top + Inches(0.4)
     for i, (label, score, detail) in enumerate(metrics):
         y = bar_top + i * Inches(0.7)
@@ -477,42 +406,14 @@ def create_slide_4_technology_advantage(prs):
             detail, font_size=9, color=TEXT_LIGHT
         )
 
-    add_footer(slide, "Technology assessment based on 3M materials science portfolio")
-    return slide
+    add_footer(slide, footer)
 
-def create_slide_5_product_roadmap(prs):
-    """Slide 5: Product Development Roadmap."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    add_headline(slide, "Three-Phase Product Development Roadmap")
+def product_roadmap_slide(slide, headline, phases, footer):
+    """Product Roadmap: one bordered card per phase."""
+    add_headline(slide, headline)
 
     left_top = MARGIN + Inches(0.8)
 
-    # Phase cards
-    phases = [
-        {
-            "phase": "PHASE 1: HERO PRODUCT",
-            "timeframe": "Months 0-6",
-            "product": "VHB™ Heavy-Duty Hook System",
-            "details": "3 SKUs (25/50/100 lb capacity)\nRetail: $49-89 | Margin: 65%\nHome Depot exclusive launch",
-            "color": ACCENT
-        },
-        {
-            "phase": "PHASE 2: CATEGORY EXPANSION",
-            "timeframe": "Months 7-12",
-            "product": "Modular Systems",
-            "details": "Rail System ($129-249)\nOverhead Storage ($199-299)\nSpecialty Solutions (Bike, Sports, Tools)",
-            "color": CHARCOAL
-        },
-        {
-            "phase": "PHASE 3: ECOSYSTEM",
-            "timeframe": "Year 2",
-            "product": "Smart Features + Services",
-            "details": "Smart weight sensors with app\nSubscription consumables\nProfessional installation\nB2B commercial segment",
-            "color": AMBER
-        }
-    ]
-
     card_height = Inches(1.3)
     for i, phase_data in enumerate(phases):
         y = left_top + i * (card_height + Inches(0.15))
@@ -551,33 +452,20 @@ def create_slide_5_product_roadmap(prs):
             phase_data["details"], font_size=10, color=TEXT, line_spacing=1.5
         )
 
-    add_footer(slide, "Product development timeline from 03_PRODUCT_DEVELOPMENT_ROADMAP.md")
-    return slide
+    add_footer(slide, footer)
 
-def create_slide_6_financial_projections(prs):
-    """Slide 6: Financial Projections."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    add_headline(slide, "Financial Projections Show Strong ROI by Year 2")
+def financial_projections_slide(slide, headline, assumptions, metrics, headers, rows, footer):
+    """Financial Projections: headline metrics and 3-year forecast table."""
+    add_headline(slide, headline)
 
     left_top = MARGIN + Inches(0.8)
 
     # Left column - Key metrics
     add_section_header(slide, MARGIN, left_top, "REVENUE MODEL ASSUMPTIONS")
-    add_body_text(
-        slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH,
-        "Conservative scenario based on 15% capture of quality-seeking segment. Hero product pricing $49-89 with 65% gross margin target at scale."
-    )
-
-    metrics_data = [
-        ("Break-Even Point", "Month 14"),
-        ("Year 3 Cumulative Profit", "$2.94M"),
-        ("Year 3 Revenue", "$3.15M"),
-        ("Year 3 ROI", "1265%")
-    ]
+    add_body_text(slide, MARGIN, left_top + Inches(0.3), LEFT_COL_WIDTH, assumptions)
 
     metrics_top = left_top + Inches(1.0)
-    for i, (label, value) in enumerate(metrics_data):
+    for i, (label, value) in enumerate(metrics):
         y = metrics_top + i * Inches(0.4)
         add_text_box(
             slide, MARGIN, y, LEFT_COL_WIDTH * 0.6, Inches(0.2),
@@ -597,7 +485,6 @@ def create_slide_6_financial_projections(prs):
     )
 
     # Table headers
-    headers = ["Metric", "Year 1", "Year 2", "Year 3"]
     header_y = left_top + Inches(0.35)
     col_width = RIGHT_COL_WIDTH / 4
 
@@ -609,14 +496,6 @@ def create_slide_6_financial_projections(prs):
         )
 
     # Table rows
-    rows = [
-        ("Units", "10,000", "28,000", "45,000"),
-        ("Revenue", "$640K", "$1.96M", "$3.15M"),
-        ("Gross Profit", "$416K", "$1.27M", "$2.05M"),
-        ("Investment", "$900K", "$200K", "$150K"),
-        ("ROI", "-46%", "537%", "1265%")
-    ]
-
     row_y = header_y + Inches(0.35)
     for row_data in rows:
         is_roi = row_data[0] == "ROI"
@@ -631,57 +510,14 @@ def create_slide_6_financial_projections(prs):
             )
         row_y += Inches(0.28)
 
-    add_footer(slide, "Financial model from 01_EXECUTIVE_BRIEFING.md conservative scenario")
-    return slide
+    add_footer(slide, footer)
 
-def create_slide_7_next_steps(prs):
-    """Slide 7: Immediate Action Items."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-    add_headline(slide, "Immediate Action Items: 12-Week Launch Plan")
+def next_steps_slide(slide, headline, actions, footer):
+    """Next Steps: week blocks with action title and task bullets."""
+    add_headline(slide, headline)
 
     left_top = MARGIN + Inches(0.8)
 
-    # Action items with timeline
-    actions = [
-        {
-            "week": "WEEK 1-2",
-            "action": "Technical Validation",
-            "tasks": [
-                "Validate VHB adhesion on top 10 garage surface types",
-                "Test painted drywall, concrete, wood, metal surfaces",
-                "ASTM D3330 compliance testing"
-            ]
-        },
-        {
-            "week": "WEEK 3-4",
-            "action": "Consumer Concept Testing",
-            "tasks": [
-                "3D printed prototype development (50 units)",
-                "30 in-home installations documented",
-                "Installation time and ease assessment"
-            ]
-        },
-        {
-            "week": "WEEK 5-8",
-            "action": "Retailer Partnership",
-            "tasks": [
-                "Home Depot exclusive launch discussions",
-                "50 store test market planning",
-                "End-cap display program development"
-            ]
-        },
-        {
-            "week": "WEEK 9-12",
-            "action": "Pilot Production",
-            "tasks": [
-                "500 unit pilot production run",
-                "Field testing in actual use conditions",
-                "Package design finalization"
-            ]
-        }
-    ]
-
     for i, action_data in enumerate(actions):
         y = left_top + i * Inches(0.9)
 
@@ -713,46 +549,189 @@ def create_slide_7_next_steps(prs):
             tasks_text, font_size=10, color=TEXT, line_spacing=1.4
         )
 
-    add_footer(slide, "Action plan from 01_EXECUTIVE_BRIEFING.md | Timeline assumes immediate approval")
-    return slide
+    add_footer(slide, footer)
+
+# === SLIDE CONTENT ===
+SLIDES = [
+    ("Executive Summary", Slide(executive_summary_slide, {
+        "headline": "3M Garage Organization Market Intelligence: Executive Summary",
+        "stats": [
+            ("9,555", "Products Analyzed"),
+            ("5", "Major Retailers"),
+            ("571+", "Consumer Videos"),
+            ("$518K", "Monthly Revenue\n(Top 20 SKUs)")
+        ],
+        "insights": [
+            ("Quality Crisis", "90% of best-selling products generate negative quality sentiment despite $518K monthly revenue"),
+            ("Premium Gap", "Less than 3% of market in $40-80 premium segment presents untapped opportunity"),
+            ("Technology Advantage", "VHB™ adhesive addresses #1 consumer pain point: damage-free mounting"),
+            ("Purchase Evolution", "Customers shift from price-focus (34%) to quality-focus (41%) after initial purchase")
+        ],
+        "footer": "3M Category Intelligence Analysis | October 2025"
+    })),
+    ("Market Opportunity", Slide(market_opportunity_slide, {
+        "headline": "Massive Quality Gap Despite Strong Sales Performance",
+        "pattern": "Market demonstrates concentrated demand with top 20 SKUs generating 28,770 units/month, yet 90% of best-sellers produce negative quality sentiment.",
+        "insight": "Consumers accept poor quality due to lack of premium alternatives, creating opportunity for differentiated positioning.",
+        "hard_truth": (
+            "Current market accepts systemic failure as normal",
+            "Products routinely fail at 30% of rated capacity. Catastrophic mounting failures cause property damage. Premium segment is virtually non-existent."
+        ),
+        "units": ("28,770", "Units/Month\n(Top 20 SKUs)"),
+        "revenue": ("$518K", "Monthly Revenue\n(Top 20 SKUs)"),
+        "negative_share": 0.90,
+        "failures": [
+            ("Weight Capacity Failures", "67%"),
+            ("Mounting System Failures", "41%"),
+            ("Durability Issues", "38%")
+        ],
+        "footer": "Analysis of 2,847 negative reviews across 5 retail channels"
+    })),
+    ("Competitive Positioning", Slide(competitive_positioning_slide, {
+        "headline": "Strategic Premium Gap in Competitive Landscape",
+        "structure": "85% of market concentrated in commodity segment ($5-20), with premium tier ($40-80) representing less than 3% of products but demonstrating higher satisfaction rates.",
+        "hard_truth": (
+            "$40-80 premium gap is virtually uncontested",
+            "Current market structure creates race-to-bottom in commodity tier while professional tier ($80+) remains fragmented. White space opportunity for premium performance positioning."
+        ),
+        "headers": ["Segment", "Price Range", "Share", "Key Players"],
+        "rows": [
+            ("Commodity", "$5-20", "85%", "Rubbermaid, Everbilt"),
+            ("Value", "$20-40", "12%", "Gladiator, Husky"),
+            ("Premium Gap", "$40-80", "<3%", "3M OPPORTUNITY"),
+            ("Professional", "$80+", "<1%", "StoreWall, Monkey Bar")
+        ],
+        "footer": "Market share analysis from 9,555 products across 5 retailers"
+    })),
+    ("Technology Advantage", Slide(technology_advantage_slide, {
+        "headline": "3M Technology Directly Addresses Top Consumer Pain Points",
+        "sections": [
+            ("VHB™ ADHESIVE TECHNOLOGY",
+             "Addresses #1 consumer pain point: mounting without wall damage. 10x stronger than mechanical fasteners, temperature stable -40°F to 200°F, proven in architectural applications supporting 1000+ lbs."),
+            ("ADVANCED MATERIALS SCIENCE",
+             "Powder coating expertise eliminates rust issues (38% of current complaints). Composite materials for weight optimization. Surface treatments for enhanced durability.")
+        ],
+        "hard_truth": (
+            "Technology advantage creates sustainable moat",
+            "Competitors lack adhesive expertise and materials science capabilities. 3M's existing retail relationships accelerate distribution. Scale manufacturing maintains quality at volume."
+        ),
+        "metrics": [
+            ("VHB™ Adhesion Strength", 95, "10x vs. mechanical fasteners"),
+            ("Temperature Stability", 92, "-40°F to 200°F range"),
+            ("Durability/Anti-Rust", 88, "Powder coating expertise")
+        ],
+        "footer": "Technology assessment based on 3M materials science portfolio"
+    })),
+    ("Product Roadmap", Slide(product_roadmap_slide, {
+        "headline": "Three-Phase Product Development Roadmap",
+        "phases": [
+            {
+                "phase": "PHASE 1: HERO PRODUCT",
+                "timeframe": "Months 0-6",
+                "product": "VHB™ Heavy-Duty Hook System",
+                "details": "3 SKUs (25/50/100 lb capacity)\nRetail: $49-89 | Margin: 65%\nHome Depot exclusive launch",
+                "color": ACCENT
+            },
+            {
+                "phase": "PHASE 2: CATEGORY EXPANSION",
+                "timeframe": "Months 7-12",
+                "product": "Modular Systems",
+                "details": "Rail System ($129-249)\nOverhead Storage ($199-299)\nSpecialty Solutions (Bike, Sports, Tools)",
+                "color": CHARCOAL
+            },
+            {
+                "phase": "PHASE 3: ECOSYSTEM",
+                "timeframe": "Year 2",
+                "product": "Smart Features + Services",
+                "details": "Smart weight sensors with app\nSubscription consumables\nProfessional installation\nB2B commercial segment",
+                "color": AMBER
+            }
+        ],
+        "footer": "Product development timeline from 03_PRODUCT_DEVELOPMENT_ROADMAP.md"
+    })),
+    ("Financial Projections", Slide(financial_projections_slide, {
+        "headline": "Financial Projections Show Strong ROI by Year 2",
+        "assumptions": "Conservative scenario based on 15% capture of quality-seeking segment. Hero product pricing $49-89 with 65% gross margin target at scale.",
+        "metrics": [
+            ("Break-Even Point", "Month 14"),
+            ("Year 3 Cumulative Profit", "$2.94M"),
+            ("Year 3 Revenue", "$3.15M"),
+            ("Year 3 ROI", "1265%")
+        ],
+        "headers": ["Metric", "Year 1", "Year 2", "Year 3"],
+        "rows": [
+            ("Units", "10,000", "28,000", "45,000"),
+            ("Revenue", "$640K", "$1.96M", "$3.15M"),
+            ("Gross Profit", "$416K", "$1.27M", "$2.05M"),
+            ("Investment", "$900K", "$200K", "$150K"),
+            ("ROI", "-46%", "537%", "1265%")
+        ],
+        "footer": "Financial model from 01_EXECUTIVE_BRIEFING.md conservative scenario"
+    })),
+    ("Next Steps", Slide(next_steps_slide, {
+        "headline": "Immediate Action Items: 12-Week Launch Plan",
+        "actions": [
+            {
+                "week": "WEEK 1-2",
+                "action": "Technical Validation",
+                "tasks": [
+                    "Validate VHB adhesion on top 10 garage surface types",
+                    "Test painted drywall, concrete, wood, metal surfaces",
+                    "ASTM D3330 compliance testing"
+                ]
+            },
+            {
+                "week": "WEEK 3-4",
+                "action": "Consumer Concept Testing",
+                "tasks": [
+                    "3D printed prototype development (50 units)",
+                    "30 in-home installations documented",
+                    "Installation time and ease assessment"
+                ]
+            },
+            {
+                "week": "WEEK 5-8",
+                "action": "Retailer Partnership",
+                "tasks": [
+                    "Home Depot exclusive launch discussions",
+                    "50 store test market planning",
+                    "End-cap display program development"
+                ]
+            },
+            {
+                "week": "WEEK 9-12",
+                "action": "Pilot Production",
+                "tasks": [
+                    "500 unit pilot production run",
+                    "Field testing in actual use conditions",
+                    "Package design finalization"
+                ]
+            }
+        ],
+        "footer": "Action plan from 01_EXECUTIVE_BRIEFING.md | Timeline assumes immediate approval"
+    })),
+]
 
 def main():
     """Generate complete garage organizer deck."""
     print("🚀 Creating 3M Garage Organization Category Intelligence Deck")
     print("=" * 60)
 
-    prs = create_presentation()
+    deck = create_presentation()
 
     print("📊 Generating slides...")
-    create_slide_1_executive_summary(prs)
-    print("  ✅ Slide 1: Executive Summary")
-
-    create_slide_2_market_opportunity(prs)
-    print("  ✅ Slide 2: Market Opportunity")
-
-    create_slide_3_competitive_positioning(prs)
-    print("  ✅ Slide 3: Competitive Positioning")
-
-    create_slide_4_technology_advantage(prs)
-    print("  ✅ Slide 4: Technology Advantage")
-
-    create_slide_5_product_roadmap(prs)
-    print("  ✅ Slide 5: Product Roadmap")
-
-    create_slide_6_financial_projections(prs)
-    print("  ✅ Slide 6: Financial Projections")
-
-    create_slide_7_next_steps(prs)
-    print("  ✅ Slide 7: Next Steps")
+    deck.extend(spec for _, spec in SLIDES)
 
     # Save presentation
     output_file = "Garage_Organizers_Category_Intelligence_CLIENT_DECK.pptx"
-    prs.save(output_file)
+    deck.build(output_file)
+    for i, (name, _) in enumerate(SLIDES, 1):
+        print(f"  ✅ Slide {i}: {name}")
 
     print("=" * 60)
     print(f"✅ DECK CREATED SUCCESSFULLY")
     print(f"📁 File: {output_file}")
-    print(f"📊 Slides: {len(prs.slides)}")
+    print(f"📊 Slides: {len(deck)}")
     print(f"🎨 Design: offbrain BOLD (Charcoal/Teal)")
     print(f"📐 Format: 16:9 (1920x1080px)")
     print()
@@ -1,19 +1,38 @@
-"""Pull Reddit posts + top comments from public JSON endpoints."""
+"""Pull Reddit posts + top comments from public JSON endpoints.
+
+Runs are incremental: a state file next to the output keeps, per
+subreddit and sort, the newest post seen (fullname + created_utc), and
+only posts newer than that are fetched (paging back to it, up to a page
+cap) and appended to the JSONL. Comment trees are fetched concurrently
+through one pooled session, all requests sharing a single rate limiter.
+"""
 from __future__ import annotations
 
 import argparse
 import json
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
 LISTING_URL = "https://www.reddit.com/r/{name}/{sort}.json"
 COMMENT_URL = "https://www.reddit.com{permalink}.json"
 DEFAULT_USER_AGENT = "AccentLightingResearchBot/0.1"
+# Reddit's 100 queries/minute Data API limit applies to OAuth clients only;
+# the unauthenticated .json endpoints used here get about 10/minute per IP
+# and answer 429 beyond that. The X-Ratelimit-* response headers tighten
+# this further whenever Reddit reports less headroom.
+DEFAULT_REQUESTS_PER_MINUTE = 10
+DEFAULT_BURST = 2
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_PAGES = 10
+MAX_RETRIES = 3
 
 
 @dataclass
@@ -23,11 +42,16 @@ class SubredditConfig:
     limit: int
     comment_limit: int
 
+    @property
+    def key(self) -> str:
+        return f"{self.name}/{self.sort}"
+
 
 @dataclass
 class Config:
     user_agent: str
     subreddits: List[SubredditConfig]
+    requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE
 
 
 def load_config(path: Path) -> Config:
@@ -45,17 +69,88 @@ def load_config(path: Path) -> Config:
     if not subreddits:
         raise ValueError("No subreddits defined in config")
     user_agent = raw.get("user_agent", DEFAULT_USER_AGENT)
-    return Config(user_agent=user_agent, subreddits=subreddits)
+    requests_per_minute = float(raw.get("requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE))
+    return Config(user_agent=user_agent, subreddits=subreddits, requests_per_minute=requests_per_minute)
+
+
+class RateLimiter:
+    """Token bucket shared by every request thread.
+
+    Refills at ``requests_per_minute`` with up to ``burst`` requests in
+    hand. ``observe`` reads Reddit's X-Ratelimit-Remaining/Reset headers and
+    holds all threads until the window resets when headroom runs out.
+    """
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE, burst: int = DEFAULT_BURST) -> None:
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def observe(self, headers: Dict[str, str]) -> None:
+        try:
+            remaining = float(headers["X-Ratelimit-Remaining"])
+            reset = float(headers["X-Ratelimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if remaining < 1:
+            self.pause(reset)
+
+
+def make_session(user_agent: str, pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+
+class RedditClient:
+    """Rate-limited JSON GETs over a pooled session, retrying 429s and 5xx."""
 
+    def __init__(self, session: requests.Session, limiter: RateLimiter, max_retries: int = MAX_RETRIES) -> None:
+        self.session = session
+        self.limiter = limiter
+        self.max_retries = max_retries
 
-def reddit_get(url: str, headers: Dict[str, str], params: Dict[str, int] | None = None) -> dict:
-    response = requests.get(url, headers=headers, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    def get(self, url: str, params: Dict[str, int | str] | None = None) -> dict:
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            response = self.session.get(url, params=params, timeout=30)
+            self.limiter.observe(response.headers)
+            if attempt < self.max_retries and (response.status_code == 429 or response.status_code >= 500):
+                retry_after = response.headers.get("Retry-After") or response.headers.get("X-Ratelimit-Reset")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 2.0 ** attempt
+                self.limiter.pause(delay)
+                continue
+            response.raise_for_status()
+            return response.json()
+        raise RuntimeError(f"Unreachable retry loop for {url}")
 
 
-def fetch_comments(permalink: str, comment_limit: int, headers: Dict[str, str]) -> List[dict]:
-    payload = reddit_get(COMMENT_URL.format(permalink=permalink.rstrip("/")), headers, params={"limit": comment_limit})
+def fetch_comments(permalink: str, comment_limit: int, client: RedditClient) -> List[dict]:
+    payload = client.get(COMMENT_URL.format(permalink=permalink.rstrip("/")), params={"limit": comment_limit})
     if len(payload) < 2:
         return []
     comments_block = payload[1]
@@ -81,47 +176,194 @@ def fetch_comments(permalink: str, comment_limit: int, headers: Dict[str, str])
     return comments
 
 
-def fetch_subreddit(cfg: SubredditConfig, headers: Dict[str, str]) -> List[dict]:
-    listing = reddit_get(
-        LISTING_URL.format(name=cfg.name, sort=cfg.sort),
-        headers,
-        params={"limit": cfg.limit},
+def _is_new(data: dict, mark: Optional[dict]) -> bool:
+    if not mark:
+        return True
+    if data.get("name") == mark["fullname"] or data.get("name") in mark.get("written", ()):
+        return False
+    return (data.get("created_utc") or 0) > mark["created_utc"]
+
+
+def fetch_new_posts(
+    cfg: SubredditConfig,
+    client: RedditClient,
+    mark: Optional[dict] = None,
+    max_pages: int = DEFAULT_MAX_PAGES,
+) -> List[dict]:
+    """Listing entries newer than the high-water mark, newest first.
+
+    Without a mark only the first page is read. With one, pages are followed
+    (``after``) back to the mark: until the marked post shows up, a page has
+    nothing new, or ``max_pages`` pages have been read.
+    """
+    posts: List[dict] = []
+    after: Optional[str] = None
+    for _ in range(max(1, max_pages)):
+        params: Dict[str, int | str] = {"limit": cfg.limit}
+        if after:
+            params["after"] = after
+        listing = client.get(LISTING_URL.format(name=cfg.name, sort=cfg.sort), params=params)
+        page_new = 0
+        reached_mark = False
+        for post in listing.get("data", {}).get("children", []):
+            if post.get("kind") != "t3":
+                continue
+            data = post.get("data", {})
+            if mark and data.get("name") == mark["fullname"]:
+                reached_mark = True
+            if _is_new(data, mark):
+                posts.append(data)
+                page_new += 1
+        after = listing.get("data", {}).get("after")
+        if not mark or reached_mark or not page_new or not after:
+            return posts
+    print(f"r/{cfg.name}/{cfg.sort}: stopped after {max_pages} pages before reaching the saved mark")
+    return posts
+
+
+def build_record(cfg: SubredditConfig, data: dict, client: RedditClient) -> dict:
+    record = {
+        "platform": "reddit",
+        "subreddit": cfg.name,
+        "sort": cfg.sort,
+        "post_id": data.get("id"),
+        "title": data.get("title"),
+        "author": data.get("author"),
+        "score": data.get("score"),
+        "num_comments": data.get("num_comments"),
+        "created_utc": data.get("created_utc"),
+        "url": data.get("url"),
+        "permalink": f"https://www.reddit.com{data.get('permalink', '')}",
+        "selftext": data.get("selftext"),
+        "comments": [],
+    }
+    try:
+        record["comments"] = fetch_comments(data.get("permalink", ""), cfg.comment_limit, client)
+    except (requests.RequestException, ValueError) as exc:
+        record["comments_error"] = str(exc)[:200]
+    return record
+
+
+def newest_mark(posts: List[dict], mark: Optional[dict]) -> Optional[dict]:
+    for data in posts:
+        created = data.get("created_utc") or 0
+        if mark is None or created > mark["created_utc"]:
+            mark = {"fullname": data.get("name"), "created_utc": created}
+    return mark
+
+
+def advance_mark(posts: List[dict], failed: set, mark: Optional[dict]) -> Optional[dict]:
+    """Mark after writing ``posts``, kept below any post whose comments failed.
+
+    Posts in ``failed`` (fullnames written with ``comments_error``) must be
+    refetched next run, so the mark stops short of the oldest one. Posts
+    already written above the mark are kept under ``written`` (fullname ->
+    created_utc) and skipped on the refetch instead of being appended twice.
+    """
+    written = dict(mark.get("written", {})) if mark else {}
+    written.update(
+        (data.get("name"), data.get("created_utc") or 0) for data in posts if data.get("name") not in failed
     )
-    posts = listing.get("data", {}).get("children", [])
-    records: List[dict] = []
-    for post in posts:
-        if post.get("kind") != "t3":
-            continue
-        data = post.get("data", {})
-        comments = fetch_comments(data.get("permalink", ""), cfg.comment_limit, headers)
-        records.append(
-            {
-                "platform": "reddit",
-                "subreddit": cfg.name,
-                "sort": cfg.sort,
-                "post_id": data.get("id"),
-                "title": data.get("title"),
-                "author": data.get("author"),
-                "score": data.get("score"),
-                "num_comments": data.get("num_comments"),
-                "created_utc": data.get("created_utc"),
-                "url": data.get("url"),
-                "permalink": f"https://www.reddit.com{data.get('permalink', '')}",
-                "selftext": data.get("selftext"),
-                "comments": comments,
-            }
-        )
-        time.sleep(1)
-    return records
+    cutoff = min((data.get("created_utc") or 0 for data in posts if data.get("name") in failed), default=None)
+
+    base = {"fullname": mark["fullname"], "created_utc": mark["created_utc"]} if mark else None
+    below = [
+        {"name": name, "created_utc": created}
+        for name, created in written.items()
+        if cutoff is None or created < cutoff
+    ]
+    base = newest_mark(below, base)
+    if cutoff is None:
+        return base
+    if base is None:
+        base = {"fullname": None, "created_utc": cutoff - 1}
+    base["written"] = {name: created for name, created in written.items() if created > base["created_utc"]}
+    return base
 
 
-def write_records(path: Path, records: List[dict]) -> None:
+def load_state(path: Path) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_state(path: Path, state: Dict[str, dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        for record in records:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    tmp.replace(path)
+
+
+def state_path_for(output: Path) -> Path:
+    return output.with_name(output.name + ".state.json")
+
+
+def harvest(
+    config: Config,
+    output: Path,
+    client: RedditClient,
+    state_path: Path,
+    workers: int = DEFAULT_WORKERS,
+    full: bool = False,
+    max_pages: int = DEFAULT_MAX_PAGES,
+) -> int:
+    """Fetch new posts for every subreddit and append them to ``output``.
+
+    Records are appended as their comment trees arrive. A subreddit's mark
+    only advances once all of its new posts are written, so an interrupted
+    run refetches that subreddit rather than skipping posts, and never past
+    a post written with ``comments_error`` so that post is retried. ``full``
+    ignores the marks and rewrites the output from scratch.
+    """
+    state = {} if full else load_state(state_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, output.open("w" if full else "a", encoding="utf-8") as handle:
+        listings = {
+            pool.submit(fetch_new_posts, cfg, client, state.get(cfg.key), max_pages): cfg for cfg in config.subreddits
+        }
+        record_futures: Dict[Future, Tuple[SubredditConfig, dict]] = {}
+        remaining: Dict[str, int] = {}
+        new_posts: Dict[str, List[dict]] = {}
+        failed: Dict[str, set] = {}
+
+        def advance(cfg: SubredditConfig) -> None:
+            mark = advance_mark(new_posts[cfg.key], failed[cfg.key], state.get(cfg.key))
+            if mark is not None:
+                state[cfg.key] = mark
+                save_state(state_path, state)
+
+        for future in as_completed(list(listings)):
+            cfg = listings[future]
+            try:
+                posts = future.result()
+            except (requests.RequestException, ValueError) as exc:
+                print(f"r/{cfg.name}: listing failed ({exc})")
+                continue
+            print(f"r/{cfg.name}/{cfg.sort}: {len(posts)} new posts")
+            new_posts[cfg.key] = posts
+            failed[cfg.key] = set()
+            remaining[cfg.key] = len(posts)
+            if not posts:
+                advance(cfg)
+            for data in posts:
+                record_futures[pool.submit(build_record, cfg, data, client)] = (cfg, data)
+
+        for future in as_completed(list(record_futures)):
+            cfg, data = record_futures[future]
+            record = future.result()
+            if "comments_error" in record:
+                failed[cfg.key].add(data.get("name"))
             json.dump(record, handle)
             handle.write("\n")
+            handle.flush()
+            written += 1
+            remaining[cfg.key] -= 1
+            if remaining[cfg.key] == 0:
+                advance(cfg)
 
+    return written
 
 
 def main() -> None:
@@ -138,21 +380,38 @@ def main() -> None:
         default=Path("/Volumes/DATA/Consulting/251106-3M-accent-lighting/raw/social/reddit/reddit_sample.jsonl"),
         help="Where to store the JSONL output",
     )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        help="High-water mark file (default: <output>.state.json)",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent requests")
+    parser.add_argument("--full", action="store_true", help="Ignore saved marks and rewrite the output")
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help="Listing pages to follow back to a subreddit's saved mark",
+    )
     args = parser.parse_args()
 
     config = load_config(args.config)
-    headers = {"User-Agent": config.user_agent}
-
-    all_records: List[dict] = []
-    for subreddit in config.subreddits:
-        all_records.extend(fetch_subreddit(subreddit, headers))
-        time.sleep(2)
+    client = RedditClient(make_session(config.user_agent, args.workers), RateLimiter(config.requests_per_minute))
+    state_path = args.state or state_path_for(args.output)
 
-    if not all_records:
+    written = harvest(
+        config,
+        args.output,
+        client,
+        state_path,
+        workers=args.workers,
+        full=args.full,
+        max_pages=args.max_pages,
+    )
+    if args.full and not written:
         raise SystemExit("No Reddit data collected")
 
-    write_records(args.output, all_records)
-    print(f"Wrote {len(all_records)} Reddit posts to {args.output}")
+    print(f"Appended {written} new Reddit posts to {args.output}")
 
 
 if __name__ == "__main__":
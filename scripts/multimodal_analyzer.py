@@ -31,9 +31,36 @@ with open(project_root / 'config' / 'model_paths.yaml') as f:
 os.environ['OLLAMA_MODELS'] = config['models']['ollama']['base_path']
 os.environ['XDG_CACHE_HOME'] = config['models']['whisper']['cache_dir']
 
+from core.text import KeywordMatcher
+
 # Analysis configuration
 FRAME_EXTRACTION_INTERVAL = 30  # Extract keyframe every 30 seconds
 
+# JTBD keyword signals, matched case-insensitively as whole words: short
+# keywords like 'dim', 'add' and 'LED' would otherwise hit 'dimension',
+# 'address' and 'ledge'. Plurals and verb forms ('installed', 'fixing',
+# 'replaced') are listed explicitly, since whole-word matching does not
+# catch them the way the old substring check did.
+JTBD_MATCHER = KeywordMatcher({
+    'pain_point': [
+        'problem', 'problems', 'issue', 'issues',
+        'struggle', 'struggles', 'struggled', 'struggling',
+        'difficult', 'difficulty', 'hard', 'harder',
+        'dark', 'darker', 'darkness', 'dim', 'glare', 'shadow', 'shadows', 'uneven',
+        'expensive', 'complicated', 'frustrating'
+    ],
+    'solution': [
+        'solution', 'solutions',
+        'fix', 'fixes', 'fixed', 'fixing',
+        'install', 'installs', 'installed', 'installing', 'installation',
+        'add', 'adds', 'added', 'adding',
+        'replace', 'replaces', 'replaced', 'replacing', 'replacement',
+        'LED', 'LEDs', 'strip light', 'strip lights', 'dimmer', 'dimmers',
+        'smart light', 'smart lights', 'diffuser', 'diffusers', 'reflector', 'reflectors',
+        'fixture', 'fixtures'
+    ],
+}, boundary="word")
+
 class MultiModalAnalyzer:
     """Multi-modal video analysis using ML stack"""
 
@@ -260,28 +287,13 @@ Provide a concise analysis focusing on pain points and solutions."""
 
         # Extract from transcription
         if 'full_text' in transcription:
-            text = transcription['full_text'].lower()
-
-            # Common pain point keywords
-            pain_keywords = [
-                'problem', 'issue', 'struggle', 'difficult', 'hard',
-                'dark', 'dim', 'glare', 'shadow', 'uneven',
-                'expensive', 'complicated', 'frustrating'
-            ]
-
-            # Common solution keywords
-            solution_keywords = [
-                'solution', 'fix', 'install', 'add', 'replace',
-                'LED', 'strip light', 'dimmer', 'smart light',
-                'diffuser', 'reflector', 'fixture'
-            ]
-
             # Simple keyword extraction (would be enhanced with NLP)
-            for segment in transcription.get('segments', []):
-                seg_text = segment['text'].lower()
+            segments = transcription.get('segments', [])
+            segment_labels = JTBD_MATCHER.labels_many(segment['text'] for segment in segments)
 
+            for segment, labels in zip(segments, segment_labels):
                 # Check for pain points
-                if any(keyword in seg_text for keyword in pain_keywords):
+                if 'pain_point' in labels:
                     insights['pain_points'].append({
                         'timestamp': segment['start'],
                         'text': segment['text'],
@@ -289,7 +301,7 @@ Provide a concise analysis focusing on pain points and solutions."""
                     })
 
                 # Check for solutions
-                if any(keyword in seg_text for keyword in solution_keywords):
+                if 'solution' in labels:
                     insights['solutions'].append({
                         'timestamp': segment['start'],
                         'text': segment['text'],
@@ -5,16 +5,19 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Iterable
 
 import pandas as pd
 import yaml
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Font
-from openpyxl.worksheet.datavalidation import DataValidation
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.reporting import Column, StreamingWorkbook
+from core.reporting.excel_writer import list_formula, lists_rows
+from core.text import KeywordMatcher
 DEFAULT_POSTS = ROOT / 'outputs' / 'manual_sample_posts.json'
 DEFAULT_SNIPPETS = ROOT / 'outputs' / 'manual_snippet_annotations.yaml'
 DEFAULT_OUTPUT = ROOT / 'outputs' / 'ig_preference_manual_coding.xlsx'
@@ -66,6 +69,28 @@ HYPOTHESIS_DRIVER_KEYWORDS = {
     'Workflow_UX': ['workflow', 'process', 'template', 'tool', 'experience', 'interface'],
 }
 
+HYPOTHESIS_DRIVER_MATCHER = KeywordMatcher(HYPOTHESIS_DRIVER_KEYWORDS)
+
+# Equity measures and creator cues keep their substring semantics
+# (``keyword in text``); one pass per snippet covers every list.
+SIGNAL_COLUMNS = {
+    'connection_signal': 'connection',
+    'discovery_signal': 'discovery',
+    'expression_signal': 'expression',
+    'entertainment_signal': 'entertainment',
+    'creativity_signal': 'creativity',
+    'content_quality_signal': 'content_quality',
+}
+SIGNAL_MATCHER = KeywordMatcher(
+    {**MEASURE_KEYWORDS, 'content_quality': CONTENT_QUALITY_KEYWORDS, 'creator': CREATOR_KEYWORDS},
+    boundary='none',
+)
+SENTIMENT_PRIORITY = ['Negative', 'Mixed', 'Neutral', 'Positive']
+CREATOR_RANK = {'Unknown': 0, 'Possible': 1, 'Confirmed': 2}
+
+# Runs of str.isalnum() characters (\w without the underscore)
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
 FOLLOWER_PATTERN = re.compile(
     r"(?P<num>\d{1,3}(?:[,.]\d{3})*|\d+(?:\.\d+)?)\s*(?P<suffix>[kKmM])?\s*(?:\+)?\s*(followers?|subs(?:cribers)?|fans|audience)"
 )
@@ -119,8 +144,7 @@ def select_example_posts(posts: Iterable[dict], limit: int = 10) -> list[str]:
 
 
 def tokenize(text: str) -> set[str]:
-    cleaned = ''.join(ch.lower() if ch.isalnum() else ' ' for ch in text)
-    return {tok for tok in cleaned.split() if tok}
+    return {tok.lower() for tok in TOKEN_PATTERN.findall(text)}
 
 
 def re_split_sentences(text: str) -> list[str]:
@@ -137,26 +161,39 @@ def re_split_sentences(text: str) -> list[str]:
     return sentences
 
 
-def best_verbatim_excerpt(post_text: str, interpretation: str, max_length: int = 360) -> str:
+def split_post(post_text: str) -> list[tuple[str, set[str]]]:
+    """Sentences of a post with their token sets, computed once per post."""
     sentences = [seg.strip() for seg in re_split_sentences(post_text) if seg.strip()]
+    return [(sentence, tokenize(sentence)) for sentence in sentences]
+
+
+def best_verbatim_excerpt(
+    post_text: str,
+    interpretation: str,
+    max_length: int = 360,
+    sentences: list[tuple[str, set[str]]] | None = None,
+) -> str:
+    """Post sentence sharing the most tokens with the interpretation.
+
+    Pass ``sentences`` (from ``split_post``) to reuse a post's split across
+    all of its snippets.
+    """
+    if sentences is None:
+        sentences = split_post(post_text)
     if not sentences:
         return post_text[:max_length]
     target = tokenize(interpretation)
-    best_sentence = sentences[0]
+    best_sentence = sentences[0][0]
     best_score = 0
-    for sentence in sentences:
-        overlap = tokenize(sentence) & target
-        score = len(overlap)
+    for sentence, tokens in sentences:
+        score = len(tokens & target)
         if score > best_score:
             best_sentence = sentence
             best_score = score
-    excerpt = best_sentence if best_score > 0 else sentences[0]
-    return excerpt[:max_length]
+    return best_sentence[:max_length]
 
 
-def score_measure(text: str, keywords: list[str]) -> str:
-    lowered = text.lower()
-    matches = sum(1 for keyword in keywords if keyword in lowered)
+def _measure_level(matches: int) -> str:
     if matches >= 2:
         return 'Strong'
     if matches == 1:
@@ -164,6 +201,11 @@ def score_measure(text: str, keywords: list[str]) -> str:
     return 'None'
 
 
+def score_measure(text: str, keywords: list[str]) -> str:
+    lowered = text.lower()
+    return _measure_level(sum(1 for keyword in keywords if keyword in lowered))
+
+
 def detect_established_creator(text: str) -> str:
     for match in FOLLOWER_PATTERN.finditer(text):
         number = match.group('num').replace(',', '')
@@ -185,50 +227,49 @@ def detect_established_creator(text: str) -> str:
 
 
 def detect_hypothesis_drivers(text: str) -> set[str]:
-    lowered = text.lower()
-    tags: set[str] = set()
-    for driver, keywords in HYPOTHESIS_DRIVER_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            tags.add(driver)
-    return tags
+    return set(HYPOTHESIS_DRIVER_MATCHER.labels(text))
+
+
+def confirmed_creators(texts: pd.Series) -> pd.Series:
+    """Vectorized follower-count check: True where any count is >= 10k."""
+    found = texts.str.extractall(FOLLOWER_PATTERN)
+    if found.empty:
+        return pd.Series(False, index=texts.index)
+    values = pd.to_numeric(found['num'].str.replace(',', '', regex=False), errors='coerce')
+    multiplier = found['suffix'].str.lower().map({'k': 1_000, 'm': 1_000_000}).fillna(1)
+    confirmed = (values * multiplier >= 10_000).groupby(level=0).any()
+    return confirmed.reindex(texts.index, fill_value=False)
 
 
 def add_verbatims_and_signals(snippets_df: pd.DataFrame, posts: list[dict]) -> pd.DataFrame:
-    post_map = {item['post_id']: item for item in posts}
-    verbatims = []
-    connection = []
-    discovery = []
-    expression = []
-    entertainment = []
-    creativity = []
-    content_quality = []
-    established = []
-    hypothesis_tags = []
-    for row in snippets_df.itertuples():
-        post = post_map[row.post_id]
-        excerpt = best_verbatim_excerpt(post['text'], row.agent_interpretation)
-        combined_text = f"{row.agent_interpretation} {excerpt} {row.agent_rationale}"
-        verbatims.append(excerpt)
-        connection.append(score_measure(combined_text, MEASURE_KEYWORDS['connection']))
-        discovery.append(score_measure(combined_text, MEASURE_KEYWORDS['discovery']))
-        expression.append(score_measure(combined_text, MEASURE_KEYWORDS['expression']))
-        entertainment.append(score_measure(combined_text, MEASURE_KEYWORDS['entertainment']))
-        creativity.append(score_measure(combined_text, MEASURE_KEYWORDS['creativity']))
-        content_quality.append(score_measure(combined_text, CONTENT_QUALITY_KEYWORDS))
-        established.append(detect_established_creator(combined_text))
-        tags = detect_hypothesis_drivers(combined_text)
-        hypothesis_tags.append('; '.join(sorted(tags)) if tags else 'None')
+    post_text = {item['post_id']: item['text'] for item in posts}
+    # Split and tokenize each post once, however many snippets it has
+    sentence_cache = {post_id: split_post(text) for post_id, text in post_text.items()}
+    verbatims = [
+        best_verbatim_excerpt(post_text[post_id], interpretation, sentences=sentence_cache[post_id])
+        for post_id, interpretation in zip(snippets_df['post_id'], snippets_df['agent_interpretation'])
+    ]
 
     updated = snippets_df.copy()
     updated.insert(2, 'verbatim_excerpt', verbatims)
-    updated['connection_signal'] = connection
-    updated['discovery_signal'] = discovery
-    updated['expression_signal'] = expression
-    updated['entertainment_signal'] = entertainment
-    updated['creativity_signal'] = creativity
-    updated['content_quality_signal'] = content_quality
-    updated['established_creator_flag'] = established
-    updated['hypothesis_driver_tags'] = hypothesis_tags
+    combined = (
+        updated['agent_interpretation'] + ' ' + updated['verbatim_excerpt'] + ' '
+        + updated['agent_rationale'].fillna('').astype(str)
+    )
+
+    matched = SIGNAL_MATCHER.keywords_many(combined)
+    for column, label in SIGNAL_COLUMNS.items():
+        updated[column] = [_measure_level(len(hits.get(label, ()))) for hits in matched]
+
+    has_creator_keyword = pd.Series([bool(hits.get('creator')) for hits in matched], index=updated.index)
+    updated['established_creator_flag'] = 'Unknown'
+    updated.loc[has_creator_keyword, 'established_creator_flag'] = 'Possible'
+    updated.loc[confirmed_creators(combined), 'established_creator_flag'] = 'Confirmed'
+
+    updated['hypothesis_driver_tags'] = [
+        '; '.join(sorted(tags)) if tags else 'None'
+        for tags in HYPOTHESIS_DRIVER_MATCHER.labels_many(combined)
+    ]
     updated = add_post_level_labels(updated)
     cols = [
         'post_id', 'snippet_id', 'verbatim_excerpt', 'agent_interpretation', 'agent_rationale',
@@ -241,32 +282,26 @@ def add_verbatims_and_signals(snippets_df: pd.DataFrame, posts: list[dict]) -> p
     return updated[cols]
 
 
+def _top_per_post(snippets_df: pd.DataFrame, column: str, tie_rank: dict[str, int] | None = None) -> pd.Series:
+    """Most frequent value of ``column`` per post.
+
+    Ties go to the lowest ``tie_rank`` (unranked values last), then to the
+    value seen first in the post.
+    """
+    counts = snippets_df.groupby(['post_id', column], sort=False).size().rename('count').reset_index()
+    counts['rank'] = counts[column].map(tie_rank or {}).fillna(len(tie_rank or {}))
+    counts = counts.sort_values(['post_id', 'count', 'rank'], ascending=[True, False, True], kind='stable')
+    return counts.drop_duplicates('post_id').set_index('post_id')[column]
+
+
 def add_post_level_labels(snippets_df: pd.DataFrame) -> pd.DataFrame:
-    driver_map: dict[str, str] = {}
-    sentiment_map: dict[str, str] = {}
-    creator_map: dict[str, str] = {}
-    sentiment_priority = ['Negative', 'Mixed', 'Neutral', 'Positive']
-    sentiment_rank = {value: idx for idx, value in enumerate(sentiment_priority)}
-    creator_rank = {'Unknown': 0, 'Possible': 1, 'Confirmed': 2}
-
-    for post_id, group in snippets_df.groupby('post_id'):
-        driver_counts = group['driver_topic'].value_counts()
-        driver_map[post_id] = driver_counts.idxmax()
-
-        sentiment_counts = group['sentiment'].value_counts()
-        max_count = sentiment_counts.max()
-        candidates = [s for s, count in sentiment_counts.items() if count == max_count]
-        ordered = sorted(candidates, key=lambda x: sentiment_rank.get(x, len(sentiment_priority)))
-        sentiment_map[post_id] = ordered[0]
-
-        best_flag = 'Unknown'
-        best_score = -1
-        for flag in group['established_creator_flag']:
-            score = creator_rank.get(flag, -1)
-            if score > best_score:
-                best_flag = flag
-                best_score = score
-        creator_map[post_id] = best_flag
+    sentiment_rank = {value: idx for idx, value in enumerate(SENTIMENT_PRIORITY)}
+    creator_flags = {rank: flag for flag, rank in CREATOR_RANK.items()}
+
+    driver_map = _top_per_post(snippets_df, 'driver_topic')
+    sentiment_map = _top_per_post(snippets_df, 'sentiment', sentiment_rank)
+    creator_rank = snippets_df['established_creator_flag'].map(CREATOR_RANK).fillna(-1)
+    creator_map = creator_rank.groupby(snippets_df['post_id']).max().map(creator_flags).fillna('Unknown')
 
     snippets_df = snippets_df.copy()
     snippets_df['post_overall_driver'] = snippets_df['post_id'].map(driver_map)
@@ -276,31 +311,19 @@ def add_post_level_labels(snippets_df: pd.DataFrame) -> pd.DataFrame:
 
 
 def build_examples(snippets_df: pd.DataFrame, posts: list[dict]) -> pd.DataFrame:
-    post_map = {p['post_id']: p for p in posts}
+    post_info = pd.DataFrame(
+        {'post_id': p['post_id'], 'platform': p['platform'], 'source_url': p['url'], 'raw_verbatim': p['text']}
+        for p in posts
+    ).drop_duplicates('post_id')
     keep = select_example_posts(posts)
-    rows = []
-    for row in snippets_df.itertuples():
-        if row.post_id not in keep:
-            continue
-        post = post_map[row.post_id]
-        rows.append(
-            {
-                'post_id': row.post_id,
-                'platform': post['platform'],
-                'source_url': post['url'],
-                'raw_verbatim': post['text'],
-                'snippet_id': row.snippet_id,
-                'verbatim_excerpt': row.verbatim_excerpt,
-                'agent_interpretation': row.agent_interpretation,
-                'driver_topic': row.driver_topic,
-                'sentiment': row.sentiment,
-                'app_signal': row.app_signal,
-                'post_overall_driver': row.post_overall_driver,
-                'post_overall_sentiment': row.post_overall_sentiment,
-                'post_established_flag': row.post_established_flag,
-            }
-        )
-    return pd.DataFrame(rows)
+    examples = snippets_df[snippets_df['post_id'].isin(keep)].merge(post_info, on='post_id', how='left')
+    return examples[
+        [
+            'post_id', 'platform', 'source_url', 'raw_verbatim', 'snippet_id', 'verbatim_excerpt',
+            'agent_interpretation', 'driver_topic', 'sentiment', 'app_signal',
+            'post_overall_driver', 'post_overall_sentiment', 'post_established_flag',
+        ]
+    ].reset_index(drop=True)
 
 
 def write_workbook(
@@ -321,17 +344,6 @@ def write_workbook(
         ]
     )
 
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        readme_df.to_excel(writer, sheet_name='README', index=False)
-        posts_df.to_excel(writer, sheet_name='Posts_Audit', index=False)
-        snippets_df.to_excel(writer, sheet_name='Snippets_50', index=False)
-        examples_df.to_excel(writer, sheet_name='Examples10', index=False)
-
-    wb = load_workbook(output_path)
-    lists_ws = wb.create_sheet('Lists')
-    lists_ws.sheet_state = 'hidden'
-
-    sentiment_priority = ['Negative', 'Mixed', 'Neutral', 'Positive']
     reference_lists = [
         ('driver_topic', sorted(snippets_df['driver_topic'].unique())),
         ('sentiment', sorted(snippets_df['sentiment'].unique())),
@@ -345,63 +357,48 @@ def write_workbook(
         ('creativity_signal', ['None', 'Possible', 'Strong']),
         ('content_quality_signal', ['None', 'Possible', 'Strong']),
         ('post_overall_driver', sorted(snippets_df['driver_topic'].unique())),
-        ('post_overall_sentiment', sentiment_priority),
+        ('post_overall_sentiment', SENTIMENT_PRIORITY),
         ('post_established_flag', ['Unknown', 'Possible', 'Confirmed']),
         ('review_action', ['Pending', 'Approved', 'Recode']),
     ]
 
-    column_lookup: dict[str, int] = {}
-    for col_idx, (name, values) in enumerate(reference_lists, start=1):
-        lists_ws.cell(row=1, column=col_idx, value=name)
-        for row_idx, value in enumerate(values, start=2):
-            lists_ws.cell(row=row_idx, column=col_idx, value=value)
-        column_lookup[name] = col_idx
-
-    snippets_ws = wb['Snippets_50']
-    posts_ws = wb['Posts_Audit']
-    examples_ws = wb['Examples10']
-    readme_ws = wb['README']
+    col_widths = {
+        'Snippets_50': [12, 14, 55, 60, 48, 22, 16, 20, 18, 18, 16, 16, 16, 16, 16, 16, 22, 22, 18, 16, 16, 45],
+        'Posts_Audit': [12, 14, 55, 80],
+        'Examples10': [12, 14, 50, 80, 16, 60, 20, 16, 20, 20, 18, 18, 18],
+        'README': [22, 90],
+    }
 
-    for ws in (snippets_ws, posts_ws, examples_ws, readme_ws):
-        ws.freeze_panes = 'A2'
+    def columns(sheet_name: str, frame: pd.DataFrame) -> list[Column]:
+        widths = col_widths[sheet_name]
+        return [
+            Column(str(name), widths[idx] if idx < len(widths) else None)
+            for idx, name in enumerate(frame.columns)
+        ]
 
-    col_widths = {
-        'Snippets_50': {
-            'A': 12, 'B': 14, 'C': 55, 'D': 60, 'E': 48,
-            'F': 22, 'G': 16, 'H': 20, 'I': 18, 'J': 18,
-            'K': 16, 'L': 16, 'M': 16, 'N': 16, 'O': 16,
-            'P': 16, 'Q': 22, 'R': 22, 'S': 18, 'T': 16,
-            'U': 16, 'V': 45,
-        },
-        'Posts_Audit': {'A': 12, 'B': 14, 'C': 55, 'D': 80},
-        'Examples10': {'A': 12, 'B': 14, 'C': 50, 'D': 80, 'E': 16, 'F': 60, 'G': 20, 'H': 16, 'I': 20, 'J': 20, 'K': 18, 'L': 18, 'M': 18},
-        'README': {'A': 22, 'B': 90},
+    # Dropdowns cover columns F onwards of Snippets_50, one per reference list
+    snippet_columns = columns('Snippets_50', snippets_df)
+    validations = {
+        snippet_columns[5 + idx].header: list_formula('Lists', idx + 1, len(values))
+        for idx, (_, values) in enumerate(reference_lists)
+        if 5 + idx < len(snippet_columns)
     }
-    for sheet_name, widths in col_widths.items():
-        ws = wb[sheet_name]
-        for col, width in widths.items():
-            ws.column_dimensions[col].width = width
-
-    wrap = Alignment(wrap_text=True, vertical='top')
-    for ws in (snippets_ws, posts_ws, examples_ws, readme_ws):
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = wrap
-        for cell in ws[1]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    max_row = snippets_ws.max_row
-    start_ord = ord('F')
-    for idx, (name, values) in enumerate(reference_lists):
-        column_letter = chr(start_ord + idx)
-        col_idx = column_lookup[name]
-        formula = f"=Lists!${chr(64 + col_idx)}$2:${chr(64 + col_idx)}${len(values) + 1}"
-        dv = DataValidation(type='list', formula1=formula, allow_blank=False)
-        snippets_ws.add_data_validation(dv)
-        dv.add(f'{column_letter}2:{column_letter}{max_row}')
-
-    wb.save(output_path)
+
+    # Write-only workbook: rows stream to disk and the header/wrap styles are
+    # registered once instead of being set cell by cell after a reload
+    with StreamingWorkbook(output_path) as book:
+        book.write_dataframe('README', readme_df, columns('README', readme_df))
+        book.write_dataframe('Posts_Audit', posts_df, columns('Posts_Audit', posts_df))
+        book.write_dataframe('Snippets_50', snippets_df, snippet_columns, validations=validations)
+        book.write_dataframe('Examples10', examples_df, columns('Examples10', examples_df))
+        book.write_rows(
+            'Lists',
+            [Column(name, style=None) for name, _ in reference_lists],
+            lists_rows([values for _, values in reference_lists]),
+            header=None,
+            freeze_header=False,
+            hidden=True,
+        )
 
 
 def parse_args() -> argparse.Namespace:
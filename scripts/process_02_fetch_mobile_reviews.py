@@ -1,19 +1,30 @@
 #!/usr/bin/env python3
-"""Download mobile app reviews from Apple + Google stores and build a consolidated sample."""
+"""Download mobile app reviews from Apple + Google stores and build a consolidated sample.
+
+Every (app, store, country) feed is fetched concurrently; requests to each
+store share one pooled session and one rate limiter. Reviews accumulate in
+an indexed SQLite table, and each feed keeps a watermark (newest review
+seen), so reruns stop paging at the first already-stored review instead of
+walking back to the date cutoff. The CSV sample is drawn from that table.
+"""
 from __future__ import annotations
 
 import argparse
 import csv
 import datetime as dt
 import random
+import sqlite3
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Callable, Iterable, Iterator
 
 import requests
 from google_play_scraper import Sort, reviews as gp_reviews
+from requests.adapters import HTTPAdapter
 
 APPS = {
     'instagram': {
@@ -40,6 +51,10 @@ APPLE_BASE_URL = (
 )
 APPLE_SORTS = ('mostRecent', 'mostHelpful')
 APPLE_PAGE_LIMIT = 10
+DEFAULT_WORKERS = 8
+MAX_RETRIES = 3
+
+REVIEW_COLUMNS = ['store', 'app', 'review_id', 'timestamp', 'rating', 'version', 'author', 'title', 'content', 'votes']
 
 
 @dataclass
@@ -56,6 +71,7 @@ class ReviewRecord:
     title: str | None
     content: str | None
     votes: int | None
+    country: str = 'us'
 
     def as_row(self) -> list[str]:
         return [
@@ -72,10 +88,160 @@ class ReviewRecord:
         ]
 
 
+@dataclass(frozen=True)
+class Watermark:
+    """Newest review already stored for one (app, store, country) feed."""
+
+    review_id: str
+    timestamp: dt.datetime
+
+    def reached(self, review_id: str, timestamp: dt.datetime) -> bool:
+        return review_id == self.review_id or timestamp < self.timestamp
+
+
+class ReviewStore:
+    """SQLite table of every fetched review plus per-feed watermarks (thread-safe)."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS reviews (
+                    store TEXT NOT NULL,
+                    app TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    review_id TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    rating INTEGER,
+                    version TEXT,
+                    author TEXT,
+                    title TEXT,
+                    content TEXT,
+                    votes INTEGER,
+                    PRIMARY KEY (store, review_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_reviews_app_time ON reviews (app, store, timestamp);
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    store TEXT NOT NULL,
+                    app TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    review_id TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    PRIMARY KEY (store, app, country)
+                );
+                """
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def upsert(self, records: Iterable[ReviewRecord]) -> int:
+        """Insert or refresh reviews; returns how many were new."""
+        new = 0
+        with self._lock, self._conn:
+            for r in records:
+                cursor = self._conn.execute(
+                    'INSERT OR IGNORE INTO reviews VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (r.store, r.app, r.country, r.review_id, r.timestamp.isoformat(), r.rating,
+                     r.version, r.author, r.title, r.content, r.votes),
+                )
+                if cursor.rowcount:
+                    new += 1
+                else:
+                    # Edited reviews and vote counts change; keep the latest
+                    self._conn.execute(
+                        """
+                        UPDATE reviews SET timestamp = ?, rating = ?, version = ?, title = ?, content = ?, votes = ?
+                        WHERE store = ? AND review_id = ?
+                        """,
+                        (r.timestamp.isoformat(), r.rating, r.version, r.title, r.content, r.votes,
+                         r.store, r.review_id),
+                    )
+        return new
+
+    def watermark(self, store: str, app: str, country: str) -> Watermark | None:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT review_id, timestamp FROM watermarks WHERE store = ? AND app = ? AND country = ?',
+                (store, app, country),
+            ).fetchone()
+        return Watermark(row[0], dt.datetime.fromisoformat(row[1])) if row else None
+
+    def advance_watermark(self, store: str, app: str, country: str, records: list[ReviewRecord]) -> None:
+        if not records:
+            return
+        newest = max(records, key=lambda r: r.timestamp)
+        current = self.watermark(store, app, country)
+        if current is not None and current.timestamp >= newest.timestamp:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?, ?)',
+                (store, app, country, newest.review_id, newest.timestamp.isoformat()),
+            )
+
+    def known_ids(self, store: str, review_ids: list[str]) -> set[str]:
+        if not review_ids:
+            return set()
+        placeholders = ','.join('?' * len(review_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT review_id FROM reviews WHERE store = ? AND review_id IN ({placeholders})',
+                [store, *review_ids],
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def load(self, store: str, app: str, cutoff: dt.datetime) -> list[ReviewRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT store, app, review_id, timestamp, rating, version, author, title, content, votes, country
+                FROM reviews WHERE store = ? AND app = ? AND timestamp >= ? ORDER BY timestamp DESC
+                """,
+                (store, app, cutoff.isoformat()),
+            ).fetchall()
+        return [
+            ReviewRecord(
+                store=row[0], app=row[1], review_id=row[2], timestamp=dt.datetime.fromisoformat(row[3]),
+                rating=row[4], version=row[5], author=row[6], title=row[7], content=row[8], votes=row[9],
+                country=row[10],
+            )
+            for row in rows
+        ]
+
+
+class RateLimiter:
+    """Minimum spacing between requests, shared by every worker thread."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def make_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+    return session
+
+
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('--output', type=Path, default=Path('outputs/research/mobile_app_reviews_12mo.csv'))
-    parser.add_argument('--country', default='us', help='App Store country storefront')
+    parser.add_argument('--db', type=Path, default=Path('outputs/research/mobile_app_reviews.sqlite'),
+                        help='SQLite review store (kept between runs)')
+    parser.add_argument('--country', default='us', help='Storefront country, or a comma-separated list')
     parser.add_argument('--sample-size', type=int, default=500, help='Target sample per app/store')
     parser.add_argument(
         '--cutoff-date',
@@ -83,65 +249,120 @@ def parse_args() -> argparse.Namespace:
         help='Earliest UTC date (YYYY-MM-DD) to include reviews from',
     )
     parser.add_argument('--seed', type=int, default=42)
-    parser.add_argument('--sleep', type=float, default=0.4, help='Delay between paginated requests')
+    parser.add_argument('--sleep', type=float, default=0.4,
+                        help='Minimum delay between requests to the same store (shared by all workers)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent feeds')
+    parser.add_argument('--full', action='store_true', help='Ignore watermarks and page back to the cutoff')
     return parser.parse_args()
 
 
-def _iter_app_store_pages(app_id: int, country: str, sleep: float) -> Iterator[tuple[str, dict]]:
-    for sort in APPLE_SORTS:
-        for page in range(1, APPLE_PAGE_LIMIT + 1):
-            url = APPLE_BASE_URL.format(country=country, page=page, sort=sort, app_id=app_id)
-            resp = requests.get(url, timeout=30)
-            if resp.status_code == 400:
-                break
-            resp.raise_for_status()
-            payload = resp.json()
-            entries = payload.get('feed', {}).get('entry', [])
-            if len(entries) <= 1:
-                break
-            yield sort, payload
-            time.sleep(sleep)
+def _get_json(session: requests.Session, limiter: RateLimiter, url: str) -> dict | None:
+    """GET with the store limiter, retrying 429/5xx; None when the feed has no such page."""
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        resp = session.get(url, timeout=30)
+        if resp.status_code == 400:
+            return None
+        if attempt < MAX_RETRIES and (resp.status_code == 429 or resp.status_code >= 500):
+            time.sleep(2 ** attempt)
+            continue
+        resp.raise_for_status()
+        return resp.json()
+    return None
 
 
-def fetch_app_store_reviews(app: str, app_id: int, country: str, cutoff: dt.datetime, sleep: float) -> list[ReviewRecord]:
-    seen: dict[str, ReviewRecord] = {}
-    for sort, payload in _iter_app_store_pages(app_id, country, sleep):
+def _iter_app_store_pages(
+    session: requests.Session, limiter: RateLimiter, app_id: int, country: str, sort: str
+) -> Iterator[list[dict]]:
+    for page in range(1, APPLE_PAGE_LIMIT + 1):
+        url = APPLE_BASE_URL.format(country=country, page=page, sort=sort, app_id=app_id)
+        payload = _get_json(session, limiter, url)
+        if payload is None:
+            break
         entries = payload.get('feed', {}).get('entry', [])
-        for entry in entries[1:]:
-            review_id = entry.get('id', {}).get('label')
-            if not review_id:
-                continue
-            updated_raw = entry.get('updated', {}).get('label')
-            if not updated_raw:
-                continue
-            updated = dt.datetime.fromisoformat(updated_raw.replace('Z', '+00:00'))
-            if updated < cutoff:
-                continue
-            rating_str = entry.get('im:rating', {}).get('label')
-            votes_str = entry.get('im:voteCount', {}).get('label')
-            seen[review_id] = ReviewRecord(
-                store='app_store',
-                app=app,
-                review_id=review_id,
-                timestamp=updated,
-                rating=int(rating_str) if rating_str else None,
-                version=entry.get('im:version', {}).get('label'),
-                author=entry.get('author', {}).get('name', {}).get('label'),
-                title=entry.get('title', {}).get('label'),
-                content=entry.get('content', {}).get('label'),
-                votes=int(votes_str) if votes_str else None,
-            )
+        if len(entries) <= 1:
+            break
+        # First entry describes the app itself
+        yield entries[1:]
+
+
+def _app_store_record(app: str, country: str, entry: dict) -> ReviewRecord | None:
+    review_id = entry.get('id', {}).get('label')
+    updated_raw = entry.get('updated', {}).get('label')
+    if not review_id or not updated_raw:
+        return None
+    rating_str = entry.get('im:rating', {}).get('label')
+    votes_str = entry.get('im:voteCount', {}).get('label')
+    return ReviewRecord(
+        store='app_store',
+        app=app,
+        review_id=review_id,
+        timestamp=dt.datetime.fromisoformat(updated_raw.replace('Z', '+00:00')).astimezone(dt.timezone.utc),
+        rating=int(rating_str) if rating_str else None,
+        version=entry.get('im:version', {}).get('label'),
+        author=entry.get('author', {}).get('name', {}).get('label'),
+        title=entry.get('title', {}).get('label'),
+        content=entry.get('content', {}).get('label'),
+        votes=int(votes_str) if votes_str else None,
+        country=country,
+    )
+
+
+def fetch_app_store_reviews(
+    app: str,
+    app_id: int,
+    country: str,
+    sort: str,
+    cutoff: dt.datetime,
+    session: requests.Session,
+    limiter: RateLimiter,
+    watermark: Watermark | None = None,
+    known_ids: Callable[[list[str]], set[str]] | None = None,
+) -> list[ReviewRecord]:
+    """One App Store feed, newest first.
+
+    ``mostRecent`` stops at the watermark; ``mostHelpful`` is not
+    chronological, so it stops at the first page with nothing new.
+    """
+    seen: dict[str, ReviewRecord] = {}
+    for entries in _iter_app_store_pages(session, limiter, app_id, country, sort):
+        records = [r for r in (_app_store_record(app, country, e) for e in entries) if r is not None]
+        stop = False
+        if sort == 'mostRecent':
+            for record in records:
+                if watermark is not None and watermark.reached(record.review_id, record.timestamp):
+                    stop = True
+                    break
+                if record.timestamp >= cutoff:
+                    seen[record.review_id] = record
+        else:
+            fresh = [r for r in records if r.timestamp >= cutoff]
+            if known_ids is not None:
+                known = known_ids([r.review_id for r in records])
+                stop = all(r.review_id in known for r in records)
+                fresh = [r for r in fresh if r.review_id not in known]
+            seen.update((r.review_id, r) for r in fresh)
+        if stop:
+            break
     return sorted(seen.values(), key=lambda r: r.timestamp, reverse=True)
 
 
-def fetch_play_store_reviews(app: str, package: str, cutoff: dt.datetime, sleep: float) -> list[ReviewRecord]:
+def fetch_play_store_reviews(
+    app: str,
+    package: str,
+    country: str,
+    cutoff: dt.datetime,
+    limiter: RateLimiter,
+    watermark: Watermark | None = None,
+) -> list[ReviewRecord]:
     collected: list[ReviewRecord] = []
     token = None
     while True:
+        limiter.acquire()
         batch, token = gp_reviews(
             package,
             lang='en',
-            country='us',
+            country=country,
             sort=Sort.NEWEST,
             count=200,
             continuation_token=token,
@@ -156,14 +377,15 @@ def fetch_play_store_reviews(app: str, package: str, cutoff: dt.datetime, sleep:
             if stamped.tzinfo is None:
                 stamped = stamped.replace(tzinfo=dt.timezone.utc)
             stamped = stamped.astimezone(dt.timezone.utc)
-            if stamped < cutoff:
+            review_id = item.get('reviewId', '')
+            if stamped < cutoff or (watermark is not None and watermark.reached(review_id, stamped)):
                 stop = True
                 break
             collected.append(
                 ReviewRecord(
                     store='play_store',
                     app=app,
-                    review_id=item.get('reviewId', ''),
+                    review_id=review_id,
                     timestamp=stamped,
                     rating=item.get('score'),
                     version=item.get('appVersion'),
@@ -171,11 +393,11 @@ def fetch_play_store_reviews(app: str, package: str, cutoff: dt.datetime, sleep:
                     title=item.get('title'),
                     content=item.get('content'),
                     votes=item.get('thumbsUpCount'),
+                    country=country,
                 )
             )
         if stop or token is None:
             break
-        time.sleep(sleep)
     return collected
 
 
@@ -208,28 +430,89 @@ def write_consolidated(reviews: list[ReviewRecord], output: Path) -> None:
     output.parent.mkdir(parents=True, exist_ok=True)
     with output.open('w', newline='', encoding='utf-8') as handle:
         writer = csv.writer(handle)
-        writer.writerow(['store', 'app', 'review_id', 'timestamp', 'rating', 'version', 'author', 'title', 'content', 'votes'])
+        writer.writerow(REVIEW_COLUMNS)
         for record in reviews:
             writer.writerow(record.as_row())
 
 
+def harvest(
+    store: ReviewStore,
+    countries: list[str],
+    cutoff: dt.datetime,
+    sleep: float,
+    workers: int,
+    full: bool = False,
+) -> None:
+    """Fetch every (app, store, country, sort) feed concurrently into ``store``.
+
+    Worker threads only fetch; results are written and watermarks advanced
+    on the calling thread as each feed completes, so a failed feed keeps
+    its old watermark and is simply retried next run.
+    """
+    session = make_session(workers)
+    limiters = {'app_store': RateLimiter(sleep), 'play_store': RateLimiter(sleep)}
+
+    def known_ids(review_ids: list[str]) -> set[str]:
+        return store.known_ids('app_store', review_ids)
+
+    def watermark(store_name: str, app: str, country: str) -> Watermark | None:
+        return None if full else store.watermark(store_name, app, country)
+
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for app, ids in APPS.items():
+            for country in countries:
+                for sort in APPLE_SORTS:
+                    future = executor.submit(
+                        fetch_app_store_reviews, app, ids['app_store_id'], country, sort, cutoff,
+                        session, limiters['app_store'], watermark('app_store', app, country),
+                        None if full else known_ids,
+                    )
+                    jobs[future] = ('app_store', app, country, sort)
+                future = executor.submit(
+                    fetch_play_store_reviews, app, ids['play_store_id'], country, cutoff,
+                    limiters['play_store'], watermark('play_store', app, country),
+                )
+                jobs[future] = ('play_store', app, country, 'newest')
+
+        for future in as_completed(jobs):
+            store_name, app, country, sort = jobs[future]
+            try:
+                records = future.result()
+            except Exception as exc:  # noqa: BLE001 - keep the other feeds going
+                print(f"{app} {store_name}/{country}/{sort}: failed ({exc})")
+                continue
+            new = store.upsert(records)
+            if sort in ('mostRecent', 'newest'):
+                store.advance_watermark(store_name, app, country, records)
+            print(f"{app} {store_name}/{country}/{sort}: fetched {len(records)}, new {new}")
+    session.close()
+
+
 def main() -> None:
     args = parse_args()
     cutoff = dt.datetime.fromisoformat(args.cutoff_date).replace(tzinfo=dt.timezone.utc)
-    all_samples: list[ReviewRecord] = []
-    for app, ids in APPS.items():
-        app_store_reviews = fetch_app_store_reviews(app, ids['app_store_id'], args.country, cutoff, args.sleep)
-        sample_app_store = stratified_sample(app_store_reviews, args.sample_size, args.seed)
-        all_samples.extend(sample_app_store)
-
-        play_store_reviews = fetch_play_store_reviews(app, ids['play_store_id'], cutoff, args.sleep)
-        sample_play_store = stratified_sample(play_store_reviews, args.sample_size, args.seed)
-        all_samples.extend(sample_play_store)
-
-        print(
-            f"{app}: apple={len(app_store_reviews)} -> sample {len(sample_app_store)} | "
-            f"google={len(play_store_reviews)} -> sample {len(sample_play_store)}"
-        )
+    countries = [c.strip().lower() for c in args.country.split(',') if c.strip()]
+    store = ReviewStore(args.db)
+    try:
+        harvest(store, countries, cutoff, args.sleep, args.workers, args.full)
+
+        all_samples: list[ReviewRecord] = []
+        for app in APPS:
+            app_store_reviews = store.load('app_store', app, cutoff)
+            sample_app_store = stratified_sample(app_store_reviews, args.sample_size, args.seed)
+            all_samples.extend(sample_app_store)
+
+            play_store_reviews = store.load('play_store', app, cutoff)
+            sample_play_store = stratified_sample(play_store_reviews, args.sample_size, args.seed)
+            all_samples.extend(sample_play_store)
+
+            print(
+                f"{app}: apple={len(app_store_reviews)} -> sample {len(sample_app_store)} | "
+                f"google={len(play_store_reviews)} -> sample {len(sample_play_store)}"
+            )
+    finally:
+        store.close()
 
     write_consolidated(all_samples, args.output)
     print(f"Wrote consolidated sample -> {args.output}")
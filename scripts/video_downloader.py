@@ -9,7 +9,6 @@ Output: data/videos/{video_id}/video.mp4 + metadata.json
 import os
 import sys
 import json
-import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -18,6 +17,9 @@ from dotenv import load_dotenv
 # Load environment
 project_root = Path(__file__).parent.parent
 load_dotenv(project_root / '.env')
+sys.path.insert(0, str(project_root))
+
+from core.data_sources.video_downloads import DownloadJob, VideoDownloadManager, yt_dlp
 
 # Download configuration
 MAX_VIDEOS_PER_CREATOR = 2  # Top 2 recent videos per creator
@@ -25,6 +27,7 @@ MAX_TOTAL_VIDEOS = 30       # Total video limit
 VIDEO_DURATION_MIN = 240    # 4 minutes minimum
 VIDEO_DURATION_MAX = 1200   # 20 minutes maximum
 VIDEO_QUALITY = 'bestvideo[height<=1080]+bestaudio/best[height<=1080]'
+MAX_CONCURRENT_DOWNLOADS = 8
 
 class VideoDownloader:
     """YouTube video downloader using yt-dlp"""
@@ -33,11 +36,21 @@ class VideoDownloader:
         self.creator_db = self.load_creator_database(creator_db_path)
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.manager = VideoDownloadManager(
+            self.output_dir / 'download_queue.sqlite',
+            max_workers=MAX_CONCURRENT_DOWNLOADS,
+            format=VIDEO_QUALITY,
+            merge_output_format='mp4',
+        )
 
         self.downloaded_count = 0
         self.skipped_count = 0
         self.failed_count = 0
 
+    def close(self):
+        """Release the download queue's SQLite connection"""
+        self.manager.close()
+
     def load_creator_database(self, db_path: Path) -> Dict:
         """Load creator database from JSON"""
         if not db_path.exists():
@@ -48,35 +61,20 @@ class VideoDownloader:
         with open(db_path) as f:
             return json.load(f)
 
-    def get_video_info(self, video_id: str) -> Optional[Dict]:
-        """
-        Fetch video metadata using yt-dlp
+    def make_job(self, video_id: str) -> DownloadJob:
+        return DownloadJob(
+            video_id,
+            f'https://www.youtube.com/watch?v={video_id}',
+            self.output_dir / video_id / 'video.mp4'
+        )
 
-        Returns video info dict or None if failed
+    def get_video_info(self, video_ids: List[str]) -> Dict[str, Optional[Dict]]:
         """
-        try:
-            cmd = [
-                'yt-dlp',
-                '--dump-json',
-                '--no-download',
-                f'https://www.youtube.com/watch?v={video_id}'
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            else:
-                return None
+        Fetch metadata for many videos concurrently using yt-dlp
 
-        except Exception as e:
-            print(f"   ⚠️  Failed to get info: {str(e)[:50]}")
-            return None
+        Returns video_id -> info dict (None where extraction failed)
+        """
+        return self.manager.extract_info([self.make_job(video_id) for video_id in video_ids])
 
     def should_download(self, video_info: Dict) -> tuple[bool, str]:
         """
@@ -91,12 +89,6 @@ class VideoDownloader:
         if duration > VIDEO_DURATION_MAX:
             return False, f"Too long ({duration//60}m)"
 
-        # Check if already downloaded
-        video_id = video_info['id']
-        video_dir = self.output_dir / video_id
-        if (video_dir / 'video.mp4').exists():
-            return False, "Already downloaded"
-
         # Check availability
         if video_info.get('is_live', False):
             return False, "Live stream"
@@ -106,84 +98,55 @@ class VideoDownloader:
 
         return True, "OK"
 
-    def download_video(self, video_id: str, video_info: Dict) -> bool:
+    def save_metadata(self, video_id: str, video_info: Dict, video_path: Path, file_size_mb: float):
+        """Write metadata.json next to a downloaded video"""
+        metadata = {
+            'video_id': video_id,
+            'title': video_info['title'],
+            'channel': video_info['channel'],
+            'channel_id': video_info['channel_id'],
+            'duration': video_info['duration'],
+            'view_count': video_info.get('view_count', 0),
+            'like_count': video_info.get('like_count', 0),
+            'comment_count': video_info.get('comment_count', 0),
+            'upload_date': video_info.get('upload_date'),
+            'description': video_info.get('description', ''),
+            'tags': video_info.get('tags', []),
+            'categories': video_info.get('categories', []),
+            'thumbnail': video_info.get('thumbnail'),
+            'file_size_mb': file_size_mb,
+            'downloaded_at': datetime.now().isoformat(),
+            'video_path': str(video_path),
+            'url': f"https://www.youtube.com/watch?v={video_id}"
+        }
+
+        with open(video_path.parent / 'metadata.json', 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+    def download_videos(self, video_infos: Dict[str, Dict]) -> List[str]:
         """
-        Download video and save metadata
+        Download videos concurrently and save metadata as each finishes
 
-        Returns True if successful
+        Returns ids of videos that were downloaded in this call
         """
-        video_dir = self.output_dir / video_id
-        video_dir.mkdir(parents=True, exist_ok=True)
-
-        video_path = video_dir / 'video.mp4'
-        metadata_path = video_dir / 'metadata.json'
-
-        print(f"   📥 Downloading to: {video_dir.name}/")
-
-        try:
-            # Download video
-            cmd = [
-                'yt-dlp',
-                '-f', VIDEO_QUALITY,
-                '--merge-output-format', 'mp4',
-                '-o', str(video_path),
-                '--no-playlist',
-                '--quiet',
-                '--progress',
-                f'https://www.youtube.com/watch?v={video_id}'
-            ]
-
-            result = subprocess.run(
-                cmd,
-                timeout=600,  # 10 minute timeout
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                print(f"   ❌ Download failed: {result.stderr[:100]}")
-                return False
-
-            # Verify file exists
-            if not video_path.exists():
-                print(f"   ❌ Video file not created")
-                return False
-
-            file_size_mb = video_path.stat().st_size / (1024 * 1024)
-            print(f"   ✅ Downloaded: {file_size_mb:.1f} MB")
-
-            # Save metadata
-            metadata = {
-                'video_id': video_id,
-                'title': video_info['title'],
-                'channel': video_info['channel'],
-                'channel_id': video_info['channel_id'],
-                'duration': video_info['duration'],
-                'view_count': video_info.get('view_count', 0),
-                'like_count': video_info.get('like_count', 0),
-                'comment_count': video_info.get('comment_count', 0),
-                'upload_date': video_info.get('upload_date'),
-                'description': video_info.get('description', ''),
-                'tags': video_info.get('tags', []),
-                'categories': video_info.get('categories', []),
-                'thumbnail': video_info.get('thumbnail'),
-                'file_size_mb': file_size_mb,
-                'downloaded_at': datetime.now().isoformat(),
-                'video_path': str(video_path),
-                'url': f"https://www.youtube.com/watch?v={video_id}"
-            }
-
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
-            return True
-
-        except subprocess.TimeoutExpired:
-            print(f"   ❌ Download timeout (>10min)")
-            return False
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)[:100]}")
-            return False
+        def on_complete(result):
+            file_size_mb = result.size_bytes / (1024 * 1024)
+            print(f"   ✅ Downloaded: {result.job.job_id} ({file_size_mb:.1f} MB)")
+            self.save_metadata(result.job.job_id, video_infos[result.job.job_id], result.job.output_path, file_size_mb)
+
+        results = self.manager.run([self.make_job(video_id) for video_id in video_infos], on_complete=on_complete)
+
+        downloaded = []
+        for result in results:
+            if result.status == 'downloaded':
+                downloaded.append(result.job.job_id)
+            elif result.status == 'skipped':
+                print(f"   ⏭️  Skipped {result.job.job_id}: {result.reason}")
+                self.skipped_count += 1
+            else:
+                print(f"   ❌ Download failed {result.job.job_id}: {result.reason[:100]}")
+                self.failed_count += 1
+        return downloaded
 
     def download_from_creators(self) -> List[Dict]:
         """
@@ -201,52 +164,52 @@ class VideoDownloader:
         print(f"Duration: {VIDEO_DURATION_MIN//60}-{VIDEO_DURATION_MAX//60} minutes")
         print(f"Quality: {VIDEO_QUALITY}")
 
+        # Candidates in creator order
+        candidates = []
+        for creator in creators:
+            for video in creator.get('recent_videos', [])[:MAX_VIDEOS_PER_CREATOR]:
+                candidates.append((creator['title'], video))
+
+        print(f"\n🔍 Fetching info for {len(candidates)} videos...")
+        video_infos = self.get_video_info([video['video_id'] for _, video in candidates])
+
+        eligible = []
+        for creator_name, video in candidates:
+            video_id = video['video_id']
+            video_info = video_infos.get(video_id)
+            if not video_info:
+                print(f"   ⚠️  Could not fetch info: {video_id}")
+                self.failed_count += 1
+                continue
+
+            should_dl, reason = self.should_download(video_info)
+            if not should_dl:
+                print(f"   ⏭️  Skipped {video['title'][:50]}: {reason}")
+                self.skipped_count += 1
+                continue
+            eligible.append((creator_name, video, video_info))
+
+        # Download in waves so failures and already-present files are
+        # backfilled from later candidates, up to MAX_TOTAL_VIDEOS
         downloaded_videos = []
-
-        for i, creator in enumerate(creators, 1):
-            if self.downloaded_count >= MAX_TOTAL_VIDEOS:
-                print(f"\n⚠️  Reached max videos ({MAX_TOTAL_VIDEOS}) - stopping")
-                break
-
-            creator_name = creator['title']
-            print(f"\n[{i}/{len(creators)}] {creator_name}")
-
-            # Get recent videos
-            recent_videos = creator.get('recent_videos', [])[:MAX_VIDEOS_PER_CREATOR]
-
-            for j, video in enumerate(recent_videos, 1):
-                if self.downloaded_count >= MAX_TOTAL_VIDEOS:
-                    break
-
-                video_id = video['video_id']
-                video_title = video['title'][:50]
-
-                print(f"   [{j}/{len(recent_videos)}] {video_title}...")
-
-                # Get full video info
-                video_info = self.get_video_info(video_id)
-                if not video_info:
-                    print(f"   ⚠️  Could not fetch info")
-                    self.failed_count += 1
-                    continue
-
-                # Check if should download
-                should_dl, reason = self.should_download(video_info)
-                if not should_dl:
-                    print(f"   ⏭️  Skipped: {reason}")
-                    self.skipped_count += 1
-                    continue
-
-                # Download
-                if self.download_video(video_id, video_info):
+        position = 0
+        while self.downloaded_count < MAX_TOTAL_VIDEOS and position < len(eligible):
+            wave = eligible[position:position + MAX_TOTAL_VIDEOS - self.downloaded_count]
+            position += len(wave)
+            print(f"\n📥 Downloading {len(wave)} videos ({MAX_CONCURRENT_DOWNLOADS} at a time)...")
+
+            downloaded_ids = set(self.download_videos({video['video_id']: info for _, video, info in wave}))
+            for creator_name, video, _ in wave:
+                if video['video_id'] in downloaded_ids:
                     self.downloaded_count += 1
                     downloaded_videos.append({
-                        'video_id': video_id,
+                        'video_id': video['video_id'],
                         'creator': creator_name,
-                        'title': video_title
+                        'title': video['title'][:50]
                     })
-                else:
-                    self.failed_count += 1
+
+        if self.downloaded_count >= MAX_TOTAL_VIDEOS:
+            print(f"\n⚠️  Reached max videos ({MAX_TOTAL_VIDEOS}) - stopping")
 
         return downloaded_videos
 
@@ -297,23 +260,13 @@ class VideoDownloader:
 
 
 def check_dependencies():
-    """Verify yt-dlp is installed"""
-    try:
-        result = subprocess.run(
-            ['yt-dlp', '--version'],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            print(f"✅ yt-dlp version: {result.stdout.strip()}")
-            return True
-        else:
-            print("❌ yt-dlp not working properly")
-            return False
-    except FileNotFoundError:
+    """Verify the yt-dlp Python package is installed"""
+    if yt_dlp is None:
         print("❌ yt-dlp not installed")
         print("   Install: pip install yt-dlp")
         return False
+    print(f"✅ yt-dlp version: {yt_dlp.version.__version__}")
+    return True
 
 
 def main():
@@ -330,12 +283,17 @@ def main():
 
     # Run downloader
     downloader = VideoDownloader(creator_db_path, output_dir)
-    downloaded_videos = downloader.download_from_creators()
+    try:
+        downloaded_videos = downloader.download_from_creators()
+
+        # Save results
+        if downloaded_videos:
+            downloader.save_manifest(downloaded_videos)
+            downloader.generate_summary()
+    finally:
+        downloader.close()
 
-    # Save results
     if downloaded_videos:
-        downloader.save_manifest(downloaded_videos)
-        downloader.generate_summary()
         print(f"\n✅ Video download complete!")
         print(f"   Next: python scripts/multimodal_analyzer.py")
     else:
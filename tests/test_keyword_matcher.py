@@ -0,0 +1,159 @@
+"""Tests for the shared compiled keyword matcher."""
+from __future__ import annotations
+
+import ast
+import random
+from pathlib import Path
+
+import pytest
+
+from core.text import KeywordMatcher
+
+THEMES = {
+    "heat": ["heat", "hot", "warm", "overheat"],
+    "color": ["color", "warm white", "cool white", "color temp"],
+    "power": ["transformer", "driver", "power supply", "supply", "12v", "voltage"],
+    "safety": ["code", "ground", "shock", "voltage"],
+    "storage": ["bin", "rack", "hook", "led"],
+}
+
+
+def legacy_labels(text, patterns):
+    lowered = text.lower()
+    return [label for label, keywords in patterns.items() if any(k in lowered for k in keywords)]
+
+
+def legacy_keywords(text, patterns):
+    lowered = text.lower()
+    found = {}
+    for label, keywords in patterns.items():
+        hits = [k for k in keywords if k in lowered]
+        if hits:
+            found[label] = hits
+    return found
+
+
+@pytest.mark.parametrize(
+    "boundary, text, expected",
+    [
+        ("word", "The dim setting", ["dim"]),
+        ("word", "Swapped the dimmer", []),
+        ("word", "Mounted on a ledge", []),
+        ("word", "Bright LED strip", ["led"]),
+        ("prefix", "Swapped the dimmer", ["dim"]),
+        ("prefix", "Mounted on a ledge", ["led"]),
+        ("prefix", "Kitchen cabinet", []),
+        ("none", "Kitchen cabinet", ["bin"]),
+        ("none", "It failed", ["led"]),
+    ],
+)
+def test_boundary_modes(boundary, text, expected):
+    matcher = KeywordMatcher({"kw": ["dim", "led", "bin"]}, boundary=boundary)
+    assert matcher.keywords(text).get("kw", []) == expected
+
+
+def test_prefix_matches_plurals_but_not_mid_word():
+    matcher = KeywordMatcher({"storage": ["hook", "rack", "bin"]})
+    assert matcher.keywords("Two hooks and a bracket") == {"storage": ["hook"]}
+    assert matcher.labels("A cabinet bracket") == []
+
+
+def test_unknown_boundary_rejected():
+    with pytest.raises(ValueError):
+        KeywordMatcher({"a": ["x"]}, boundary="suffix")
+
+
+@pytest.mark.parametrize("boundary", ["word", "prefix", "none"])
+def test_overlapping_keywords_all_reported(boundary):
+    matcher = KeywordMatcher(THEMES, boundary=boundary)
+    found = matcher.keywords("Warm white strip with a 12V power supply")
+    assert found == {
+        "heat": ["warm"],
+        "color": ["warm white"],
+        "power": ["power supply", "supply", "12v"],
+    }
+
+
+def test_word_mode_shorter_keyword_needs_its_own_boundary():
+    matcher = KeywordMatcher({"a": ["color", "color temp"]}, boundary="word")
+    assert matcher.keywords("color temperature") == {"a": ["color"]}
+    assert matcher.keywords("color temp is off") == {"a": ["color", "color temp"]}
+
+
+def test_shared_keyword_maps_to_every_label_in_pattern_order():
+    matcher = KeywordMatcher(THEMES)
+    assert matcher.labels("Voltage drop, then heat") == ["heat", "power", "safety"]
+    assert [(label, kw) for label, kw, _ in matcher.find("voltage")] == [("power", "voltage"), ("safety", "voltage")]
+
+
+def test_find_reports_positions_in_text_order():
+    matcher = KeywordMatcher({"a": ["supply"], "b": ["power supply"]})
+    assert matcher.find("power supply") == [("b", "power supply", 0), ("a", "supply", 6)]
+
+
+def test_case_sensitive():
+    matcher = KeywordMatcher({"a": ["LED"]}, case_sensitive=True)
+    assert matcher.labels("LED strip") == ["a"]
+    assert matcher.labels("led strip") == []
+
+
+def test_document_counts():
+    matcher = KeywordMatcher(THEMES)
+    assert matcher.document_counts(["hot hot hot", "a hook", "nothing"]) == {"heat": 1, "storage": 1}
+
+
+def _corpus(seed=7, size=300):
+    rng = random.Random(seed)
+    vocab = [
+        "heat", "heated", "warm", "warmer", "white", "cool", "color", "temp", "temperature",
+        "power", "supply", "supplying", "12v", "transformer", "decoded", "code", "grounded",
+        "cabinet", "bin", "bracket", "rack", "hooks", "ledge", "failed", "led", "LED", "the", "a",
+        "Shock", "voltage", "overheating", "driver", "screwdriver",
+    ]
+    seps = [" ", ", ", ". ", "-", "/"]
+    return ["".join(rng.choice(vocab) + rng.choice(seps) for _ in range(rng.randint(0, 15))) for _ in range(size)]
+
+
+def test_none_mode_matches_legacy_substring_logic():
+    matcher = KeywordMatcher(THEMES, boundary="none")
+    texts = _corpus()
+    assert matcher.labels_many(texts) == [legacy_labels(t, THEMES) for t in texts]
+    assert matcher.keywords_many(texts) == [legacy_keywords(t, THEMES) for t in texts]
+
+
+@pytest.mark.parametrize("boundary", ["word", "prefix"])
+def test_bounded_modes_are_subsets_of_legacy_substring_logic(boundary):
+    matcher = KeywordMatcher(THEMES, boundary=boundary)
+    for text in _corpus():
+        legacy = legacy_keywords(text, THEMES)
+        for label, keywords in matcher.keywords(text).items():
+            assert set(keywords) <= set(legacy[label])
+
+
+def _jtbd_matcher():
+    """Rebuild scripts/multimodal_analyzer.JTBD_MATCHER without importing the
+    script (it loads torch/whisper/ollama at import time)."""
+    source = (Path(__file__).resolve().parents[1] / "scripts" / "multimodal_analyzer.py").read_text()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "JTBD_MATCHER" for t in node.targets):
+            call = node.value
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+            return KeywordMatcher(ast.literal_eval(call.args[0]), **kwargs)
+    raise AssertionError("JTBD_MATCHER not found")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("I installed the strip", ["solution"]),
+        ("we are installing lights", ["solution"]),
+        ("replaced the bulbs", ["solution"]),
+        ("struggled with wiring", ["pain_point"]),
+        ("I fixed the glare", ["pain_point", "solution"]),
+        ("added a dimmer", ["solution"]),
+        ("check the address and dimensions", []),
+        ("shelf on a ledge", []),
+    ],
+)
+def test_jtbd_matcher_labels_inflected_transcripts(text, expected):
+    assert _jtbd_matcher().labels(text) == expected